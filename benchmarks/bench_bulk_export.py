@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for POST /api/conversations/bulk-export.
+
+OLD: render every conversation one after another into a ZIP held in a
+     BytesIO, then send it in one piece
+NEW: ExportRenderer (PDFs in a process pool, content-hash cache) feeding a
+     ZipStream that yields chunks as members are written
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import random
+import time
+import zipfile
+
+import searchat.core  # noqa: F401  (load searchat.config via core before searchat.api)
+from searchat.api.exports import ExportRenderer, ZipStream, archive_name, iter_exports
+from searchat.api.models.responses import ConversationMessage, ConversationResponse
+from searchat.services.export_service import export_conversation
+
+CODE = '''```python
+def handler(event, context):
+    items = [transform(record) for record in event["records"]]
+    return {"status": 200, "count": len(items)}
+```'''
+
+
+def synthetic_conversations(n, messages, seed=13):
+    rng = random.Random(seed)
+    conversations = []
+    for i in range(n):
+        turns = [
+            ConversationMessage(
+                role="user" if j % 2 == 0 else "assistant",
+                content=" ".join(rng.choice(["deploy", "lambda", "retry", "queue", "timeout"]) for _ in range(80))
+                + ("\n\n" + CODE if j % 3 == 2 else ""),
+                timestamp=f"2026-01-01T00:{j % 60:02d}:00",
+            )
+            for j in range(messages)
+        ]
+        conversations.append(ConversationResponse(
+            conversation_id=f"conv-{i:05d}", title=f"Conversation {i}", project_id="proj",
+            file_path=f"/tmp/conv-{i}.jsonl", message_count=messages, tool="claude", messages=turns,
+        ))
+    return {c.conversation_id: c for c in conversations}
+
+
+def old_export(conversations, ids, format):
+    """The previous route body: serial render into an in-memory ZIP."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for conversation_id in ids:
+            conversation = conversations[conversation_id]
+            exported = export_conversation(conversation, format=format)
+            archive.writestr(archive_name(conversation, conversation_id, format), exported.content)
+    return buffer.getvalue()
+
+
+async def new_export(conversations, ids, format, renderer):
+    async def load(conversation_id):
+        return conversations[conversation_id]
+
+    total = largest = 0
+    start = time.perf_counter()
+    first_chunk_ms = None
+    async for chunk in ZipStream().stream(iter_exports(ids, load, format, renderer)):
+        if first_chunk_ms is None:
+            first_chunk_ms = (time.perf_counter() - start) * 1000
+        total += len(chunk)
+        largest = max(largest, len(chunk))
+    return total, largest, first_chunk_ms
+
+
+def benchmark_bulk_export(n_conversations, messages, format, workers):
+    """Benchmark: in-memory serial ZIP vs streamed, pooled, cached ZIP."""
+    print("\n" + "="*70)
+    print(f"BENCHMARK: Bulk Export ({n_conversations} conversations x {messages} messages, "
+          f"format={format}, export_workers={workers}, cpus={os.cpu_count()})")
+    print("="*70)
+
+    conversations = synthetic_conversations(n_conversations, messages)
+    ids = list(conversations)
+
+    start = time.perf_counter()
+    archive = old_export(conversations, ids, format)
+    old_s = time.perf_counter() - start
+
+    renderer = ExportRenderer(workers=workers, cache_mb=512)
+    try:
+        start = time.perf_counter()
+        total, largest, first_ms = asyncio.run(new_export(conversations, ids, format, renderer))
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, _, warm_first_ms = asyncio.run(new_export(conversations, ids, format, renderer))
+        warm_s = time.perf_counter() - start
+    finally:
+        renderer.shutdown()
+
+    print(f"\n{'strategy':<24} {'total':>9} {'first byte':>12} {'largest buffer':>16}")
+    print(f"{'OLD in-memory serial':<24} {old_s:>8.2f}s {old_s * 1000:>10.0f}ms {len(archive) / 1e6:>13.2f} MB")
+    print(f"{'NEW streamed (cold)':<24} {cold_s:>8.2f}s {first_ms:>10.0f}ms {largest / 1e6:>13.2f} MB")
+    print(f"{'NEW streamed (cached)':<24} {warm_s:>8.2f}s {warm_first_ms:>10.0f}ms {largest / 1e6:>13.2f} MB")
+    print(f"\nArchive size: OLD {len(archive) / 1e6:.2f} MB, NEW {total / 1e6:.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conversations", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=40)
+    parser.add_argument("--format", default="pdf", choices=["json", "markdown", "text", "ipynb", "pdf"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT BULK EXPORT BENCHMARK")
+    print("="*70)
+
+    benchmark_bulk_export(args.conversations, args.messages, args.format, args.workers)
+
+    print("\n" + "="*70)
+    print("OLD holds the whole archive until the last conversation is rendered;")
+    print("NEW sends each member as it is written. Process-pool speedup needs")
+    print("more than one CPU (workers are capped at the CPU count).")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
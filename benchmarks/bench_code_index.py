@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for code symbol and substring lookups.
+
+OLD: parquet_scan over every data/code/*.parquet file per request
+     (list_contains for symbols, ILIKE for substrings, count(*) OVER())
+NEW: CodeIndex probes: sorted symbol table and trigram posting lists,
+     candidates verified against the indexed blocks
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from searchat.core.code_index import RESULT_COLUMNS, CodeIndex
+from searchat.models.schemas import CODE_BLOCK_SCHEMA
+
+ROWS_PER_FILE = 100_000
+
+
+def identifiers(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        "_".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(2))
+        for _ in range(count)
+    ]
+
+
+def write_corpus(code_dir, n_blocks, vocabulary):
+    """Parquet files shaped like the indexer's, ~300 characters of code per block."""
+    rng = random.Random(11)
+    base = datetime(2026, 1, 1)
+    for start in range(0, n_blocks, ROWS_PER_FILE):
+        rows = []
+        for i in range(start, min(start + ROWS_PER_FILE, n_blocks)):
+            fn, helper, arg, attr, module = (rng.choice(vocabulary) for _ in range(5))
+            rows.append({
+                "conversation_id": f"conv-{i // 8}",
+                "project_id": f"project-{start // ROWS_PER_FILE}",
+                "connector": "claude",
+                "file_path": f"/sessions/{i // 8}.jsonl",
+                "title": f"Session {i // 8}",
+                "conversation_created_at": base,
+                "conversation_updated_at": base + timedelta(minutes=i // 8),
+                "message_index": i % 8,
+                "block_index": 0,
+                "role": "assistant",
+                "message_timestamp": base + timedelta(seconds=i),
+                "fence_language": "python",
+                "language": "python",
+                "language_source": "fence",
+                "functions": [fn],
+                "classes": [],
+                "imports": [module],
+                "code": (
+                    f"import {module}\n\n"
+                    f"def {fn}(self, {arg}):\n"
+                    f"    result = {helper}({arg}, retries=3)\n"
+                    f"    if result is None:\n"
+                    f"        raise ValueError('{attr} missing')\n"
+                    f"    return result.{attr}\n"
+                ),
+                "code_hash": f"{i:064x}",
+                "lines": 6,
+            })
+        table = pa.Table.from_pylist(rows, schema=CODE_BLOCK_SCHEMA)
+        pq.write_table(table, code_dir / f"project_project-{start // ROWS_PER_FILE}.parquet")
+
+
+def parquet_query(parquet_glob, where, params):
+    con = duckdb.connect(database=":memory:")
+    try:
+        return con.execute(
+            f"""
+            SELECT {RESULT_COLUMNS}, count(*) OVER() AS total_count
+            FROM parquet_scan(?)
+            WHERE {where}
+            ORDER BY conversation_updated_at DESC, message_timestamp DESC
+            LIMIT 20 OFFSET 0
+            """,
+            [parquet_glob, *params],
+        ).fetchall()
+    finally:
+        con.close()
+
+
+def timed(fn, repeats):
+    latencies = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies), result
+
+
+def benchmark_code_index(n_blocks, repeats):
+    """Benchmark: parquet scan vs CodeIndex probe."""
+    print("\n" + "="*70)
+    print(f"BENCHMARK: Code Symbol / Substring Lookup ({n_blocks:,} code blocks)")
+    print("="*70)
+
+    vocabulary = identifiers(max(1000, n_blocks // 10))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        code_dir = Path(tmpdir) / "data" / "code"
+        code_dir.mkdir(parents=True)
+        write_corpus(code_dir, n_blocks, vocabulary)
+        parquet_glob = str(code_dir / "*.parquet")
+
+        index = CodeIndex(Path(tmpdir) / "data" / "indices" / "code_index.duckdb")
+        start = time.perf_counter()
+        index.rebuild(code_dir)
+        build_seconds = time.perf_counter() - start
+        parquet_mb = sum(p.stat().st_size for p in code_dir.glob("*.parquet")) / 2**20
+        print(f"Parquet: {parquet_mb:,.0f} MB   index build: {build_seconds:.1f}s, "
+              f"{index.path.stat().st_size / 2**20:,.0f} MB")
+
+        name = vocabulary[len(vocabulary) // 2]
+        cases = [
+            (
+                f"function = {name}",
+                lambda: parquet_query(parquet_glob, "list_contains(functions, ?)", [name]),
+                lambda: index.search(code_dir, symbols={"functions": name}, limit=20, offset=0),
+            ),
+            (
+                f"substring '{name[:6]}'",
+                lambda: parquet_query(parquet_glob, "code ILIKE '%' || ? || '%'", [name[:6]]),
+                lambda: index.search(code_dir, terms=[name[:6]], limit=20, offset=0),
+            ),
+            (
+                "substring 'retries=3'",
+                lambda: parquet_query(parquet_glob, "code ILIKE '%' || ? || '%'", ["retries=3"]),
+                lambda: index.search(code_dir, terms=["retries=3"], limit=20, offset=0),
+            ),
+        ]
+
+        print(f"\n{'query':<32} {'OLD p50':>9} {'OLD p95':>9} {'NEW p50':>9} {'NEW p95':>9} {'hits':>9}")
+        for label, old, new in cases:
+            old_ms, old_rows = timed(old, repeats)
+            new_ms, new_rows = timed(new, repeats)
+            hits = int(new_rows[0][-1]) if new_rows else 0
+            assert hits == (int(old_rows[0][-1]) if old_rows else 0)
+            print(
+                f"{label[:32]:<32} {np.percentile(old_ms, 50):>7.1f}ms {np.percentile(old_ms, 95):>7.1f}ms "
+                f"{np.percentile(new_ms, 50):>7.1f}ms {np.percentile(new_ms, 95):>7.1f}ms {hits:>9,}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT CODE INDEX BENCHMARK")
+    print("="*70)
+
+    benchmark_code_index(args.blocks, args.repeats)
+
+    print("\n" + "="*70)
+    print("Selective lookups become index probes; a substring found in most")
+    print("blocks ('retries=3') still verifies every candidate, like a scan.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
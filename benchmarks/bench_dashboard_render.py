@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for /api/dashboards/{id}/render.
+
+OLD: one search per widget, run one after another
+NEW: render planner: one search per distinct (query, mode, filters), run
+     concurrently on the retrieval pool; rendered widgets cached until the
+     index generation changes
+
+Searches are DuckDB substring scans over a synthetic conversation table,
+which release the GIL like the real keyword path.
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from datetime import datetime
+
+import duckdb
+import numpy as np
+
+import searchat.core  # noqa: F401  (load searchat.config via core before searchat.api)
+from searchat.api.dashboard_render import WidgetRequest, clear_widget_caches, render_widgets
+from searchat.api.utils import search_result_to_response, sort_results
+from searchat.core.result_cache import ResultCache
+from searchat.models import SearchFilters, SearchMode, SearchResult, SearchResults
+
+
+class ScanEngine:
+    """Keyword search stand-in: substring scan + score sort in DuckDB."""
+
+    def __init__(self, n_conversations, n_projects=20, seed=11):
+        rng = random.Random(seed)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(2000)]
+        self.con = duckdb.connect(database=":memory:")
+        self.con.execute(
+            "CREATE TABLE conversations AS SELECT "
+            "'conv-' || i AS conversation_id, 'project-' || (i % ?) AS project_id, "
+            "'title ' || i AS title, (i % 50) + 1 AS message_count, "
+            "list_aggregate(list_transform(range(40), x -> ?[1 + ((i * 7919 + x * 104729) % ?)]), "
+            "'string_agg', ' ') AS full_text FROM range(?) t(i)",
+            [n_projects, words, len(words), n_conversations],
+        )
+        self.words = words
+        self.result_cache = ResultCache(max_entries=1000, max_bytes=64 * 1024 * 1024, ttl_seconds=3600)
+        self.searches = 0
+
+    def search(self, q, mode=SearchMode.KEYWORD, filters=None):
+        self.searches += 1
+        start = time.perf_counter()
+        where, params = "full_text LIKE ?", [f"%{q}%"]
+        if filters is not None and filters.project_ids:
+            where += " AND project_id = ?"
+            params.append(filters.project_ids[0])
+        rows = self.con.cursor().execute(
+            f"SELECT conversation_id, project_id, title, message_count FROM conversations "
+            f"WHERE {where} ORDER BY message_count DESC LIMIT 100",
+            params,
+        ).fetchall()
+        now = datetime(2026, 1, 1)
+        results = [
+            SearchResult(
+                conversation_id=cid, project_id=pid, title=title, created_at=now, updated_at=now,
+                message_count=count, file_path=f"/tmp/{cid}.jsonl", score=1.0, snippet=title,
+            )
+            for cid, pid, title, count in rows
+        ]
+        return SearchResults(
+            results=results, total_count=len(results),
+            search_time_ms=(time.perf_counter() - start) * 1000, mode_used="keyword",
+        )
+
+
+def dashboard(engine, n_widgets, n_distinct):
+    """``n_widgets`` widgets over ``n_distinct`` (query, filters) pairs."""
+    rng = random.Random(7)
+    searches = [
+        (rng.choice(engine.words[:50]), rng.choice([None, "project-1", "project-2"]))
+        for _ in range(n_distinct)
+    ]
+    requests = []
+    for i in range(n_widgets):
+        text, project = searches[i % n_distinct]
+        requests.append(WidgetRequest(
+            widget={"id": f"w-{i}"},
+            query={"id": f"q-{i}", "query": text},
+            mode=SearchMode.KEYWORD,
+            filters=SearchFilters(project_ids=[project] if project else None),
+            sort_by=rng.choice(["relevance", "messages"]),
+            limit=rng.choice([5, 10]),
+        ))
+    return requests
+
+
+def old_render(engine, requests):
+    """The previous route body: one search per widget, in order."""
+    widgets = []
+    for request in requests:
+        results = engine.search(request.text, mode=request.mode, filters=request.filters)
+        trimmed = sort_results(results.results, request.sort_by)[: request.limit]
+        widgets.append([search_result_to_response(r) for r in trimmed])
+    return widgets
+
+
+def benchmark_render(n_conversations, n_widgets, n_distinct, runs):
+    """Benchmark: serial per-widget searches vs the render planner."""
+    print("\n" + "="*70)
+    print(f"BENCHMARK: Dashboard Render ({n_widgets} widgets, {n_distinct} distinct searches, "
+          f"{n_conversations:,} conversations)")
+    print("="*70)
+
+    engine = ScanEngine(n_conversations)
+    requests = dashboard(engine, n_widgets, n_distinct)
+
+    old_ms, cold_ms, warm_ms = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        old_render(engine, requests)
+        old_ms.append((time.perf_counter() - start) * 1000)
+
+        engine.result_cache.invalidate()
+        clear_widget_caches()
+        before = engine.searches
+        start = time.perf_counter()
+        asyncio.run(render_widgets(engine, requests))
+        cold_ms.append((time.perf_counter() - start) * 1000)
+        cold_searches = engine.searches - before
+
+        start = time.perf_counter()
+        asyncio.run(render_widgets(engine, requests))
+        warm_ms.append((time.perf_counter() - start) * 1000)
+
+    print(f"\n{'strategy':<28} {'searches':>9} {'p50':>10} {'p95':>10}")
+    for label, searches, samples in (
+        ("OLD serial per widget", n_widgets, old_ms),
+        ("NEW planner (cold)", cold_searches, cold_ms),
+        ("NEW planner (cached)", 0, warm_ms),
+    ):
+        samples = np.array(samples)
+        print(f"{label:<28} {searches:>9} {np.percentile(samples, 50):>8.1f}ms "
+              f"{np.percentile(samples, 95):>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conversations", type=int, default=200_000)
+    parser.add_argument("--widgets", type=int, default=12)
+    parser.add_argument("--distinct", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT DASHBOARD RENDER BENCHMARK")
+    print("="*70)
+
+    benchmark_render(args.conversations, args.widgets, args.distinct, args.runs)
+
+    print("\n" + "="*70)
+    print("Cold renders gain from deduplication everywhere; concurrency adds")
+    print("up to min(distinct searches, retrieval workers)x on multi-core hosts.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
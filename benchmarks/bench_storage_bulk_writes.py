@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for UnifiedStorage ingest throughput (rows/sec).
+
+OLD: one cursor.execute per message / exchange / embedding / code block,
+     autocommit per statement (the pre-bulk UnifiedIndexer write path)
+NEW: upsert_exchanges / upsert_embeddings / insert_code_blocks /
+     insert_messages column batches, one transaction per session
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from searchat.storage.schema import EMBEDDING_DIM
+from searchat.storage.unified_storage import UnifiedStorage
+
+
+def build_sessions(n_sessions, messages_per_session, seed=42):
+    """Synthetic sessions: messages, exchanges, embeddings and code blocks."""
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    sessions = []
+    for s in range(n_sessions):
+        conversation_id = f"conv-{s}"
+        messages = [
+            {
+                "sequence": i,
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i} of session {s} " * 20,
+                "timestamp": now,
+                "has_code": i % 4 == 1,
+                "code_blocks": None,
+            }
+            for i in range(messages_per_session)
+        ]
+        exchanges = [
+            {
+                "exchange_id": f"{conversation_id}-x{i}",
+                "conversation_id": conversation_id,
+                "project_id": "bench",
+                "ply_start": i,
+                "ply_end": i + 1,
+                "exchange_text": messages[i]["content"] + messages[i + 1]["content"],
+                "created_at": now,
+            }
+            for i in range(0, messages_per_session - 1, 2)
+        ]
+        embeddings = rng.standard_normal((len(exchanges), EMBEDDING_DIM)).astype(np.float32)
+        code_blocks = [
+            {
+                "conversation_id": conversation_id,
+                "project_id": "bench",
+                "message_index": i,
+                "block_index": 0,
+                "code": f"def f{i}():\n    return {i}\n",
+                "code_hash": f"{conversation_id}-{i}",
+                "lines": 2,
+                "language": "python",
+                "functions": [f"f{i}"],
+            }
+            for i in range(1, messages_per_session, 4)
+        ]
+        sessions.append((conversation_id, messages, exchanges, embeddings, code_blocks))
+    return sessions
+
+
+def count_rows(sessions):
+    return sum(
+        len(messages) + 2 * len(exchanges) + len(code_blocks)
+        for _, messages, exchanges, _, code_blocks in sessions
+    )
+
+
+def write_per_row(storage, sessions):
+    """Pre-bulk write path: one statement per row, autocommit."""
+    cur = storage._write_cursor()
+    for conversation_id, messages, exchanges, embeddings, code_blocks in sessions:
+        cur.execute("DELETE FROM messages WHERE conversation_id = ?", [conversation_id])
+        for msg in messages:
+            cur.execute(
+                "INSERT INTO messages "
+                "(conversation_id, sequence, role, content, timestamp, "
+                "has_code, code_blocks) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    conversation_id, msg["sequence"], msg["role"], msg["content"],
+                    msg["timestamp"], msg["has_code"],
+                    json.dumps(msg["code_blocks"]) if msg["code_blocks"] else None,
+                ],
+            )
+        for exc in exchanges:
+            storage.upsert_exchange(**exc)
+        for exc, vec in zip(exchanges, embeddings):
+            storage.upsert_embedding(exc["exchange_id"], vec.tolist())
+        for block in code_blocks:
+            storage.insert_code_block(**block)
+
+
+def write_bulk(storage, sessions):
+    """Bulk write path: column batches, one transaction per session."""
+    for conversation_id, messages, exchanges, embeddings, code_blocks in sessions:
+        with storage.transaction():
+            storage.insert_messages(conversation_id, messages)
+            storage.upsert_exchanges(exchanges)
+            storage.upsert_embeddings([exc["exchange_id"] for exc in exchanges], embeddings)
+            storage.insert_code_blocks(code_blocks)
+
+
+def time_writes(write, sessions):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = UnifiedStorage(Path(tmpdir) / "bench.duckdb")
+        try:
+            start = time.perf_counter()
+            write(storage, sessions)
+            elapsed = time.perf_counter() - start
+            counts = storage.get_row_counts()
+        finally:
+            storage.close()
+    return elapsed, counts
+
+
+def benchmark_bulk_writes(n_sessions, messages_per_session):
+    """Benchmark: per-row autocommit inserts vs batched transactional inserts."""
+    print("\n" + "="*70)
+    print("BENCHMARK: UnifiedStorage Ingest (per-row vs bulk + transaction)")
+    print("="*70)
+
+    sessions = build_sessions(n_sessions, messages_per_session)
+    total_rows = count_rows(sessions)
+
+    old_time, old_counts = time_writes(write_per_row, sessions)
+    new_time, new_counts = time_writes(write_bulk, sessions)
+    assert old_counts == new_counts, (old_counts, new_counts)
+
+    print(f"Sessions: {n_sessions:,} x {messages_per_session} messages")
+    print(f"Rows written: {total_rows:,} "
+          f"(messages {new_counts['messages']:,}, exchanges {new_counts['exchanges']:,}, "
+          f"embeddings {new_counts['verbatim_embeddings']:,}, "
+          f"code blocks {new_counts['code_blocks']:,})")
+    print(f"\nOLD (per-row execute):     {old_time:.2f}s  {total_rows/old_time:,.0f} rows/sec")
+    print(f"NEW (bulk + transaction):  {new_time:.2f}s  {total_rows/new_time:,.0f} rows/sec")
+    print(f"\nSpeedup: {old_time/new_time:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=40)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT STORAGE INGEST BENCHMARK")
+    print("="*70)
+
+    benchmark_bulk_writes(args.sessions, args.messages)
+
+    print("\n" + "="*70)
+    print("Embedding time is excluded; vectors are pre-generated.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for /api/search/suggestions.
+
+OLD: per request, tokenize the 1000 most recent titles, build words and
+     bigram/trigram phrases and rank matches in Python (SQL fetch not timed)
+NEW: SuggestionIndex over every title: binary search over sorted keys,
+     precomputed top suggestions for heavy prefixes
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import searchat.core  # noqa: F401  (load searchat.config via core before searchat.services)
+from searchat.services.suggestion_index import SuggestionIndex
+
+OLD_TITLE_LIMIT = 1000
+
+
+class TitleStore:
+    def __init__(self, titles):
+        self.titles = titles
+
+    def list_conversation_titles(self, project_ids=None):
+        return [row for row in self.titles if project_ids is None or row[0] in project_ids]
+
+
+def synthetic_titles(n_conversations, n_projects=50, vocabulary_size=20_000, seed=3):
+    """Titles of 3-8 words drawn from a Zipf-distributed vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(vocabulary_size)
+    ]
+    weights = 1 / np.arange(1, vocabulary_size + 1)
+    picks = np.random.default_rng(seed).choice(
+        vocabulary_size, size=(n_conversations, 8), p=weights / weights.sum(),
+    )
+    return [
+        (f"project-{i % n_projects}", " ".join(vocabulary[j] for j in row[: rng.randint(3, 8)]).title())
+        for i, row in enumerate(picks)
+    ]
+
+
+def old_suggest(titles, q, limit):
+    """The previous per-request implementation, minus the SQL fetch."""
+    suggestions = set()
+    q_lower = q.lower()
+    for title in titles:
+        title_lower = title.lower()
+        if q_lower in title_lower:
+            suggestions.add(title)
+        words = title.split()
+        for word in words:
+            clean_word = ''.join(c for c in word if c.isalnum() or c in ['-', '_'])
+            if len(clean_word) >= 3 and clean_word.lower().startswith(q_lower):
+                suggestions.add(clean_word)
+        for i in range(len(words) - 1):
+            phrase = ' '.join(words[i:i + 2])
+            if phrase.lower().startswith(q_lower) or q_lower in phrase.lower():
+                suggestions.add(phrase)
+            if i < len(words) - 2:
+                phrase = ' '.join(words[i:i + 3])
+                if phrase.lower().startswith(q_lower) or q_lower in phrase.lower():
+                    suggestions.add(phrase)
+    return sorted(suggestions, key=lambda s: (not s.lower().startswith(q_lower), len(s), s.lower()))[:limit]
+
+
+def timed(fn, queries):
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies)
+
+
+def benchmark_suggestions(n_conversations, n_queries, max_entries):
+    """Benchmark: per-request title scan vs prefix index."""
+    print("\n" + "="*70)
+    print(f"BENCHMARK: Search Suggestions ({n_conversations:,} conversations)")
+    print("="*70)
+
+    titles = synthetic_titles(n_conversations)
+    recent = [title for _, title in titles[-OLD_TITLE_LIMIT:]]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index = SuggestionIndex(TitleStore(titles), Path(tmpdir), max_entries=max_entries)
+        start = time.perf_counter()
+        index.suggest("a")
+        build_seconds = time.perf_counter() - start
+        print(f"Index build: {build_seconds:.2f}s, {index.size:,} entries (cap {max_entries:,})")
+
+        rng = random.Random(5)
+        words = [word for _, title in rng.sample(titles, min(n_queries, len(titles))) for word in title.split()]
+        print(f"\n{'prefix length':<16} {'OLD p50':>9} {'OLD p95':>9} {'NEW p50':>9} {'NEW p95':>9}")
+        for length in (1, 2, 3, 4):
+            prefixes = [word[:length] for word in rng.sample(words, n_queries)]
+            old_ms = timed(lambda q: old_suggest(recent, q, 10), prefixes)
+            new_ms = timed(lambda q: index.suggest(q, 10), prefixes)
+            print(
+                f"{length:<16} {np.percentile(old_ms, 50):>7.2f}ms {np.percentile(old_ms, 95):>7.2f}ms "
+                f"{np.percentile(new_ms, 50):>7.3f}ms {np.percentile(new_ms, 95):>7.3f}ms"
+            )
+
+        index.invalidate({"project-0"})
+        start = time.perf_counter()
+        index.refresh()
+        print(f"\nIncremental refresh of 1 project (background): {time.perf_counter() - start:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conversations", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-entries", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT SEARCH SUGGESTIONS BENCHMARK")
+    print("="*70)
+
+    benchmark_suggestions(args.conversations, args.queries, args.max_entries)
+
+    print("\n" + "="*70)
+    print("OLD only ever saw the 1000 most recent titles; NEW covers the whole")
+    print("archive. Refreshes reload changed projects off the request path;")
+    print("lookups keep using the previous snapshot until the new one is ready.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
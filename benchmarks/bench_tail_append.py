@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for re-indexing a live Claude session that gained one turn.
+
+OLD: sha256 the whole file, ClaudeConnector.parse every line, re-chunk the
+     whole conversation (every chunk is re-embedded)
+NEW: ClaudeConnector.parse_tail from the stored TailCursor, re-chunk from the
+     last open chunk (only those chunks are re-embedded)
+"""
+
+import argparse
+import hashlib
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from searchat.config import Config
+from searchat.core.connectors import ClaudeConnector
+from searchat.core.indexer import ConversationIndexer
+
+
+def write_session(path, n_messages):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n_messages):
+            f.write(json.dumps({
+                "type": "user" if i % 2 == 0 else "assistant",
+                "timestamp": "2026-02-06T12:00:00",
+                "message": {"content": f"Message {i} " + "lorem ipsum " * 40},
+            }) + "\n")
+
+
+def append_turn(path):
+    with open(path, "a", encoding="utf-8") as f:
+        for role in ("user", "assistant"):
+            f.write(json.dumps({
+                "type": role,
+                "timestamp": "2026-02-06T13:00:00",
+                "message": {"content": f"new {role} turn " * 20},
+            }) + "\n")
+
+
+def benchmark_tail_append(n_messages, repeats):
+    """Benchmark: full reparse vs tail parse after one appended turn."""
+    print("\n" + "="*70)
+    print(f"BENCHMARK: Re-index After One Appended Turn ({n_messages:,} messages)")
+    print("="*70)
+
+    connector = ClaudeConnector()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        indexer = ConversationIndexer(Path(tmpdir) / "search", Config.load())
+        path = Path(tmpdir) / "proj" / "live.jsonl"
+        path.parent.mkdir()
+        write_session(path, n_messages)
+        record, cursor = connector.parse_with_cursor(path, 0)
+        chunks = indexer._chunk_by_messages(record.messages, record.title)
+        boundary = chunks[-1]["start_message_index"]
+        append_turn(path)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            hashlib.sha256(path.read_bytes()).hexdigest()
+            full = connector.parse(path, 0)
+            old_chunks = indexer._chunk_by_messages(full.messages, full.title)
+        old_time = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            tail = connector.parse_tail(path, cursor)
+            messages = record.messages + tail.messages
+            new_chunks = indexer._chunk_by_messages(messages, record.title, start=boundary)
+        new_time = (time.perf_counter() - start) / repeats
+
+    print(f"File size: {path.stat().st_size / 1024:,.0f} KB" if path.exists() else "")
+    print(f"\nOLD (full parse):  {old_time*1000:8.2f}ms  {len(old_chunks):,} chunks to embed")
+    print(f"NEW (tail parse):  {new_time*1000:8.2f}ms  {len(new_chunks):,} chunks to embed")
+    print(f"\nSpeedup: {old_time/new_time:.1f}x (parse + chunk), "
+          f"{len(old_chunks)/len(new_chunks):.0f}x fewer embeddings")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT TAIL-APPEND BENCHMARK")
+    print("="*70)
+
+    benchmark_tail_append(args.messages, args.repeats)
+
+    print("\n" + "="*70)
+    print("Embedding and Parquet/DuckDB writes are excluded; chunk counts show")
+    print("how many embeddings each path would compute.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
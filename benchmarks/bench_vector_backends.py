@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark script comparing the two semantic search vector backends.
+
+FAISS:  FAISS top-k -> VALUES join over metadata parquet + conversations parquet
+DuckDB: one statement over verbatim_embeddings (HNSW when VSS is loaded)
+        joined to exchanges and conversations in the persistent store
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import faiss
+import numpy as np
+import pandas as pd
+
+from searchat.core.unified_search import UnifiedSearchEngine
+from searchat.config import Config
+from searchat.config.constants import (
+    INDEX_FORMAT,
+    INDEX_FORMAT_VERSION,
+    INDEX_SCHEMA_VERSION,
+)
+from searchat.services.storage_contracts import IndexMetadata, write_index_metadata
+from searchat.storage.schema import EMBEDDING_DIM
+from searchat.storage.unified_storage import UnifiedStorage
+
+
+class FixedQueryEmbedder:
+    """Returns pre-generated query vectors in rotation (no model load)."""
+
+    def __init__(self, queries: np.ndarray):
+        self.queries = queries
+        self.position = 0
+
+    def encode(self, text):
+        vec = self.queries[self.position % len(self.queries)]
+        self.position += 1
+        return vec
+
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+def build_corpus(search_dir, n_conversations, exchanges_per_conversation, seed=42):
+    """Write the same synthetic corpus in FAISS/parquet and DuckDB layouts."""
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    n_vectors = n_conversations * exchanges_per_conversation
+    vectors = normalize(rng.standard_normal((n_vectors, EMBEDDING_DIM)))
+
+    conv_rows = []
+    meta_rows = []
+    exchange_rows = []
+    for c in range(n_conversations):
+        conversation_id = f"conv-{c}"
+        project_id = f"project-{c % 20}"
+        conv_rows.append({
+            "conversation_id": conversation_id,
+            "project_id": project_id,
+            "file_path": f"/path/to/{conversation_id}.jsonl",
+            "title": f"Conversation {c}",
+            "created_at": now,
+            "updated_at": now,
+            "message_count": exchanges_per_conversation * 2,
+            "full_text": " ".join(f"word{j}" for j in range(100)),
+            "embedding_id": c,
+            "file_hash": f"hash-{c}",
+            "indexed_at": now,
+        })
+        for x in range(exchanges_per_conversation):
+            vector_id = c * exchanges_per_conversation + x
+            text = f"Exchange {x} of conversation {c} " * 8
+            meta_rows.append({
+                "vector_id": vector_id,
+                "conversation_id": conversation_id,
+                "project_id": project_id,
+                "chunk_index": x,
+                "chunk_text": text,
+                "message_start_index": x * 2,
+                "message_end_index": x * 2 + 1,
+            })
+            exchange_rows.append((
+                f"{conversation_id}-x{x}", conversation_id, project_id,
+                x * 2, x * 2 + 1, text, now,
+            ))
+
+    # Legacy layout: conversations parquet + metadata parquet + FAISS + index metadata
+    conv_dir = search_dir / "data" / "conversations"
+    indices_dir = search_dir / "data" / "indices"
+    conv_dir.mkdir(parents=True, exist_ok=True)
+    indices_dir.mkdir(parents=True, exist_ok=True)
+    conv_df = pd.DataFrame(conv_rows)
+    conv_df.to_parquet(conv_dir / "project_bench.parquet", index=False)
+    pd.DataFrame(meta_rows).to_parquet(indices_dir / "embeddings.metadata.parquet", index=False)
+
+    index = faiss.IndexIDMap2(faiss.IndexFlatL2(EMBEDDING_DIM))
+    index.add_with_ids(vectors, np.arange(n_vectors, dtype=np.int64))
+    faiss.write_index(index, str(indices_dir / "embeddings.faiss"))
+
+    config = Config.load()
+    write_index_metadata(search_dir, IndexMetadata(
+        schema_version=INDEX_SCHEMA_VERSION,
+        index_format_version=INDEX_FORMAT_VERSION,
+        created_at=now.isoformat(),
+        embedding_model=config.embedding.model,
+        format=INDEX_FORMAT,
+        total_conversations=n_conversations,
+        total_chunks=n_vectors,
+    ))
+
+    # DuckDB layout: conversations + exchanges + verbatim_embeddings
+    storage = UnifiedStorage(search_dir / "data" / "searchat.duckdb")
+    con = storage.connection
+    con.register("conv_df", conv_df)
+    con.execute(
+        "INSERT INTO conversations (conversation_id, project_id, file_path, title, "
+        "created_at, updated_at, message_count, full_text, file_hash, indexed_at) "
+        "SELECT conversation_id, project_id, file_path, title, created_at, updated_at, "
+        "message_count, full_text, file_hash, indexed_at FROM conv_df"
+    )
+    con.unregister("conv_df")
+    con.executemany(
+        "INSERT INTO exchanges (exchange_id, conversation_id, project_id, ply_start, "
+        "ply_end, exchange_text, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        exchange_rows,
+    )
+    emb_df = pd.DataFrame({
+        "exchange_id": [row[0] for row in exchange_rows],
+        "embedding": list(vectors),
+    })
+    con.register("emb_df", emb_df)
+    con.execute(
+        f"INSERT INTO verbatim_embeddings SELECT exchange_id, "
+        f"embedding::FLOAT[{EMBEDDING_DIM}] FROM emb_df"
+    )
+    con.unregister("emb_df")
+    return storage, vectors, config
+
+
+def time_backend(engine, queries, n_iterations):
+    latencies = []
+    for _ in range(n_iterations):
+        for _ in range(len(queries)):
+            start = time.perf_counter()
+            engine._semantic_search("benchmark query", None)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies)
+
+
+def benchmark_vector_backends(n_conversations, exchanges_per_conversation, n_queries, n_iterations):
+    """Benchmark: FAISS + parquet join vs DuckDB HNSW single statement."""
+    print("\n" + "="*70)
+    print("BENCHMARK: Semantic Search Vector Backend (FAISS vs DuckDB HNSW)")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        search_dir = Path(tmpdir)
+        storage, vectors, config = build_corpus(
+            search_dir, n_conversations, exchanges_per_conversation,
+        )
+        rng = np.random.default_rng(7)
+        queries = normalize(
+            vectors[rng.integers(0, len(vectors), n_queries)]
+            + 0.05 * rng.standard_normal((n_queries, EMBEDDING_DIM))
+        )
+
+        config.storage.vector_backend = "faiss"
+        faiss_engine = UnifiedSearchEngine(search_dir, config)
+        faiss_engine.embedder = FixedQueryEmbedder(queries)
+        faiss_engine.ensure_faiss_loaded()
+        faiss_engine._semantic_search("warmup", None)
+
+        duck_config = Config.load()
+        duck_config.storage.vector_backend = "duckdb"
+        duck_engine = UnifiedSearchEngine(search_dir, duck_config, storage=storage)
+        duck_engine.embedder = FixedQueryEmbedder(queries)
+        duck_engine._semantic_search("warmup", None)
+
+        old = time_backend(faiss_engine, queries, n_iterations)
+        new = time_backend(duck_engine, queries, n_iterations)
+
+        print(f"Corpus: {n_conversations:,} conversations, "
+              f"{len(vectors):,} vectors ({EMBEDDING_DIM}d)")
+        print(f"Queries: {n_queries} x {n_iterations} iterations")
+        print(f"DuckDB VSS (HNSW) loaded: {storage._vss_available}")
+        print(f"\nOLD (FAISS + parquet join):  p50 {np.percentile(old, 50):.2f}ms  "
+              f"p95 {np.percentile(old, 95):.2f}ms")
+        print(f"NEW (DuckDB single query):   p50 {np.percentile(new, 50):.2f}ms  "
+              f"p95 {np.percentile(new, 95):.2f}ms")
+        print(f"\nSpeedup (p50): {np.percentile(old, 50)/np.percentile(new, 50):.1f}x")
+
+        faiss_engine.close()
+        duck_engine.close()
+        storage.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conversations", type=int, default=2000)
+    parser.add_argument("--exchanges", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SEARCHAT VECTOR BACKEND BENCHMARK")
+    print("="*70)
+
+    benchmark_vector_backends(
+        args.conversations, args.exchanges, args.queries, args.iterations,
+    )
+
+    print("\n" + "="*70)
+    print("Without the VSS extension DuckDB falls back to a sequential scan;")
+    print("set [storage].vector_backend = \"duckdb\" once HNSW is available.")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
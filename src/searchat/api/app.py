@@ -33,6 +33,8 @@ from searchat.api.dependencies import (
 )
 import searchat.api.dependencies as deps
 from searchat.api import state as api_state
+from searchat.api.executors import configure_executors, shutdown_executors
+from searchat.api.exports import configure_exports, shutdown_exports
 from searchat.api.readiness import get_readiness
 from searchat.api.warmup import invalidate_search_index, start_background_warmup
 from searchat.api.templates import templates
@@ -100,6 +102,9 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     # --- startup ---
     started = time.perf_counter()
     initialize_services()
+    # Size the thread pools before warmup can build them with defaults.
+    configure_executors(get_config())
+    configure_exports(get_config())
     start_background_warmup()
 
     config = get_config()
@@ -123,6 +128,9 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     if watcher:
         watcher.stop()
         set_watcher(None)
+    shutdown_executors()
+    shutdown_exports()
+    deps.close_analytics_service()
 
 
 # Create FastAPI app
@@ -226,7 +234,7 @@ def on_new_conversations(file_paths: list[str]) -> None:
 
         updated_conversations = getattr(stats, "updated_conversations", 0)
         if stats.new_conversations > 0 or updated_conversations > 0:
-            invalidate_search_index()
+            invalidate_search_index(getattr(stats, "changed_project_ids", None))
 
             api_state.watcher_stats["indexed_count"] += stats.new_conversations + updated_conversations
             api_state.watcher_stats["last_update"] = datetime.now().isoformat()
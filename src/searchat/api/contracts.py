@@ -1,6 +1,7 @@
 """Stable response contract serializers for API routes."""
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
 from searchat.api.models import SearchResultResponse
@@ -145,6 +146,126 @@ def serialize_status_payload(
     }
 
 
+def serialize_status_keyword_index_payload(status: Any | None) -> dict[str, Any]:
+    if status is None:
+        return {"available": False, "keyword_index": None}
+    last_sync = status.last_sync
+    return {
+        "available": True,
+        "keyword_index": {
+            "path": status.path,
+            "persistent": status.persistent,
+            "stemmer": status.stemmer,
+            "documents": status.documents,
+            "postings": status.postings,
+            "total_tokens_processed": status.total_tokens_processed,
+            "last_sync": None if last_sync is None else {
+                "added": last_sync.added,
+                "updated": last_sync.updated,
+                "removed": last_sync.removed,
+                "tokens_processed": last_sync.tokens_processed,
+                "elapsed_ms": round(last_sync.elapsed_ms, 2),
+                "full_rebuild": last_sync.full_rebuild,
+            },
+        },
+    }
+
+
+def serialize_status_result_cache_payload(stats: Any | None) -> dict[str, Any]:
+    if stats is None:
+        return {"available": False, "result_cache": None}
+    return {
+        "available": True,
+        "result_cache": {
+            "entries": stats.entries,
+            "bytes": stats.bytes,
+            "max_entries": stats.max_entries,
+            "max_bytes": stats.max_bytes,
+            "ttl_seconds": stats.ttl_seconds,
+            "generation": stats.generation,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_rate": round(stats.hit_rate, 4),
+            "evictions": stats.evictions,
+            "invalidations": stats.invalidations,
+        },
+    }
+
+
+def serialize_status_embedding_cache_payload(caches: list[Any]) -> dict[str, Any]:
+    return {
+        "enabled": bool(caches),
+        "caches": [
+            {
+                "path": cache.path,
+                "persistent": cache.persistent,
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "hit_rate": round(cache.hit_rate, 4),
+                "memory_entries": cache.memory_entries,
+                "persistent_entries": cache.persistent_entries,
+                "evictions": cache.evictions,
+            }
+            for cache in caches
+        ],
+    }
+
+
+def serialize_status_profile_payload(
+    *,
+    enabled: bool,
+    stages: list[Any],
+    traces: list[Any],
+) -> dict[str, Any]:
+    return {
+        "enabled": enabled,
+        "stages": [
+            {
+                "stage": stage.stage,
+                "count": stage.count,
+                "mean_ms": round(stage.mean_ms, 3),
+                "p50_ms": round(stage.p50_ms, 3),
+                "p95_ms": round(stage.p95_ms, 3),
+                "p99_ms": round(stage.p99_ms, 3),
+                "max_ms": round(stage.max_ms, 3),
+            }
+            for stage in stages
+        ],
+        "recent": [
+            {
+                "kind": trace.kind,
+                "label": trace.label,
+                "started_at": datetime.fromtimestamp(trace.started_at, timezone.utc).isoformat(),
+                "total_ms": round(trace.total_ms, 3),
+                "stages": [
+                    {"stage": name, "ms": round(elapsed_ms, 3)}
+                    for name, elapsed_ms in trace.stages
+                ],
+            }
+            for trace in traces
+        ],
+    }
+
+
+def serialize_status_executors_payload(executors: list[Any]) -> dict[str, Any]:
+    return {
+        "executors": [
+            {
+                "name": executor.name,
+                "workers": executor.workers,
+                "queue_limit": executor.queue_limit,
+                "running": executor.running,
+                "queued": executor.queued,
+                "peak_depth": executor.peak_depth,
+                "completed": executor.completed,
+                "rejected": executor.rejected,
+                "avg_job_ms": round(executor.avg_job_ms, 3),
+            }
+            for executor in executors
+        ],
+    }
+
+
 def serialize_status_features_payload(
     *,
     analytics_enabled: bool,
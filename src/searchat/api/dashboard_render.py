@@ -0,0 +1,220 @@
+"""Render planner behind ``GET /api/dashboards/{dashboard_id}/render``.
+
+Widgets often show the same saved query with a different limit or sort
+order. Rather than one full search per widget, the planner groups widgets
+by ``(query, mode, filters)``, runs each distinct search once on the
+retrieval pool (at most one per retrieval worker at a time, so a large
+dashboard never saturates the pool on its own) and renders every widget in
+a group from the shared results.
+
+Query text used by several semantic or hybrid searches (same text,
+different filters) is embedded once, up front: into the engine's
+embedding cache when one is configured, otherwise pinned on the engine
+for the duration of the render. Rendered widgets are cached per engine, keyed on the
+result-cache generation, so they are reused until the index changes.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException
+
+from searchat.api.executors import RETRIEVAL, get_executor, run_retrieval
+from searchat.api.utils import search_result_to_response, sort_results
+from searchat.core.result_cache import result_cache_key
+from searchat.models import SearchFilters, SearchMode, SearchResults
+
+log = logging.getLogger(__name__)
+
+# Rendered widgets kept per engine; entries from older generations age out.
+WIDGET_CACHE_ENTRIES = 256
+
+_SEMANTIC_MODES = (SearchMode.HYBRID, SearchMode.SEMANTIC)
+
+
+@dataclass(frozen=True)
+class WidgetRequest:
+    """One widget with its saved query resolved and validated."""
+
+    widget: dict[str, Any]
+    query: dict[str, Any]
+    mode: SearchMode
+    filters: SearchFilters
+    sort_by: str
+    limit: int
+
+    @property
+    def text(self) -> str:
+        return self.query["query"]
+
+    @property
+    def search_key(self) -> str:
+        return result_cache_key(self.text, self.mode.value, self.filters)
+
+
+class _WidgetCache:
+    """Small LRU of rendered widget bodies, honouring the result cache TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple, body: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Keyed on the engine's result cache, which owns the index generation.
+_WIDGET_CACHES: weakref.WeakKeyDictionary[Any, _WidgetCache] = weakref.WeakKeyDictionary()
+_WIDGET_CACHES_LOCK = threading.Lock()
+
+
+def _widget_cache(search_engine) -> tuple[_WidgetCache, int] | None:
+    result_cache = getattr(search_engine, "result_cache", None)
+    generation = getattr(result_cache, "generation", None)
+    if isinstance(generation, bool) or not isinstance(generation, int):
+        return None
+    if not getattr(result_cache, "max_entries", 0):
+        return None
+    with _WIDGET_CACHES_LOCK:
+        cache = _WIDGET_CACHES.get(result_cache)
+        if cache is None:
+            ttl_seconds = getattr(result_cache, "ttl_seconds", 0)
+            cache = _WidgetCache(WIDGET_CACHE_ENTRIES, ttl_seconds)
+            _WIDGET_CACHES[result_cache] = cache
+    return cache, generation
+
+
+def clear_widget_caches() -> None:
+    with _WIDGET_CACHES_LOCK:
+        _WIDGET_CACHES.clear()
+
+
+async def render_widgets(search_engine, requests: Sequence[WidgetRequest]) -> list[dict[str, Any]]:
+    """Render ``requests`` in order, one search per distinct query."""
+    start = time.perf_counter()
+    cached = _widget_cache(search_engine)
+    bodies: list[dict[str, Any]] = [{}] * len(requests)
+    hits = [False] * len(requests)
+    render_ms = [0.0] * len(requests)
+
+    groups: dict[str, list[int]] = {}
+    for i, request in enumerate(requests):
+        body = cached[0].get(_body_key(request, cached[1])) if cached is not None else None
+        if body is not None:
+            bodies[i], hits[i] = body, True
+            render_ms[i] = (time.perf_counter() - start) * 1000
+        else:
+            groups.setdefault(request.search_key, []).append(i)
+
+    if groups:
+        leaders = [requests[indexes[0]] for indexes in groups.values()]
+        shared = await _share_query_embeddings(search_engine, leaders)
+        slots = asyncio.Semaphore(get_executor(RETRIEVAL).workers)
+
+        async def run_group(indexes: list[int]) -> None:
+            leader = requests[indexes[0]]
+            async with slots:
+                results = await run_retrieval(
+                    search_engine.search, leader.text, mode=leader.mode, filters=leader.filters,
+                )
+            for i in indexes:
+                bodies[i] = _render_body(requests[i], results)
+                if cached is not None:
+                    cached[0].put(_body_key(requests[i], cached[1]), bodies[i])
+                render_ms[i] = (time.perf_counter() - start) * 1000
+
+        try:
+            await asyncio.gather(*(run_group(indexes) for indexes in groups.values()))
+        finally:
+            if shared:
+                search_engine.release_query_embeddings(shared)
+
+    return [
+        _widget_payload(request, body, render_ms=render_ms[i], cached=hits[i])
+        for i, (request, body) in enumerate(zip(requests, bodies))
+    ]
+
+
+async def _share_query_embeddings(
+    search_engine, searches: Sequence[WidgetRequest],
+) -> list[str]:
+    """Embed text shared by several semantic searches once, before they run.
+
+    Returns the warmed texts, which the caller releases once its searches
+    are done; empty when nothing was warmed.
+    """
+    warm = getattr(search_engine, "warm_query_embeddings", None)
+    release = getattr(search_engine, "release_query_embeddings", None)
+    counts = Counter(request.text for request in searches if request.mode in _SEMANTIC_MODES)
+    shared = [text for text, count in counts.items() if count > 1]
+    if warm is None or release is None or not shared:
+        return []
+    try:
+        await run_retrieval(warm, shared)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        # Each search encodes (or falls back) on its own.
+        log.debug("Skipping shared dashboard query embeddings: %s", exc)
+        return []
+    return shared
+
+
+def _body_key(request: WidgetRequest, generation: int) -> tuple:
+    return (generation, request.search_key, request.sort_by, request.limit)
+
+
+def _render_body(request: WidgetRequest, results: SearchResults) -> dict[str, Any]:
+    trimmed = sort_results(results.results, request.sort_by)[: request.limit]
+    return {
+        "results": [search_result_to_response(r) for r in trimmed],
+        "total": results.total_count,
+        "search_time_ms": results.search_time_ms,
+    }
+
+
+def _widget_payload(
+    request: WidgetRequest,
+    body: dict[str, Any],
+    *,
+    render_ms: float,
+    cached: bool,
+) -> dict[str, Any]:
+    return {
+        "id": request.widget.get("id"),
+        "title": request.widget.get("title") or request.query.get("name") or "Saved Query",
+        "query_id": request.query.get("id"),
+        "query": request.query.get("query"),
+        "mode": request.mode.value,
+        "sort_by": request.sort_by,
+        "results": body["results"],
+        "total": body["total"],
+        "search_time_ms": body["search_time_ms"],
+        "render_ms": render_ms,
+        "cached": cached,
+    }
@@ -40,6 +40,7 @@ _duckdb_store = None
 _expertise_store = None
 _knowledge_graph_store = None
 _palace_query = None
+_suggestion_index = None
 
 # Snapshot-scoped caches (keyed by dataset root, i.e. backup directory path).
 _duckdb_store_by_dir: dict[str, "StorageBackend"] = {}
@@ -61,7 +62,8 @@ def initialize_services():
         _analytics_service, \
         _duckdb_store, \
         _expertise_store, \
-        _knowledge_graph_store
+        _knowledge_graph_store, \
+        _suggestion_index
 
     readiness = get_readiness()
     readiness.set_component("services", "loading")
@@ -93,6 +95,7 @@ def initialize_services():
             _knowledge_graph_store = KnowledgeGraphStore(_search_dir)
         _bookmarks_service = BookmarksService(_config)
         _analytics_service = SearchAnalyticsService(_config)
+        _suggestion_index = None
         _saved_queries_service = SavedQueriesService(_config)
         _dashboards_service = DashboardsService(_config)
         readiness.set_component("services", "ready")
@@ -256,7 +259,18 @@ def get_or_create_search_engine_for(search_dir: Path) -> "RetrievalBackend":
 
     from searchat.services.retrieval_service import build_retrieval_service
 
-    engine = build_retrieval_service(search_dir, config=get_config())
+    config = get_config()
+    if _uses_duckdb_vectors(config):
+        engine = build_retrieval_service(
+            search_dir,
+            config=config,
+            storage=get_duckdb_store_for(search_dir),
+            **_pooled_model_providers(),
+        )
+    else:
+        engine = build_retrieval_service(
+            search_dir, config=config, **_pooled_model_providers(),
+        )
     _search_engine_by_dir[key] = engine
     return engine
 
@@ -346,6 +360,30 @@ def get_palace_query():
         return _palace_query
 
 
+def get_suggestion_index():
+    """Get search suggestion index singleton (lazy-initialized, built on first lookup)."""
+    global _suggestion_index
+    if _suggestion_index is not None:
+        return _suggestion_index
+
+    config = get_config()
+    store = get_duckdb_store()
+    search_dir = get_search_dir()
+    with _service_lock:
+        if _suggestion_index is not None:
+            return _suggestion_index
+
+        from searchat.services.suggestion_index import SuggestionIndex
+
+        _suggestion_index = SuggestionIndex(
+            store,
+            search_dir,
+            analytics=_analytics_service,
+            max_entries=config.performance.suggestion_index_max_entries,
+        )
+        return _suggestion_index
+
+
 def get_bookmarks_service():
     """Get bookmarks service singleton."""
     if _bookmarks_service is None:
@@ -382,6 +420,18 @@ def get_analytics_service():
     return _analytics_service
 
 
+def close_analytics_service() -> None:
+    """Flush buffered search analytics and stop its writer (app shutdown)."""
+    service = _analytics_service
+    close = getattr(service, "close", None)
+    if not callable(close):
+        return
+    try:
+        close()
+    except Exception as exc:
+        logger.warning("Failed to flush search analytics: %s", exc)
+
+
 def get_watcher():
     """Get watcher singleton (may be None if not started)."""
     return _watcher
@@ -393,6 +443,23 @@ def set_watcher(watcher):
     _watcher = watcher
 
 
+def _uses_duckdb_vectors(config: Config) -> bool:
+    """True when semantic search should read vectors from the shared DuckDB store."""
+    storage_config = getattr(config, "storage", None)
+    return getattr(storage_config, "vector_backend", "faiss") == "duckdb"
+
+
+def _pooled_model_providers() -> dict:
+    """Engine kwargs: the shared batching embedder and a pooled reranker."""
+    from searchat.api.executors import pooled_reranking_service
+    from searchat.services.semantic_model_service import shared_embedding_service
+
+    return {
+        "embedding_provider": shared_embedding_service,
+        "reranking_provider": pooled_reranking_service,
+    }
+
+
 def _ensure_search_engine():
     """Create and initialize search engine (blocking)."""
     global _search_engine
@@ -409,7 +476,17 @@ def _ensure_search_engine():
         try:
             from searchat.services.retrieval_service import build_retrieval_service
 
-            _search_engine = build_retrieval_service(_search_dir, config=_config)
+            if _uses_duckdb_vectors(_config):
+                _search_engine = build_retrieval_service(
+                    _search_dir,
+                    config=_config,
+                    storage=get_duckdb_store(),
+                    **_pooled_model_providers(),
+                )
+            else:
+                _search_engine = build_retrieval_service(
+                    _search_dir, config=_config, **_pooled_model_providers(),
+                )
             readiness.set_component("search_engine", "ready")
         except Exception as e:
             readiness.set_component("search_engine", "error", error=str(e))
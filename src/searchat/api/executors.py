@@ -0,0 +1,290 @@
+"""Bounded thread pools for the blocking work behind async API routes.
+
+The search routes are ``async def``, but the work behind them (DuckDB
+queries, FAISS lookups, sentence-transformer encoding, cross-encoder
+reranking) is synchronous. Run inline, one slow semantic query stalls
+every request on the event loop, health checks included. Routes hand that
+work to two pools instead:
+
+  - ``retrieval`` runs whole search / hydration calls;
+  - ``inference`` runs model calls: reranker ``predict`` (reached from
+    retrieval threads through :class:`PooledModel`) and LLM highlight
+    extraction. Query embeddings go through the shared batching embedder,
+    which already runs one forward pass at a time.
+
+Each pool admits at most ``workers + queue_limit`` jobs. Beyond that,
+:meth:`BoundedExecutor.submit` raises :class:`ExecutorSaturated` and
+:func:`run_retrieval` / :func:`run_inference` turn it into ``503`` with a
+``Retry-After`` header. ``/api/status/executors`` reports depth, peak depth
+and rejection counts per pool.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+
+from searchat.config.constants import (
+    DEFAULT_EXECUTOR_QUEUE_LIMIT,
+    DEFAULT_INFERENCE_WORKERS,
+    DEFAULT_RETRIEVAL_WORKERS,
+)
+from searchat.contracts.errors import server_busy_message
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRIEVAL = "retrieval"
+INFERENCE = "inference"
+
+# Retry-After bounds (seconds) derived from queue depth and recent job time.
+_MIN_RETRY_AFTER = 1
+_MAX_RETRY_AFTER = 30
+# Weight of the newest sample in the job-duration moving average.
+_DURATION_ALPHA = 0.2
+
+_worker = threading.local()
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time counters for one pool."""
+
+    name: str
+    workers: int
+    queue_limit: int
+    running: int
+    queued: int
+    peak_depth: int
+    completed: int
+    rejected: int
+    avg_job_ms: float
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised when a pool already holds ``workers + queue_limit`` jobs."""
+
+    def __init__(self, name: str, retry_after: int) -> None:
+        super().__init__(f"{name} executor saturated")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def _mark_worker(name: str) -> None:
+    _worker.pool = name
+
+
+class BoundedExecutor:
+    """Thread pool with admission control and queue-depth counters."""
+
+    def __init__(self, name: str, *, workers: int, queue_limit: int) -> None:
+        self.name = name
+        self.workers = max(1, int(workers))
+        self.queue_limit = max(0, int(queue_limit))
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix=f"searchat-{name}",
+            initializer=_mark_worker,
+            initargs=(name,),
+        )
+        self._lock = threading.Lock()
+        self._pending = 0  # admitted and not yet finished (running + queued)
+        self._running = 0
+        self._peak_depth = 0
+        self._completed = 0
+        self._rejected = 0
+        self._avg_job_ms = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_limit
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Queue ``fn`` or raise :class:`ExecutorSaturated` when the pool is full."""
+        with self._lock:
+            if self._pending >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturated(self.name, self._retry_after_locked())
+            self._admit_locked()
+        return self._submit_admitted(fn, args, kwargs)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await ``fn`` on this pool; cancelling the caller drops a queued job."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` on this pool from another worker thread and wait for it.
+
+        Callers here were already admitted by another pool, so this waits for
+        a slot instead of rejecting. Calls made from this pool's own threads
+        run inline rather than deadlocking on a free worker.
+        """
+        if getattr(_worker, "pool", None) == self.name:
+            return fn(*args, **kwargs)
+        with self._lock:
+            self._admit_locked()
+        return self._submit_admitted(fn, args, kwargs).result()
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                name=self.name,
+                workers=self.workers,
+                queue_limit=self.queue_limit,
+                running=self._running,
+                queued=self._pending - self._running,
+                peak_depth=self._peak_depth,
+                completed=self._completed,
+                rejected=self._rejected,
+                avg_job_ms=self._avg_job_ms,
+            )
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _admit_locked(self) -> None:
+        self._pending += 1
+        self._peak_depth = max(self._peak_depth, self._pending)
+
+    def _retry_after_locked(self) -> int:
+        # Time for the current backlog to drain at the recent per-job rate.
+        backlog_s = self._avg_job_ms * self._pending / self.workers / 1000
+        return min(_MAX_RETRY_AFTER, max(_MIN_RETRY_AFTER, math.ceil(backlog_s)))
+
+    def _submit_admitted(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> Future[T]:
+        def job() -> T:
+            with self._lock:
+                self._running += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._pending -= 1
+                    self._running -= 1
+                    self._completed += 1
+                    if self._completed == 1:
+                        self._avg_job_ms = elapsed_ms
+                    else:
+                        self._avg_job_ms += _DURATION_ALPHA * (elapsed_ms - self._avg_job_ms)
+
+        try:
+            future = self._pool.submit(job)
+        except RuntimeError:
+            self._release()
+            raise
+        # ``job`` frees its slot before the result is published; a job
+        # cancelled while still queued never runs, so free it here instead.
+        future.add_done_callback(lambda f: self._release() if f.cancelled() else None)
+        return future
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+class PooledModel:
+    """Model proxy whose ``encode`` / ``predict`` run on the inference pool."""
+
+    def __init__(self, model: Any, executor: BoundedExecutor) -> None:
+        self._model = model
+        self._executor = executor
+
+    def encode(self, *args: Any, **kwargs: Any) -> Any:
+        return self._executor.call(self._model.encode, *args, **kwargs)
+
+    def predict(self, *args: Any, **kwargs: Any) -> Any:
+        return self._executor.call(self._model.predict, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+
+_EXECUTORS: dict[str, BoundedExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+_SIZES: dict[str, tuple[int, int]] = {
+    RETRIEVAL: (DEFAULT_RETRIEVAL_WORKERS, DEFAULT_EXECUTOR_QUEUE_LIMIT),
+    INFERENCE: (DEFAULT_INFERENCE_WORKERS, DEFAULT_EXECUTOR_QUEUE_LIMIT),
+}
+
+
+def configure_executors(config) -> None:
+    """Size the pools from ``[performance]``; takes effect for pools not yet built."""
+    performance = getattr(config, "performance", None)
+    queue_limit = getattr(performance, "executor_queue_limit", DEFAULT_EXECUTOR_QUEUE_LIMIT)
+    with _EXECUTORS_LOCK:
+        _SIZES[RETRIEVAL] = (
+            getattr(performance, "retrieval_workers", DEFAULT_RETRIEVAL_WORKERS),
+            queue_limit,
+        )
+        _SIZES[INFERENCE] = (
+            getattr(performance, "inference_workers", DEFAULT_INFERENCE_WORKERS),
+            queue_limit,
+        )
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Process-wide pool ``name`` (``retrieval`` or ``inference``), built on first use."""
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(name)
+        if executor is None:
+            workers, queue_limit = _SIZES[name]
+            executor = BoundedExecutor(name, workers=workers, queue_limit=queue_limit)
+            _EXECUTORS[name] = executor
+        return executor
+
+
+def executor_stats() -> list[ExecutorStats]:
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+    return [executor.stats() for executor in executors]
+
+
+def shutdown_executors() -> None:
+    """Stop every pool; queued jobs are cancelled, running ones finish."""
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        try:
+            executor.shutdown()
+        except Exception as exc:  # pragma: no cover - best effort at shutdown
+            log.warning("Failed to shut down %s executor: %s", executor.name, exc)
+
+
+async def _run_on(name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    try:
+        return await get_executor(name).run(fn, *args, **kwargs)
+    except ExecutorSaturated as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=server_busy_message(),
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+
+
+async def run_retrieval(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await blocking search/storage work; ``503`` + ``Retry-After`` when saturated."""
+    return await _run_on(RETRIEVAL, fn, *args, **kwargs)
+
+
+async def run_inference(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await a blocking model call; ``503`` + ``Retry-After`` when saturated."""
+    return await _run_on(INFERENCE, fn, *args, **kwargs)
+
+
+def pooled_reranking_service(config):
+    """Reranking model whose ``predict`` runs on the inference pool."""
+    from searchat.services.semantic_model_service import build_reranking_service
+
+    return PooledModel(build_reranking_service(config), get_executor(INFERENCE))
@@ -0,0 +1,283 @@
+"""Conversation export rendering and the streaming bulk-export archive.
+
+``POST /api/conversations/bulk-export`` streams its ZIP: each member is
+compressed into a small buffer that is drained into the response after
+every entry, so memory holds the in-flight window of rendered
+conversations, never the whole archive.
+
+Up to ``EXPORT_WINDOW_PER_WORKER`` conversations per export worker are
+loaded and rendered at once; they are written in request order. PDF
+rendering (reportlab plus Pygments highlighting) is CPU-bound and runs in a
+spawn-context process pool of ``performance.export_workers`` processes,
+capped at the CPU count (one means in-process). Other formats, and PDFs
+when there is no pool, render on a thread.
+
+Rendered exports are cached by ``(conversation_id, content hash, format)``
+in an LRU of at most ``performance.export_cache_mb`` megabytes. The hash
+covers every field the exporters read, so an edited conversation is
+rendered again.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import zipfile
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from fastapi import HTTPException
+
+from searchat.config.constants import DEFAULT_EXPORT_CACHE_MB, DEFAULT_EXPORT_WORKERS
+from searchat.services.export_service import ExportFormat, ExportResult, export_conversation
+
+log = logging.getLogger(__name__)
+
+# Formats rendered in the process pool; the rest are cheap enough for a thread.
+PROCESS_FORMATS = frozenset({"pdf"})
+# Conversations loaded or rendered ahead of the archive writer, per worker.
+EXPORT_WINDOW_PER_WORKER = 4
+
+EXPORT_EXTENSIONS = {
+    "json": "json",
+    "markdown": "md",
+    "text": "txt",
+    "ipynb": "ipynb",
+    "pdf": "pdf",
+}
+
+
+def content_hash(conversation) -> str:
+    """sha256 over every conversation field the exporters read."""
+    payload = {
+        "conversation_id": conversation.conversation_id,
+        "title": conversation.title,
+        "project_id": conversation.project_id,
+        "project_path": conversation.project_path,
+        "tool": conversation.tool,
+        "message_count": conversation.message_count,
+        "messages": [[msg.role, msg.content, msg.timestamp] for msg in conversation.messages],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class ExportCache:
+    """Thread-safe LRU of rendered exports bounded by total content bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, str], ExportResult] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: tuple[str, str, str]) -> ExportResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple[str, str, str], result: ExportResult) -> None:
+        size = len(result.content)
+        with self._lock:
+            if size > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.content)
+            self._entries[key] = result
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ExportRenderer:
+    """Renders exports through the cache, PDFs in a lazily started process pool."""
+
+    def __init__(self, *, workers: int, cache_mb: int) -> None:
+        self.workers = max(1, min(int(workers), os.cpu_count() or 1))
+        self.cache = ExportCache(int(cache_mb) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def render(self, conversation, format: ExportFormat) -> ExportResult:
+        key = (conversation.conversation_id, content_hash(conversation), format)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        pool = self._process_pool() if format in PROCESS_FORMATS else None
+        result: ExportResult | None = None
+        if pool is not None:
+            try:
+                result = await asyncio.wrap_future(pool.submit(export_conversation, conversation, format=format))
+            except Exception as exc:
+                # Broken pool or an unpicklable conversation: render here instead.
+                log.warning("Export worker failed for %s, rendering in-process: %s", key[0], exc)
+                self._drop_pool(pool)
+        if result is None:
+            result = await asyncio.to_thread(export_conversation, conversation, format=format)
+        self.cache.put(key, result)
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _process_pool(self) -> ProcessPoolExecutor | None:
+        if self.workers <= 1:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    # Load searchat.core first; searchat.services alone hits an import cycle.
+                    initializer=importlib.import_module,
+                    initargs=("searchat.core",),
+                )
+            return self._pool
+
+    def _drop_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_RENDERER: ExportRenderer | None = None
+_RENDERER_LOCK = threading.Lock()
+_SIZES: dict[str, int] = {"workers": DEFAULT_EXPORT_WORKERS, "cache_mb": DEFAULT_EXPORT_CACHE_MB}
+
+
+def configure_exports(config) -> None:
+    """Size the renderer from ``[performance]``; takes effect if not yet built."""
+    performance = getattr(config, "performance", None)
+    with _RENDERER_LOCK:
+        _SIZES["workers"] = getattr(performance, "export_workers", DEFAULT_EXPORT_WORKERS)
+        _SIZES["cache_mb"] = getattr(performance, "export_cache_mb", DEFAULT_EXPORT_CACHE_MB)
+
+
+def get_export_renderer() -> ExportRenderer:
+    """Process-wide renderer, built on first use."""
+    global _RENDERER
+    with _RENDERER_LOCK:
+        if _RENDERER is None:
+            _RENDERER = ExportRenderer(workers=_SIZES["workers"], cache_mb=_SIZES["cache_mb"])
+        return _RENDERER
+
+
+def shutdown_exports() -> None:
+    """Stop the export worker processes (app shutdown)."""
+    global _RENDERER
+    with _RENDERER_LOCK:
+        renderer, _RENDERER = _RENDERER, None
+    if renderer is not None:
+        renderer.shutdown()
+
+
+def archive_name(conversation, conversation_id: str, format: str) -> str:
+    safe_title = "".join(
+        c for c in conversation.title[:50]
+        if c.isalnum() or c in (" ", "-", "_")
+    ).strip()
+    if not safe_title:
+        safe_title = conversation_id
+    return f"{safe_title}_{conversation_id[:8]}.{EXPORT_EXTENSIONS[format]}"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target; ``zipfile`` falls back to data descriptors."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStream:
+    """ZIP archive written incrementally; ``stream`` yields its bytes."""
+
+    def __init__(self) -> None:
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", zipfile.ZIP_DEFLATED)
+
+    async def stream(self, entries: AsyncIterator[tuple[str, bytes]]) -> AsyncIterator[bytes]:
+        try:
+            async for name, content in entries:
+                await asyncio.to_thread(self._zip.writestr, name, content)
+                chunk = self._sink.drain()
+                if chunk:
+                    yield chunk
+            self._zip.close()
+            yield self._sink.drain()
+        finally:
+            await entries.aclose()
+
+
+async def iter_exports(
+    conversation_ids: Sequence[str],
+    load: Callable[[str], Awaitable[Any]],
+    format: ExportFormat,
+    renderer: ExportRenderer,
+) -> AsyncIterator[tuple[str, bytes]]:
+    """``(archive name, content)`` per loadable conversation, in request order.
+
+    Conversations that fail to load or render are logged and skipped.
+    """
+
+    async def export_one(conversation_id: str) -> tuple[str, bytes] | None:
+        try:
+            conversation = await load(conversation_id)
+            exported = await renderer.render(conversation, format)
+            return archive_name(conversation, conversation_id, format), exported.content
+        except HTTPException:
+            log.warning("Skipping conversation %s in bulk export", conversation_id)
+        except Exception as exc:
+            log.error("Error exporting %s: %s", conversation_id, exc)
+        return None
+
+    window = renderer.workers * EXPORT_WINDOW_PER_WORKER
+    pending: deque[asyncio.Task] = deque()
+    ids = iter(conversation_ids)
+    try:
+        while True:
+            for conversation_id in ids:
+                pending.append(asyncio.ensure_future(export_one(conversation_id)))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            entry = await pending.popleft()
+            if entry is not None:
+                yield entry
+    finally:
+        # Also runs when the client disconnects mid-download.
+        for task in pending:
+            task.cancel()
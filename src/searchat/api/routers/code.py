@@ -12,8 +12,10 @@ from searchat.contracts.errors import (
     internal_server_error_message,
     pygments_required_message,
 )
+from searchat.api.executors import run_retrieval
 from searchat.api.utils import (
     ensure_code_index_has_symbol_columns,
+    get_code_index,
     rows_to_code_results,
 )
 
@@ -104,6 +106,12 @@ async def get_conversation_code_symbols(
         if not code_dir.exists() or not any(code_dir.glob("*.parquet")):
             raise HTTPException(status_code=503, detail=code_symbol_index_missing_message())
 
+        code_index = get_code_index(search_dir)
+        if code_index is not None:
+            symbols = await run_retrieval(code_index.conversation_symbols, code_dir, conversation_id)
+            if symbols is not None:
+                return CodeSymbolsResponse(conversation_id=conversation_id, **symbols)
+
         parquet_glob = str(code_dir / "*.parquet")
         conn = dataset.store._connect()
         try:
@@ -199,40 +207,34 @@ async def _search_code_symbol(
         if not code_dir.exists() or not any(code_dir.glob("*.parquet")):
             raise HTTPException(status_code=503, detail=code_symbol_index_missing_message())
 
-        parquet_glob = str(code_dir / "*.parquet")
-        conn = dataset.store._connect()
-        try:
-            ensure_code_index_has_symbol_columns(conn, parquet_glob)
-
-            filters: list[str] = [f"list_contains({column}, ?)"]
-            params: list[object] = [value]
-            if language:
-                filters.append("lower(language) = lower(?)")
-                params.append(language)
-            if project:
-                filters.append("project_id = ?")
-                params.append(project)
-            if tool:
-                filters.append("lower(connector) = lower(?)")
-                params.append(tool)
-
-            where_sql = "WHERE " + " AND ".join(filters)
-
-            query_sql = f"""
-                SELECT
-                    conversation_id, project_id, title, file_path, connector,
-                    message_index, block_index, role, language, language_source,
-                    fence_language, lines, code, code_hash,
-                    conversation_updated_at, count(*) OVER() AS total_count
-                FROM parquet_scan(?)
-                {where_sql}
-                ORDER BY conversation_updated_at DESC, message_timestamp DESC
-                LIMIT ? OFFSET ?
-            """
-
-            rows = conn.execute(query_sql, [parquet_glob, *params, limit, offset]).fetchall()
-        finally:
-            conn.close()
+        filters: list[str] = []
+        params: list[object] = []
+        if language:
+            filters.append("lower(language) = lower(?)")
+            params.append(language)
+        if project:
+            filters.append("project_id = ?")
+            params.append(project)
+        if tool:
+            filters.append("lower(connector) = lower(?)")
+            params.append(tool)
+
+        rows = None
+        code_index = get_code_index(search_dir)
+        if code_index is not None:
+            rows = await run_retrieval(
+                code_index.search,
+                code_dir,
+                filters=filters,
+                params=params,
+                symbols={column: value},
+                limit=limit,
+                offset=offset,
+            )
+        if rows is None:
+            rows = _scan_code_symbol(
+                dataset.store, str(code_dir / "*.parquet"), column, value, filters, params, limit, offset,
+            )
 
         total, results = rows_to_code_results(rows)
 
@@ -247,3 +249,34 @@ async def _search_code_symbol(
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=internal_server_error_message()) from exc
+
+
+def _scan_code_symbol(
+    store,
+    parquet_glob: str,
+    column: str,
+    value: str,
+    filters: list[str],
+    params: list[object],
+    limit: int,
+    offset: int,
+) -> list[tuple]:
+    """Symbol lookup straight over the code Parquet files (no code index)."""
+    conn = store._connect()
+    try:
+        ensure_code_index_has_symbol_columns(conn, parquet_glob)
+        where_sql = "WHERE " + " AND ".join([f"list_contains({column}, ?)", *filters])
+        query_sql = f"""
+            SELECT
+                conversation_id, project_id, title, file_path, connector,
+                message_index, block_index, role, language, language_source,
+                fence_language, lines, code, code_hash,
+                conversation_updated_at, count(*) OVER() AS total_count
+            FROM parquet_scan(?)
+            {where_sql}
+            ORDER BY conversation_updated_at DESC, message_timestamp DESC
+            LIMIT ? OFFSET ?
+        """
+        return conn.execute(query_sql, [parquet_glob, value, *params, limit, offset]).fetchall()
+    finally:
+        conn.close()
@@ -34,6 +34,8 @@ from searchat.contracts.similarity import (
     serialize_similar_conversations_payload,
 )
 from searchat.api.dataset_access import get_dataset_semantic_retrieval, get_dataset_store
+from searchat.api.executors import run_retrieval
+from searchat.api.exports import ZipStream, get_export_renderer, iter_exports
 from searchat.api.warmup import invalidate_search_index
 from searchat.api.utils import detect_tool_from_path, detect_source_from_path, parse_date_filter
 from searchat.contracts.errors import (
@@ -65,7 +67,6 @@ from searchat.contracts.errors import (
 )
 import searchat.api.dependencies as deps
 
-from searchat.services.export_service import export_conversation as render_export
 
 from searchat.api.dependencies import get_platform_manager
 
@@ -782,6 +783,62 @@ def _detect_language(code: str) -> str:
     return detect(code)
 
 
+def _find_similar_rows(
+    store,
+    search_engine,
+    conversation_id: str,
+    limit: int,
+) -> tuple[dict, list[tuple]]:
+    """Embed a conversation and hydrate its neighbours (blocking; retrieval pool)."""
+    # Verify conversation exists
+    conv_meta = store.get_conversation_meta(conversation_id)
+    if not conv_meta:
+        raise HTTPException(
+            status_code=404,
+            detail=conversation_not_found_message(conversation_id),
+        )
+
+    # Get representative text from the conversation to generate embedding
+    # Get the conversation's title and some content
+    metadata_path = search_engine.metadata_path
+    conn = store._connect()
+
+    try:
+        # Get chunk text for this conversation
+        query = """
+            SELECT chunk_text
+            FROM parquet_scan(?)
+            WHERE conversation_id = ?
+            ORDER BY vector_id
+            LIMIT 1
+        """
+        result = conn.execute(query, [str(metadata_path), conversation_id]).fetchone()
+
+        if not result:
+            raise HTTPException(
+                status_code=404,
+                detail=no_embeddings_for_conversation_message()
+            )
+
+        chunk_text = result[0]
+    finally:
+        conn.close()
+
+    # Combine title and chunk text for better representation
+    representative_text = f"{conv_meta['title']} {chunk_text}"
+    hits = search_engine.find_similar_vector_hits(representative_text, limit + 10)
+    if not hits:
+        return conv_meta, []
+
+    # Hydrate from the engine's resident vector lookup
+    rows = search_engine.similar_conversation_rows(
+        hits,
+        exclude_conversation_id=conversation_id,
+        limit=limit,
+    )
+    return conv_meta, rows
+
+
 @router.get("/conversation/{conversation_id}/similar")
 async def get_similar_conversations(
     conversation_id: str,
@@ -797,101 +854,16 @@ async def get_similar_conversations(
                 status_code=503,
                 detail=retrieval_capability_inspection_failed_message(str(exc)),
             ) from exc
-        store = dataset.store
-
-        # Verify conversation exists
-        conv_meta = store.get_conversation_meta(conversation_id)
-        if not conv_meta:
-            raise HTTPException(
-                status_code=404,
-                detail=conversation_not_found_message(conversation_id),
+        conv_meta, rows = await run_retrieval(
+            _find_similar_rows, dataset.store, search_engine, conversation_id, limit,
+        )
+        if not rows:
+            return serialize_similar_conversations_payload(
+                conversation_id=conversation_id,
+                title=conv_meta["title"],
+                similar_conversations=[],
             )
 
-        # Get representative text from the conversation to generate embedding
-        # Get the conversation's title and some content
-        metadata_path = search_engine.metadata_path
-        conn = store._connect()
-
-        try:
-            # Get chunk text for this conversation
-            query = """
-                SELECT chunk_text
-                FROM parquet_scan(?)
-                WHERE conversation_id = ?
-                ORDER BY vector_id
-                LIMIT 1
-            """
-            result = conn.execute(query, [str(metadata_path), conversation_id]).fetchone()
-
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail=no_embeddings_for_conversation_message()
-                )
-
-            chunk_text = result[0]
-
-            # Combine title and chunk text for better representation
-            representative_text = f"{conv_meta['title']} {chunk_text}"
-            hits = [
-                (hit.vector_id, hit.distance)
-                for hit in search_engine.find_similar_vector_hits(representative_text, limit + 10)
-            ]
-
-            if not hits:
-                return serialize_similar_conversations_payload(
-                    conversation_id=conversation_id,
-                    title=conv_meta["title"],
-                    similar_conversations=[],
-                )
-
-            # Query metadata and conversations to get details
-            values_clause = ", ".join(["(?, ?)"] * len(hits))
-            params = []
-            for vid, distance in hits:
-                params.extend([vid, distance])
-
-            params.append(str(metadata_path))
-            params.append(search_engine.conversations_glob)
-
-            sql = f"""
-                WITH hits(vector_id, distance) AS (
-                    VALUES {values_clause}
-                )
-                SELECT
-                    m.conversation_id,
-                    c.project_id,
-                    c.title,
-                    c.created_at,
-                    c.updated_at,
-                    c.message_count,
-                    c.file_path,
-                    hits.distance
-                FROM hits
-                JOIN parquet_scan(?) AS m
-                    ON m.vector_id = hits.vector_id
-                JOIN (
-                    SELECT conversation_id, project_id, title, created_at,
-                           updated_at, message_count, file_path
-                    FROM parquet_scan(?)
-                    QUALIFY row_number() OVER (
-                        PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST
-                    ) = 1
-                ) AS c
-                    ON c.conversation_id = m.conversation_id
-                WHERE m.conversation_id != ?
-                QUALIFY row_number() OVER (PARTITION BY m.conversation_id ORDER BY hits.distance) = 1
-                ORDER BY hits.distance
-                LIMIT ?
-            """
-            params.append(conversation_id)  # Filter out original conversation
-            params.append(limit)
-
-            rows = conn.execute(sql, params).fetchall()
-
-        finally:
-            conn.close()
-
         # Format results
         similar_conversations = []
         for (
@@ -1021,7 +993,7 @@ async def export_conversation(
                 detail=invalid_export_format_message(),
             )
 
-        exported = render_export(conv_response, format=format_lower)  # type: ignore[arg-type]
+        exported = await get_export_renderer().render(conv_response, format_lower)  # type: ignore[arg-type]
 
         return Response(
             content=exported.content,
@@ -1050,10 +1022,8 @@ async def bulk_export_conversations(
     request: BulkExportRequest,
     snapshot: str | None = Query(None, description="Backup snapshot name (read-only)"),
 ):
-    """Export multiple conversations as a ZIP archive."""
+    """Export multiple conversations as a ZIP archive, streamed as it is written."""
     try:
-        import io
-        import zipfile
         from datetime import datetime
 
         if not request.conversation_ids:
@@ -1079,53 +1049,20 @@ async def bulk_export_conversations(
                 detail=invalid_export_format_message()
             )
 
-        # Determine file extension
-        ext_map = {
-            "json": "json",
-            "markdown": "md",
-            "text": "txt",
-            "ipynb": "ipynb",
-            "pdf": "pdf",
-        }
-        ext = ext_map[format_lower]
+        renderer = get_export_renderer()
 
-        # Create ZIP file in memory
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for conv_id in request.conversation_ids:
-                try:
-                    if snapshot is None:
-                        conv_response = await get_conversation(conv_id)
-                    else:
-                        conv_response = await get_conversation(conv_id, snapshot=snapshot)
-                    exported = render_export(conv_response, format=format_lower)  # type: ignore[arg-type]
-
-                    safe_title = "".join(
-                        c for c in conv_response.title[:50]
-                        if c.isalnum() or c in (" ", "-", "_")
-                    ).strip()
-                    if not safe_title:
-                        safe_title = conv_id
-
-                    filename = f"{safe_title}_{conv_id[:8]}.{ext}"
-                    zip_file.writestr(filename, exported.content)
-
-                except HTTPException:
-                    # Skip conversations that can't be loaded
-                    logger.warning(f"Skipping conversation {conv_id} in bulk export")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error exporting {conv_id}: {e}")
-                    continue
+        async def load(conv_id: str):
+            if snapshot is None:
+                return await get_conversation(conv_id)
+            return await get_conversation(conv_id, snapshot=snapshot)
 
-        # Prepare ZIP for download
-        zip_buffer.seek(0)
+        archive = ZipStream()
+        entries = iter_exports(request.conversation_ids, load, format_lower, renderer)  # type: ignore[arg-type]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_filename = f"searchat_export_{timestamp}.zip"
 
         return StreamingResponse(
-            iter([zip_buffer.getvalue()]),
+            archive.stream(entries),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{zip_filename}"'
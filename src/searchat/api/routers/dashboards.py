@@ -17,12 +17,9 @@ from searchat.api.contracts import (
     serialize_success_flag_payload,
 )
 import searchat.api.dependencies as deps
+from searchat.api.dashboard_render import WidgetRequest, render_widgets
 from searchat.api.dataset_access import _DatasetNotReady, get_dataset_retrieval
-from searchat.api.utils import (
-    parse_date_filter,
-    sort_results,
-    search_result_to_response,
-)
+from searchat.api.utils import parse_date_filter
 from searchat.contracts.errors import (
     dashboard_not_found_message,
     dashboard_validation_message,
@@ -196,7 +193,7 @@ async def render_dashboard(dashboard_id: str):
             raise HTTPException(status_code=404, detail=dashboard_not_found_message())
 
         widgets = _ensure_widgets(dashboard)
-        widget_requests: list[dict[str, Any]] = []
+        widget_requests: list[WidgetRequest] = []
         needs_semantic = False
 
         for widget in widgets:
@@ -215,7 +212,21 @@ async def render_dashboard(dashboard_id: str):
             if mode in (SearchMode.HYBRID, SearchMode.SEMANTIC):
                 needs_semantic = True
 
-            widget_requests.append({"widget": widget, "query": query, "mode": mode})
+            sort_by = _normalize_sort_by(query.get("filters"))
+            widget_sort = widget.get("sort_by")
+            if isinstance(widget_sort, str) and widget_sort:
+                sort_by = widget_sort
+
+            widget_requests.append(
+                WidgetRequest(
+                    widget=widget,
+                    query=query,
+                    mode=mode,
+                    filters=_build_filters(query.get("filters")),
+                    sort_by=sort_by,
+                    limit=widget.get("limit") if isinstance(widget.get("limit"), int) else 5,
+                )
+            )
 
         try:
             if needs_semantic:
@@ -224,40 +235,8 @@ async def render_dashboard(dashboard_id: str):
                 dataset = get_dataset_retrieval(None, search_mode=SearchMode.KEYWORD)
         except _DatasetNotReady as exc:
             return exc.response
-        search_engine = dataset.retrieval_service
 
-        rendered_widgets = []
-        for request in widget_requests:
-            widget = request["widget"]
-            query = request["query"]
-            mode = request["mode"]
-
-            filters = _build_filters(query.get("filters"))
-            results = search_engine.search(query["query"], mode=mode, filters=filters)
-            sort_by = _normalize_sort_by(query.get("filters"))
-            widget_sort = widget.get("sort_by")
-            if isinstance(widget_sort, str) and widget_sort:
-                sort_by = widget_sort
-
-            sorted_list = sort_results(results.results, sort_by)
-            widget_limit = widget.get("limit") if isinstance(widget.get("limit"), int) else 5
-            trimmed = sorted_list[:widget_limit]
-
-            response_results = [search_result_to_response(r) for r in trimmed]
-
-            rendered_widgets.append(
-                {
-                    "id": widget.get("id"),
-                    "title": widget.get("title") or query.get("name") or "Saved Query",
-                    "query_id": query.get("id"),
-                    "query": query.get("query"),
-                    "mode": mode.value,
-                    "sort_by": sort_by,
-                    "results": response_results,
-                    "total": results.total_count,
-                    "search_time_ms": results.search_time_ms,
-                }
-            )
+        rendered_widgets = await render_widgets(dataset.retrieval_service, widget_requests)
 
         return serialize_dashboard_render_payload(
             dashboard=dashboard,
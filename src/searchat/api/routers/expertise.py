@@ -428,8 +428,12 @@ def prime_expertise(
 @router.post("/extract", response_model=ExtractionResponse)
 def extract_expertise(body: ExtractionRequest) -> ExtractionResponse:
     """Run extraction pipeline on provided text."""
+    from functools import partial
+
     from searchat.expertise.pipeline import ExtractionPipeline
+    from searchat.core.embedding_cache import get_embedding_cache
     from searchat.expertise.embeddings import ExpertiseEmbeddingIndex
+    from searchat.services.semantic_model_service import shared_embedding_service
 
     store = get_expertise_store()
     config = get_config()
@@ -440,6 +444,8 @@ def extract_expertise(body: ExtractionRequest) -> ExtractionResponse:
         embedding_index = ExpertiseEmbeddingIndex(
             search_dir,
             embedding_model=config.embedding.model,
+            embedding_cache=get_embedding_cache(config, search_dir),
+            embedding_provider=partial(shared_embedding_service, config),
         )
 
     pipeline = ExtractionPipeline(store, embedding_index, config)
@@ -9,9 +9,11 @@ from fastapi.responses import HTMLResponse
 from starlette.responses import StreamingResponse
 
 from searchat.api.dataset_access import get_dataset_store
+from searchat.api.executors import RETRIEVAL, ExecutorSaturated, get_executor
 from searchat.api.templates import templates
 import searchat.api.dependencies as deps
 from searchat.api import state as api_state
+from searchat.contracts.errors import server_busy_message
 from searchat.expertise.models import ExpertiseQuery, ExpertiseType, ExpertiseSeverity
 from searchat.models.domain import SearchFilters
 from searchat.models.enums import SearchMode
@@ -116,11 +118,22 @@ async def search_results(
         )
         search_mode = SearchMode(mode) if mode else SearchMode.HYBRID
 
-        search_response = engine.search(
-            query=search_q,
-            mode=search_mode,
-            filters=filters,
-        )
+        try:
+            search_response = await get_executor(RETRIEVAL).run(
+                engine.search,
+                query=search_q,
+                mode=search_mode,
+                filters=filters,
+            )
+        except ExecutorSaturated as exc:
+            ctx["error"] = server_busy_message()
+            return templates.TemplateResponse(
+                request,
+                "fragments/search-results.html",
+                ctx,
+                status_code=503,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
         all_results = search_response.results
         ctx["total"] = search_response.total_count
         ctx["search_time_ms"] = round(search_response.search_time_ms, 1)
@@ -873,9 +886,12 @@ async def rebuild_knowledge_graph(request: Request) -> HTMLResponse:
 def rebuild_knowledge_graph_stream(request: Request) -> StreamingResponse:
     """SSE stream: rebuild knowledge graph with live progress."""
     import json as _json
+    from functools import partial
 
+    from searchat.core.embedding_cache import get_embedding_cache
     from searchat.expertise.embeddings import ExpertiseEmbeddingIndex
     from searchat.expertise.models import ExpertiseQuery as _EQ
+    from searchat.services.semantic_model_service import shared_embedding_service
     from searchat.knowledge_graph.detector import ContradictionDetector
     from searchat.knowledge_graph.models import EdgeType, KnowledgeEdge
 
@@ -896,17 +912,28 @@ def rebuild_knowledge_graph_stream(request: Request) -> StreamingResponse:
 
         yield _sse("progress", {"phase": "Rebuilding embedding index", "current": 0, "total": total, "pct": -1})
 
-        embedding_index = ExpertiseEmbeddingIndex(data_dir=_get_data_dir(config))
+        embedding_index = ExpertiseEmbeddingIndex(
+            data_dir=_get_data_dir(config),
+            embedding_model=config.embedding.model,
+            embedding_cache=get_embedding_cache(config, _get_data_dir(config)),
+            embedding_provider=partial(shared_embedding_service, config),
+        )
         embedding_index.rebuild(records)
 
         yield _sse("progress", {"phase": "Scanning for contradictions", "current": 0, "total": total, "pct": 0})
 
+        # Pairs already linked, in either direction, are not flagged again.
+        existing = {
+            frozenset((edge.source_id, edge.target_id))
+            for edge in kg_store.get_contradictions(unresolved_only=False)
+        }
         detector = ContradictionDetector()
         new_contradictions = 0
-        for i, record in enumerate(records):
-            candidates = detector.check_record(record, expertise_store, embedding_index)
-            for candidate in candidates:
-                edge = KnowledgeEdge(
+        for scored, pair_total, candidates in detector.scan(
+            expertise_store, embedding_index, records=records, exclude=existing,
+        ):
+            edges = [
+                KnowledgeEdge(
                     source_id=candidate.record_id_a,
                     target_id=candidate.record_id_b,
                     edge_type=EdgeType.CONTRADICTS,
@@ -915,18 +942,16 @@ def rebuild_knowledge_graph_stream(request: Request) -> StreamingResponse:
                         "nli_score": candidate.contradiction_score,
                     },
                 )
-                kg_store.create_edge(edge)
-                new_contradictions += 1
-
-            done_count = i + 1
-            if done_count % 10 == 0 or done_count == total:
-                pct = int(done_count / total * 100) if total else 100
-                yield _sse("progress", {
-                    "phase": "Scanning for contradictions",
-                    "current": done_count,
-                    "total": total,
-                    "pct": pct,
-                })
+                for candidate in candidates
+            ]
+            kg_store.bulk_create_edges(edges)
+            new_contradictions += len(edges)
+            yield _sse("progress", {
+                "phase": "Scoring similar pairs",
+                "current": scored,
+                "total": pair_total,
+                "pct": int(scored / pair_total * 100) if pair_total else 100,
+            })
 
         msg = (
             f"<strong>Knowledge graph rebuilt.</strong> "
@@ -953,9 +978,12 @@ async def rebuild_expertise_index(request: Request) -> HTMLResponse:
 def rebuild_expertise_index_stream(request: Request) -> StreamingResponse:
     """SSE stream: rebuild expertise embedding index with live progress."""
     import json as _json
+    from functools import partial
 
+    from searchat.core.embedding_cache import get_embedding_cache
     from searchat.expertise.embeddings import ExpertiseEmbeddingIndex
     from searchat.expertise.models import ExpertiseQuery as _EQ
+    from searchat.services.semantic_model_service import shared_embedding_service
 
     expertise_store = _safe_get(deps.get_expertise_store)
 
@@ -973,7 +1001,12 @@ def rebuild_expertise_index_stream(request: Request) -> StreamingResponse:
 
         yield _sse("progress", {"phase": f"Encoding {total} records", "current": 0, "total": total, "pct": -1})
 
-        embedding_index = ExpertiseEmbeddingIndex(data_dir=_get_data_dir(config))
+        embedding_index = ExpertiseEmbeddingIndex(
+            data_dir=_get_data_dir(config),
+            embedding_model=config.embedding.model,
+            embedding_cache=get_embedding_cache(config, _get_data_dir(config)),
+            embedding_provider=partial(shared_embedding_service, config),
+        )
         embedding_index.rebuild(records)
 
         yield _sse("progress", {"phase": "Saving index", "current": total, "total": total, "pct": 100})
@@ -178,20 +178,21 @@ def list_contradictions(
     if domain is not None or project is not None:
         expertise_store = get_expertise_store()
         filtered: list[KnowledgeEdge] = []
-        for edge in contradiction_edges:
-            rec_a = expertise_store.get(edge.source_id)
-            rec_b = expertise_store.get(edge.target_id)
-            if domain is not None:
-                if (rec_a is None or rec_a.domain != domain) and (
-                    rec_b is None or rec_b.domain != domain
-                ):
-                    continue
-            if project is not None:
-                if (rec_a is None or rec_a.project != project) and (
-                    rec_b is None or rec_b.project != project
-                ):
-                    continue
-            filtered.append(edge)
+        with expertise_store.session():
+            for edge in contradiction_edges:
+                rec_a = expertise_store.get(edge.source_id)
+                rec_b = expertise_store.get(edge.target_id)
+                if domain is not None:
+                    if (rec_a is None or rec_a.domain != domain) and (
+                        rec_b is None or rec_b.domain != domain
+                    ):
+                        continue
+                if project is not None:
+                    if (rec_a is None or rec_a.project != project) and (
+                        rec_b is None or rec_b.project != project
+                    ):
+                        continue
+                filtered.append(edge)
         contradiction_edges = filtered
 
     results = [
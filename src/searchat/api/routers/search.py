@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from pathlib import Path
 
+import duckdb
 from fastapi import APIRouter, Query, HTTPException
 
 from searchat.api.contracts import (
@@ -15,18 +17,21 @@ from searchat.contracts.errors import (
     code_search_index_missing_message,
     highlight_provider_required_message,
     internal_server_error_message,
+    invalid_code_regex_message,
     invalid_highlight_provider_message,
     invalid_search_mode_message,
 )
 from searchat.models import AlgorithmType, SearchMode, SearchFilters
 from searchat.services.highlight_service import extract_highlight_terms
 from searchat.services.llm_service import LLMServiceError
+from searchat.api.executors import run_inference, run_retrieval
 from searchat.api.dataset_access import _DatasetNotReady, get_dataset_retrieval, get_dataset_store
 from searchat.api.utils import (
     parse_date_filter,
     validate_tool,
     sort_results,
     ensure_code_index_has_symbol_columns,
+    get_code_index,
     rows_to_code_results,
 )
 import searchat.api.dependencies as deps
@@ -59,9 +64,102 @@ def _resolve_highlight_terms(
         return None
 
 
+def _query_code_blocks(
+    store,
+    search_dir: Path,
+    filters: list[str],
+    params: list[object],
+    *,
+    terms: list[str],
+    regex: str | None,
+    function: str | None,
+    class_name: str | None,
+    import_name: str | None,
+    limit: int,
+    offset: int,
+) -> list[tuple]:
+    """Run a code-block query (blocking; called on the retrieval pool).
+
+    Uses the code symbol/trigram index when it is current, otherwise scans
+    the code Parquet files.
+    """
+    code_dir = search_dir / "data" / "code"
+    code_index = get_code_index(search_dir)
+    if code_index is not None:
+        symbols = {
+            kind: value
+            for kind, value in (("functions", function), ("classes", class_name), ("imports", import_name))
+            if value
+        }
+        rows = code_index.search(
+            code_dir,
+            filters=filters,
+            params=params,
+            terms=terms,
+            regex=regex,
+            symbols=symbols,
+            limit=limit,
+            offset=offset,
+        )
+        if rows is not None:
+            return rows
+
+    parquet_glob = str(code_dir / "*.parquet")
+    conn = store._connect()
+    try:
+        if function or class_name or import_name:
+            ensure_code_index_has_symbol_columns(conn, parquet_glob)
+
+        for term in terms:
+            filters.append("code ILIKE '%' || ? || '%' ")
+            params.append(term)
+        if regex:
+            filters.append("regexp_matches(code, ?)")
+            params.append(regex)
+        if function:
+            filters.append("list_contains(functions, ?)")
+            params.append(function)
+        if class_name:
+            filters.append("list_contains(classes, ?)")
+            params.append(class_name)
+        if import_name:
+            filters.append("list_contains(imports, ?)")
+            params.append(import_name)
+
+        where_sql = "WHERE " + " AND ".join(filters) if filters else ""
+
+        query_sql = f"""
+            SELECT
+                conversation_id, project_id, title, file_path, connector,
+                message_index, block_index, role, language, language_source,
+                fence_language, lines, code, code_hash,
+                conversation_updated_at, count(*) OVER() AS total_count
+            FROM parquet_scan(?)
+            {where_sql}
+            ORDER BY conversation_updated_at DESC, message_timestamp DESC
+            LIMIT ? OFFSET ?
+        """
+
+        return conn.execute(query_sql, [parquet_glob, *params, limit, offset]).fetchall()
+    finally:
+        conn.close()
+
+
+def _validate_code_regex(pattern: str) -> None:
+    """Reject patterns DuckDB's RE2 engine cannot compile."""
+    conn = duckdb.connect(database=":memory:")
+    try:
+        conn.execute("SELECT regexp_matches('', ?)", [pattern]).fetchall()
+    except duckdb.InvalidInputException as exc:
+        raise HTTPException(status_code=400, detail=invalid_code_regex_message(str(exc))) from exc
+    finally:
+        conn.close()
+
+
 @router.get("/search/code")
 async def search_code(
     q: str = Query("*", description="Code search query (use * to list recent)"),
+    regex: bool = Query(False, description="Treat q as a regular expression (RE2 syntax)"),
     language: str | None = Query(None, description="Filter by language (e.g. python)"),
     function: str | None = Query(None, description="Filter by function name (exact match)"),
     class_name: str | None = Query(None, description="Filter by class name (exact match)"),
@@ -86,14 +184,17 @@ async def search_code(
 
         filters: list[str] = []
         params: list[object] = []
+        terms: list[str] = []
+        pattern: str | None = None
 
         if q.strip() != "*":
-            terms = [t for t in q.strip().split() if t]
-            if not terms:
-                terms = [q.strip()]
-            for term in terms:
-                filters.append("code ILIKE '%' || ? || '%' ")
-                params.append(term)
+            if regex:
+                pattern = q
+                _validate_code_regex(pattern)
+            else:
+                terms = [t for t in q.strip().split() if t]
+                if not terms:
+                    terms = [q.strip()]
 
         if language:
             filters.append("lower(language) = lower(?)")
@@ -105,39 +206,20 @@ async def search_code(
             filters.append("lower(connector) = lower(?)")
             params.append(validate_tool(tool))
 
-        parquet_glob = str(code_dir / "*.parquet")
-        conn = dataset.store._connect()
-        try:
-            if function or class_name or import_name:
-                ensure_code_index_has_symbol_columns(conn, parquet_glob)
-
-            if function:
-                filters.append("list_contains(functions, ?)")
-                params.append(function)
-            if class_name:
-                filters.append("list_contains(classes, ?)")
-                params.append(class_name)
-            if import_name:
-                filters.append("list_contains(imports, ?)")
-                params.append(import_name)
-
-            where_sql = "WHERE " + " AND ".join(filters) if filters else ""
-
-            query_sql = f"""
-                SELECT
-                    conversation_id, project_id, title, file_path, connector,
-                    message_index, block_index, role, language, language_source,
-                    fence_language, lines, code, code_hash,
-                    conversation_updated_at, count(*) OVER() AS total_count
-                FROM parquet_scan(?)
-                {where_sql}
-                ORDER BY conversation_updated_at DESC, message_timestamp DESC
-                LIMIT ? OFFSET ?
-            """
-
-            rows = conn.execute(query_sql, [parquet_glob, *params, limit, offset]).fetchall()
-        finally:
-            conn.close()
+        rows = await run_retrieval(
+            _query_code_blocks,
+            dataset.store,
+            search_dir,
+            filters,
+            params,
+            terms=terms,
+            regex=pattern,
+            function=function,
+            class_name=class_name,
+            import_name=import_name,
+            limit=limit,
+            offset=offset,
+        )
 
         total, results = rows_to_code_results(rows)
 
@@ -224,9 +306,11 @@ async def search(
         # Dispatch: use algorithm kwarg if engine supports it, else fall back to mode
         from searchat.core.unified_search import UnifiedSearchEngine
         if algo_type is not None and isinstance(search_engine, UnifiedSearchEngine):
-            results = search_engine.search(q, mode=search_mode, filters=filters, algorithm=algo_type)
+            results = await run_retrieval(
+                search_engine.search, q, mode=search_mode, filters=filters, algorithm=algo_type,
+            )
         else:
-            results = search_engine.search(q, mode=search_mode, filters=filters)
+            results = await run_retrieval(search_engine.search, q, mode=search_mode, filters=filters)
 
         highlight_terms = None
         if highlight and len(q.strip()) >= 4 and mode != "keyword":
@@ -235,8 +319,8 @@ async def search(
             provider = highlight_provider.lower()
             if provider not in ("openai", "ollama"):
                 raise HTTPException(status_code=400, detail=invalid_highlight_provider_message())
-            highlight_terms = _resolve_highlight_terms(
-                str(search_dir), q, provider, highlight_model
+            highlight_terms = await run_inference(
+                _resolve_highlight_terms, str(search_dir), q, provider, highlight_model
             )
 
         # Log search analytics (opt-in; active dataset only)
@@ -308,71 +392,15 @@ async def get_search_suggestions(
     q: str = Query(..., description="Prefix to search for", min_length=1),
     limit: int = Query(10, description="Max suggestions to return (1-20)", ge=1, le=20)
 ):
-    """Get search suggestions based on conversation titles and common terms."""
-    try:
-        store = deps.get_duckdb_store()
-
-        # Get all conversation titles and extract terms
-        query = """
-            SELECT DISTINCT title
-            FROM conversations
-            WHERE title IS NOT NULL
-            ORDER BY updated_at DESC
-            LIMIT 1000
-        """
-
-        conn = store._connect()
-        result = conn.execute(query).fetchall()
-
-        suggestions = set()
-        q_lower = q.lower()
-
-        # Extract words and phrases from titles
-        for (title,) in result:
-            if not title:
-                continue
-
-            title_lower = title.lower()
-
-            # Add full title if it matches
-            if q_lower in title_lower:
-                suggestions.add(title)
-
-            # Extract individual words
-            words = title.split()
-            for word in words:
-                # Clean word (remove punctuation)
-                clean_word = ''.join(c for c in word if c.isalnum() or c in ['-', '_'])
-                if len(clean_word) >= 3 and clean_word.lower().startswith(q_lower):
-                    suggestions.add(clean_word)
-
-            # Extract common phrases (2-3 words)
-            for i in range(len(words) - 1):
-                # 2-word phrase
-                phrase = ' '.join(words[i:i+2])
-                if phrase.lower().startswith(q_lower) or q_lower in phrase.lower():
-                    suggestions.add(phrase)
-
-                # 3-word phrase
-                if i < len(words) - 2:
-                    phrase = ' '.join(words[i:i+3])
-                    if phrase.lower().startswith(q_lower) or q_lower in phrase.lower():
-                        suggestions.add(phrase)
-
-        # Sort suggestions by relevance (prefix match first, then contains)
-        sorted_suggestions = sorted(
-            suggestions,
-            key=lambda s: (
-                not s.lower().startswith(q_lower),  # Prefix matches first
-                len(s),  # Shorter suggestions first
-                s.lower()  # Alphabetical
-            )
-        )
-
-        return serialize_search_suggestions_payload(
-            query=q,
-            suggestions=sorted_suggestions[:limit],
-        )
+    """Get search suggestions from the in-memory prefix index.
 
+    Covers conversation titles (words, bigrams, full titles), project names,
+    code symbols and past queries that returned results.
+    """
+    try:
+        suggestions = await run_retrieval(deps.get_suggestion_index().suggest, q, limit)
+        return serialize_search_suggestions_payload(query=q, suggestions=suggestions)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=internal_server_error_message()) from e
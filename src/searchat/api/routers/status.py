@@ -2,15 +2,27 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
 from searchat.api.contracts import (
+    serialize_status_embedding_cache_payload,
+    serialize_status_executors_payload,
     serialize_status_features_payload,
+    serialize_status_keyword_index_payload,
     serialize_status_payload,
+    serialize_status_profile_payload,
+    serialize_status_result_cache_payload,
 )
 import searchat.api.dependencies as deps
+from searchat.api.executors import executor_stats
 from searchat.api.readiness import get_readiness
-from searchat.api.utils import get_retrieval_capabilities_snapshot
+from searchat.core.embedding_cache import embedding_cache_stats
+from searchat.core.profiling import get_profiler
+from searchat.api.utils import (
+    get_keyword_index_snapshot,
+    get_result_cache_snapshot,
+    get_retrieval_capabilities_snapshot,
+)
 
 
 router = APIRouter()
@@ -48,3 +60,40 @@ async def get_features():
         snapshots_enabled=config.snapshots.enabled,
         retrieval=get_retrieval_capabilities_snapshot(),
     )
+
+
+@router.get("/status/keyword-index")
+async def get_keyword_index_status():
+    """Return keyword index size and last delta-merge timing/token counts."""
+    return serialize_status_keyword_index_payload(get_keyword_index_snapshot())
+
+
+@router.get("/status/result-cache")
+async def get_result_cache_status():
+    """Return search result cache size, hit/miss counts and index generation."""
+    return serialize_status_result_cache_payload(get_result_cache_snapshot())
+
+
+@router.get("/status/embedding-cache")
+async def get_embedding_cache_status():
+    """Return embedding cache hit/miss counts and sizes for this process."""
+    return serialize_status_embedding_cache_payload(embedding_cache_stats())
+
+
+@router.get("/status/executors")
+async def get_executors_status():
+    """Return queue depth, rejections and job time for the API thread pools."""
+    return serialize_status_executors_payload(executor_stats())
+
+
+@router.get("/status/profile")
+async def get_profile_status(traces: int = Query(10, ge=0, le=50)):
+    """Return per-stage p50/p95/p99 timings when performance.enable_profiling is on."""
+    profiler = get_profiler(deps.get_config())
+    if profiler is None:
+        return serialize_status_profile_payload(enabled=False, stages=[], traces=[])
+    return serialize_status_profile_payload(
+        enabled=True,
+        stages=profiler.stats(),
+        traces=profiler.recent_traces(traces),
+    )
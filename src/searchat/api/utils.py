@@ -7,13 +7,14 @@ from pathlib import Path
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 
-from searchat.config.constants import VALID_TOOL_NAMES
+from searchat.config.constants import DEFAULT_CODE_INDEX_ENABLED, VALID_TOOL_NAMES
 from searchat.contracts.errors import (
     invalid_model_provider_message,
     invalid_tool_filter_message,
     retrieval_capability_inspection_failed_message,
     snapshot_not_found_message,
 )
+from searchat.core.code_index import CodeIndex, code_index_path
 from searchat.models import SearchResult
 
 VALID_PROVIDERS: frozenset[str] = frozenset({"openai", "ollama", "embedded"})
@@ -223,6 +224,34 @@ def get_retrieval_capabilities_snapshot() -> dict[str, object] | None:
     }
 
 
+def get_keyword_index_snapshot():
+    """Best-effort keyword index status from the active search engine."""
+    import searchat.api.dependencies as deps
+
+    service = getattr(deps, "_search_engine", None)
+    describe = getattr(service, "describe_keyword_index", None)
+    if not callable(describe):
+        return None
+    try:
+        return describe()
+    except Exception:
+        return None
+
+
+def get_result_cache_snapshot():
+    """Best-effort search result cache counters from the active search engine."""
+    import searchat.api.dependencies as deps
+
+    service = getattr(deps, "_search_engine", None)
+    describe = getattr(service, "describe_result_cache", None)
+    if not callable(describe):
+        return None
+    try:
+        return describe()
+    except Exception:
+        return None
+
+
 def _get_retrieval_capabilities(retrieval_service=None, *, fail_closed: bool = False):
     """Return retrieval capabilities when a semantic retrieval service is available."""
     service = retrieval_service
@@ -299,6 +328,17 @@ def ensure_code_index_has_symbol_columns(conn, parquet_glob: str) -> None:
         )
 
 
+def get_code_index(search_dir: Path) -> CodeIndex | None:
+    """Code symbol/trigram index for a dataset, or None when disabled in config."""
+    import searchat.api.dependencies as deps
+
+    config = getattr(deps, "_config", None)
+    performance = getattr(config, "performance", None)
+    if not getattr(performance, "code_index", DEFAULT_CODE_INDEX_ENABLED):
+        return None
+    return CodeIndex(code_index_path(search_dir))
+
+
 def rows_to_code_results(rows: list) -> tuple[int, list]:
     """Convert DuckDB code search rows to (total, list[CodeSearchResultResponse]).
 
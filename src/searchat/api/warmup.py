@@ -207,15 +207,26 @@ def _warmup_semantic_components() -> None:
             logger.info("Warmup: semantic components %.1fms", elapsed_ms)
 
 
-def invalidate_search_index() -> None:
-    """Clear caches and mark semantic components stale after indexing."""
+def invalidate_search_index(changed_project_ids: set[str] | None = None) -> None:
+    """Clear caches and mark semantic components stale after indexing.
+
+    ``changed_project_ids`` narrows search result invalidation to those
+    projects; ``None`` drops every cached result.
+    """
     from searchat.api import dependencies as deps
 
     api_state.clear_query_caches()
 
+    suggestions = deps._suggestion_index
+    if suggestions is not None:
+        suggestions.invalidate(changed_project_ids)
+
     engine = deps._search_engine
     if engine is not None:
-        engine.refresh_index()
+        if changed_project_ids is None:
+            engine.refresh_index()
+        else:
+            engine.refresh_index(changed_project_ids=changed_project_ids)
 
     readiness = get_readiness()
     readiness.set_component("metadata", "idle")
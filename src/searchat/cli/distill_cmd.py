@@ -3,14 +3,21 @@ from __future__ import annotations
 
 import sys
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from searchat.palace.scheduler import SchedulerStats
+
+_PROGRESS_INTERVAL_SECONDS = 10.0
 
 
 def run_distill(argv: list[str]) -> int:
     """Run palace distillation on pending conversations.
 
-    Usage: searchat distill [--project PROJECT] [--retry-errors] [--dry-run]
+    Usage: searchat distill [--project PROJECT] [--workers N] [--retry-errors] [--dry-run]
     """
     project_id: str | None = None
+    workers: int | None = None
     retry_errors = False
     dry_run = False
 
@@ -19,17 +26,24 @@ def run_distill(argv: list[str]) -> int:
         arg = args.pop(0)
         if arg == "--project" and args:
             project_id = args.pop(0)
+        elif arg == "--workers" and args:
+            value = args.pop(0)
+            if not value.isdigit() or int(value) < 1:
+                print(f"Invalid --workers value: {value}", file=sys.stderr)
+                return 1
+            workers = int(value)
         elif arg == "--retry-errors":
             retry_errors = True
         elif arg == "--dry-run":
             dry_run = True
         elif arg in ("-h", "--help"):
-            print("Usage: searchat distill [--project PROJECT] [--retry-errors] [--dry-run]")
+            print("Usage: searchat distill [--project PROJECT] [--workers N] [--retry-errors] [--dry-run]")
             print()
             print("Distill pending conversations into the Memory Palace.")
             print()
             print("Options:")
             print("  --project PROJECT   Filter by project ID")
+            print("  --workers N         Concurrent LLM calls (default: [distillation] workers)")
             print("  --retry-errors      Clear LLM error skips and retry")
             print("  --dry-run           List pending conversations without distilling")
             return 0
@@ -43,6 +57,8 @@ def run_distill(argv: list[str]) -> int:
     if not config.palace.enabled:
         print("Palace is not enabled. Set [palace] enabled = true in settings.toml")
         return 1
+    if workers is not None:
+        config.distillation.workers = workers
 
     search_dir = PathResolver.get_shared_search_dir(config)
     data_dir = search_dir / "data"
@@ -62,6 +78,8 @@ def run_distill(argv: list[str]) -> int:
         provider=config.distillation.provider,
         model=config.distillation.cli_model,
         prompt_template=config.distillation.prompt,
+        packed_prompt_template=config.distillation.packed_prompt,
+        timeout_seconds=config.distillation.call_timeout_seconds,
     )
 
     # Get a duckdb_store for reading conversations
@@ -91,12 +109,44 @@ def run_distill(argv: list[str]) -> int:
         print("Nothing to distill.")
         return 0
 
+    print(f"Workers: {config.distillation.workers}")
+    last_report = time.monotonic()
+
+    def report(progress: SchedulerStats) -> None:
+        nonlocal last_report
+        if time.monotonic() - last_report < _PROGRESS_INTERVAL_SECONDS:
+            return
+        last_report = time.monotonic()
+        finished = (
+            progress.conversations_done
+            + progress.conversations_skipped
+            + progress.conversations_failed
+        )
+        print(
+            f"  {finished}/{progress.conversations_total} conversations, "
+            f"queue depth {progress.queue_depth}, "
+            f"{progress.exchanges_per_second:.2f} exchanges/s, "
+            f"call p50 {progress.latency_p50_ms / 1000:.1f}s"
+        )
+
     start = time.time()
-    stats = distiller.distill_all_pending(project_id)
+    stats = distiller.distill_all_pending(project_id, on_progress=report)
     elapsed = time.time() - start
 
     print(f"Distilled {stats.conversations_processed} conversations")
     print(f"  Objects created: {stats.objects_created}")
+    run = distiller.last_run
+    if run is not None:
+        print(f"  Skipped: {run.conversations_skipped}, failed (will retry): {run.conversations_failed}")
+        print(f"  LLM calls: {run.calls} ({run.retries} retries, {run.failed_calls} failed)")
+        print(
+            f"  Call latency: p50 {run.latency_p50_ms / 1000:.1f}s, "
+            f"p95 {run.latency_p95_ms / 1000:.1f}s, max {run.latency_max_ms / 1000:.1f}s"
+        )
+        print(
+            f"  Throughput: {run.exchanges_per_second:.2f} exchanges/s, "
+            f"{run.conversations_per_minute:.1f} conversations/min"
+        )
     print(f"  Time: {elapsed:.1f}s")
 
     distiller.close()
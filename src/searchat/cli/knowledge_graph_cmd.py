@@ -77,12 +77,13 @@ def _cmd_stats(args: argparse.Namespace) -> int:
 
     edge_type_counts: dict[str, int] = {t.value: 0 for t in EdgeType}
     total_edges = 0
-    for record in all_records:
-        edges = kg_store.get_edges_for_record(record.id, as_source=True, as_target=False)
-        for edge in edges:
-            if edge.source_id == record.id:
-                edge_type_counts[edge.edge_type.value] += 1
-                total_edges += 1
+    with kg_store.session():
+        for record in all_records:
+            edges = kg_store.get_edges_for_record(record.id, as_source=True, as_target=False)
+            for edge in edges:
+                if edge.source_id == record.id:
+                    edge_type_counts[edge.edge_type.value] += 1
+                    total_edges += 1
 
     contradiction_rate = len(all_contradictions) / node_count if node_count > 0 else 0.0
     health_score = max(
@@ -126,13 +127,14 @@ def _cmd_contradictions(args: argparse.Namespace) -> int:
 
     if args.domain:
         filtered = []
-        for edge in edges:
-            rec_a = expertise_store.get(edge.source_id)
-            rec_b = expertise_store.get(edge.target_id)
-            if (rec_a and rec_a.domain == args.domain) or (
-                rec_b and rec_b.domain == args.domain
-            ):
-                filtered.append(edge)
+        with expertise_store.session():
+            for edge in edges:
+                rec_a = expertise_store.get(edge.source_id)
+                rec_b = expertise_store.get(edge.target_id)
+                if (rec_a and rec_a.domain == args.domain) or (
+                    rec_b and rec_b.domain == args.domain
+                ):
+                    filtered.append(edge)
         edges = filtered
 
     if not edges:
@@ -145,16 +147,17 @@ def _cmd_contradictions(args: argparse.Namespace) -> int:
     resolved_label = " (resolved)" if not args.unresolved_only else ""
     print(f"Contradictions{resolved_label}: {len(edges)}")
     print("-" * 60)
-    for edge in edges:
-        status = "OPEN" if edge.resolution_id is None else "RESOLVED"
-        rec_a = expertise_store.get(edge.source_id)
-        rec_b = expertise_store.get(edge.target_id)
-        content_a = (rec_a.content[:60] + "...") if rec_a and len(rec_a.content) > 60 else (rec_a.content if rec_a else "<deleted>")
-        content_b = (rec_b.content[:60] + "...") if rec_b and len(rec_b.content) > 60 else (rec_b.content if rec_b else "<deleted>")
-        print(f"  [{status}] {edge.id}")
-        print(f"    A ({edge.source_id}): {content_a}")
-        print(f"    B ({edge.target_id}): {content_b}")
-        print()
+    with expertise_store.session():
+        for edge in edges:
+            status = "OPEN" if edge.resolution_id is None else "RESOLVED"
+            rec_a = expertise_store.get(edge.source_id)
+            rec_b = expertise_store.get(edge.target_id)
+            content_a = (rec_a.content[:60] + "...") if rec_a and len(rec_a.content) > 60 else (rec_a.content if rec_a else "<deleted>")
+            content_b = (rec_b.content[:60] + "...") if rec_b and len(rec_b.content) > 60 else (rec_b.content if rec_b else "<deleted>")
+            print(f"  [{status}] {edge.id}")
+            print(f"    A ({edge.source_id}): {content_a}")
+            print(f"    B ({edge.target_id}): {content_b}")
+            print()
 
     kg_store.close()
     return 0
@@ -440,6 +440,11 @@ def main():
 
             raise SystemExit(run_health(argv[1:]))
 
+        if argv and argv[0] == "profile":
+            from searchat.cli.profile_cmd import run_profile
+
+            raise SystemExit(run_profile(argv[1:]))
+
         if argv and argv[0] == "ci-check":
             from searchat.cli.ci_check_cmd import run_ci_check
 
@@ -475,6 +480,7 @@ def main():
             print("  searchat distill [--project PROJECT] [--retry-errors] [--dry-run]")
             print("  searchat migrate-storage [--dry-run] [--verify] [--rollback]")
             print("  searchat health [--url URL] [--json]")
+            print("  searchat profile [--url URL] [--traces N] [--json]")
             print("  searchat ci-check [--fail-on-contradictions] [--fail-on-staleness-threshold FLOAT]")
             print()
             return
@@ -0,0 +1,86 @@
+"""CLI command: searchat profile — dump per-stage search/indexing timings."""
+from __future__ import annotations
+
+import json
+import sys
+import urllib.error
+import urllib.request
+
+
+def run_profile(argv: list[str]) -> int:
+    url = "http://localhost:8000"
+    raw_json = False
+    traces = 5
+
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg == "--url" and args:
+            url = args.pop(0)
+        elif arg == "--json":
+            raw_json = True
+        elif arg == "--traces" and args:
+            traces = int(args.pop(0))
+        elif arg in ("-h", "--help"):
+            print("Usage: searchat profile [--url URL] [--traces N] [--json]")
+            print()
+            print("Requires performance.enable_profiling = true on the server.")
+            print()
+            print("Options:")
+            print("  --url URL     Server URL (default: http://localhost:8000)")
+            print("  --traces N    Recent searches to break down by stage (default: 5)")
+            print("  --json        Output raw JSON instead of tables")
+            return 0
+
+    endpoint = f"{url.rstrip('/')}/api/status/profile?traces={traces}"
+
+    try:
+        req = urllib.request.Request(endpoint)
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            data = json.loads(resp.read().decode())
+    except (urllib.error.URLError, OSError) as exc:
+        print(f"Error: cannot reach server at {endpoint}: {exc}", file=sys.stderr)
+        return 1
+
+    if raw_json:
+        print(json.dumps(data, indent=2))
+        return 0
+
+    if not data.get("enabled"):
+        print(
+            "Profiling is disabled. Set performance.enable_profiling = true "
+            "(or SEARCHAT_ENABLE_PROFILING=true) and restart the server.",
+            file=sys.stderr,
+        )
+        return 1
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    stages = data.get("stages", [])
+    if not stages:
+        console.print("No timings recorded yet.")
+        return 0
+
+    table = Table(show_header=True, title="Stage timings (ms)")
+    table.add_column("Stage", style="bold")
+    for column in ("Count", "Mean", "p50", "p95", "p99", "Max"):
+        table.add_column(column, justify="right")
+    for stage in stages:
+        table.add_row(
+            stage["stage"],
+            str(stage["count"]),
+            f"{stage['mean_ms']:.1f}",
+            f"{stage['p50_ms']:.1f}",
+            f"{stage['p95_ms']:.1f}",
+            f"{stage['p99_ms']:.1f}",
+            f"{stage['max_ms']:.1f}",
+        )
+    console.print(table)
+
+    for trace in data.get("recent", []):
+        breakdown = ", ".join(f"{s['stage']}={s['ms']:.1f}" for s in trace["stages"])
+        console.print(f"{trace['total_ms']:8.1f}ms  {trace['label']}  [dim]{breakdown}[/]")
+
+    return 0
@@ -58,6 +58,10 @@ VALID_TOOL_NAMES: frozenset[str] = frozenset({
 # Embedding model
 DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 DEFAULT_EMBEDDING_BATCH_SIZE = 32
+DEFAULT_EMBEDDING_MAX_BATCH_TOKENS = 0  # 0 = limit batches by batch_size only
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 200_000  # ~300 MB on disk at 384 dims
+DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS = 3.0
+DEFAULT_EMBEDDING_QUERY_CACHE_SIZE = 256
 
 # Text chunking
 DEFAULT_CHUNK_SIZE = 1500
@@ -88,6 +92,7 @@ INDEX_SCHEMA_VERSION = "1.2"
 INDEX_FORMAT_VERSION = "1.0"
 INDEX_FORMAT = "parquet+faiss"
 INDEX_METADATA_FILENAME = "index_metadata.json"
+KEYWORD_INDEX_FILENAME = "keyword_index.duckdb"
 
 # Search engine backend
 DEFAULT_SEARCH_ENGINE = "unified"  # "legacy" | "unified"
@@ -111,6 +116,7 @@ DEFAULT_DUCKDB_FILENAME = "searchat.duckdb"
 DEFAULT_HNSW_EF_CONSTRUCTION = 128
 DEFAULT_HNSW_EF_SEARCH = 64
 DEFAULT_HNSW_M = 16
+DEFAULT_VECTOR_BACKEND = "faiss"  # "faiss" | "duckdb"
 
 # ============================================================================
 # Performance Defaults
@@ -118,8 +124,19 @@ DEFAULT_HNSW_M = 16
 
 DEFAULT_MEMORY_LIMIT_MB = 3000
 DEFAULT_QUERY_CACHE_SIZE = 100
+DEFAULT_QUERY_CACHE_MB = 32
+DEFAULT_QUERY_CACHE_TTL_SECONDS = 300
 DEFAULT_ENABLE_PROFILING = False
 DEFAULT_FAISS_MMAP = False
+DEFAULT_FAISS_INDEX_TYPE = "auto"  # "auto" | "flat" | "hnsw" | "ivf" | "ivfpq"
+DEFAULT_FAISS_MEMORY_BUDGET_MB = 2048
+DEFAULT_CODE_INDEX_ENABLED = True
+DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES = 200_000
+DEFAULT_RETRIEVAL_WORKERS = 4
+DEFAULT_INFERENCE_WORKERS = 1
+DEFAULT_EXECUTOR_QUEUE_LIMIT = 32
+DEFAULT_EXPORT_WORKERS = 2
+DEFAULT_EXPORT_CACHE_MB = 64
 
 # =========================================================================
 # Analytics Defaults
@@ -127,6 +144,10 @@ DEFAULT_FAISS_MMAP = False
 
 DEFAULT_ANALYTICS_ENABLED = False
 DEFAULT_ANALYTICS_RETENTION_DAYS = 30
+DEFAULT_ANALYTICS_BUFFER_SIZE = 10_000  # pending events; oldest dropped when full
+DEFAULT_ANALYTICS_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_ANALYTICS_FLUSH_BATCH = 500  # wake the writer early at this many pending events
+DEFAULT_ANALYTICS_RETENTION_INTERVAL_SECONDS = 3600
 
 # Chat feature flags
 DEFAULT_ENABLE_RAG_CHAT = True
@@ -228,6 +249,10 @@ ENV_HOST = "SEARCHAT_HOST"
 ENV_MEMORY_LIMIT = "SEARCHAT_MEMORY_LIMIT_MB"
 ENV_EMBEDDING_MODEL = "SEARCHAT_EMBEDDING_MODEL"
 ENV_EMBEDDING_BATCH = "SEARCHAT_EMBEDDING_BATCH_SIZE"
+ENV_EMBEDDING_MAX_BATCH_TOKENS = "SEARCHAT_EMBEDDING_MAX_BATCH_TOKENS"
+ENV_EMBEDDING_CACHE_MAX_ENTRIES = "SEARCHAT_EMBEDDING_CACHE_MAX_ENTRIES"
+ENV_EMBEDDING_QUERY_BATCH_WINDOW_MS = "SEARCHAT_EMBEDDING_QUERY_BATCH_WINDOW_MS"
+ENV_EMBEDDING_QUERY_CACHE_SIZE = "SEARCHAT_EMBEDDING_QUERY_CACHE_SIZE"
 ENV_CACHE_SIZE = "SEARCHAT_QUERY_CACHE_SIZE"
 ENV_PROFILING = "SEARCHAT_ENABLE_PROFILING"
 ENV_ENABLE_CONNECTORS = "SEARCHAT_ENABLE_CONNECTORS"
@@ -267,6 +292,7 @@ ENV_KG_NLI_MODEL = "SEARCHAT_KG_NLI_MODEL"
 # Storage backend
 ENV_STORAGE_BACKEND = "SEARCHAT_STORAGE_BACKEND"
 ENV_DUCKDB_PATH = "SEARCHAT_DUCKDB_PATH"
+ENV_VECTOR_BACKEND = "SEARCHAT_VECTOR_BACKEND"
 
 ENV_ISOLATION_MODE = "SEARCHAT_ISOLATION_MODE"
 ENV_VARIANT_SUFFIX = "SEARCHAT_VARIANT_SUFFIX"
@@ -310,6 +336,27 @@ You will be provided with "Context Chunks" retrieved from the user's past chat h
 FTS_STEMMER = "english"
 FTS_STOPWORDS = "english"
 
+# Persistent keyword index tokenization (mirrors DuckDB FTS defaults:
+# strip accents, lowercase, split on non-letters)
+FTS_TOKEN_SPLIT_PATTERN = "[^a-z]+"
+FTS_ENGLISH_STOPWORDS: frozenset[str] = frozenset({
+    "a", "about", "above", "after", "again", "against", "all", "am", "an",
+    "and", "any", "are", "as", "at", "be", "because", "been", "before",
+    "being", "below", "between", "both", "but", "by", "can", "could", "did",
+    "do", "does", "doing", "down", "during", "each", "few", "for", "from",
+    "further", "had", "has", "have", "having", "he", "her", "here", "hers",
+    "herself", "him", "himself", "his", "how", "i", "if", "in", "into", "is",
+    "it", "its", "itself", "just", "me", "more", "most", "my", "myself",
+    "no", "nor", "not", "now", "of", "off", "on", "once", "only", "or",
+    "other", "our", "ours", "ourselves", "out", "over", "own", "same", "she",
+    "should", "so", "some", "such", "than", "that", "the", "their", "theirs",
+    "them", "themselves", "then", "there", "these", "they", "this", "those",
+    "through", "to", "too", "under", "until", "up", "very", "was", "we",
+    "were", "what", "when", "where", "which", "while", "who", "whom", "why",
+    "will", "with", "would", "you", "your", "yours", "yourself",
+    "yourselves",
+})
+
 # ============================================================================
 # CORS / Server Defaults
 # ============================================================================
@@ -374,6 +421,13 @@ DEFAULT_DISTILLATION_CLI_MODEL_OPENAI = "gpt-5.3-codex"
 DEFAULT_DISTILLATION_BATCH_SIZE = 10
 DEFAULT_DISTILLATION_MAX_PLY_LENGTH = 20
 DEFAULT_DISTILLATION_MIN_EXCHANGE_CHARS = 50
+# Scheduler: concurrent LLM calls, per-provider caps, prompt packing, retries.
+DEFAULT_DISTILLATION_WORKERS = 4
+DEFAULT_DISTILLATION_PROVIDER_CONCURRENCY: dict[str, int] = {"claude": 4, "openai": 4}
+DEFAULT_DISTILLATION_PACK_TOKEN_BUDGET = 4000
+DEFAULT_DISTILLATION_MAX_RETRIES = 3
+DEFAULT_DISTILLATION_RETRY_BACKOFF_SECONDS = 2.0
+DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS = 300
 
 DEFAULT_DISTILLATION_PROMPT = """Distill this conversation exchange into JSON:
 
@@ -390,6 +444,20 @@ Return ONLY valid JSON matching this schema:
 {{"exchange_core": "...", "specific_context": "...", "room_assignments": [...]}}
 """
 
+DEFAULT_DISTILLATION_PACKED_PROMPT = """Distill each of the {exchange_count} conversation exchanges below into JSON, independently of the others:
+
+- "exchange_core": 1-2 sentences. What was accomplished or decided? Use the specific terms from the exchange. Do not invent details not present in the text. If the exchange is mostly empty, say so briefly.
+- "specific_context": One concrete detail from the text: a number, error message, parameter name, or file path. Copy it exactly from the text. Do not use the project path.
+- "room_assignments": 1-3 rooms. Each room is a topic this exchange belongs to. {{"room_type": "<file|concept|workflow>", "room_key": "<identifier>", "room_label": "<short label>", "relevance": <0.0-1.0>}}. A room should be specific enough to group related exchanges (e.g. "retry_timeout" not "errors").
+
+Project: {project_id}
+
+{exchanges_text}
+
+Return ONLY valid JSON matching this schema, with exactly one entry per exchange, in order:
+{{"exchanges": [{{"exchange_core": "...", "specific_context": "...", "room_assignments": [...]}}, ...]}}
+"""
+
 DEFAULT_PERTURN_PROMPT = """Distill this conversation exchange into JSON:
 
 - "exchange_core": 1-2 sentences. What was accomplished or decided? Use specific terms from the text.
@@ -413,6 +481,10 @@ ENV_DISTILLATION_CLI_MODEL = "SEARCHAT_DISTILLATION_CLI_MODEL"
 ENV_DISTILLATION_BATCH_SIZE = "SEARCHAT_DISTILLATION_BATCH_SIZE"
 ENV_DISTILLATION_MAX_PLY_LENGTH = "SEARCHAT_DISTILLATION_MAX_PLY_LENGTH"
 ENV_DISTILLATION_MIN_EXCHANGE_CHARS = "SEARCHAT_DISTILLATION_MIN_EXCHANGE_CHARS"
+ENV_DISTILLATION_WORKERS = "SEARCHAT_DISTILLATION_WORKERS"
+ENV_DISTILLATION_PACK_TOKEN_BUDGET = "SEARCHAT_DISTILLATION_PACK_TOKEN_BUDGET"
+ENV_DISTILLATION_MAX_RETRIES = "SEARCHAT_DISTILLATION_MAX_RETRIES"
+ENV_DISTILLATION_CALL_TIMEOUT_SECONDS = "SEARCHAT_DISTILLATION_CALL_TIMEOUT_SECONDS"
 ENV_PALACE_ENABLED = "SEARCHAT_PALACE_ENABLED"
 
 # ============================================================================
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import os
 from typing import overload
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import tomli
 from dotenv import load_dotenv
@@ -30,7 +30,9 @@ from .constants import (
     DEFAULT_HNSW_EF_CONSTRUCTION,
     DEFAULT_HNSW_EF_SEARCH,
     DEFAULT_HNSW_M,
+    DEFAULT_VECTOR_BACKEND,
     ENV_DUCKDB_PATH,
+    ENV_VECTOR_BACKEND,
     # Search engine / ranking defaults
     DEFAULT_RANKING_INTERSECTION_BOOST,
     DEFAULT_RANKING_KEYWORD_WEIGHT,
@@ -43,6 +45,10 @@ from .constants import (
     # Defaults
     DEFAULT_EMBEDDING_MODEL,
     DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
+    DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+    DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS,
+    DEFAULT_EMBEDDING_QUERY_CACHE_SIZE,
     DEFAULT_INDEX_BATCH_SIZE,
     DEFAULT_MAX_WORKERS,
     DEFAULT_AUTO_INDEX,
@@ -61,6 +67,16 @@ from .constants import (
     DEFAULT_QUERY_CACHE_SIZE,
     DEFAULT_ENABLE_PROFILING,
     DEFAULT_FAISS_MMAP,
+    DEFAULT_FAISS_INDEX_TYPE,
+    DEFAULT_FAISS_MEMORY_BUDGET_MB,
+    DEFAULT_CODE_INDEX_ENABLED,
+    DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES,
+    DEFAULT_EXPORT_WORKERS,
+    DEFAULT_EXPORT_CACHE_MB,
+    DEFAULT_RETRIEVAL_WORKERS,
+    DEFAULT_INFERENCE_WORKERS,
+    DEFAULT_EXECUTOR_QUEUE_LIMIT,
+    DEFAULT_QUERY_CACHE_MB,
     DEFAULT_ANALYTICS_ENABLED,
     DEFAULT_ANALYTICS_RETENTION_DAYS,
     DEFAULT_ENABLE_RAG_CHAT,
@@ -85,6 +101,10 @@ from .constants import (
     ENV_MEMORY_LIMIT,
     ENV_EMBEDDING_MODEL,
     ENV_EMBEDDING_BATCH,
+    ENV_EMBEDDING_MAX_BATCH_TOKENS,
+    ENV_EMBEDDING_CACHE_MAX_ENTRIES,
+    ENV_EMBEDDING_QUERY_BATCH_WINDOW_MS,
+    ENV_EMBEDDING_QUERY_CACHE_SIZE,
     ENV_CACHE_SIZE,
     ENV_PROFILING,
     ENV_ENABLE_CONNECTORS,
@@ -150,6 +170,13 @@ from .constants import (
     DEFAULT_DISTILLATION_MAX_PLY_LENGTH,
     DEFAULT_DISTILLATION_MIN_EXCHANGE_CHARS,
     DEFAULT_DISTILLATION_PROMPT,
+    DEFAULT_DISTILLATION_PACKED_PROMPT,
+    DEFAULT_DISTILLATION_WORKERS,
+    DEFAULT_DISTILLATION_PROVIDER_CONCURRENCY,
+    DEFAULT_DISTILLATION_PACK_TOKEN_BUDGET,
+    DEFAULT_DISTILLATION_MAX_RETRIES,
+    DEFAULT_DISTILLATION_RETRY_BACKOFF_SECONDS,
+    DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS,
     DEFAULT_PERTURN_PROMPT,
     DEFAULT_PALACE_ENABLED,
     ENV_DISTILLATION_PROVIDER,
@@ -157,6 +184,10 @@ from .constants import (
     ENV_DISTILLATION_BATCH_SIZE,
     ENV_DISTILLATION_MAX_PLY_LENGTH,
     ENV_DISTILLATION_MIN_EXCHANGE_CHARS,
+    ENV_DISTILLATION_WORKERS,
+    ENV_DISTILLATION_PACK_TOKEN_BUDGET,
+    ENV_DISTILLATION_MAX_RETRIES,
+    ENV_DISTILLATION_CALL_TIMEOUT_SECONDS,
     ENV_PALACE_ENABLED,
 )
 
@@ -380,6 +411,10 @@ class EmbeddingConfig:
     batch_size: int
     cache_embeddings: bool
     device: str = "auto"  # auto, cuda, cpu
+    max_batch_tokens: int = DEFAULT_EMBEDDING_MAX_BATCH_TOKENS
+    cache_max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+    query_batch_window_ms: float = DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS
+    query_cache_size: int = DEFAULT_EMBEDDING_QUERY_CACHE_SIZE
 
     @classmethod
     def from_dict(cls, data: dict) -> "EmbeddingConfig":
@@ -401,6 +436,22 @@ class EmbeddingConfig:
                 "SEARCHAT_EMBEDDING_DEVICE",
                 data.get("device", "auto")
             ) or "auto",
+            max_batch_tokens=_get_env_int(
+                ENV_EMBEDDING_MAX_BATCH_TOKENS,
+                data.get("max_batch_tokens", DEFAULT_EMBEDDING_MAX_BATCH_TOKENS)
+            ),
+            cache_max_entries=_get_env_int(
+                ENV_EMBEDDING_CACHE_MAX_ENTRIES,
+                data.get("cache_max_entries", DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES)
+            ),
+            query_batch_window_ms=_get_env_float(
+                ENV_EMBEDDING_QUERY_BATCH_WINDOW_MS,
+                data.get("query_batch_window_ms", DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS)
+            ),
+            query_cache_size=_get_env_int(
+                ENV_EMBEDDING_QUERY_CACHE_SIZE,
+                data.get("query_cache_size", DEFAULT_EMBEDDING_QUERY_CACHE_SIZE)
+            ),
         )
 
     def get_device(self) -> str:
@@ -515,6 +566,16 @@ class PerformanceConfig:
     query_cache_size: int
     enable_profiling: bool
     faiss_mmap: bool
+    retrieval_workers: int = DEFAULT_RETRIEVAL_WORKERS
+    inference_workers: int = DEFAULT_INFERENCE_WORKERS
+    executor_queue_limit: int = DEFAULT_EXECUTOR_QUEUE_LIMIT
+    query_cache_mb: int = DEFAULT_QUERY_CACHE_MB
+    faiss_index_type: str = DEFAULT_FAISS_INDEX_TYPE
+    faiss_memory_budget_mb: int = DEFAULT_FAISS_MEMORY_BUDGET_MB
+    code_index: bool = DEFAULT_CODE_INDEX_ENABLED
+    suggestion_index_max_entries: int = DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES
+    export_workers: int = DEFAULT_EXPORT_WORKERS
+    export_cache_mb: int = DEFAULT_EXPORT_CACHE_MB
 
     @classmethod
     def from_dict(cls, data: dict) -> "PerformanceConfig":
@@ -536,6 +597,46 @@ class PerformanceConfig:
                 "SEARCHAT_FAISS_MMAP",
                 bool(data.get("faiss_mmap", DEFAULT_FAISS_MMAP)),
             ),
+            retrieval_workers=_get_env_int(
+                "SEARCHAT_RETRIEVAL_WORKERS",
+                data.get("retrieval_workers", DEFAULT_RETRIEVAL_WORKERS),
+            ),
+            inference_workers=_get_env_int(
+                "SEARCHAT_INFERENCE_WORKERS",
+                data.get("inference_workers", DEFAULT_INFERENCE_WORKERS),
+            ),
+            executor_queue_limit=_get_env_int(
+                "SEARCHAT_EXECUTOR_QUEUE_LIMIT",
+                data.get("executor_queue_limit", DEFAULT_EXECUTOR_QUEUE_LIMIT),
+            ),
+            query_cache_mb=_get_env_int(
+                "SEARCHAT_QUERY_CACHE_MB",
+                data.get("query_cache_mb", DEFAULT_QUERY_CACHE_MB),
+            ),
+            faiss_index_type=_get_env_str(
+                "SEARCHAT_FAISS_INDEX_TYPE",
+                data.get("faiss_index_type", DEFAULT_FAISS_INDEX_TYPE),
+            ) or DEFAULT_FAISS_INDEX_TYPE,
+            faiss_memory_budget_mb=_get_env_int(
+                "SEARCHAT_FAISS_MEMORY_BUDGET_MB",
+                data.get("faiss_memory_budget_mb", DEFAULT_FAISS_MEMORY_BUDGET_MB),
+            ),
+            code_index=_get_env_bool(
+                "SEARCHAT_CODE_INDEX",
+                bool(data.get("code_index", DEFAULT_CODE_INDEX_ENABLED)),
+            ),
+            suggestion_index_max_entries=_get_env_int(
+                "SEARCHAT_SUGGESTION_INDEX_MAX_ENTRIES",
+                data.get("suggestion_index_max_entries", DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES),
+            ),
+            export_workers=_get_env_int(
+                "SEARCHAT_EXPORT_WORKERS",
+                data.get("export_workers", DEFAULT_EXPORT_WORKERS),
+            ),
+            export_cache_mb=_get_env_int(
+                "SEARCHAT_EXPORT_CACHE_MB",
+                data.get("export_cache_mb", DEFAULT_EXPORT_CACHE_MB),
+            ),
         )
 
 
@@ -795,6 +896,15 @@ class DistillationConfig:
     min_exchange_chars: int
     prompt: str
     perturn_prompt: str
+    packed_prompt: str = DEFAULT_DISTILLATION_PACKED_PROMPT
+    workers: int = DEFAULT_DISTILLATION_WORKERS
+    provider_concurrency: dict[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_DISTILLATION_PROVIDER_CONCURRENCY)
+    )
+    pack_token_budget: int = DEFAULT_DISTILLATION_PACK_TOKEN_BUDGET
+    max_retries: int = DEFAULT_DISTILLATION_MAX_RETRIES
+    retry_backoff_seconds: float = DEFAULT_DISTILLATION_RETRY_BACKOFF_SECONDS
+    call_timeout_seconds: int = DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS
 
     @classmethod
     def from_dict(cls, data: dict) -> "DistillationConfig":
@@ -826,6 +936,32 @@ class DistillationConfig:
             ),
             prompt=data.get("prompt", DEFAULT_DISTILLATION_PROMPT),
             perturn_prompt=data.get("perturn_prompt", DEFAULT_PERTURN_PROMPT),
+            packed_prompt=data.get("packed_prompt", DEFAULT_DISTILLATION_PACKED_PROMPT),
+            workers=max(1, _get_env_int(
+                ENV_DISTILLATION_WORKERS,
+                data.get("workers", DEFAULT_DISTILLATION_WORKERS),
+            )),
+            provider_concurrency={
+                str(name).strip().lower(): max(1, int(limit))
+                for name, limit in data.get(
+                    "provider_concurrency", DEFAULT_DISTILLATION_PROVIDER_CONCURRENCY,
+                ).items()
+            },
+            pack_token_budget=max(0, _get_env_int(
+                ENV_DISTILLATION_PACK_TOKEN_BUDGET,
+                data.get("pack_token_budget", DEFAULT_DISTILLATION_PACK_TOKEN_BUDGET),
+            )),
+            max_retries=max(0, _get_env_int(
+                ENV_DISTILLATION_MAX_RETRIES,
+                data.get("max_retries", DEFAULT_DISTILLATION_MAX_RETRIES),
+            )),
+            retry_backoff_seconds=max(0.0, float(
+                data.get("retry_backoff_seconds", DEFAULT_DISTILLATION_RETRY_BACKOFF_SECONDS),
+            )),
+            call_timeout_seconds=max(1, _get_env_int(
+                ENV_DISTILLATION_CALL_TIMEOUT_SECONDS,
+                data.get("call_timeout_seconds", DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS),
+            )),
         )
 
 
@@ -850,9 +986,17 @@ class StorageConfig:
     hnsw_ef_construction: int
     hnsw_ef_search: int
     hnsw_m: int
+    vector_backend: str = DEFAULT_VECTOR_BACKEND  # "faiss" | "duckdb"
 
     @classmethod
     def from_dict(cls, data: dict) -> "StorageConfig":
+        vector_backend = _get_env_str(
+            ENV_VECTOR_BACKEND,
+            data.get("vector_backend", DEFAULT_VECTOR_BACKEND),
+        )
+        normalized_backend = str(vector_backend or DEFAULT_VECTOR_BACKEND).strip().lower()
+        if normalized_backend not in {"faiss", "duckdb"}:
+            normalized_backend = DEFAULT_VECTOR_BACKEND
         return cls(
             backend="duckdb",
             duckdb_path=_get_env_str(
@@ -871,6 +1015,7 @@ class StorageConfig:
                 "SEARCHAT_HNSW_M",
                 data.get("hnsw_m", DEFAULT_HNSW_M),
             ),
+            vector_backend=normalized_backend,
         )
 
     def resolve_duckdb_path(self, search_dir: str | Path) -> Path:
@@ -96,10 +96,18 @@ def code_search_index_missing_message() -> str:
     return "Code index not found. Rebuild the index to enable /api/search/code."
 
 
+def invalid_code_regex_message(reason: str) -> str:
+    return f"Invalid regular expression: {reason}"
+
+
 def retrieval_capability_inspection_failed_message(reason: str) -> str:
     return f"Retrieval capability inspection failed: {reason}"
 
 
+def server_busy_message() -> str:
+    return "Server is busy; retry shortly"
+
+
 def snapshot_not_found_message() -> str:
     return "Snapshot not found"
 
@@ -33,6 +33,14 @@ class RetrievalBackend(Protocol):
         self, text: str, k: int
     ) -> list[SemanticVectorHit]: ...
 
+    def similar_conversation_rows(
+        self,
+        vector_hits: list[SemanticVectorHit],
+        *,
+        exclude_conversation_id: str,
+        limit: int,
+    ) -> list[tuple]: ...
+
     def describe_capabilities(self) -> RetrievalCapabilities: ...
 
     def refresh_index(self) -> None: ...
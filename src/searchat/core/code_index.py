@@ -0,0 +1,710 @@
+"""Persistent symbol and trigram index over extracted code blocks.
+
+The legacy indexer writes code blocks to ``data/code/project_*.parquet``, and
+the code endpoints used to scan every one of those files per request.
+:class:`CodeIndex` keeps ``data/indices/code_index.duckdb`` alongside them:
+
+  - ``code_blocks``   one row per block, with an ART index on ``block_id``;
+  - ``code_symbols``  (kind, symbol) -> (conversation_id, message_index,
+    block_index, block_id), written sorted by key so lookups prune by zonemap;
+  - ``code_trigrams`` block-id posting lists per lowercase trigram,
+    delta-encoded and zlib-compressed, one row per trigram per segment.
+
+Substring terms of :data:`MIN_TERM_LENGTH` or more characters, and the
+literals a regex requires, become posting-list intersections; the candidates
+are then verified with ``ILIKE`` / ``regexp_matches``.
+
+The indexer applies every code parquet change as it happens
+(:meth:`CodeIndex.apply`). Appends add a posting segment; removals delete
+block and symbol rows and leave stale postings that the block join drops.
+Past :data:`MAX_SEGMENTS` segments or :data:`MAX_DEAD_FRACTION` stale blocks
+the index is rebuilt from parquet. The index records the parquet files'
+:func:`parquet_signature`; readers only use it while that still matches the
+files on disk, and return ``None`` otherwise so callers scan parquet instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+
+from searchat.models.schemas import CODE_BLOCK_SCHEMA
+
+log = logging.getLogger(__name__)
+
+CODE_INDEX_FILENAME = "code_index.duckdb"
+SYMBOL_KINDS = ("functions", "classes", "imports")
+MIN_TERM_LENGTH = 3
+MAX_SEGMENTS = 64
+MAX_DEAD_FRACTION = 0.25
+# Candidate sets up to this size are fetched through the block_id index.
+POINT_LOOKUP_MAX = 256
+# Characters of code per posting segment while rebuilding; bounds build memory.
+BUILD_BATCH_CHARS = 8_000_000
+
+_BLOCK_COLUMNS = (
+    "conversation_id",
+    "project_id",
+    "connector",
+    "file_path",
+    "title",
+    "conversation_updated_at",
+    "message_index",
+    "block_index",
+    "role",
+    "message_timestamp",
+    "fence_language",
+    "language",
+    "language_source",
+    "code",
+    "code_hash",
+    "lines",
+)
+
+# Same columns, in the same order, as the parquet queries in the code routes.
+RESULT_COLUMNS = (
+    "conversation_id, project_id, title, file_path, connector, "
+    "message_index, block_index, role, language, language_source, "
+    "fence_language, lines, code, code_hash, conversation_updated_at"
+)
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS code_blocks (
+    block_id                BIGINT NOT NULL,
+    conversation_id         VARCHAR,
+    project_id              VARCHAR,
+    connector               VARCHAR,
+    file_path               VARCHAR,
+    title                   VARCHAR,
+    conversation_updated_at TIMESTAMP,
+    message_index           INTEGER,
+    block_index             INTEGER,
+    role                    VARCHAR,
+    message_timestamp       TIMESTAMP,
+    fence_language          VARCHAR,
+    language                VARCHAR,
+    language_source         VARCHAR,
+    code                    VARCHAR,
+    code_hash               VARCHAR,
+    lines                   INTEGER
+);
+CREATE TABLE IF NOT EXISTS code_symbols (
+    kind            VARCHAR NOT NULL,
+    symbol          VARCHAR NOT NULL,
+    conversation_id VARCHAR,
+    message_index   INTEGER,
+    block_index     INTEGER,
+    block_id        BIGINT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS code_blocks_block_id ON code_blocks(block_id);
+CREATE TABLE IF NOT EXISTS code_trigrams (
+    trigram  BIGINT NOT NULL,
+    segment  INTEGER NOT NULL,
+    postings BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS code_index_meta (
+    key   VARCHAR PRIMARY KEY,
+    value VARCHAR
+);
+"""
+
+_PATH_LOCKS: dict[str, threading.RLock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+# One read-only connection per index file, keyed by path, tagged with the
+# file identity it was opened on. Keeping it open keeps DuckDB's buffer cache.
+_READERS: dict[str, tuple[tuple[int, int, int], duckdb.DuckDBPyConnection]] = {}
+
+
+def code_index_path(search_dir: Path) -> Path:
+    return Path(search_dir) / "data" / "indices" / CODE_INDEX_FILENAME
+
+
+def parquet_signature(code_dir: Path) -> str:
+    """Fingerprint (name, size, mtime) of the code parquet files."""
+    digest = hashlib.sha1()
+    for path in sorted(Path(code_dir).glob("*.parquet")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def trigram_codes(text: str) -> np.ndarray:
+    """Sorted unique trigram codes of ``text`` (case-insensitive)."""
+    chars = _code_points(text.lower())
+    if chars.size < 3:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(_pack(chars))
+
+
+def regex_literals(pattern: str) -> list[str]:
+    """Literal runs every match of ``pattern`` must contain.
+
+    Conservative: only characters outside groups and character classes
+    count, a quantifier drops the character it applies to, and a top-level
+    alternation means nothing is required.
+    """
+    literals: list[str] = []
+    current: list[str] = []
+    depth = 0
+    i = 0
+
+    def flush() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+                i += 2
+            else:
+                flush()
+                i = _escape_end(pattern, i)
+            continue
+        if ch == "[":
+            flush()
+            i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            continue
+        if ch == "(":
+            flush()
+            depth += 1
+        elif ch == ")":
+            depth = max(0, depth - 1)
+        elif ch == "|" and depth == 0:
+            return []
+        elif ch in "*?{":
+            if current:
+                current.pop()
+            flush()
+            if ch == "{":
+                end = pattern.find("}", i)
+                i = len(pattern) if end < 0 else end
+        elif ch in "+.^$":
+            flush()
+        elif depth == 0:
+            current.append(ch)
+        i += 1
+    flush()
+    return literals
+
+
+def _escape_end(pattern: str, start: int) -> int:
+    """Index just past the escape sequence at ``pattern[start]``.
+
+    Covers the multi-character RE2 escapes (``\\xHH``, ``\\x{...}``,
+    ``\\pX``, ``\\p{...}``, octal ``\\NNN`` and ``\\Q...\\E``) so their
+    characters are not taken for literal text.
+    """
+    i = start + 1
+    kind = pattern[i : i + 1]
+    i += 1
+    if kind == "x":
+        if pattern[i : i + 1] == "{":
+            end = pattern.find("}", i)
+            return len(pattern) if end < 0 else end + 1
+        return min(i + 2, len(pattern))
+    if kind in ("p", "P"):
+        if pattern[i : i + 1] == "{":
+            end = pattern.find("}", i)
+            return len(pattern) if end < 0 else end + 1
+        return min(i + 1, len(pattern))
+    if kind == "Q":
+        end = pattern.find("\\E", i)
+        return len(pattern) if end < 0 else end + 2
+    if kind and kind in "01234567":
+        while i < len(pattern) and i < start + 4 and pattern[i] in "01234567":
+            i += 1
+    return i
+
+
+def _indexable(literal: str) -> bool:
+    # Non-ASCII case folding may differ between Python and DuckDB's ILIKE.
+    return len(literal) >= MIN_TERM_LENGTH and literal.isascii()
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+def _pack(chars: np.ndarray) -> np.ndarray:
+    # 21 bits per code point; three fit in a positive int64.
+    return (chars[:-2] << 42) | (chars[1:-1] << 21) | chars[2:]
+
+
+def _batch_postings(block_ids: np.ndarray, codes: Sequence[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR postings for one segment: (trigrams, offsets, block ids)."""
+    texts = [(code or "").lower() for code in codes]
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    chars = _code_points("".join(texts))
+    empty = np.empty(0, dtype=np.int64)
+    if chars.size < 3:
+        return empty, np.zeros(1, dtype=np.int64), empty
+
+    owners = np.repeat(np.asarray(block_ids, dtype=np.int64), lengths)
+    trigrams = _pack(chars)
+    # Keep trigrams whose three characters come from the same block.
+    same_block = owners[:-2] == owners[2:]
+    trigrams, owners = trigrams[same_block], owners[:-2][same_block]
+
+    order = np.lexsort((owners, trigrams))
+    trigrams, owners = trigrams[order], owners[order]
+    if trigrams.size == 0:
+        return empty, np.zeros(1, dtype=np.int64), empty
+    distinct = np.ones(trigrams.size, dtype=bool)
+    distinct[1:] = (trigrams[1:] != trigrams[:-1]) | (owners[1:] != owners[:-1])
+    trigrams, owners = trigrams[distinct], owners[distinct]
+
+    starts = np.flatnonzero(np.r_[True, trigrams[1:] != trigrams[:-1]])
+    return trigrams[starts], np.r_[starts, trigrams.size], owners
+
+
+def _encode_postings(block_ids: np.ndarray) -> bytes:
+    return zlib.compress(np.diff(block_ids, prepend=0).astype("<u4").tobytes(), 1)
+
+
+def _decode_postings(blob: bytes) -> np.ndarray:
+    return np.cumsum(np.frombuffer(zlib.decompress(blob), dtype="<u4"), dtype=np.int64)
+
+
+def _insert_postings(con: duckdb.DuckDBPyConnection, segment: int, block_ids: np.ndarray, codes: Sequence[str]) -> None:
+    trigrams, offsets, owners = _batch_postings(block_ids, codes)
+    if trigrams.size == 0:
+        return
+    postings = [
+        _encode_postings(owners[offsets[i] : offsets[i + 1]]) for i in range(trigrams.size)
+    ]
+    batch = pa.table({
+        "trigram": pa.array(trigrams, type=pa.int64()),
+        "segment": pa.array(np.full(trigrams.size, segment, dtype=np.int32)),
+        "postings": pa.array(postings, type=pa.binary()),
+    })
+    con.register("trigram_batch", batch)
+    try:
+        con.execute("INSERT INTO code_trigrams SELECT trigram, segment, postings FROM trigram_batch")
+    finally:
+        con.unregister("trigram_batch")
+
+
+def _path_lock(path: Path) -> threading.RLock:
+    # DuckDB refuses to open one file read-only and read-write at once in a
+    # process, so every connection to an index file is serialized here.
+    key = str(path.resolve())
+    with _PATH_LOCKS_GUARD:
+        lock = _PATH_LOCKS.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            _PATH_LOCKS[key] = lock
+        return lock
+
+
+def _cached_reader(path: Path) -> duckdb.DuckDBPyConnection:
+    """Shared read-only connection, reopened when the file changed (caller holds the path lock)."""
+    stat = path.stat()
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _READERS.get(str(path))
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    _drop_reader(path)
+    con = duckdb.connect(str(path), read_only=True)
+    _READERS[str(path)] = (identity, con)
+    return con
+
+
+def _drop_reader(path: Path) -> None:
+    cached = _READERS.pop(str(path), None)
+    if cached is not None:
+        cached[1].close()
+
+
+def _get_meta(con: duckdb.DuckDBPyConnection, key: str) -> str | None:
+    row = con.execute("SELECT value FROM code_index_meta WHERE key = ?", [key]).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(con: duckdb.DuckDBPyConnection, key: str, value: object) -> None:
+    con.execute("INSERT OR REPLACE INTO code_index_meta VALUES (?, ?)", [key, str(value)])
+
+
+class CodeIndex:
+    """Symbol and trigram index for one dataset's code blocks."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path).resolve()
+
+    @contextmanager
+    def _connect(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Read-write connection; closes this process's reader first."""
+        with _path_lock(self.path):
+            _drop_reader(self.path)
+            con = duckdb.connect(str(self.path))
+            try:
+                yield con
+            finally:
+                con.close()
+
+    @contextmanager
+    def _reader(self, code_dir: Path) -> Iterator[duckdb.DuckDBPyConnection | None]:
+        """Read-only connection while the index matches ``code_dir``, else None."""
+        with _path_lock(self.path):
+            con: duckdb.DuckDBPyConnection | None = None
+            try:
+                if self.path.exists():
+                    con = _cached_reader(self.path)
+                    if _get_meta(con, "signature") != parquet_signature(code_dir):
+                        con = None
+            except (OSError, duckdb.Error) as exc:
+                # Locked by a writer in another process, or unreadable.
+                log.debug("Code index unavailable, scanning Parquet: %s", exc)
+                _drop_reader(self.path)
+                con = None
+            yield con
+
+    # ------------------------------------------------------------------
+    # Maintenance (indexer)
+    # ------------------------------------------------------------------
+
+    def rebuild(self, code_dir: Path) -> int:
+        """Build the index from every parquet file in ``code_dir``.
+
+        Writes a fresh file and swaps it in, so readers never see a partial
+        index. Returns the number of blocks indexed.
+        """
+        code_dir = Path(code_dir)
+        signature = parquet_signature(code_dir)
+        files = sorted(code_dir.glob("*.parquet"))
+        tmp_path = self.path.with_name(self.path.name + ".rebuild")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in (tmp_path, tmp_path.with_name(tmp_path.name + ".wal")):
+            stale.unlink(missing_ok=True)
+
+        con = duckdb.connect(str(tmp_path))
+        try:
+            con.execute(_DDL)
+            total = self._load_parquet(con, [str(path) for path in files]) if files else 0
+            _set_meta(con, "signature", signature)
+            _set_meta(con, "dead_blocks", 0)
+            _set_meta(con, "next_block_id", total + 1)
+            con.execute("CHECKPOINT")
+        except BaseException:
+            con.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        con.close()
+
+        with _path_lock(self.path):
+            _drop_reader(self.path)
+            self.path.with_name(self.path.name + ".wal").unlink(missing_ok=True)
+            os.replace(tmp_path, self.path)
+        return total
+
+    @staticmethod
+    def _load_parquet(con: duckdb.DuckDBPyConnection, files: list[str]) -> int:
+        columns = {
+            row[0]
+            for row in con.execute(
+                "DESCRIBE SELECT * FROM read_parquet(?, union_by_name = true)", [files]
+            ).fetchall()
+        }
+        if not columns.issuperset(SYMBOL_KINDS):
+            # Pre-symbol code files: leave lookups to the Parquet scan, which
+            # reports that the index needs rebuilding.
+            raise ValueError("Code parquet files have no symbol columns")
+        selected = ", ".join(
+            column if column in columns else f"NULL AS {column}" for column in _BLOCK_COLUMNS
+        )
+        symbols = ", ".join(SYMBOL_KINDS)
+        con.execute(
+            f"""
+            CREATE TEMP TABLE staged AS
+            SELECT row_number() OVER () AS block_id, {selected}, {symbols}
+            FROM read_parquet(?, union_by_name = true)
+            """,
+            [files],
+        )
+        con.execute(
+            f"INSERT INTO code_blocks SELECT block_id, {', '.join(_BLOCK_COLUMNS)} FROM staged ORDER BY block_id"
+        )
+        unnested = " UNION ALL ".join(
+            f"SELECT '{kind}' AS kind, unnest({kind}) AS symbol, conversation_id, "
+            f"message_index, block_index, block_id FROM staged"
+            for kind in SYMBOL_KINDS
+        )
+        con.execute(
+            f"""
+            INSERT INTO code_symbols
+            SELECT DISTINCT * FROM ({unnested})
+            WHERE symbol IS NOT NULL AND symbol <> ''
+            ORDER BY kind, symbol, block_id
+            """
+        )
+        con.execute("DROP TABLE staged")
+
+        total, chars = con.execute(
+            "SELECT count(*), coalesce(sum(length(code)), 0) FROM code_blocks"
+        ).fetchone()
+        if not total:
+            return 0
+        per_segment = max(1, int(BUILD_BATCH_CHARS * total // max(chars, 1)))
+        for segment, first in enumerate(range(1, total + 1, per_segment), 1):
+            rows = con.execute(
+                "SELECT block_id, code FROM code_blocks WHERE block_id BETWEEN ? AND ? ORDER BY block_id",
+                [first, first + per_segment - 1],
+            ).fetchall()
+            ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            _insert_postings(con, segment, ids, [row[1] for row in rows])
+        return int(total)
+
+    def apply(
+        self,
+        code_dir: Path,
+        *,
+        before: str,
+        add: Sequence[dict] = (),
+        remove_conversation_ids: Iterable[str] = (),
+    ) -> None:
+        """Apply one code parquet change to the index.
+
+        ``before`` is :func:`parquet_signature` taken just before the parquet
+        write. If the index did not record it, the index missed an earlier
+        change and is rebuilt from parquet instead.
+        """
+        code_dir = Path(code_dir)
+        removed = list(dict.fromkeys(remove_conversation_ids))
+        rebuild = not self.path.exists()
+        if not rebuild:
+            try:
+                with self._connect() as con:
+                    if _get_meta(con, "signature") != before:
+                        rebuild = True
+                    else:
+                        rebuild = self._apply_incremental(con, code_dir, add, removed)
+            except duckdb.IOException as exc:
+                # Another process has the file open; a rebuild swaps in a new file.
+                log.info("Code index is locked, rebuilding it instead: %s", exc)
+                rebuild = True
+        if rebuild:
+            self.rebuild(code_dir)
+
+    def _apply_incremental(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        code_dir: Path,
+        add: Sequence[dict],
+        removed: list[str],
+    ) -> bool:
+        """Apply the change in one transaction; returns True when compaction is due."""
+        con.execute("BEGIN TRANSACTION")
+        try:
+            dead = int(_get_meta(con, "dead_blocks") or 0)
+            if removed:
+                dead += con.execute(
+                    "SELECT count(*) FROM code_blocks WHERE conversation_id IN (SELECT unnest(?))",
+                    [removed],
+                ).fetchone()[0]
+                con.execute("DELETE FROM code_blocks WHERE conversation_id IN (SELECT unnest(?))", [removed])
+                con.execute("DELETE FROM code_symbols WHERE conversation_id IN (SELECT unnest(?))", [removed])
+            if add:
+                self._insert_blocks(con, add)
+            _set_meta(con, "dead_blocks", dead)
+            _set_meta(con, "signature", parquet_signature(code_dir))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+        live, segments = con.execute(
+            "SELECT (SELECT count(*) FROM code_blocks), (SELECT count(DISTINCT segment) FROM code_trigrams)"
+        ).fetchone()
+        return segments > MAX_SEGMENTS or dead > MAX_DEAD_FRACTION * max(live, 1)
+
+    @staticmethod
+    def _insert_blocks(con: duckdb.DuckDBPyConnection, rows: Sequence[dict]) -> None:
+        # Ids are never reused: stale postings may still name removed blocks.
+        next_id = int(_get_meta(con, "next_block_id") or 1)
+        next_segment = con.execute("SELECT coalesce(max(segment), 0) + 1 FROM code_trigrams").fetchone()[0]
+        table = pa.Table.from_pylist(list(rows), schema=CODE_BLOCK_SCHEMA)
+        ids = np.arange(next_id, next_id + table.num_rows, dtype=np.int64)
+        _set_meta(con, "next_block_id", next_id + table.num_rows)
+        batch = table.select(list(_BLOCK_COLUMNS)).append_column("block_id", pa.array(ids))
+        con.register("block_batch", batch)
+        try:
+            con.execute(
+                f"INSERT INTO code_blocks SELECT block_id, {', '.join(_BLOCK_COLUMNS)} FROM block_batch"
+            )
+        finally:
+            con.unregister("block_batch")
+
+        symbols = sorted(
+            {
+                (kind, symbol, row["conversation_id"], row["message_index"], row["block_index"], int(block_id))
+                for row, block_id in zip(rows, ids)
+                for kind in SYMBOL_KINDS
+                for symbol in row.get(kind) or ()
+                if symbol
+            }
+        )
+        if symbols:
+            con.executemany("INSERT INTO code_symbols VALUES (?, ?, ?, ?, ?, ?)", symbols)
+        _insert_postings(con, int(next_segment), ids, [row.get("code") or "" for row in rows])
+
+    # ------------------------------------------------------------------
+    # Queries (API)
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        code_dir: Path,
+        *,
+        filters: Sequence[str] = (),
+        params: Sequence[object] = (),
+        terms: Sequence[str] = (),
+        regex: str | None = None,
+        symbols: dict[str, str] | None = None,
+        limit: int,
+        offset: int,
+    ) -> list[tuple] | None:
+        """Code search rows (``RESULT_COLUMNS`` + total count), or None when stale.
+
+        Symbols and trigram postings narrow the blocks first; small candidate
+        sets are then fetched by ``block_id`` and verified.
+
+        ``filters``/``params`` are extra SQL predicates over block columns;
+        ``terms`` must all occur (case-insensitive); ``symbols`` maps a kind in
+        :data:`SYMBOL_KINDS` to an exact symbol name.
+        """
+        with self._reader(code_dir) as con:
+            if con is None:
+                return None
+
+            where = list(filters)
+            args = list(params)
+            source = "code_blocks"
+            literals = [*terms, *(regex_literals(regex) if regex else [])]
+            candidates = self._candidates(con, symbols or {}, literals)
+            if candidates is not None:
+                if candidates.size == 0:
+                    return []
+                if candidates.size <= POINT_LOOKUP_MAX:
+                    # Materialized so the other predicates cannot turn the
+                    # index lookup back into a table scan.
+                    ids = ", ".join(map(str, candidates.tolist()))
+                    source = (
+                        "(WITH candidates AS MATERIALIZED "
+                        f"(SELECT * FROM code_blocks WHERE block_id IN ({ids})) "
+                        "SELECT * FROM candidates)"
+                    )
+                else:
+                    con.register("candidate_blocks", pa.table({"block_id": pa.array(candidates)}))
+                    where.append("block_id IN (SELECT block_id FROM candidate_blocks)")
+
+            for term in terms:
+                where.append("code ILIKE '%' || ? || '%'")
+                args.append(term)
+            if regex:
+                where.append("regexp_matches(code, ?)")
+                args.append(regex)
+
+            where_sql = "WHERE " + " AND ".join(where) if where else ""
+            try:
+                return con.execute(
+                    f"""
+                    SELECT {RESULT_COLUMNS}, count(*) OVER() AS total_count
+                    FROM {source}
+                    {where_sql}
+                    ORDER BY conversation_updated_at DESC, message_timestamp DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    [*args, limit, offset],
+                ).fetchall()
+            finally:
+                con.unregister("candidate_blocks")
+
+    @staticmethod
+    def _candidates(
+        con: duckdb.DuckDBPyConnection,
+        symbols: dict[str, str],
+        literals: Sequence[str],
+    ) -> np.ndarray | None:
+        """Block ids matching every symbol and holding every literal's trigrams.
+
+        None when nothing narrows the search (no symbol, no indexable literal).
+        """
+        result: np.ndarray | None = None
+        for kind, value in symbols.items():
+            rows = con.execute(
+                "SELECT DISTINCT block_id FROM code_symbols WHERE kind = ? AND symbol = ?", [kind, value]
+            ).fetchall()
+            found = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            result = found if result is None else np.intersect1d(result, found, assume_unique=True)
+
+        codes = [trigram_codes(literal) for literal in literals if _indexable(literal)]
+        if not codes:
+            return result
+        wanted = np.unique(np.concatenate(codes))
+        rows = con.execute(
+            "SELECT trigram, postings FROM code_trigrams "
+            "WHERE trigram IN (SELECT unnest(?::BIGINT[])) ORDER BY trigram, segment",
+            [wanted.tolist()],
+        ).fetchall()
+
+        lists: dict[int, list[np.ndarray]] = {}
+        for trigram, blob in rows:
+            lists.setdefault(trigram, []).append(_decode_postings(blob))
+        if len(lists) < wanted.size:
+            return np.empty(0, dtype=np.int64)
+
+        for postings in sorted((np.concatenate(parts) for parts in lists.values()), key=len):
+            result = postings if result is None else np.intersect1d(result, postings, assume_unique=True)
+            if result.size == 0:
+                break
+        return result
+
+    def symbol_counts(
+        self, code_dir: Path, project_ids: Sequence[str] | None = None,
+    ) -> list[tuple[str, str, int]] | None:
+        """``(project_id, symbol, blocks)`` over every kind, or None when stale."""
+        with self._reader(code_dir) as con:
+            if con is None:
+                return None
+            sql = (
+                "SELECT b.project_id, s.symbol, count(DISTINCT s.block_id) "
+                "FROM code_symbols s JOIN code_blocks b USING (block_id)"
+            )
+            params: list[object] = []
+            if project_ids is not None:
+                sql += " WHERE list_contains(?, b.project_id)"
+                params.append(list(project_ids))
+            return con.execute(sql + " GROUP BY ALL", params).fetchall()
+
+    def conversation_symbols(self, code_dir: Path, conversation_id: str) -> dict[str, list[str]] | None:
+        """Sorted distinct symbols per kind for one conversation, or None when stale."""
+        with self._reader(code_dir) as con:
+            if con is None:
+                return None
+            rows = con.execute(
+                "SELECT kind, list_sort(list(DISTINCT symbol)) FROM code_symbols "
+                "WHERE conversation_id = ? GROUP BY kind",
+                [conversation_id],
+            ).fetchall()
+        found = {kind: list(values) for kind, values in rows}
+        return {kind: found.get(kind, []) for kind in SYMBOL_KINDS}
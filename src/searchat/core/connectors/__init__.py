@@ -1,5 +1,11 @@
 from .base import AgentProviderBase
-from .protocols import AgentConnector, ConnectorMatch
+from .protocols import (
+    AgentConnector,
+    ConnectorMatch,
+    TailCursor,
+    TailParse,
+    TailParsingConnector,
+)
 from .registry import (
     register_connector,
     get_connectors,
@@ -9,6 +15,8 @@ from .registry import (
     discover_watch_dirs,
     discover_entrypoint_connectors,
     has_v2_support,
+    supports_tail_parse,
+    release_parse_caches,
 )
 from .codex import CodexConnector
 from .claude import ClaudeConnector
@@ -35,6 +43,9 @@ __all__ = [
     "AgentProviderBase",
     "AgentConnector",
     "ConnectorMatch",
+    "TailCursor",
+    "TailParse",
+    "TailParsingConnector",
     "register_connector",
     "discover_entrypoint_connectors",
     "get_connectors",
@@ -43,4 +54,6 @@ __all__ = [
     "supported_extensions",
     "discover_watch_dirs",
     "has_v2_support",
+    "supports_tail_parse",
+    "release_parse_caches",
 ]
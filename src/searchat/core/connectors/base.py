@@ -67,3 +67,9 @@ class AgentProviderBase(ABC):
         Default: None (connector does not support resumption).
         """
         return None
+
+    def release_parse_cache(self) -> None:
+        """Drop state cached across parse calls; called after each indexing pass.
+
+        Default: no-op (connector keeps no state between parse calls).
+        """
@@ -8,7 +8,13 @@ from typing import Any
 
 from searchat.config import Config, PathResolver
 from searchat.core.connectors.base import AgentProviderBase
-from searchat.core.connectors.utils import MARKDOWN_CODE_BLOCK_RE
+from searchat.core.connectors.protocols import TailCursor, TailParse
+from searchat.core.connectors.utils import (
+    MARKDOWN_CODE_BLOCK_RE,
+    chain_file_hash,
+    read_appended_lines,
+    tail_checkpoint,
+)
 from searchat.models import ConversationRecord, MessageRecord
 
 
@@ -71,43 +77,37 @@ class ClaudeConnector(AgentProviderBase):
                         paths.add(fp)
         return sorted(paths)
 
-    def parse(self, path: Path, embedding_id: int) -> ConversationRecord:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = [json.loads(line) for line in f]
-
-        file_hash = hashlib.sha256(path.read_bytes()).hexdigest()
-        conversation_id = path.stem
-        project_id = path.parent.name
-
-        def _extract_content(entry: dict) -> str:
-            raw = entry.get("message", {})
-            raw_content = raw.get("content", raw.get("text", ""))
-            if isinstance(raw_content, str):
-                return raw_content
-            if isinstance(raw_content, list):
-                return "\n\n".join(
-                    block.get("text", "")
-                    for block in raw_content
-                    if block.get("type") == "text"
-                )
-            return ""
+    @staticmethod
+    def _extract_content(entry: dict) -> str:
+        raw = entry.get("message", {})
+        raw_content = raw.get("content", raw.get("text", ""))
+        if isinstance(raw_content, str):
+            return raw_content
+        if isinstance(raw_content, list):
+            return "\n\n".join(
+                block.get("text", "")
+                for block in raw_content
+                if block.get("type") == "text"
+            )
+        return ""
 
-        title = "Untitled"
-        for entry in lines:
-            text = _extract_content(entry).strip()
+    @classmethod
+    def _title_from_entries(cls, entries: list[dict]) -> str | None:
+        for entry in entries:
+            text = cls._extract_content(entry).strip()
             if text:
-                title = text[:100]
-                break
+                return text[:100]
+        return None
 
+    @classmethod
+    def _messages_from_entries(cls, entries: list[dict], start_sequence: int = 0) -> list[MessageRecord]:
         messages: list[MessageRecord] = []
-        full_text_parts: list[str] = []
-
-        for entry in lines:
+        for entry in entries:
             msg_type = entry.get("type")
             if msg_type not in ("user", "assistant"):
                 continue
 
-            content = _extract_content(entry)
+            content = cls._extract_content(entry)
 
             code_blocks = MARKDOWN_CODE_BLOCK_RE.findall(content)
             has_code = len(code_blocks) > 0
@@ -117,7 +117,7 @@ class ClaudeConnector(AgentProviderBase):
 
             messages.append(
                 MessageRecord(
-                    sequence=len(messages),
+                    sequence=start_sequence + len(messages),
                     role=msg_type,
                     content=content,
                     timestamp=timestamp,
@@ -125,16 +125,38 @@ class ClaudeConnector(AgentProviderBase):
                     code_blocks=code_blocks,
                 )
             )
+        return messages
 
-            full_text_parts.append(content)
+    def parse(self, path: Path, embedding_id: int) -> ConversationRecord:
+        return self.parse_with_cursor(path, embedding_id)[0]
 
-        full_text = "\n\n".join(full_text_parts)
+    def parse_with_cursor(
+        self, path: Path, embedding_id: int
+    ) -> tuple[ConversationRecord, TailCursor | None]:
+        """Parse the whole file and return where a later :meth:`parse_tail` can resume.
+
+        The cursor is None when the file does not end on a line boundary.
+        """
+        data = path.read_bytes()
+        lines = data.split(b"\n")
+        if data.endswith(b"\n"):
+            lines.pop()
+        entries = [json.loads(line) for line in lines]
+
+        file_hash = hashlib.sha256(data).hexdigest()
+        conversation_id = path.stem
+        project_id = path.parent.name
+
+        title = self._title_from_entries(entries) or "Untitled"
+        messages = self._messages_from_entries(entries)
+
+        full_text = "\n\n".join(m.content for m in messages)
         created_at = messages[0].timestamp if messages else datetime.now()
         updated_at = messages[-1].timestamp if messages else datetime.now()
 
-        files_mentioned = self._extract_file_paths(lines)
+        files_mentioned = self._extract_file_paths(entries)
 
-        return ConversationRecord(
+        record = ConversationRecord(
             conversation_id=conversation_id,
             project_id=project_id,
             file_path=str(path),
@@ -150,6 +172,40 @@ class ClaudeConnector(AgentProviderBase):
             files_mentioned=files_mentioned if files_mentioned else None,
             git_branch=None,  # Not extractable from current JSONL format
         )
+        cursor = None
+        if not data or data.endswith(b"\n"):
+            cursor = TailCursor(
+                byte_offset=len(data),
+                next_sequence=len(messages),
+                checkpoint=tail_checkpoint(data),
+                file_hash=file_hash,
+            )
+        return record, cursor
+
+    def parse_tail(self, path: Path, cursor: TailCursor) -> TailParse | None:
+        """Parse only the lines appended since ``cursor``.
+
+        Returns None when the file shrank or was rewritten before the
+        cursor; the caller should fall back to a full :meth:`parse`.
+        """
+        appended = read_appended_lines(path, cursor.byte_offset, cursor.checkpoint)
+        if appended is None:
+            return None
+        lines, byte_offset, checkpoint, consumed = appended
+        entries = [json.loads(line) for line in lines]
+        messages = self._messages_from_entries(entries, cursor.next_sequence)
+        files_mentioned = self._extract_file_paths(entries)
+        return TailParse(
+            messages=messages,
+            cursor=TailCursor(
+                byte_offset=byte_offset,
+                next_sequence=cursor.next_sequence + len(messages),
+                checkpoint=checkpoint,
+                file_hash=chain_file_hash(cursor.file_hash, consumed) if consumed else cursor.file_hash,
+            ),
+            title=self._title_from_entries(entries),
+            files_mentioned=files_mentioned or None,
+        )
 
     # -- V2: AgentProvider methods --
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -12,12 +14,48 @@ from searchat.core.connectors.utils import MARKDOWN_CODE_BLOCK_RE, title_from_me
 from searchat.models import ConversationRecord, MessageRecord
 
 
+# Parsed databases kept during an indexing pass (indexing walks one DB's
+# composers in a row); all are dropped by release_parse_cache() after it.
+_MAX_SESSIONS = 4
+
+
+class _VscdbSession:
+    """One read of a Cursor ``state.vscdb``: composers and a bubble-id index.
+
+    Composer records are decoded up front (discovery needs their ids).
+    Bubble rows are indexed by id as raw JSON text and decoded on first use,
+    so parsing one composer touches only its own bubbles.
+    """
+
+    def __init__(self, db_path: Path, composers: dict[str, dict], bubble_rows: dict[str, str]) -> None:
+        self.db_path = db_path
+        self.composers = composers
+        self._bubble_rows = bubble_rows
+        self._bubbles: dict[str, dict | None] = {}
+
+    def bubble(self, bubble_id: str) -> dict | None:
+        if bubble_id not in self._bubbles:
+            raw = self._bubble_rows.get(bubble_id)
+            data = None
+            if raw is not None:
+                try:
+                    data = json.loads(raw)
+                except json.JSONDecodeError:
+                    data = None
+            self._bubbles[bubble_id] = data if isinstance(data, dict) else None
+        return self._bubbles[bubble_id]
+
+
 class CursorConnector(AgentProviderBase):
     name: str = "cursor"
     supported_extensions: tuple[str, ...] = (".json",)
 
     _VSCDB_SENTINEL = ".vscdb.cursor/"
 
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[Path, tuple[tuple[int, ...], _VscdbSession]] = OrderedDict()
+        self._sessions_lock = threading.Lock()
+
     def discover_files(self, config: Config) -> list[Path]:
         pseudo_files: list[Path] = []
 
@@ -63,40 +101,63 @@ class CursorConnector(AgentProviderBase):
 
     def parse(self, path: Path, embedding_id: int) -> ConversationRecord:
         db_path, composer_id = self._decode_pseudo_path(path)
+        session = self._session(db_path)
+        return self._composer_record(session, composer_id, path, embedding_id)
+
+    def release_parse_cache(self) -> None:
+        """Drop parsed databases so they are not held between indexing passes."""
+        with self._sessions_lock:
+            self._sessions.clear()
+
+    def composer_fingerprint(self, composer: dict, composer_id: str) -> str | None:
+        """Change marker from ``lastUpdatedAt``; None when Cursor did not record one."""
+        updated = composer.get("lastUpdatedAt")
+        if not isinstance(updated, (int, float)):
+            return None
+        headers = composer.get("fullConversationHeadersOnly")
+        header_count = len(headers) if isinstance(headers, list) else 0
+        return hashlib.sha256(
+            f"cursor:{composer_id}:{updated}:{header_count}".encode("utf-8")
+        ).hexdigest()
 
-        con = self._connect_ro(db_path)
-        try:
-            table, key_col, value_col = self._find_kv_table(con)
-            composer = self._load_composer(con, table, key_col, value_col, composer_id)
-
-            headers = composer.get("fullConversationHeadersOnly")
-            if not isinstance(headers, list) or not headers:
-                raise ValueError(f"Cursor composer has no conversation headers: {composer_id}")
-
-            bubble_ids: list[tuple[str, int]] = []
-            for entry in headers:
-                if not isinstance(entry, dict):
-                    continue
-                bubble_id = entry.get("bubbleId")
-                bubble_type = entry.get("type")
-                if isinstance(bubble_id, str) and isinstance(bubble_type, int):
-                    bubble_ids.append((bubble_id, bubble_type))
+    def _composer_record(
+        self,
+        session: _VscdbSession,
+        composer_id: str,
+        path: Path,
+        embedding_id: int,
+    ) -> ConversationRecord:
+        db_path = session.db_path
+        composer = session.composers.get(composer_id)
+        if composer is None:
+            raise ValueError(f"Composer record not found: {composer_id}")
 
-            if not bubble_ids:
-                raise ValueError(f"Cursor composer has no bubble ids: {composer_id}")
+        headers = composer.get("fullConversationHeadersOnly")
+        if not isinstance(headers, list) or not headers:
+            raise ValueError(f"Cursor composer has no conversation headers: {composer_id}")
 
-            bubbles = self._load_bubbles(con, table, value_col)
+        bubble_ids: list[tuple[str, int]] = []
+        for entry in headers:
+            if not isinstance(entry, dict):
+                continue
+            bubble_id = entry.get("bubbleId")
+            bubble_type = entry.get("type")
+            if isinstance(bubble_id, str) and isinstance(bubble_type, int):
+                bubble_ids.append((bubble_id, bubble_type))
 
-        finally:
-            con.close()
+        if not bubble_ids:
+            raise ValueError(f"Cursor composer has no bubble ids: {composer_id}")
 
         messages: list[MessageRecord] = []
         full_text_parts: list[str] = []
+        bubbles: list[dict] = []
+        db_mtime: datetime | None = None
 
         for bubble_id, bubble_type in bubble_ids:
-            bubble = bubbles.get(bubble_id)
+            bubble = session.bubble(bubble_id)
             if bubble is None:
                 raise ValueError(f"Missing Cursor bubble record: {bubble_id}")
+            bubbles.append(bubble)
 
             role = "user" if bubble_type == 1 else "assistant" if bubble_type == 2 else "assistant"
             content = self._extract_bubble_text(bubble)
@@ -105,7 +166,9 @@ class CursorConnector(AgentProviderBase):
 
             timestamp = self._bubble_timestamp(bubble)
             if timestamp is None:
-                timestamp = datetime.fromtimestamp(db_path.stat().st_mtime)
+                if db_mtime is None:
+                    db_mtime = datetime.fromtimestamp(db_path.stat().st_mtime)
+                timestamp = db_mtime
 
             code_blocks = MARKDOWN_CODE_BLOCK_RE.findall(content)
             has_code = len(code_blocks) > 0
@@ -134,17 +197,16 @@ class CursorConnector(AgentProviderBase):
         project_id = self._project_id_from_db_path(db_path)
 
         file_path = str(path)
-        file_hash = hashlib.sha256(
-            json.dumps(
-                {
-                    "composer": composer,
-                    "bubbles": [bubbles.get(bid) for bid, _t in bubble_ids],
-                },
-                ensure_ascii=True,
-                sort_keys=True,
-                default=str,
-            ).encode("utf-8")
-        ).hexdigest()
+        file_hash = self.composer_fingerprint(composer, composer_id)
+        if file_hash is None:
+            file_hash = hashlib.sha256(
+                json.dumps(
+                    {"composer": composer, "bubbles": bubbles},
+                    ensure_ascii=True,
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()
 
         full_text = "\n\n".join(full_text_parts)
 
@@ -163,6 +225,50 @@ class CursorConnector(AgentProviderBase):
             indexed_at=datetime.now(),
         )
 
+    def _session(self, db_path: Path) -> _VscdbSession:
+        """Parsed view of ``db_path``, rebuilt only when the file changes."""
+        if not db_path.exists():
+            raise FileNotFoundError(f"Cursor DB does not exist: {db_path}")
+        signature = self._db_signature(db_path)
+        with self._sessions_lock:
+            cached = self._sessions.get(db_path)
+            if cached is not None and cached[0] == signature:
+                self._sessions.move_to_end(db_path)
+                return cached[1]
+
+        session = self._load_session(db_path)
+        with self._sessions_lock:
+            self._sessions[db_path] = (signature, session)
+            self._sessions.move_to_end(db_path)
+            while len(self._sessions) > _MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        return session
+
+    @staticmethod
+    def _db_signature(db_path: Path) -> tuple[int, ...]:
+        """Stat of the DB and its ``-wal`` sidecar.
+
+        Cursor writes in WAL mode: commits land in ``state.vscdb-wal`` and
+        only reach the main file at a checkpoint.
+        """
+        stat = db_path.stat()
+        signature: tuple[int, ...] = (stat.st_mtime_ns, stat.st_size)
+        try:
+            wal = Path(f"{db_path}-wal").stat()
+        except OSError:
+            return signature
+        return signature + (wal.st_mtime_ns, wal.st_size)
+
+    def _load_session(self, db_path: Path) -> _VscdbSession:
+        con = self._connect_ro(db_path)
+        try:
+            table, key_col, value_col = self._find_kv_table(con)
+            composers = self._load_composers(con, table, key_col, value_col)
+            bubble_rows = self._load_bubble_rows(con, table, key_col, value_col)
+        finally:
+            con.close()
+        return _VscdbSession(db_path, composers, bubble_rows)
+
     def _connect_ro(self, db_path: Path) -> sqlite3.Connection:
         if not db_path.exists():
             raise FileNotFoundError(f"Cursor DB does not exist: {db_path}")
@@ -196,17 +302,21 @@ class CursorConnector(AgentProviderBase):
         raise RuntimeError("Could not find Cursor key/value table with columns 'key' and 'value'")
 
     def _list_composer_ids(self, db_path: Path) -> list[str]:
-        con = self._connect_ro(db_path)
-        try:
-            table, key_col, value_col = self._find_kv_table(con)
-            rows = con.execute(
-                f"SELECT {key_col}, {value_col} FROM {table} WHERE {key_col} LIKE ?",
-                ("%composerData:%",),
-            ).fetchall()
-        finally:
-            con.close()
+        return sorted(self._session(db_path).composers)
+
+    def _load_composers(
+        self,
+        con: sqlite3.Connection,
+        table: str,
+        key_col: str,
+        value_col: str,
+    ) -> dict[str, dict]:
+        rows = con.execute(
+            f"SELECT {key_col}, {value_col} FROM {table} WHERE {key_col} LIKE ?",
+            ("%composerData:%",),
+        ).fetchall()
 
-        ids: set[str] = set()
+        composers: dict[str, dict] = {}
         for key, value in rows:
             if not isinstance(value, str):
                 continue
@@ -218,46 +328,40 @@ class CursorConnector(AgentProviderBase):
                 continue
             composer_id = data.get("composerId")
             if isinstance(composer_id, str) and composer_id.strip():
-                ids.add(composer_id.strip())
+                composers[composer_id.strip()] = data
                 continue
             if isinstance(key, str) and "composerData:" in key:
                 tail = key.split("composerData:", 1)[1]
                 if tail:
-                    ids.add(tail)
+                    composers[tail] = data
 
-        return sorted(ids)
+        return composers
 
-    def _load_composer(
+    def _load_bubble_rows(
         self,
         con: sqlite3.Connection,
         table: str,
         key_col: str,
         value_col: str,
-        composer_id: str,
-    ) -> dict:
-        rows = con.execute(
-            f"SELECT {value_col} FROM {table} WHERE {key_col} LIKE ? LIMIT 1",
-            (f"%composerData:{composer_id}%",),
-        ).fetchall()
-        if not rows:
-            raise ValueError(f"Composer record not found: {composer_id}")
-        value = rows[0][0]
-        if not isinstance(value, str):
-            raise ValueError(f"Composer record is not JSON text: {composer_id}")
-        data = json.loads(value)
-        if not isinstance(data, dict):
-            raise ValueError(f"Composer record is not an object: {composer_id}")
-        return data
-
-    def _load_bubbles(self, con: sqlite3.Connection, table: str, value_col: str) -> dict[str, dict]:
-        bubbles: dict[str, dict] = {}
+    ) -> dict[str, str]:
+        """Index bubble rows by id, leaving the JSON undecoded.
+
+        Cursor keys bubbles as ``bubbleId:<composerId>:<bubbleId>``; other
+        layouts fall back to reading ``bubbleId`` from the JSON.
+        """
+        bubbles: dict[str, str] = {}
         rows = con.execute(
-            f"SELECT {value_col} FROM {table} WHERE {value_col} LIKE ?",
+            f"SELECT {key_col}, {value_col} FROM {table} WHERE {value_col} LIKE ?",
             ("%\"bubbleId\"%",),
         ).fetchall()
-        for (value,) in rows:
+        for key, value in rows:
             if not isinstance(value, str):
                 continue
+            if isinstance(key, str) and key.startswith("bubbleId:"):
+                bubble_id = key.rsplit(":", 1)[1].strip()
+                if bubble_id:
+                    bubbles[bubble_id] = value
+                    continue
             try:
                 data = json.loads(value)
             except json.JSONDecodeError:
@@ -266,7 +370,7 @@ class CursorConnector(AgentProviderBase):
                 continue
             bubble_id = data.get("bubbleId")
             if isinstance(bubble_id, str) and bubble_id.strip():
-                bubbles[bubble_id.strip()] = data
+                bubbles[bubble_id.strip()] = value
         return bubbles
 
     def _extract_bubble_text(self, bubble: dict) -> str:
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 from searchat.config import Config
-from searchat.models import ConversationRecord
+from searchat.models import ConversationRecord, MessageRecord
 
 
 @runtime_checkable
@@ -34,3 +34,44 @@ class AgentConnector(Protocol):
 class ConnectorMatch:
     connector: AgentConnector
     path: Path
+
+
+@dataclass(frozen=True)
+class TailCursor:
+    """Where a resumable parse of an append-only file stopped.
+
+    ``byte_offset`` is the end of the last complete line consumed and
+    ``next_sequence`` the sequence number the next message will get.
+    ``checkpoint`` hashes the bytes just before ``byte_offset`` so a file
+    that was rewritten rather than appended to is detected. ``file_hash``
+    chains the hash of each appended tail onto the previous one.
+    """
+
+    byte_offset: int
+    next_sequence: int
+    checkpoint: str
+    file_hash: str
+
+
+@dataclass
+class TailParse:
+    """Messages appended to a file since a :class:`TailCursor`."""
+
+    messages: list[MessageRecord]
+    cursor: TailCursor
+    title: str | None = None
+    files_mentioned: list[str] | None = None
+
+
+@runtime_checkable
+class TailParsingConnector(Protocol):
+    """Optional capability of connectors whose files only ever grow (JSONL logs)."""
+
+    def parse_with_cursor(
+        self, path: Path, embedding_id: int
+    ) -> tuple[ConversationRecord, TailCursor | None]:
+        ...
+
+    def parse_tail(self, path: Path, cursor: TailCursor) -> TailParse | None:
+        """Parse lines appended since ``cursor``; None when the file was rewritten."""
+        ...
@@ -93,6 +93,18 @@ def get_connectors() -> tuple[AgentConnector, ...]:
     return tuple(_CONNECTORS)
 
 
+def release_parse_caches() -> None:
+    """Let every connector drop state it cached while an indexing pass parsed files."""
+    for connector in _CONNECTORS:
+        release = getattr(type(connector), "release_parse_cache", None)
+        if not callable(release):
+            continue
+        try:
+            connector.release_parse_cache()
+        except Exception as exc:
+            logger.warning("Failed to release parse cache for %s: %s", connector.name, exc)
+
+
 def discover_all_files(config: Config) -> list[ConnectorMatch]:
     matches: list[ConnectorMatch] = []
     for connector in _CONNECTORS:
@@ -127,6 +139,18 @@ def has_v2_support(connector: AgentConnector) -> bool:
     return isinstance(connector, AgentProviderBase)
 
 
+def supports_tail_parse(connector: AgentConnector) -> bool:
+    """Check if a connector can resume parsing an append-only file from a TailCursor.
+
+    Looks the methods up on the class, so test doubles that answer every
+    attribute (MagicMock) are not mistaken for TailParsingConnector.
+    """
+    cls = type(connector)
+    return callable(getattr(cls, "parse_with_cursor", None)) and callable(
+        getattr(cls, "parse_tail", None)
+    )
+
+
 def discover_watch_dirs(config: Config) -> list[Path]:
     dirs: list[Path] = []
     for connector in _CONNECTORS:
@@ -1,8 +1,11 @@
 """Shared utilities used by multiple conversation connectors."""
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 from datetime import datetime
+from pathlib import Path
 
 from searchat.models import MessageRecord
 
@@ -57,3 +60,44 @@ def parse_flexible_timestamp(value: object) -> datetime | None:
             return None
 
     return None
+
+
+# Bytes before a tail cursor that must be unchanged for a resumed parse.
+TAIL_CHECKPOINT_BYTES = 4096
+
+
+def tail_checkpoint(data: bytes) -> str:
+    """Hash of the last :data:`TAIL_CHECKPOINT_BYTES` of ``data``."""
+    return hashlib.sha256(data[-TAIL_CHECKPOINT_BYTES:]).hexdigest()
+
+
+def chain_file_hash(previous: str, appended: bytes) -> str:
+    """File hash after appending ``appended`` to a file hashed as ``previous``."""
+    appended_hash = hashlib.sha256(appended).hexdigest()
+    return hashlib.sha256(f"{previous}:{appended_hash}".encode()).hexdigest()
+
+
+def read_appended_lines(
+    path: Path, byte_offset: int, checkpoint: str
+) -> tuple[list[bytes], int, str, bytes] | None:
+    """Read the complete lines appended to ``path`` after ``byte_offset``.
+
+    Returns ``(lines, new_offset, new_checkpoint, consumed_bytes)``, or None
+    when the file shrank or the bytes before ``byte_offset`` no longer match
+    ``checkpoint`` (the file was rewritten). A trailing partial line is left
+    for the next call.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < byte_offset:
+            return None
+        start = max(0, byte_offset - TAIL_CHECKPOINT_BYTES)
+        f.seek(start)
+        before = f.read(byte_offset - start)
+        if hashlib.sha256(before).hexdigest() != checkpoint:
+            return None
+        appended = f.read(size - byte_offset)
+
+    consumed = appended[: appended.rfind(b"\n") + 1]
+    lines = consumed.split(b"\n")[:-1]
+    return lines, byte_offset + len(consumed), tail_checkpoint(before + consumed), consumed
@@ -0,0 +1,366 @@
+"""Content-addressed embedding cache shared by every embedder.
+
+Vectors are keyed by ``(model key, sha256 of whitespace-normalized text)``,
+so re-indexing an unchanged conversation, rebuilding FAISS or the expertise
+index, or re-running a similarity query never re-encodes the same text
+with the same model.
+
+Two tiers:
+
+  - an in-process LRU of recently used vectors, and
+  - ``data/indices/embedding_cache.duckdb``, which persists across runs.
+    Newly computed vectors are buffered and flushed in batches. Cache hits
+    only record their last-used time in memory; those times are written
+    just before an eviction (so hot rows are not evicted) and on close. The
+    file is trimmed to ``embedding.cache_max_entries`` rows by evicting the
+    least recently used.
+
+When the DuckDB file cannot be opened (read-only dataset, or another
+process holds the lock) the cache runs memory-only for this process.
+Disabled entirely with ``embedding.cache_embeddings = false``.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+
+from searchat.config.constants import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+
+log = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_FILENAME = "embedding_cache.duckdb"
+
+# Vectors kept in the in-process LRU (~1.5 KB each at 384 dims).
+_MEMORY_ENTRIES = 8192
+# Buffered writes / last-used bumps before an automatic flush to disk.
+_FLUSH_THRESHOLD = 512
+
+
+def text_key(text: str) -> str:
+    """Content address of a text: sha256 over its whitespace-normalized form."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    """Point-in-time cache counters for status reporting."""
+
+    path: str
+    persistent: bool
+    hits: int
+    misses: int
+    memory_entries: int
+    persistent_entries: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class EmbeddingCache:
+    """Two-tier (LRU + DuckDB) cache of text embeddings."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+        memory_entries: int = _MEMORY_ENTRIES,
+    ) -> None:
+        self.db_path = db_path
+        self.max_entries = max(1, int(max_entries))
+        self._memory_limit = max(1, int(memory_entries))
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        # Newly computed vectors to insert on the next flush.
+        self._dirty: dict[tuple[str, str], np.ndarray] = {}
+        # Last-used time (µs) of cache hits not yet written to the file.
+        self._touched: dict[tuple[str, str], int] = {}
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._opened = False
+        self.persistent = True
+        self._persistent_entries = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def encode(
+        self,
+        model_key: str,
+        texts: Sequence[str],
+        encode: Callable[[list[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Return an (n, dim) float32 matrix, calling ``encode`` only for unseen texts."""
+        if not texts:
+            return np.asarray(encode([]), dtype=np.float32)
+
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            found = self._lookup_locked(model_key, keys)
+
+        # Encode each distinct missing text once, outside the lock.
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            encoded = np.asarray(encode(list(missing.values())), dtype=np.float32)
+            rows = encoded.shape[0] if encoded.ndim == 2 else len(missing)
+            if encoded.size == 0 or rows != len(missing) or encoded.size % len(missing):
+                raise ValueError(
+                    f"Embedder returned shape {encoded.shape} for {len(missing)} texts"
+                )
+            encoded = encoded.reshape(len(missing), -1)
+            new_vectors = dict(zip(missing.keys(), encoded))
+            with self._lock:
+                for key, vector in new_vectors.items():
+                    self._remember_locked((model_key, key), vector, dirty=True)
+                found.update(new_vectors)
+                if len(self._dirty) >= _FLUSH_THRESHOLD:
+                    self._flush_locked()
+
+        return np.stack([found[key] for key in keys]).astype(np.float32, copy=False)
+
+    def flush(self) -> None:
+        """Persist buffered writes and apply size-based eviction."""
+        with self._lock:
+            self._flush_locked()
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                path=str(self.db_path),
+                persistent=self.persistent,
+                hits=self._hits,
+                misses=self._misses,
+                memory_entries=len(self._memory),
+                persistent_entries=self._persistent_entries,
+                evictions=self._evictions,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._conn is not None and self._touched:
+                try:
+                    self._write_touched_locked(self._conn)
+                except duckdb.Error as exc:
+                    log.warning("Failed to persist embedding cache recency: %s", exc)
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    def _connection_locked(self) -> duckdb.DuckDBPyConnection | None:
+        if self._opened:
+            return self._conn
+        self._opened = True
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = duckdb.connect(str(self.db_path))
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model VARCHAR NOT NULL,
+                    text_hash VARCHAR NOT NULL,
+                    embedding FLOAT[] NOT NULL,
+                    last_used BIGINT NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+                """
+            )
+            self._persistent_entries = conn.execute(
+                "SELECT count(*) FROM embedding_cache"
+            ).fetchone()[0]
+        except (OSError, duckdb.Error) as exc:
+            log.warning("Embedding cache %s unavailable, caching in memory only: %s", self.db_path, exc)
+            self.persistent = False
+            return None
+        self._conn = conn
+        return conn
+
+    def _remember_locked(self, key: tuple[str, str], vector: np.ndarray, *, dirty: bool) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_limit:
+            self._memory.popitem(last=False)
+        if dirty:
+            self._dirty[key] = vector
+
+    def _lookup_locked(self, model_key: str, keys: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        unresolved: list[str] = []
+        now_us = time.time_ns() // 1000
+        for key in dict.fromkeys(keys):
+            vector = self._memory.get((model_key, key))
+            if vector is None:
+                unresolved.append(key)
+                continue
+            self._memory.move_to_end((model_key, key))
+            if self.persistent and (model_key, key) not in self._dirty:
+                self._touched[(model_key, key)] = now_us
+            found[key] = vector
+
+        conn = self._connection_locked() if unresolved else None
+        if conn is not None:
+            result = conn.execute(
+                "SELECT text_hash, embedding FROM embedding_cache "
+                "WHERE model = ? AND text_hash IN (SELECT unnest(?::VARCHAR[]))",
+                [model_key, unresolved],
+            ).fetchnumpy()
+            for key, embedding in zip(result["text_hash"], result["embedding"]):
+                vector = np.asarray(embedding, dtype=np.float32)
+                self._remember_locked((model_key, str(key)), vector, dirty=False)
+                self._touched[(model_key, str(key))] = now_us
+                found[str(key)] = vector
+
+        for key in keys:
+            if key in found:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return found
+
+    def _flush_locked(self) -> None:
+        if not self._dirty:
+            return
+        conn = self._connection_locked()
+        if conn is None:
+            self._dirty.clear()
+            self._touched.clear()
+            return
+
+        items = list(self._dirty.items())
+        self._dirty.clear()
+        for key, _vector in items:
+            self._touched.pop(key, None)
+        batch = pa.table({
+            "model": [model for (model, _key), _vec in items],
+            "text_hash": [key for (_model, key), _vec in items],
+            "embedding": pa.array(
+                [np.asarray(vector, dtype=np.float32) for _key, vector in items],
+                type=pa.list_(pa.float32()),
+            ),
+            "last_used": pa.array([time.time_ns() // 1000] * len(items), type=pa.int64()),
+        })
+        try:
+            conn.register("batch", batch)
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO embedding_cache "
+                    "SELECT model, text_hash, embedding::FLOAT[], last_used FROM batch"
+                )
+            finally:
+                conn.unregister("batch")
+
+            count = conn.execute("SELECT count(*) FROM embedding_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._write_touched_locked(conn)
+                conn.execute(
+                    "DELETE FROM embedding_cache WHERE rowid IN ("
+                    "SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                    [overflow],
+                )
+                self._evictions += overflow
+                count -= overflow
+            self._persistent_entries = count
+        except duckdb.Error as exc:
+            log.warning("Failed to persist embedding cache: %s", exc)
+
+    def _write_touched_locked(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Write the last-used times of cache hits; eviction ranks rows by them."""
+        if not self._touched:
+            return
+        items = list(self._touched.items())
+        self._touched.clear()
+        batch = pa.table({
+            "model": [model for (model, _key), _ts in items],
+            "text_hash": [key for (_model, key), _ts in items],
+            "last_used": pa.array([ts for _key, ts in items], type=pa.int64()),
+        })
+        conn.register("touched", batch)
+        try:
+            conn.execute(
+                "UPDATE embedding_cache SET last_used = touched.last_used FROM touched "
+                "WHERE embedding_cache.model = touched.model "
+                "AND embedding_cache.text_hash = touched.text_hash"
+            )
+        finally:
+            conn.unregister("touched")
+
+
+_CACHES: dict[str, EmbeddingCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_embedding_cache(config, search_dir: Path) -> EmbeddingCache | None:
+    """Shared cache for ``search_dir``; None when ``embedding.cache_embeddings`` is off."""
+    embedding = getattr(config, "embedding", None)
+    if getattr(embedding, "cache_embeddings", False) is not True:
+        return None
+    max_entries = getattr(embedding, "cache_max_entries", DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES)
+    if isinstance(max_entries, bool) or not isinstance(max_entries, int):
+        max_entries = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+
+    db_path = Path(search_dir).expanduser() / "data" / "indices" / EMBEDDING_CACHE_FILENAME
+    with _CACHES_LOCK:
+        cache = _CACHES.get(str(db_path))
+        if cache is None:
+            cache = EmbeddingCache(db_path, max_entries=max_entries)
+            _CACHES[str(db_path)] = cache
+        return cache
+
+
+def cached_encode(
+    cache: EmbeddingCache | None,
+    model_key: str,
+    texts: Sequence[str],
+    encode: Callable[[list[str]], np.ndarray],
+) -> np.ndarray:
+    """Encode through ``cache`` when one is configured, else call ``encode`` directly."""
+    if cache is None:
+        return np.asarray(encode(list(texts)), dtype=np.float32)
+    return cache.encode(model_key, texts, encode)
+
+
+def embedding_cache_stats() -> list[EmbeddingCacheStats]:
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+    return [cache.stats() for cache in caches]
+
+
+def close_embedding_caches() -> None:
+    """Flush and close every shared cache (also registered with ``atexit``)."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+        _CACHES.clear()
+    for cache in caches:
+        try:
+            cache.close()
+        except Exception as exc:  # pragma: no cover - best effort at shutdown
+            log.warning("Failed to close embedding cache %s: %s", cache.db_path, exc)
+
+
+atexit.register(close_embedding_caches)
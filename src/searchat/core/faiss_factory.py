@@ -0,0 +1,414 @@
+"""Index selection, training and upkeep for the legacy FAISS vector index.
+
+:func:`choose_index_plan` picks the index type from corpus size and the
+``performance.faiss_memory_budget_mb`` budget:
+
+  - ``flat``   below :data:`FLAT_MAX_VECTORS`: exact search, nothing to train;
+  - ``hnsw``   up to :data:`HNSW_MAX_VECTORS` when the graph fits the budget;
+  - ``ivf``    about sqrt(n) inverted lists of raw vectors;
+  - ``ivfpq``  the same lists with product-quantized codes, when the raw
+    float32 vectors do not fit the budget.
+
+``performance.faiss_index_type`` pins one type instead of ``auto``.
+:func:`build_index` trains on a sample, then tunes ``nprobe`` (IVF) or
+``efSearch`` (HNSW) for :data:`TARGET_RECALL` recall@10 on held-out sample
+vectors. Both settings are stored in the index file.
+
+Appends add to the trained structure. :func:`retrain_reason` reports when
+that structure no longer fits: the corpus outgrew the index type, the
+inverted lists are too few for the corpus, or the lists have become
+imbalanced. :class:`FaissRetrainer` then rebuilds the index file in a
+background thread.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+from searchat.config.constants import DEFAULT_FAISS_INDEX_TYPE, DEFAULT_FAISS_MEMORY_BUDGET_MB
+
+log = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "hnsw", "ivf", "ivfpq")
+
+FLAT_MAX_VECTORS = 20_000
+HNSW_MAX_VECTORS = 200_000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+# Upper bound on vectors kept for training and tuning.
+TRAIN_SAMPLE_MAX = 50_000
+# FAISS wants at least ~39 training points per inverted list.
+_POINTS_PER_LIST = 39
+MIN_NLIST = 16
+
+TARGET_RECALL = 0.95
+_TUNE_K = 10
+_TUNE_QUERIES = 200
+# Stop raising nprobe/efSearch once recall improves by less than this.
+_RECALL_PLATEAU = 0.005
+_EF_SEARCH_CANDIDATES = (16, 32, 64, 128, 256, 512)
+
+# Sum-of-squares list imbalance (1.0 = perfectly even) that triggers a retrain.
+IMBALANCE_RETRAIN = 3.0
+# Retrain when an IVF index has fewer than this fraction of sqrt(n) lists.
+_UNDERSIZED_NLIST = 0.5
+
+_ADD_BATCH = 65_536
+
+
+@dataclass(frozen=True)
+class FaissIndexPlan:
+    """Index type and shape chosen for one build."""
+
+    kind: str
+    dimension: int
+    n_vectors: int
+    nlist: int = 0
+    hnsw_m: int = 0
+    pq_m: int = 0
+    estimated_bytes: int = 0
+
+    @property
+    def factory_string(self) -> str:
+        if self.kind == "hnsw":
+            return f"HNSW{self.hnsw_m}"
+        if self.kind == "ivf":
+            return f"IVF{self.nlist},Flat"
+        if self.kind == "ivfpq":
+            return f"IVF{self.nlist},PQ{self.pq_m}x8"
+        return "Flat"
+
+
+def _nlist_for(n_vectors: int) -> int:
+    nlist = max(MIN_NLIST, int(round(math.sqrt(max(n_vectors, 1)))))
+    return max(1, min(nlist, TRAIN_SAMPLE_MAX // _POINTS_PER_LIST, n_vectors // _POINTS_PER_LIST or 1))
+
+
+def _pq_m_for(dimension: int) -> int:
+    # Sub-quantizers of at least 4 dimensions; prefer the finest split.
+    for m in (64, 48, 32, 24, 16, 12, 8, 4, 2, 1):
+        if dimension % m == 0 and dimension // m >= 4:
+            return m
+    return 1
+
+
+def estimate_index_bytes(kind: str, n_vectors: int, dimension: int) -> int:
+    ids = 8 * n_vectors
+    if kind == "hnsw":
+        return n_vectors * (4 * dimension + 8 * HNSW_M) + ids
+    if kind == "ivfpq":
+        return n_vectors * _pq_m_for(dimension) + ids
+    return 4 * n_vectors * dimension + ids
+
+
+def choose_index_plan(
+    n_vectors: int,
+    dimension: int,
+    *,
+    memory_budget_mb: int = DEFAULT_FAISS_MEMORY_BUDGET_MB,
+    index_type: str = DEFAULT_FAISS_INDEX_TYPE,
+) -> FaissIndexPlan:
+    """Pick the index for ``n_vectors`` of ``dimension`` within the memory budget."""
+    budget = memory_budget_mb * 1024 * 1024
+    kind = index_type if index_type in INDEX_TYPES else "auto"
+    if kind == "auto":
+        if n_vectors < FLAT_MAX_VECTORS:
+            kind = "flat"
+        elif estimate_index_bytes("ivf", n_vectors, dimension) > budget:
+            kind = "ivfpq"
+        elif (
+            n_vectors <= HNSW_MAX_VECTORS
+            and estimate_index_bytes("hnsw", n_vectors, dimension) <= budget
+        ):
+            kind = "hnsw"
+        else:
+            kind = "ivf"
+    if kind in ("ivf", "ivfpq") and n_vectors < MIN_NLIST * _POINTS_PER_LIST:
+        # Too few vectors to train lists; exact search is cheap at this size.
+        kind = "flat"
+
+    return FaissIndexPlan(
+        kind=kind,
+        dimension=dimension,
+        n_vectors=n_vectors,
+        nlist=_nlist_for(n_vectors) if kind in ("ivf", "ivfpq") else 0,
+        hnsw_m=HNSW_M if kind == "hnsw" else 0,
+        pq_m=_pq_m_for(dimension) if kind == "ivfpq" else 0,
+        estimated_bytes=estimate_index_bytes(kind, n_vectors, dimension),
+    )
+
+
+def plan_from_config(n_vectors: int, dimension: int, config) -> FaissIndexPlan:
+    performance = getattr(config, "performance", None)
+    return choose_index_plan(
+        n_vectors,
+        dimension,
+        memory_budget_mb=getattr(performance, "faiss_memory_budget_mb", DEFAULT_FAISS_MEMORY_BUDGET_MB),
+        index_type=getattr(performance, "faiss_index_type", DEFAULT_FAISS_INDEX_TYPE),
+    )
+
+
+def _base_index(plan: FaissIndexPlan) -> faiss.Index:
+    if plan.kind == "flat":
+        return faiss.IndexFlatL2(plan.dimension)
+    index = faiss.index_factory(plan.dimension, plan.factory_string, faiss.METRIC_L2)
+    if plan.kind == "hnsw":
+        faiss.downcast_index(index).hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    return index
+
+
+def build_index(
+    vectors: np.ndarray,
+    ids: np.ndarray,
+    plan: FaissIndexPlan,
+    *,
+    training_sample: np.ndarray | None = None,
+) -> faiss.Index:
+    """Train, fill and tune an ``IndexIDMap2`` for ``plan``.
+
+    ``vectors`` may be a read-only memmap; it is copied in slices. Without a
+    ``training_sample`` the first :data:`TRAIN_SAMPLE_MAX` rows are used.
+    """
+    base = _base_index(plan)
+    sample = training_sample
+    if sample is None:
+        sample = vectors[:TRAIN_SAMPLE_MAX]
+    sample = np.ascontiguousarray(sample, dtype=np.float32)
+    if plan.kind in ("ivf", "ivfpq"):
+        base.train(sample)
+
+    index = faiss.IndexIDMap2(base)
+    id_array = np.asarray(ids, dtype=np.int64)
+    for start in range(0, len(id_array), _ADD_BATCH):
+        end = start + _ADD_BATCH
+        index.add_with_ids(np.array(vectors[start:end], dtype=np.float32), id_array[start:end])
+
+    if plan.kind != "flat":
+        tune_search_params(base, plan, sample)
+    return index
+
+
+def _recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(row_found) & set(row_truth)) for row_found, row_truth in zip(found, truth))
+    return hits / truth.size if truth.size else 1.0
+
+
+def _sweep(
+    search: Callable[[int], np.ndarray],
+    truth: np.ndarray,
+    candidates: list[int],
+) -> tuple[int, float]:
+    """Smallest candidate reaching TARGET_RECALL, or where recall stops improving."""
+    best, best_recall = candidates[-1], 0.0
+    previous = -1.0
+    for value in candidates:
+        recall = _recall_at_k(search(value), truth)
+        if recall >= TARGET_RECALL:
+            return value, recall
+        if previous >= 0 and recall - previous < _RECALL_PLATEAU:
+            return best, best_recall
+        best, best_recall, previous = value, recall, recall
+    return best, best_recall
+
+
+def tune_search_params(base: faiss.Index, plan: FaissIndexPlan, sample: np.ndarray) -> int:
+    """Set ``nprobe`` / ``efSearch`` on ``base`` from a held-out split of ``sample``.
+
+    A scratch index with the same trained structure is filled with the rest of
+    the sample and compared against exact search. Returns the chosen value.
+    """
+    n_queries = min(_TUNE_QUERIES, len(sample) // 10)
+    k = min(_TUNE_K, len(sample) - n_queries)
+    params = faiss.ParameterSpace()
+    if n_queries < 1 or k < 1:
+        value = max(1, plan.nlist // 16) if plan.kind != "hnsw" else 64
+        params.set_index_parameter(base, "nprobe" if plan.kind != "hnsw" else "efSearch", value)
+        return value
+
+    queries, corpus = sample[:n_queries], sample[n_queries:]
+    exact = faiss.IndexFlatL2(plan.dimension)
+    exact.add(corpus)
+    _, truth = exact.search(queries, k)
+
+    if plan.kind == "hnsw":
+        scratch = _base_index(plan)
+        name = "efSearch"
+        candidates = [ef for ef in _EF_SEARCH_CANDIDATES if ef >= k]
+    else:
+        scratch = faiss.clone_index(base)
+        scratch.reset()
+        name = "nprobe"
+        candidates = [1]
+        while candidates[-1] < plan.nlist:
+            candidates.append(min(candidates[-1] * 2, plan.nlist))
+    scratch.add(corpus)
+
+    def search(value: int) -> np.ndarray:
+        params.set_index_parameter(scratch, name, value)
+        return scratch.search(queries, k)[1]
+
+    value, recall = _sweep(search, truth, candidates)
+    params.set_index_parameter(base, name, value)
+    log.info("FAISS %s: %s=%d (recall@%d %.3f on sample)", plan.factory_string, name, value, k, recall)
+    return value
+
+
+def index_kind(index: faiss.Index) -> str:
+    """``flat`` / ``hnsw`` / ``ivf`` / ``ivfpq`` for an index or its IDMap wrapper."""
+    base = faiss.downcast_index(index.index) if hasattr(index, "id_map") else faiss.downcast_index(index)
+    if isinstance(base, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(base, faiss.IndexIVFPQ):
+        return "ivfpq"
+    if faiss.try_extract_index_ivf(base) is not None:
+        return "ivf"
+    return "flat"
+
+
+def search_parameters(index, sel: faiss.IDSelector) -> faiss.SearchParameters:
+    """Selector parameters typed for ``index`` and carrying its tuned settings.
+
+    IVF and HNSW indexes reject plain ``SearchParameters``, and typed ones
+    replace the stored ``nprobe`` / ``efSearch`` rather than inheriting them.
+    """
+    wrapped = getattr(index, "index", None)
+    if wrapped is not None:
+        base = faiss.downcast_index(wrapped)
+        ivf = faiss.try_extract_index_ivf(base)
+        if ivf is not None:
+            return faiss.SearchParametersIVF(sel=sel, nprobe=ivf.nprobe)
+        if isinstance(base, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=sel, efSearch=base.hnsw.efSearch)
+    return faiss.SearchParameters(sel=sel)
+
+
+def ivf_list_imbalance(index: faiss.Index) -> float | None:
+    """``nlist * sum(size^2) / n^2`` over the inverted lists; None for non-IVF."""
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is None:
+        return None
+    sizes = np.fromiter(
+        (ivf.invlists.list_size(i) for i in range(ivf.nlist)), dtype=np.float64, count=ivf.nlist
+    )
+    total = sizes.sum()
+    if total == 0:
+        return 1.0
+    return float(ivf.nlist * np.square(sizes).sum() / (total * total))
+
+
+def retrain_reason(index: faiss.Index, config) -> str | None:
+    """Why ``index`` should be rebuilt for its current size, or None."""
+    n_vectors = int(index.ntotal)
+    kind = index_kind(index)
+    plan = plan_from_config(n_vectors, int(index.d), config)
+    if plan.kind != kind:
+        return f"{kind} index holds {n_vectors} vectors; {plan.kind} fits better"
+    if kind in ("ivf", "ivfpq"):
+        nlist = faiss.try_extract_index_ivf(index).nlist
+        if nlist < _UNDERSIZED_NLIST * plan.nlist:
+            return f"{nlist} lists for {n_vectors} vectors (target {plan.nlist})"
+        imbalance = ivf_list_imbalance(index)
+        if imbalance is not None and imbalance > IMBALANCE_RETRAIN:
+            return f"inverted list imbalance {imbalance:.2f}"
+    return None
+
+
+def reconstruct_all(index: faiss.Index) -> tuple[np.ndarray, np.ndarray]:
+    """``(ids, vectors)`` of every vector in an ``IndexIDMap2`` in one call.
+
+    IVF-PQ vectors come back as their quantized approximations.
+    """
+    ids = faiss.vector_to_array(index.id_map).astype(np.int64)
+    base = faiss.downcast_index(index.index)
+    ivf = faiss.try_extract_index_ivf(base)
+    if ivf is not None:
+        ivf.make_direct_map()
+    vectors = base.reconstruct_n(0, base.ntotal) if len(ids) else np.empty((0, index.d), np.float32)
+    return ids, np.asarray(vectors, dtype=np.float32)
+
+
+def write_index_atomic(index: faiss.Index, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    faiss.write_index(index, str(tmp_path))
+    os.replace(tmp_path, path)
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FaissRetrainer:
+    """Rebuilds an on-disk index in a background thread.
+
+    ``write_lock`` must also guard every other writer of ``path``. The new
+    index is swapped in only if the file has not changed since it was read;
+    otherwise the rebuild is dropped and the next append schedules another.
+    """
+
+    def __init__(self, path: Path, config, write_lock: threading.Lock) -> None:
+        self.path = path
+        self.config = config
+        self._write_lock = write_lock
+        self._thread: threading.Thread | None = None
+        self.last_reason: str | None = None
+        self.completed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def maybe_schedule(self, index: faiss.Index) -> str | None:
+        """Start a rebuild if ``index`` needs one; returns the reason when started."""
+        if self.running:
+            return None
+        reason = retrain_reason(index, self.config)
+        if reason is None:
+            return None
+        self.last_reason = reason
+        log.info("Scheduling FAISS retrain for %s: %s", self.path, reason)
+        self._thread = threading.Thread(
+            target=self._run, name="searchat-faiss-retrain", daemon=True
+        )
+        self._thread.start()
+        return reason
+
+    def wait(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            with self._write_lock:
+                stamp = _file_stamp(self.path)
+                index = faiss.read_index(str(self.path))
+            ids, vectors = reconstruct_all(index)
+            del index
+            start = time.perf_counter()
+            plan = plan_from_config(len(ids), vectors.shape[1], self.config)
+            sample_rows = np.random.default_rng(0).permutation(len(ids))[:TRAIN_SAMPLE_MAX]
+            rebuilt = build_index(vectors, ids, plan, training_sample=vectors[np.sort(sample_rows)])
+            with self._write_lock:
+                if _file_stamp(self.path) != stamp:
+                    log.info("FAISS index changed during retrain; dropping rebuilt index")
+                    return
+                write_index_atomic(rebuilt, self.path)
+            self.completed += 1
+            log.info(
+                "FAISS retrained as %s over %d vectors in %.1fs",
+                plan.factory_string, len(ids), time.perf_counter() - start,
+            )
+        except Exception as exc:
+            log.warning("FAISS retrain failed for %s: %s", self.path, exc)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, replace
 import numpy as np
 import faiss
 import pyarrow as pa
@@ -31,8 +33,34 @@ from searchat.config.constants import (
     INDEX_FORMAT_VERSION,
     INDEX_METADATA_FILENAME,
     INDEX_SCHEMA_VERSION,
+    DEFAULT_CODE_INDEX_ENABLED,
+)
+from searchat.core.connectors import (
+    TailCursor,
+    TailParse,
+    detect_connector,
+    discover_all_files,
+    supports_tail_parse,
+)
+from searchat.core.connectors.utils import read_appended_lines
+from searchat.core.code_index import CODE_INDEX_FILENAME, CodeIndex, parquet_signature
+from searchat.core.embedding_cache import cached_encode, get_embedding_cache
+from searchat.core.faiss_factory import (
+    TRAIN_SAMPLE_MAX,
+    FaissRetrainer,
+    build_index,
+    plan_from_config,
+    reconstruct_all,
+)
+from searchat.core.profiling import get_profiler, stage_timer
+from searchat.core.indexing_pipeline import (
+    EmbeddingAccumulator,
+    code_block_rows,
+    indexing_pass,
+    iter_parsed_sources,
+    resolve_max_batch_tokens,
+    resolve_max_workers,
 )
-from searchat.core.connectors import discover_all_files, detect_connector
 from searchat.services.storage_contracts import IndexMetadata, read_index_metadata, write_index_metadata
 
 logger = get_logger(__name__)
@@ -45,6 +73,85 @@ def _build_id_selector(ids: np.ndarray) -> faiss.IDSelector:
         return faiss.IDSelectorBatch(ids.size, faiss.swig_ptr(ids))  # type: ignore[call-arg]
 
 
+# Full rebuilds embed and write this many conversations at a time.
+_REBUILD_WINDOW_CONVERSATIONS = 256
+
+
+class _VectorSpool:
+    """Append-only float32 vector file plus a reservoir sample of its rows."""
+
+    def __init__(self, path: Path, sample_size: int, *, seed: int = 0) -> None:
+        self.path = path
+        self.count = 0
+        self.dimension: int | None = None
+        self._sample_size = sample_size
+        self._sample: np.ndarray | None = None
+        self._rng = np.random.default_rng(seed)
+        self._file = open(path, "wb")
+
+    def append(self, vectors: np.ndarray) -> None:
+        if vectors.ndim != 2 or len(vectors) == 0:
+            return
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.dimension is None:
+            self.dimension = int(vectors.shape[1])
+            self._sample = np.empty((self._sample_size, self.dimension), dtype=np.float32)
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension changed mid-rebuild: {vectors.shape[1]} != {self.dimension}"
+            )
+        self._file.write(vectors.tobytes())
+        self._reservoir_add(vectors)
+        self.count += len(vectors)
+
+    def _reservoir_add(self, vectors: np.ndarray) -> None:
+        # Algorithm R: row i replaces a random slot with probability k / (i + 1).
+        assert self._sample is not None
+        positions = np.arange(self.count, self.count + len(vectors))
+        direct = positions < self._sample_size
+        self._sample[positions[direct]] = vectors[direct]
+        rest = ~direct
+        if rest.any():
+            slots = self._rng.integers(0, positions[rest] + 1)
+            keep = slots < self._sample_size
+            self._sample[slots[keep]] = vectors[rest][keep]
+
+    def training_sample(self) -> np.ndarray:
+        assert self._sample is not None
+        return self._sample[: min(self.count, self._sample_size)]
+
+    def vectors(self) -> np.ndarray:
+        """Read-only memory map over every appended vector."""
+        self._file.close()
+        return np.memmap(self.path, dtype=np.float32, mode="r", shape=(self.count, self.dimension))
+
+    def discard(self) -> None:
+        self._file.close()
+        self._sample = None
+        self.path.unlink(missing_ok=True)
+
+
+class _ParquetSink:
+    """One lazily opened ParquetWriter per output file; each write adds a row group."""
+
+    def __init__(self, schema: pa.Schema) -> None:
+        self._schema = schema
+        self._writers: dict[Path, pq.ParquetWriter] = {}
+
+    def write(self, path: Path, rows: pa.Table | list[dict]) -> None:
+        table = rows if isinstance(rows, pa.Table) else pa.Table.from_pylist(rows, schema=self._schema)
+        writer = self._writers.get(path)
+        if writer is None:
+            writer = pq.ParquetWriter(path, self._schema)
+            self._writers[path] = writer
+        writer.write_table(table)
+
+    def close(self) -> None:
+        writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            writer.close()
+
+
 class ConversationIndexer:
     """Indexes conversations from multiple AI coding agents.
 
@@ -74,11 +181,17 @@ class ConversationIndexer:
 
         # Embedder is initialized lazily (first indexing operation).
         self._embedder = None
+        self._embedding_cache = get_embedding_cache(config, search_dir)
+        self._profiler = get_profiler(config)
 
         self.batch_size = config.embedding.batch_size
         self.chunk_size = 1500
         self.chunk_overlap = 200
 
+        # Guards embeddings.faiss against the background retrainer's swap.
+        self._faiss_write_lock = threading.Lock()
+        self._faiss_retrainer: FaissRetrainer | None = None
+
         self._ensure_directories()
 
     def _write_indexed_paths(self, paths: set[str]) -> None:
@@ -135,6 +248,116 @@ class ConversationIndexer:
                 }
         return state
 
+    @staticmethod
+    def _file_state_entry(
+        record: ConversationRecord,
+        connector_name: str,
+        *,
+        file_size: int,
+        mtime_ns: int = 0,
+        cursor: TailCursor | None = None,
+        tail_chunk_start: int | None = None,
+    ) -> dict:
+        return {
+            "file_path": record.file_path,
+            "file_hash": record.file_hash,
+            "file_size": file_size,
+            "indexed_at": record.indexed_at,
+            "connector_name": connector_name,
+            "conversation_id": record.conversation_id,
+            "project_id": record.project_id,
+            "mtime_ns": mtime_ns or None,
+            "byte_offset": cursor.byte_offset if cursor else None,
+            "next_sequence": cursor.next_sequence if cursor else None,
+            "tail_checkpoint": cursor.checkpoint if cursor else None,
+            "tail_chunk_start": tail_chunk_start,
+        }
+
+    @staticmethod
+    def _unchanged_since(state: dict | None, stat: os.stat_result) -> bool:
+        """True when size and mtime match the state recorded at the last index."""
+        if not state or not state.get("mtime_ns"):
+            return False
+        return state.get("file_size") == stat.st_size and state.get("mtime_ns") == stat.st_mtime_ns
+
+    @staticmethod
+    def _tail_cursor(state: dict | None) -> TailCursor | None:
+        if not state:
+            return None
+        values = (
+            state.get("byte_offset"),
+            state.get("next_sequence"),
+            state.get("tail_checkpoint"),
+            state.get("file_hash"),
+        )
+        if any(value is None for value in values):
+            return None
+        byte_offset, next_sequence, checkpoint, file_hash = values
+        return TailCursor(int(byte_offset), int(next_sequence), checkpoint, file_hash)
+
+    def _load_conversation_record(self, project_id: str, conversation_id: str) -> ConversationRecord | None:
+        project_parquet = self.conversations_dir / f"project_{project_id}.parquet"
+        if not project_parquet.exists():
+            return None
+        rows = pq.read_table(
+            project_parquet, filters=[("conversation_id", "=", conversation_id)]
+        ).to_pylist()
+        if not rows:
+            return None
+        row = rows[-1]
+        messages = [
+            MessageRecord(
+                sequence=m["sequence"],
+                role=m["role"],
+                content=m["content"],
+                timestamp=m["timestamp"],
+                has_code=bool(m["has_code"]),
+                code_blocks=m.get("code_blocks") or [],
+            )
+            for m in row["messages"] or []
+        ]
+        return ConversationRecord(
+            conversation_id=row["conversation_id"],
+            project_id=row["project_id"],
+            file_path=row["file_path"],
+            title=row["title"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            message_count=row["message_count"],
+            messages=messages,
+            full_text=row["full_text"],
+            embedding_id=row["embedding_id"],
+            file_hash=row["file_hash"],
+            indexed_at=row["indexed_at"],
+            files_mentioned=row.get("files_mentioned"),
+            git_branch=row.get("git_branch"),
+        )
+
+    @staticmethod
+    def _extend_record(record: ConversationRecord, tail: TailParse) -> ConversationRecord:
+        """Append a parsed tail to a stored conversation record."""
+        new_text = "\n\n".join(m.content for m in tail.messages)
+        files_mentioned = sorted(set(record.files_mentioned or []) | set(tail.files_mentioned or []))
+        title = record.title
+        if title == "Untitled" and tail.title:
+            title = tail.title
+        return ConversationRecord(
+            conversation_id=record.conversation_id,
+            project_id=record.project_id,
+            file_path=record.file_path,
+            title=title,
+            created_at=record.created_at,
+            updated_at=tail.messages[-1].timestamp,
+            message_count=record.message_count + len(tail.messages),
+            messages=record.messages + tail.messages,
+            full_text=f"{record.full_text}\n\n{new_text}" if record.full_text else new_text,
+            embedding_id=record.embedding_id,
+            file_hash=tail.cursor.file_hash,
+            indexed_at=datetime.now(),
+            files_mentioned=files_mentioned or None,
+            git_branch=record.git_branch,
+        )
+
     def _get_embedder(self):
         """Create and cache the embedding model on first use."""
         if self._embedder is not None:
@@ -233,13 +456,16 @@ class ConversationIndexer:
         
         return chunks
     
-    def _chunk_by_messages(self, messages: list[MessageRecord], title: str) -> list[dict]:
+    def _chunk_by_messages(
+        self, messages: list[MessageRecord], title: str, start: int = 0
+    ) -> list[dict]:
+        """Chunk ``messages[start:]``; a non-zero ``start`` re-chunks only a conversation's tail."""
         chunks_with_metadata = []
-        current_chunk = f"{title}\n\n"
+        current_chunk = f"{title}\n\n" if start == 0 else ""
         current_messages = []
-        start_message_idx = 0
+        start_message_idx = start
         
-        for idx, msg in enumerate(messages):
+        for idx, msg in enumerate(messages[start:], start):
             msg_text = f"{msg.content}\n\n"
             
             if len(current_chunk) + len(msg_text) > self.chunk_size and current_messages:
@@ -284,6 +510,7 @@ class ConversationIndexer:
         
         return chunks_with_metadata
     
+    @indexing_pass
     def index_all(
         self,
         force: bool = False,
@@ -347,118 +574,169 @@ class ConversationIndexer:
         # Collect all files first for accurate progress tracking
         file_matches = discover_all_files(self.config)
 
-        # Phase 2: Processing conversations
+        # Phase 2: Stream conversations through parse -> chunk -> embed -> write.
+        # Only one window of records is held at a time; vectors are spooled to
+        # disk and Parquet files grow a row group per window.
         progress.update_phase("Processing conversations")
 
-        all_records: list[ConversationRecord] = []
-        all_chunks_with_meta: list[dict] = []
-        project_records_map: dict[str, list[ConversationRecord]] = {}
+        window: list[tuple[ConversationRecord, list[dict], list[dict]]] = []
         file_state_entries: list[dict] = []
-        connector_name_by_file_path: dict[str, str] = {}
+        indexed_paths: set[str] = set()
+        totals = {"conversations": 0, "messages": 0, "chunks": 0}
+        next_vector_id = 0
+        projects: set[str] = set()
+        projects_with_code: set[str] = set()
 
-        for idx, match in enumerate(file_matches, 1):
-            json_file = match.path
-            connector = match.connector
-            display_name = f"{connector.name} | {json_file.name}"
-            progress.update_file_progress(idx, len(file_matches), display_name)
+        conversation_sink = _ParquetSink(CONVERSATION_SCHEMA)
+        code_sink = _ParquetSink(CODE_BLOCK_SCHEMA)
+        metadata_sink = _ParquetSink(METADATA_SCHEMA)
+        spool = _VectorSpool(self.indices_dir / "embeddings.rebuild.f32", TRAIN_SAMPLE_MAX)
+        metadata_path = self.indices_dir / "embeddings.metadata.parquet"
 
-            try:
-                # Process based on agent type
-                record = connector.parse(json_file, 0)
+        def flush_window() -> None:
+            nonlocal next_vector_id
+            chunks = [chunk for _record, record_chunks, _code in window for chunk in record_chunks]
+            if chunks:
+                embeddings = self._batch_encode_chunks(chunks)
+                spool.append(np.asarray(embeddings, dtype=np.float32))
+
+            metadata_rows: list[dict] = []
+            by_project: dict[str, list[ConversationRecord]] = {}
+            code_by_project: dict[str, list[dict]] = {}
+            for record, record_chunks, code_rows in window:
+                record.embedding_id = next_vector_id if record_chunks else 0
+                for chunk_idx, chunk in enumerate(record_chunks):
+                    metadata_rows.append({
+                        "vector_id": next_vector_id,
+                        "conversation_id": record.conversation_id,
+                        "project_id": record.project_id,
+                        "chunk_index": chunk_idx,
+                        "chunk_text": chunk["text"],
+                        "message_start_index": chunk["start_message_index"],
+                        "message_end_index": chunk["end_message_index"],
+                        "created_at": record.created_at,
+                    })
+                    next_vector_id += 1
+                by_project.setdefault(record.project_id, []).append(record)
+                if code_rows:
+                    code_by_project.setdefault(record.project_id, []).extend(code_rows)
+
+            with stage_timer(self._profiler, "index.write"):
+                if metadata_rows:
+                    metadata_sink.write(metadata_path, metadata_rows)
+                for project_id, records in by_project.items():
+                    conversation_sink.write(
+                        self.conversations_dir / f"project_{project_id}.parquet",
+                        self._conversation_table(records),
+                    )
+                for project_id, code_rows in code_by_project.items():
+                    code_sink.write(self._code_parquet_path(project_id), code_rows)
+            projects.update(by_project)
+            projects_with_code.update(code_by_project)
+            window.clear()
 
-                # Skip conversations with no messages
-                if record.message_count == 0:
+        try:
+            # Parsing and code-block extraction fan out over indexing.max_workers
+            # processes; results arrive in discovery order.
+            parsed_sources = iter_parsed_sources(
+                ((match.path, match.connector) for match in file_matches),
+                max_workers=resolve_max_workers(self.config),
+            )
+            for idx, parsed in enumerate(parsed_sources, 1):
+                json_file = parsed.path
+                display_name = f"{parsed.connector_name} | {json_file.name}"
+                progress.update_file_progress(idx, len(file_matches), display_name)
+
+                if parsed.error is not None:
+                    if parsed.connector_name == "claude":
+                        raise RuntimeError(
+                            f"Failed to process {json_file}: {parsed.error}"
+                        ) from parsed.error
+                    logger.warning(
+                        f"Failed to process {parsed.connector_name} session {json_file}: {parsed.error}"
+                    )
                     continue
 
-                all_records.append(record)
+                if self._profiler is not None:
+                    self._profiler.record("index.parse", parsed.parse_ms)
+                record = parsed.record
 
-                connector_name_by_file_path[record.file_path] = connector.name
-
-                project_key = record.project_id
-                if project_key not in project_records_map:
-                    project_records_map[project_key] = []
-                project_records_map[project_key].append(record)
-
-                file_size = json_file.stat().st_size if json_file.exists() else 0
-                file_state_entries.append({
-                    "file_path": record.file_path,
-                    "file_hash": record.file_hash,
-                    "file_size": file_size,
-                    "indexed_at": record.indexed_at,
-                    "connector_name": connector.name,
-                    "conversation_id": record.conversation_id,
-                    "project_id": record.project_id,
-                })
-
-                # Collect chunks (will batch encode later)
-                chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
-                for chunk_idx, chunk in enumerate(chunks_with_meta):
-                    chunk["_record"] = record
-                    chunk["_chunk_index"] = chunk_idx
-                    all_chunks_with_meta.append(chunk)
-
-            except Exception as e:
-                if connector.name == "claude":
-                    raise RuntimeError(f"Failed to process {json_file}: {e}") from e
-                logger.warning(f"Failed to process {connector.name} session {json_file}: {e}")
-                continue
-
-        # Phase 3: Generate embeddings
-        progress.update_phase("Generating embeddings")
-        embeddings_array = self._batch_encode_chunks(all_chunks_with_meta, progress)
-
-        # Build metadata for FAISS index
-        metadata: list[dict] = []
-        vector_ids: list[int] = []
-        next_vector_id = 0
-        record_first_vector_id: dict[str, int] = {}
-        for chunk_meta, _embedding in zip(all_chunks_with_meta, embeddings_array):
-            record = chunk_meta["_record"]
-            if record.conversation_id not in record_first_vector_id:
-                record_first_vector_id[record.conversation_id] = next_vector_id
-            vector_id = next_vector_id
-            next_vector_id += 1
-            vector_ids.append(vector_id)
-            metadata.append({
-                "vector_id": vector_id,
-                "conversation_id": record.conversation_id,
-                "project_id": record.project_id,
-                "chunk_index": chunk_meta["_chunk_index"],
-                "chunk_text": chunk_meta["text"],
-                "message_start_index": chunk_meta["start_message_index"],
-                "message_end_index": chunk_meta["end_message_index"],
-                "created_at": record.created_at,
-            })
+                # Skip conversations with no messages
+                if record.message_count == 0:
+                    continue
 
-        # Phase 4: Building index
-        progress.update_phase("Building search index")
-        if len(embeddings_array) > 0:
-            self._build_faiss_index(embeddings_array, metadata, vector_ids)
+                with stage_timer(self._profiler, "index.chunk"):
+                    chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
+
+                file_state_entries.append(self._file_state_entry(
+                    record,
+                    parsed.connector_name,
+                    file_size=parsed.file_size,
+                    mtime_ns=parsed.mtime_ns,
+                    cursor=parsed.cursor,
+                    tail_chunk_start=chunks_with_meta[-1]["start_message_index"] if chunks_with_meta else 0,
+                ))
+                indexed_paths.add(record.file_path)
+                totals["conversations"] += 1
+                totals["messages"] += record.message_count
+                totals["chunks"] += len(chunks_with_meta)
+
+                window.append((record, chunks_with_meta, parsed.code_blocks))
+                if len(window) >= _REBUILD_WINDOW_CONVERSATIONS:
+                    flush_window()
+                    progress.update_embedding_progress(current=spool.count, total=totals["chunks"])
+            if window:
+                flush_window()
+                progress.update_embedding_progress(current=spool.count, total=totals["chunks"])
+
+            # Every project has a code-block file, empty when it has no code.
+            for project_id in projects - projects_with_code:
+                code_sink.write(self._code_parquet_path(project_id), [])
+            conversation_sink.close()
+            code_sink.close()
+            metadata_sink.close()
+            code_index = self._code_index()
+            if code_index is not None:
+                try:
+                    code_index.rebuild(self.code_dir)
+                except Exception as exc:
+                    # Code search falls back to scanning the Parquet files.
+                    logger.warning("Failed to build code index: %s", exc)
+
+            # Phase 3: Building index
+            progress.update_phase("Building search index")
+            if spool.count > 0:
+                self._build_faiss_index(
+                    spool.vectors(),
+                    np.arange(spool.count, dtype=np.int64),
+                    training_sample=spool.training_sample(),
+                )
+        finally:
+            conversation_sink.close()
+            code_sink.close()
+            metadata_sink.close()
+            spool.discard()
 
-        # Phase 5: Saving
+        # Phase 4: Saving
         progress.update_phase("Writing to storage")
-        for project_id, records in project_records_map.items():
-            for record in records:
-                record.embedding_id = record_first_vector_id.get(record.conversation_id, 0)
-            self._write_parquet_batch(records, project_id, connector_name_by_file_path)
-
         self._write_index_metadata(
-            len(all_records),
-            len(embeddings_array),
+            totals["conversations"],
+            next_vector_id,
             next_vector_id=next_vector_id,
         )
 
         # Persist indexed source paths for fast watcher startup.
-        self._write_indexed_paths({r.file_path for r in all_records})
+        self._write_indexed_paths(indexed_paths)
         if file_state_entries:
             self._write_file_state(file_state_entries)
 
         # Update final stats
         progress.update_stats(
-            conversations=len(all_records),
-            chunks=len(all_chunks_with_meta),
-            embeddings=len(embeddings_array)
+            conversations=totals["conversations"],
+            chunks=totals["chunks"],
+            embeddings=next_vector_id,
         )
+        self._flush_embedding_cache()
         progress.finish()
 
         elapsed = time.time() - start_time
@@ -471,8 +749,8 @@ class ConversationIndexer:
         faiss_size = faiss_path.stat().st_size / (1024 * 1024) if faiss_path.exists() else 0
         
         return IndexStats(
-            total_conversations=len(all_records),
-            total_messages=sum(r.message_count for r in all_records),
+            total_conversations=totals["conversations"],
+            total_messages=totals["messages"],
             index_time_seconds=elapsed,
             parquet_size_mb=parquet_size,
             faiss_size_mb=faiss_size
@@ -506,13 +784,10 @@ class ConversationIndexer:
         all_embeddings = []
         for i in range(0, len(texts), self.batch_size):
             batch = texts[i:i + self.batch_size]
-            embedder = self._get_embedder()
-            batch_embeddings = embedder.encode(
-                batch,
-                batch_size=self.batch_size,
-                show_progress_bar=False,
-                convert_to_numpy=True
-            )
+            with stage_timer(self._profiler, "index.embed"):
+                batch_embeddings = cached_encode(
+                    self._embedding_cache, self.config.embedding.model, batch, self._encode_uncached,
+                )
             all_embeddings.extend(batch_embeddings)
 
             # Update progress
@@ -523,6 +798,38 @@ class ConversationIndexer:
 
         return np.array(all_embeddings)
 
+    def _encode_uncached(self, texts: list[str]) -> np.ndarray:
+        return self._get_embedder().encode(
+            texts,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
+
+    def _encode_texts(self, texts: list[str]) -> np.ndarray:
+        return self._batch_encode_chunks([{"text": text} for text in texts])
+
+    def _flush_embedding_cache(self) -> None:
+        if self._embedding_cache is not None:
+            self._embedding_cache.flush()
+
+    def _embedding_accumulator(
+        self,
+        on_ready,
+        *,
+        on_error=None,
+        progress: ProgressCallback | None = None,
+    ) -> EmbeddingAccumulator:
+        """Accumulator that batches chunk texts across conversations for encoding."""
+        return EmbeddingAccumulator(
+            self._encode_texts,
+            on_ready,
+            batch_size=self.batch_size,
+            max_batch_tokens=resolve_max_batch_tokens(self.config),
+            on_error=on_error,
+            progress=progress,
+        )
+
     @staticmethod
     def _timestamp_ms_to_datetime(value: int | None) -> datetime | None:
         if value is None:
@@ -532,14 +839,7 @@ class ConversationIndexer:
         except (OSError, ValueError, TypeError):
             return None
 
-    def _write_parquet_batch(
-        self,
-        records: list[ConversationRecord],
-        project_id: str,
-        connector_name_by_file_path: dict[str, str],
-    ) -> None:
-        output_path = self.conversations_dir / f"project_{project_id}.parquet"
-        
+    def _conversation_table(self, records: list[ConversationRecord]) -> pa.Table:
         data = {
             'conversation_id': [r.conversation_id for r in records],
             'project_id': [r.project_id for r in records],
@@ -562,17 +862,7 @@ class ConversationIndexer:
             'files_mentioned': [r.files_mentioned for r in records],
             'git_branch': [r.git_branch for r in records],
         }
-        
-        table = pa.Table.from_pydict(data, schema=CONVERSATION_SCHEMA)
-        pq.write_table(table, output_path)
-
-        code_rows: list[dict] = []
-        for record in records:
-            connector_name = connector_name_by_file_path.get(record.file_path)
-            if not connector_name:
-                raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
-            code_rows.extend(self._extract_code_block_dicts(record, connector_name))
-        self._write_code_blocks(project_id, code_rows)
+        return pa.Table.from_pydict(data, schema=CONVERSATION_SCHEMA)
 
     def _record_to_dict(self, record: ConversationRecord) -> dict:
         return {
@@ -622,15 +912,29 @@ class ConversationIndexer:
     def _code_parquet_path(self, project_id: str) -> Path:
         return self.code_dir / f"project_{project_id}.parquet"
 
-    def _write_code_blocks(self, project_id: str, code_rows: list[dict]) -> None:
-        path = self._code_parquet_path(project_id)
-        table = pa.Table.from_pylist(code_rows, schema=CODE_BLOCK_SCHEMA)
-        pq.write_table(table, path)
+    def _code_index(self) -> CodeIndex | None:
+        performance = getattr(self.config, "performance", None)
+        if not getattr(performance, "code_index", DEFAULT_CODE_INDEX_ENABLED):
+            return None
+        return CodeIndex(self.indices_dir / CODE_INDEX_FILENAME)
+
+    def _update_code_index(self, before: str, **change) -> None:
+        """Apply a code Parquet change to the code index (``before`` = signature prior to the write)."""
+        code_index = self._code_index()
+        if code_index is None:
+            return
+        try:
+            code_index.apply(self.code_dir, before=before, **change)
+        except Exception as exc:
+            # The stored signature no longer matches, so searches scan Parquet
+            # until the next successful update rebuilds the index.
+            logger.warning("Failed to update code index: %s", exc)
 
     def _append_code_blocks(self, project_id: str, code_rows: list[dict]) -> None:
         if not code_rows:
             return
         path = self._code_parquet_path(project_id)
+        before = parquet_signature(self.code_dir)
         new_table = pa.Table.from_pylist(code_rows, schema=CODE_BLOCK_SCHEMA)
         if path.exists():
             existing_table = pq.read_table(path)
@@ -638,51 +942,20 @@ class ConversationIndexer:
             pq.write_table(combined_table, path)
         else:
             pq.write_table(new_table, path)
+        self._update_code_index(before, add=code_rows)
 
     def _remove_code_blocks_for_conversation(self, project_id: str, conversation_id: str) -> None:
         path = self._code_parquet_path(project_id)
         if not path.exists():
             return
+        before = parquet_signature(self.code_dir)
         table = pq.read_table(path)
         filtered = table.filter(pc.field("conversation_id") != conversation_id)
         pq.write_table(filtered, path)
+        self._update_code_index(before, remove_conversation_ids=[conversation_id])
 
     def _extract_code_block_dicts(self, record: ConversationRecord, connector_name: str) -> list[dict]:
-        from searchat.core.code_extractor import extract_code_blocks
-
-        rows: list[dict] = []
-        for message in record.messages:
-            extracted = extract_code_blocks(
-                message_text=message.content,
-                message_index=message.sequence,
-                role=message.role,
-            )
-            for block in extracted:
-                rows.append(
-                    {
-                        "conversation_id": record.conversation_id,
-                        "project_id": record.project_id,
-                        "connector": connector_name,
-                        "file_path": record.file_path,
-                        "title": record.title,
-                        "conversation_created_at": record.created_at,
-                        "conversation_updated_at": record.updated_at,
-                        "message_index": block.message_index,
-                        "block_index": block.block_index,
-                        "role": block.role,
-                        "message_timestamp": message.timestamp,
-                        "fence_language": block.fence_language,
-                        "language": block.language,
-                        "language_source": block.language_source,
-                        "functions": block.functions,
-                        "classes": block.classes,
-                        "imports": block.imports,
-                        "code": block.code,
-                        "code_hash": block.code_hash,
-                        "lines": block.lines,
-                    }
-                )
-        return rows
+        return code_block_rows(record, connector_name)
 
     def _remove_conversation_from_project(self, project_id: str, conversation_id: str) -> None:
         project_parquet = self.conversations_dir / f"project_{project_id}.parquet"
@@ -700,32 +973,55 @@ class ConversationIndexer:
         new_ids: list[int],
     ) -> faiss.Index:
         dimension = existing_index.d
-        base_index = faiss.IndexFlatL2(dimension)  # type: ignore[call-arg]
-        rebuilt_index = faiss.IndexIDMap2(base_index)  # type: ignore[call-arg]
+        vectors, ids = self._reconstruct_vectors(existing_index, remaining_ids)
+        if new_embeddings:
+            vectors = np.vstack([vectors, np.asarray(new_embeddings, dtype=np.float32)])
+            ids = np.concatenate([ids, np.asarray(new_ids, dtype=np.int64)])
 
-        vectors: list[np.ndarray] = []
-        ids: list[int] = []
+        plan = plan_from_config(len(ids), dimension, self.config)
+        return build_index(vectors, ids, plan)
 
-        for vector_id in remaining_ids:
+    @staticmethod
+    def _reconstruct_vectors(
+        existing_index: faiss.Index, remaining_ids: list[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectors for ``remaining_ids``, in that order, and the ids as int64."""
+        ids = np.asarray(remaining_ids, dtype=np.int64)
+        try:
+            all_ids, all_vectors = reconstruct_all(existing_index)
+        except (AttributeError, RuntimeError):
+            all_ids = np.empty(0, dtype=np.int64)
+        if len(all_ids):
+            order = np.argsort(all_ids, kind="stable")
+            rows = order[np.searchsorted(all_ids, ids, sorter=order).clip(max=len(all_ids) - 1)]
+            if np.array_equal(all_ids[rows], ids):
+                return all_vectors[rows], ids
+
+        # Per-id fallback; also reports ids missing from the index.
+        vectors: list[np.ndarray] = []
+        for vector_id in ids:
             try:
-                vector = existing_index.reconstruct(int(vector_id))  # type: ignore[call-arg]
+                vectors.append(existing_index.reconstruct(int(vector_id)))  # type: ignore[call-arg]
             except Exception as exc:
                 raise RuntimeError(
                     "Failed to reconstruct existing vectors for rebuild."
                 ) from exc
-            vectors.append(vector)
-            ids.append(int(vector_id))
-
-        if new_embeddings:
-            vectors.extend(new_embeddings)
-            ids.extend(int(vector_id) for vector_id in new_ids)
-
-        if vectors:
-            vectors_array = np.vstack(vectors).astype(np.float32)
-            ids_array = np.asarray(ids, dtype=np.int64)
-            rebuilt_index.add_with_ids(vectors_array, ids_array)  # type: ignore[call-arg]
-
-        return rebuilt_index
+        if not vectors:
+            return np.empty((0, existing_index.d), dtype=np.float32), ids
+        return np.vstack(vectors).astype(np.float32), ids
+
+    def _write_faiss_index(self, index: faiss.Index, faiss_path: Path) -> None:
+        with self._faiss_write_lock:
+            faiss.write_index(index, str(faiss_path))  # type: ignore[call-arg]
+
+    def _schedule_faiss_retrain(self, index: faiss.Index, faiss_path: Path) -> None:
+        """Rebuild in the background once appends leave ``index`` badly shaped."""
+        if self._faiss_retrainer is None:
+            self._faiss_retrainer = FaissRetrainer(faiss_path, self.config, self._faiss_write_lock)
+        try:
+            self._faiss_retrainer.maybe_schedule(index)
+        except Exception as exc:
+            logger.debug(f"Skipped FAISS retrain check: {exc}")
 
     def delete_conversations(
         self,
@@ -796,15 +1092,10 @@ class ConversationIndexer:
                 remaining_ids = remaining_meta.column("vector_id").to_pylist()
             else:
                 remaining_ids = []
-            # Ensure direct map for vector reconstruction
-            try:
-                existing_index.make_direct_map()
-            except Exception:
-                pass
             rebuilt = self._rebuild_idmap_index(
                 existing_index, remaining_ids, new_embeddings=[], new_ids=[]
             )
-            faiss.write_index(rebuilt, str(faiss_path))
+            self._write_faiss_index(rebuilt, faiss_path)
 
         # 7. Update file_state.parquet
         if self.file_state_path.exists():
@@ -873,27 +1164,20 @@ class ConversationIndexer:
     def _build_faiss_index(
         self,
         embeddings: np.ndarray,
-        metadata: list[dict],
-        vector_ids: list[int],
+        vector_ids: np.ndarray,
+        *,
+        training_sample: np.ndarray | None = None,
     ) -> None:
-        dimension = embeddings.shape[1]  # type: ignore[call-arg]
-        n_vectors = embeddings.shape[0]  # type: ignore[call-arg]
-
-        if n_vectors < 100:
-            base_index = faiss.IndexFlatL2(dimension)  # type: ignore[call-arg]
-        else:
-            quantizer = faiss.IndexFlatL2(dimension)  # type: ignore[call-arg]
-            base_index = faiss.IndexIVFFlat(quantizer, dimension, min(100, n_vectors // 10))  # type: ignore[call-arg]
-            base_index.train(embeddings)  # type: ignore[call-arg,arg-type]
+        """Write ``embeddings.faiss``; ``embeddings`` may be a read-only memmap.
 
-        index = faiss.IndexIDMap2(base_index)  # type: ignore[call-arg]
-        id_array = np.asarray(vector_ids, dtype=np.int64)
-        index.add_with_ids(embeddings, id_array)  # type: ignore[call-arg,arg-type]
-
-        faiss.write_index(index, str(self.indices_dir / "embeddings.faiss"))  # type: ignore[call-arg]
-
-        metadata_table = pa.Table.from_pylist(metadata, schema=METADATA_SCHEMA)  # type: ignore[call-arg]
-        pq.write_table(metadata_table, self.indices_dir / "embeddings.metadata.parquet")  # type: ignore[call-arg]
+        The index type comes from :func:`plan_from_config`. Trained types
+        use ``training_sample`` when given, and vectors are added in slices
+        so only one slice is copied at a time.
+        """
+        plan = plan_from_config(embeddings.shape[0], embeddings.shape[1], self.config)
+        logger.info(f"Building FAISS {plan.factory_string} over {plan.n_vectors} vectors")
+        index = build_index(embeddings, vector_ids, plan, training_sample=training_sample)
+        self._write_faiss_index(index, self.indices_dir / "embeddings.faiss")
     
     def _write_index_metadata(
         self,
@@ -1013,6 +1297,7 @@ class ConversationIndexer:
         except Exception as exc:
             logger.error("Expertise extraction failed (non-blocking): %s", exc)
 
+    @indexing_pass
     def index_append_only(
         self,
         file_paths: list[str],
@@ -1063,7 +1348,8 @@ class ConversationIndexer:
                 new_conversations=0,
                 updated_conversations=0,
                 skipped_conversations=len(file_paths),
-                update_time_seconds=time.time() - start_time
+                update_time_seconds=time.time() - start_time,
+                changed_project_ids=set(),
             )
 
         # Load existing FAISS index
@@ -1087,9 +1373,44 @@ class ConversationIndexer:
         new_conversation_records: dict[str, list[ConversationRecord]] = {}
         new_indexed_paths: set[str] = set()
         connector_name_by_file_path: dict[str, str] = {}
+        file_state_by_path: dict[str, dict] = {}
         processed_count = 0
         empty_count = 0
 
+        def embedded(item: tuple[ConversationRecord, str, list[dict]], chunk_embeddings: np.ndarray) -> None:
+            nonlocal next_vector_id, processed_count
+            record, connector_name, chunks_with_meta = item
+            record.embedding_id = next_vector_id
+
+            new_indexed_paths.add(record.file_path)
+            connector_name_by_file_path[record.file_path] = connector_name
+            new_conversation_records.setdefault(record.project_id, []).append(record)
+
+            for chunk_idx, (chunk_meta, embedding) in enumerate(zip(chunks_with_meta, chunk_embeddings)):
+                new_embeddings.append(embedding)
+
+                new_metadata.append({
+                    'vector_id': next_vector_id,
+                    'conversation_id': record.conversation_id,
+                    'project_id': record.project_id,
+                    'chunk_index': chunk_idx,
+                    'chunk_text': chunk_meta['text'],
+                    'message_start_index': chunk_meta['start_message_index'],
+                    'message_end_index': chunk_meta['end_message_index'],
+                    'created_at': record.created_at
+                })
+                new_vector_ids.append(next_vector_id)
+                next_vector_id += 1
+
+            processed_count += 1
+
+        def embed_failed(item: tuple[ConversationRecord, str, list[dict]], exc: Exception) -> None:
+            logger.error(f"Failed to process {item[0].file_path}: {exc}")
+
+        # Chunks from many conversations share each encode call; vector ids
+        # are still assigned in file order as the accumulator hands them back.
+        accumulator = self._embedding_accumulator(embedded, on_error=embed_failed, progress=progress)
+
         for idx, file_path in enumerate(new_files, 1):
             json_path = Path(file_path)
 
@@ -1108,56 +1429,49 @@ class ConversationIndexer:
             progress.update_file_progress(idx, len(new_files), display_name)
 
             try:
-                record = connector.parse(json_path, next_vector_id)
+                # Stat before reading so growth during the parse is seen next run.
+                stat = json_path.stat()
+                cursor = None
+                with stage_timer(self._profiler, "index.parse"):
+                    if supports_tail_parse(connector):
+                        record, cursor = connector.parse_with_cursor(json_path, next_vector_id)
+                    else:
+                        record = connector.parse(json_path, next_vector_id)
 
                 # Skip conversations with no messages
                 if record.message_count == 0:
                     empty_count += 1
                     continue
 
-                new_indexed_paths.add(record.file_path)
-
-                connector_name_by_file_path[record.file_path] = connector.name
-
-                project_key = record.project_id
-                if project_key not in new_conversation_records:
-                    new_conversation_records[project_key] = []
-                new_conversation_records[project_key].append(record)
-
-                chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
-
-                # Batch encode all chunks for this conversation
-                chunk_embeddings = self._batch_encode_chunks(chunks_with_meta, progress)
-
-                for chunk_idx, (chunk_meta, embedding) in enumerate(zip(chunks_with_meta, chunk_embeddings)):
-                    new_embeddings.append(embedding)
-
-                    new_metadata.append({
-                        'vector_id': next_vector_id,
-                        'conversation_id': record.conversation_id,
-                        'project_id': record.project_id,
-                        'chunk_index': chunk_idx,
-                        'chunk_text': chunk_meta['text'],
-                        'message_start_index': chunk_meta['start_message_index'],
-                        'message_end_index': chunk_meta['end_message_index'],
-                        'created_at': record.created_at
-                    })
-                    new_vector_ids.append(next_vector_id)
-                    next_vector_id += 1
-
-                processed_count += 1
+                with stage_timer(self._profiler, "index.chunk"):
+                    chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
+                file_state_by_path[record.file_path] = self._file_state_entry(
+                    record,
+                    connector.name,
+                    file_size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    cursor=cursor,
+                    tail_chunk_start=chunks_with_meta[-1]["start_message_index"] if chunks_with_meta else 0,
+                )
+                accumulator.add(
+                    (record, connector.name, chunks_with_meta),
+                    [chunk['text'] for chunk in chunks_with_meta],
+                )
 
             except Exception as e:
                 logger.error(f"Failed to process {file_path}: {e}")
                 continue
 
+        accumulator.flush()
+
         # Append to FAISS index
         if new_embeddings:
             embeddings_array = np.array(new_embeddings).astype(np.float32)
             id_array = np.asarray(new_vector_ids, dtype=np.int64)
             try:
                 existing_index.add_with_ids(embeddings_array, id_array)
-                faiss.write_index(existing_index, str(faiss_path))
+                self._write_faiss_index(existing_index, faiss_path)
+                self._schedule_faiss_retrain(existing_index, faiss_path)
             except Exception:
                 remaining_ids = [
                     int(value)
@@ -1170,7 +1484,7 @@ class ConversationIndexer:
                     new_embeddings,
                     new_vector_ids,
                 )
-                faiss.write_index(rebuilt_index, str(faiss_path))
+                self._write_faiss_index(rebuilt_index, faiss_path)
 
             # Append to metadata parquet
             new_metadata_table = pa.Table.from_pylist(new_metadata, schema=METADATA_SCHEMA)
@@ -1179,16 +1493,17 @@ class ConversationIndexer:
 
         # Append to conversation parquets
         for project_id, records in new_conversation_records.items():
-            new_record_dicts = [self._record_to_dict(r) for r in records]
-            self._append_record_dicts(project_id, new_record_dicts)
+            with stage_timer(self._profiler, "index.write"):
+                new_record_dicts = [self._record_to_dict(r) for r in records]
+                self._append_record_dicts(project_id, new_record_dicts)
 
-            code_rows: list[dict] = []
-            for record in records:
-                connector_name = connector_name_by_file_path.get(record.file_path)
-                if not connector_name:
-                    raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
-                code_rows.extend(self._extract_code_block_dicts(record, connector_name))
-            self._append_code_blocks(project_id, code_rows)
+                code_rows: list[dict] = []
+                for record in records:
+                    connector_name = connector_name_by_file_path.get(record.file_path)
+                    if not connector_name:
+                        raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
+                    code_rows.extend(self._extract_code_block_dicts(record, connector_name))
+                self._append_code_blocks(project_id, code_rows)
 
         # Update index metadata
         existing_index_metadata = self._load_existing_metadata()
@@ -1209,6 +1524,7 @@ class ConversationIndexer:
             chunks=len(new_embeddings),
             embeddings=len(new_embeddings)
         )
+        self._flush_embedding_cache()
         progress.finish()
 
         if new_indexed_paths:
@@ -1220,20 +1536,7 @@ class ConversationIndexer:
                 file_state = self._backfill_file_state()
             for records in new_conversation_records.values():
                 for record in records:
-                    path_obj = Path(record.file_path)
-                    file_size = path_obj.stat().st_size if path_obj.exists() else 0
-                    connector_name = connector_name_by_file_path.get(record.file_path)
-                    if not connector_name:
-                        raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
-                    file_state[record.file_path] = {
-                        "file_path": record.file_path,
-                        "file_hash": record.file_hash,
-                        "file_size": file_size,
-                        "indexed_at": record.indexed_at,
-                        "connector_name": connector_name,
-                        "conversation_id": record.conversation_id,
-                        "project_id": record.project_id,
-                    }
+                    file_state[record.file_path] = file_state_by_path[record.file_path]
             self._write_file_state(list(file_state.values()))
 
         # Run expertise extraction on newly indexed conversations
@@ -1247,8 +1550,10 @@ class ConversationIndexer:
             skipped_conversations=len(file_paths) - processed_count - empty_count,
             update_time_seconds=elapsed,
             empty_conversations=empty_count,
+            changed_project_ids=set(new_conversation_records),
         )
 
+    @indexing_pass
     def index_adaptive(
         self,
         file_paths: list[str],
@@ -1257,7 +1562,12 @@ class ConversationIndexer:
         """
         Adaptive indexing for new and modified conversation files.
 
-        New files are appended. Modified files trigger per-conversation reindexing.
+        New files are appended. Files whose size and mtime match the recorded
+        state are skipped without being read. Append-only sources (connectors
+        with ``parse_tail``) that only grew are resumed from the stored byte
+        offset: just the new lines are parsed, and only the conversation's
+        trailing chunk is dropped and re-embedded along with the new ones.
+        Other modified files trigger per-conversation reindexing.
         """
         if progress is None:
             progress = NullProgressAdapter()
@@ -1301,13 +1611,41 @@ class ConversationIndexer:
         new_metadata: list[dict] = []
         new_vector_ids: list[int] = []
         records_to_append: dict[str, list[ConversationRecord]] = {}
+        # Projects a re-parsed conversation was removed from (it may have moved).
+        vacated_project_ids: set[str] = set()
         removed_vector_ids: set[int] = set()
         connector_name_by_file_path: dict[str, str] = {}
+        # Tail updates only add the code blocks of the appended messages.
+        code_rows_by_file_path: dict[str, list[dict]] = {}
 
         new_count = 0
         updated_count = 0
         skipped_count = 0
 
+        def embedded(item: tuple[ConversationRecord, list[dict], int], chunk_embeddings: np.ndarray) -> None:
+            nonlocal next_vector_id
+            record, chunks_with_meta, first_chunk_index = item
+            if first_chunk_index == 0:
+                record.embedding_id = next_vector_id
+            for chunk_idx, (chunk_meta, embedding) in enumerate(
+                zip(chunks_with_meta, chunk_embeddings), first_chunk_index
+            ):
+                new_embeddings.append(embedding)
+                new_metadata.append({
+                    "vector_id": next_vector_id,
+                    "conversation_id": record.conversation_id,
+                    "project_id": record.project_id,
+                    "chunk_index": chunk_idx,
+                    "chunk_text": chunk_meta["text"],
+                    "message_start_index": chunk_meta["start_message_index"],
+                    "message_end_index": chunk_meta["end_message_index"],
+                    "created_at": record.created_at,
+                })
+                new_vector_ids.append(next_vector_id)
+                next_vector_id += 1
+
+        accumulator = self._embedding_accumulator(embedded, progress=progress)
+
         for idx, file_path in enumerate(file_paths, 1):
             json_path = Path(file_path)
             if not json_path.exists():
@@ -1319,14 +1657,110 @@ class ConversationIndexer:
             display_name = f"{connector.name} | {json_path.name}"
             progress.update_file_progress(idx, len(file_paths), display_name)
 
-            file_hash = hashlib.sha256(json_path.read_bytes()).hexdigest()
-            file_size = json_path.stat().st_size
+            stat = json_path.stat()
             existing_state = file_state.get(file_path)
+            if self._unchanged_since(existing_state, stat):
+                skipped_count += 1
+                continue
+
+            cursor = self._tail_cursor(existing_state) if supports_tail_parse(connector) else None
+            if cursor is not None and stat.st_size > cursor.byte_offset:
+                with stage_timer(self._profiler, "index.parse"):
+                    tail = connector.parse_tail(json_path, cursor)
+                if tail is not None and not tail.messages:
+                    # Only non-message lines (or a partial line) were appended.
+                    existing_state.update(
+                        file_hash=tail.cursor.file_hash,
+                        file_size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        byte_offset=tail.cursor.byte_offset,
+                        next_sequence=tail.cursor.next_sequence,
+                        tail_checkpoint=tail.cursor.checkpoint,
+                    )
+                    skipped_count += 1
+                    continue
+                stored = (
+                    self._load_conversation_record(
+                        existing_state["project_id"], existing_state["conversation_id"]
+                    )
+                    if tail is not None
+                    else None
+                )
+                if stored is not None:
+                    record = self._extend_record(stored, tail)
+                    conversation_rows = pc.equal(  # type: ignore[attr-defined]
+                        existing_metadata_table["conversation_id"], record.conversation_id
+                    )
+                    boundary = existing_state.get("tail_chunk_start")
+                    if boundary is None:
+                        starts = existing_metadata_table.filter(conversation_rows).column(
+                            "message_start_index"
+                        ).to_pylist()
+                        boundary = max(starts) if starts else 0
+                    # Every chunk but the last was closed before the append and
+                    # keeps its vector; the open trailing chunk is redone.
+                    stale = pc.and_(  # type: ignore[attr-defined]
+                        conversation_rows,
+                        pc.greater_equal(existing_metadata_table["message_start_index"], boundary),  # type: ignore[attr-defined]
+                    )
+                    stale_table = existing_metadata_table.filter(stale)
+                    kept_chunks = len(existing_metadata_table.filter(conversation_rows)) - len(stale_table)
+                    removed_vector_ids.update(
+                        value for value in stale_table.column("vector_id").to_pylist() if value is not None
+                    )
+                    existing_metadata_table = existing_metadata_table.filter(pc.invert(stale))  # type: ignore[attr-defined]
+                    self._remove_conversation_from_project(record.project_id, record.conversation_id)
+
+                    with stage_timer(self._profiler, "index.chunk"):
+                        chunks_with_meta = self._chunk_by_messages(
+                            record.messages, record.title, start=boundary
+                        )
+                    accumulator.add(
+                        (record, chunks_with_meta, kept_chunks),
+                        [chunk["text"] for chunk in chunks_with_meta],
+                    )
+                    code_rows_by_file_path[record.file_path] = code_block_rows(
+                        replace(record, messages=tail.messages),
+                        connector.name,
+                    )
+                    records_to_append.setdefault(record.project_id, []).append(record)
+                    connector_name_by_file_path[record.file_path] = connector.name
+                    file_state[record.file_path] = self._file_state_entry(
+                        record,
+                        connector.name,
+                        file_size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        cursor=tail.cursor,
+                        tail_chunk_start=(
+                            chunks_with_meta[-1]["start_message_index"] if chunks_with_meta else boundary
+                        ),
+                    )
+                    updated_count += 1
+                    continue
+
+            if (
+                cursor is not None
+                and stat.st_size == cursor.byte_offset
+                and read_appended_lines(json_path, cursor.byte_offset, cursor.checkpoint) is not None
+            ):
+                # Touched but not grown. The stored hash is chained across tail
+                # updates, so a hash of the whole file would never match it.
+                existing_state.update(file_size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                skipped_count += 1
+                continue
+
+            file_hash = hashlib.sha256(json_path.read_bytes()).hexdigest()
             if existing_state and existing_state.get("file_hash") == file_hash:
+                existing_state.update(file_size=stat.st_size, mtime_ns=stat.st_mtime_ns)
                 skipped_count += 1
                 continue
 
-            record = connector.parse(json_path, next_vector_id)
+            cursor = None
+            with stage_timer(self._profiler, "index.parse"):
+                if supports_tail_parse(connector):
+                    record, cursor = connector.parse_with_cursor(json_path, next_vector_id)
+                else:
+                    record = connector.parse(json_path, next_vector_id)
             if record.message_count == 0:
                 skipped_count += 1
                 continue
@@ -1347,39 +1781,30 @@ class ConversationIndexer:
                 if isinstance(old_project_id, str):
                     self._remove_conversation_from_project(old_project_id, old_conversation_id)
                     self._remove_code_blocks_for_conversation(old_project_id, old_conversation_id)
+                    vacated_project_ids.add(old_project_id)
                 updated_count += 1
             else:
                 new_count += 1
 
-            chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
-            record.embedding_id = next_vector_id
-            chunk_embeddings = self._batch_encode_chunks(chunks_with_meta, progress)
-            for chunk_idx, (chunk_meta, embedding) in enumerate(zip(chunks_with_meta, chunk_embeddings)):
-                new_embeddings.append(embedding)
-                new_metadata.append({
-                    "vector_id": next_vector_id,
-                    "conversation_id": record.conversation_id,
-                    "project_id": record.project_id,
-                    "chunk_index": chunk_idx,
-                    "chunk_text": chunk_meta["text"],
-                    "message_start_index": chunk_meta["start_message_index"],
-                    "message_end_index": chunk_meta["end_message_index"],
-                    "created_at": record.created_at,
-                })
-                new_vector_ids.append(next_vector_id)
-                next_vector_id += 1
+            with stage_timer(self._profiler, "index.chunk"):
+                chunks_with_meta = self._chunk_by_messages(record.messages, record.title)
+            accumulator.add(
+                (record, chunks_with_meta, 0),
+                [chunk["text"] for chunk in chunks_with_meta],
+            )
 
             records_to_append.setdefault(record.project_id, []).append(record)
             connector_name_by_file_path[record.file_path] = connector.name
-            file_state[record.file_path] = {
-                "file_path": record.file_path,
-                "file_hash": file_hash,
-                "file_size": file_size,
-                "indexed_at": record.indexed_at,
-                "connector_name": connector.name,
-                "conversation_id": record.conversation_id,
-                "project_id": record.project_id,
-            }
+            file_state[record.file_path] = self._file_state_entry(
+                record,
+                connector.name,
+                file_size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                cursor=cursor,
+                tail_chunk_start=chunks_with_meta[-1]["start_message_index"] if chunks_with_meta else 0,
+            )
+
+        accumulator.flush()
 
         # NOTE: We intentionally do not call `faiss.Index.remove_ids()` here.
         # Several FAISS builds can abort the process on remove_ids for IndexIDMap/IVF
@@ -1395,7 +1820,8 @@ class ConversationIndexer:
             try:
                 if not needs_rebuild:
                     existing_index.add_with_ids(embeddings_array, id_array)
-                    faiss.write_index(existing_index, str(faiss_path))
+                    self._write_faiss_index(existing_index, faiss_path)
+                    self._schedule_faiss_retrain(existing_index, faiss_path)
             except Exception:
                 needs_rebuild = True
 
@@ -1411,7 +1837,7 @@ class ConversationIndexer:
                 new_embeddings,
                 new_vector_ids,
             )
-            faiss.write_index(rebuilt_index, str(faiss_path))
+            self._write_faiss_index(rebuilt_index, faiss_path)
 
         if new_metadata or removed_vector_ids:
             filtered_metadata = existing_metadata_table.to_pylist()
@@ -1420,16 +1846,20 @@ class ConversationIndexer:
             pq.write_table(updated_table, self.indices_dir / "embeddings.metadata.parquet")
 
         for project_id, records in records_to_append.items():
-            record_dicts = [self._record_to_dict(r) for r in records]
-            self._append_record_dicts(project_id, record_dicts)
+            with stage_timer(self._profiler, "index.write"):
+                record_dicts = [self._record_to_dict(r) for r in records]
+                self._append_record_dicts(project_id, record_dicts)
 
-            code_rows: list[dict] = []
-            for record in records:
-                connector_name = connector_name_by_file_path.get(record.file_path)
-                if not connector_name:
-                    raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
-                code_rows.extend(self._extract_code_block_dicts(record, connector_name))
-            self._append_code_blocks(project_id, code_rows)
+                code_rows: list[dict] = []
+                for record in records:
+                    connector_name = connector_name_by_file_path.get(record.file_path)
+                    if not connector_name:
+                        raise RuntimeError(f"Missing connector name for indexed file: {record.file_path}")
+                    if record.file_path in code_rows_by_file_path:
+                        code_rows.extend(code_rows_by_file_path[record.file_path])
+                        continue
+                    code_rows.extend(self._extract_code_block_dicts(record, connector_name))
+                self._append_code_blocks(project_id, code_rows)
 
         if file_state:
             self._write_file_state(list(file_state.values()))
@@ -1455,6 +1885,7 @@ class ConversationIndexer:
             chunks=len(new_metadata),
             embeddings=len(new_metadata),
         )
+        self._flush_embedding_cache()
         progress.finish()
 
         elapsed = time.time() - start_time
@@ -1464,4 +1895,5 @@ class ConversationIndexer:
             updated_conversations=updated_count,
             skipped_conversations=skipped_count,
             update_time_seconds=elapsed,
+            changed_project_ids=set(records_to_append) | vacated_project_ids,
         )
@@ -0,0 +1,399 @@
+"""Staged parse -> embed -> write pipeline shared by the indexers.
+
+Stage 1 runs ``connector.parse`` and code-block extraction for many source
+files in a process pool sized by ``indexing.max_workers``. Results come back
+in input order so vector ids and progress stay deterministic. Stage 2 is
+:class:`EmbeddingAccumulator`, which encodes texts from many files in full,
+length-sorted batches on one model instance. Stage 3 is
+:class:`BackgroundWriter`, a single thread that drains finished files into
+storage while the next batch is parsed and embedded.
+"""
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Generic, TypeVar
+
+import numpy as np
+
+from searchat.core.connectors.protocols import AgentConnector, TailCursor
+from searchat.core.connectors.registry import release_parse_caches, supports_tail_parse
+from searchat.core.logging_config import get_logger
+from searchat.core.progress import NullProgressAdapter, ProgressCallback
+from searchat.models import ConversationRecord
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Below this many files, spawning worker processes costs more than it saves.
+PARALLEL_PARSE_MIN_FILES = 16
+# Submitted-but-unconsumed parse jobs per worker; bounds parsed records in memory.
+_IN_FLIGHT_PER_WORKER = 4
+# Texts gathered before a flush, in encode batches. A pool larger than one
+# batch gives length sorting something to work with.
+_ACCUMULATOR_POOL_BATCHES = 4
+
+
+@dataclass
+class ParsedSource:
+    """Result of parsing one source file in stage 1."""
+
+    path: Path
+    connector_name: str
+    record: ConversationRecord | None = None
+    code_blocks: list[dict] = field(default_factory=list)
+    file_size: int = 0
+    mtime_ns: int = 0
+    cursor: TailCursor | None = None
+    error: BaseException | None = None
+    # Wall time of the parse, measured where it ran (worker or inline).
+    parse_ms: float = 0.0
+
+
+def indexing_pass(method: Callable[..., T]) -> Callable[..., T]:
+    """Mark an indexer entry point; connectors drop their parse caches when it returns."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs) -> T:
+        try:
+            return method(*args, **kwargs)
+        finally:
+            release_parse_caches()
+
+    return wrapper
+
+
+def resolve_max_workers(config) -> int:
+    """Read ``indexing.max_workers`` from config, defaulting to 1 (inline)."""
+    try:
+        return max(1, int(config.indexing.max_workers))
+    except (AttributeError, TypeError, ValueError):
+        return 1
+
+
+def resolve_max_batch_tokens(config) -> int:
+    """Read ``embedding.max_batch_tokens`` from config; 0 (no token cap) when unset."""
+    value = getattr(getattr(config, "embedding", None), "max_batch_tokens", 0)
+    if isinstance(value, bool) or not isinstance(value, int):
+        return 0
+    return max(0, value)
+
+
+def code_block_rows(record: ConversationRecord, connector_name: str) -> list[dict]:
+    """Extract code blocks from a conversation as storage rows."""
+    from searchat.core.code_extractor import extract_code_blocks
+
+    rows: list[dict] = []
+    for message in record.messages:
+        extracted = extract_code_blocks(
+            message_text=message.content,
+            message_index=message.sequence,
+            role=message.role,
+        )
+        for block in extracted:
+            rows.append({
+                "conversation_id": record.conversation_id,
+                "project_id": record.project_id,
+                "connector": connector_name,
+                "file_path": record.file_path,
+                "title": record.title,
+                "conversation_created_at": record.created_at,
+                "conversation_updated_at": record.updated_at,
+                "message_index": block.message_index,
+                "block_index": block.block_index,
+                "role": block.role,
+                "message_timestamp": message.timestamp,
+                "fence_language": block.fence_language,
+                "language": block.language,
+                "language_source": block.language_source,
+                "functions": block.functions,
+                "classes": block.classes,
+                "imports": block.imports,
+                "code": block.code,
+                "code_hash": block.code_hash,
+                "lines": block.lines,
+            })
+    return rows
+
+
+def parse_source(connector: AgentConnector, path: Path) -> ParsedSource:
+    """Parse one file and extract its code blocks; errors are captured, not raised.
+
+    The file is stat'ed before it is read, so a file that grows mid-parse
+    still looks changed to the next adaptive run.
+    """
+    cursor = None
+    start = time.perf_counter()
+    try:
+        stat = path.stat() if path.exists() else None
+        if supports_tail_parse(connector):
+            record, cursor = connector.parse_with_cursor(path, 0)
+        else:
+            record = connector.parse(path, 0)
+        code_blocks = code_block_rows(record, connector.name) if record.message_count else []
+    except Exception as exc:
+        return ParsedSource(path=path, connector_name=connector.name, error=exc)
+    return ParsedSource(
+        path=path,
+        connector_name=connector.name,
+        record=record,
+        code_blocks=code_blocks,
+        file_size=stat.st_size if stat else 0,
+        mtime_ns=stat.st_mtime_ns if stat else 0,
+        cursor=cursor,
+        parse_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+class _ConnectorUnavailable(LookupError):
+    """The worker's registry lacks a connector registered at runtime in the parent."""
+
+
+def _parse_in_worker(connector_name: str, path: Path) -> ParsedSource:
+    """Process-pool entry point: resolve the connector from the registry by name."""
+    from searchat.core.connectors import get_connectors
+
+    for connector in get_connectors():
+        if connector.name == connector_name:
+            return parse_source(connector, path)
+    return ParsedSource(
+        path=path,
+        connector_name=connector_name,
+        error=_ConnectorUnavailable(connector_name),
+    )
+
+
+def _is_registered(connector: AgentConnector) -> bool:
+    """True when a worker process can rebuild this connector from the registry."""
+    from searchat.core.connectors import get_connectors
+
+    return any(c is connector for c in get_connectors())
+
+
+def iter_parsed_sources(
+    items: Iterable[tuple[Path, AgentConnector]],
+    *,
+    max_workers: int = 1,
+) -> Iterator[ParsedSource]:
+    """Parse ``(path, connector)`` pairs, yielding results in input order.
+
+    Uses a spawn-context process pool of ``max_workers`` (capped at the CPU
+    count) when that is more than one and there are at least
+    :data:`PARALLEL_PARSE_MIN_FILES` files. Connectors that are not in the
+    registry (ad-hoc or test doubles) are always parsed in this process.
+    """
+    items = list(items)
+    max_workers = min(max_workers, os.cpu_count() or 1)
+    if max_workers <= 1 or len(items) < PARALLEL_PARSE_MIN_FILES:
+        for path, connector in items:
+            yield parse_source(connector, path)
+        return
+
+    window = max_workers * _IN_FLIGHT_PER_WORKER
+    pending: deque[tuple[Path, AgentConnector, Future | None]] = deque()
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    try:
+        it = iter(items)
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    path, connector = next(it)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = (
+                    pool.submit(_parse_in_worker, connector.name, path)
+                    if _is_registered(connector)
+                    else None
+                )
+                pending.append((path, connector, future))
+            if not pending:
+                return
+            path, connector, future = pending.popleft()
+            if future is None:
+                yield parse_source(connector, path)
+                continue
+            try:
+                parsed = future.result()
+            except Exception as exc:
+                # Worker crashed or the result could not be unpickled.
+                parsed = ParsedSource(path=path, connector_name=connector.name, error=exc)
+            if isinstance(parsed.error, _ConnectorUnavailable):
+                parsed = parse_source(connector, path)
+            yield parsed
+    finally:
+        # Also runs when the consumer stops early: drop queued parses.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for batch budgeting (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class EmbeddingAccumulator(Generic[T]):
+    """Encode texts from many files together, then hand vectors back per file.
+
+    ``add(key, texts)`` queues one file's texts. Once about
+    ``batch_size * 4`` texts are pending, or on ``flush()``, the pool is sorted
+    longest-first so each encode batch pads to similar lengths. It is cut into
+    batches of at most ``batch_size`` texts and, when ``max_batch_tokens`` is
+    set, at most that many padded tokens. ``on_ready(key, vectors)`` then runs
+    for every key in the order it was added, including keys with no texts.
+
+    If ``on_error`` is given, an encode failure is reported once per key in
+    the failed pool and the pool is dropped. Otherwise the exception propagates.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[list[str]], np.ndarray],
+        on_ready: Callable[[T, np.ndarray], None],
+        *,
+        batch_size: int,
+        max_batch_tokens: int = 0,
+        on_error: Callable[[T, Exception], None] | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        self._encode = encode
+        self._on_ready = on_ready
+        self._on_error = on_error
+        self._batch_size = max(1, int(batch_size))
+        self._max_batch_tokens = max(0, int(max_batch_tokens or 0))
+        self._progress = progress or NullProgressAdapter()
+        self._keys: list[tuple[T, int]] = []
+        self._texts: list[str] = []
+        self._dim = 0
+        self.encode_calls = 0
+
+    @property
+    def pending_texts(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: T, texts: list[str]) -> None:
+        self._keys.append((key, len(texts)))
+        self._texts.extend(texts)
+        if len(self._texts) >= self._batch_size * _ACCUMULATOR_POOL_BATCHES:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._keys:
+            return
+        keys, texts = self._keys, self._texts
+        self._keys, self._texts = [], []
+
+        try:
+            vectors = self._encode_sorted(texts)
+        except Exception as exc:
+            if self._on_error is None:
+                raise
+            for key, _count in keys:
+                self._on_error(key, exc)
+            return
+
+        offset = 0
+        for key, count in keys:
+            self._on_ready(key, vectors[offset : offset + count])
+            offset += count
+
+    def _batches(self, order: np.ndarray, texts: list[str]) -> Iterator[np.ndarray]:
+        """Split longest-first ``order`` into batches within the size and token caps."""
+        start = 0
+        while start < len(order):
+            end = min(start + self._batch_size, len(order))
+            if self._max_batch_tokens:
+                # Sorted longest-first, so the first text sets the padded width.
+                width = estimate_tokens(texts[order[start]])
+                end = min(end, start + max(1, self._max_batch_tokens // width))
+            yield order[start:end]
+            start = end
+
+    def _encode_sorted(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self._dim), dtype=np.float32)
+
+        lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        order = np.argsort(-lengths, kind="stable")
+        out: np.ndarray | None = None
+        done = 0
+        for batch in self._batches(order, texts):
+            encoded = np.asarray(self._encode([texts[i] for i in batch]), dtype=np.float32)
+            if len(encoded) != len(batch):
+                raise ValueError(
+                    f"Embedder returned {len(encoded)} vectors for {len(batch)} texts"
+                )
+            self.encode_calls += 1
+            if out is None:
+                self._dim = encoded.shape[1]
+                out = np.empty((len(texts), self._dim), dtype=np.float32)
+            out[batch] = encoded
+            done += len(batch)
+            self._progress.update_embedding_progress(current=done, total=len(texts))
+        return out
+
+
+class BackgroundWriter(Generic[T]):
+    """Single thread that applies ``write`` to submitted items in order.
+
+    ``write`` returns True on success. Exceptions are logged and counted as
+    failures so one bad file never stops the drain. ``submit`` blocks once
+    ``max_pending`` items are queued, which keeps the producer from running
+    arbitrarily far ahead of storage.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        write: Callable[[T], bool],
+        *,
+        max_pending: int = 8,
+        name: str = "searchat-index-writer",
+    ) -> None:
+        self._write = write
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self.succeeded = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            try:
+                ok = self._write(item)
+            except Exception as exc:
+                logger.error("Index write failed: %s", exc)
+                ok = False
+            if ok:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+
+    def submit(self, item: T) -> None:
+        self._queue.put(item)
+
+    def close(self) -> None:
+        """Wait for every submitted item to be written."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def __enter__(self) -> "BackgroundWriter[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
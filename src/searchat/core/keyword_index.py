@@ -0,0 +1,379 @@
+"""Persistent BM25 keyword index with incremental delta merges.
+
+Replaces the per-start ``PRAGMA create_fts_index(..., overwrite=1)`` over
+an in-memory copy of the conversation parquet files. The index lives in
+``data/indices/keyword_index.duckdb`` and stores:
+
+  - ``conversations``: the searchable conversation columns plus ``doc_len``
+  - ``kw_postings``:   (term, conversation_id, tf) inverted postings
+  - ``kw_stopwords``:  stopword list used at index and query time
+  - ``kw_meta``:       format version and stemmer used to build postings
+
+``sync()`` diffs the parquet manifest (conversation_id, file_hash,
+updated_at, message_count) against the indexed rows and only tokenizes
+new or changed conversations. BM25 scores are computed at query time from
+the postings, so document-frequency statistics never need a rebuild.
+
+Tokenization mirrors DuckDB FTS defaults (strip accents, lowercase, split
+on non-letters, English stopwords). Snowball stemming is applied when the
+DuckDB ``fts`` extension can be loaded; otherwise terms are indexed as-is.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+from searchat.config.constants import (
+    FTS_ENGLISH_STOPWORDS,
+    FTS_STEMMER,
+    FTS_TOKEN_SPLIT_PATTERN,
+)
+
+log = logging.getLogger(__name__)
+
+KEYWORD_INDEX_FORMAT_VERSION = "1"
+
+_INDEXED_COLUMNS = [
+    "conversation_id", "project_id", "file_path", "title",
+    "created_at", "updated_at", "message_count", "full_text",
+    "embedding_id", "file_hash", "indexed_at",
+]
+
+
+@dataclass(frozen=True)
+class KeywordIndexSyncStats:
+    """Outcome of a single keyword index sync."""
+
+    added: int
+    updated: int
+    removed: int
+    tokens_processed: int
+    elapsed_ms: float
+    full_rebuild: bool
+
+
+@dataclass(frozen=True)
+class KeywordIndexStatus:
+    """Point-in-time description of the keyword index for status reporting."""
+
+    path: str
+    persistent: bool
+    stemmer: str
+    documents: int
+    postings: int
+    total_tokens_processed: int
+    last_sync: KeywordIndexSyncStats | None
+
+
+class PersistentKeywordIndex:
+    """BM25 inverted index over conversation parquet files, kept in DuckDB."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        memory_limit_mb: int | None = None,
+        bm25_k1: float = 1.2,
+        bm25_b: float = 0.75,
+    ) -> None:
+        self.db_path = db_path
+        self.bm25_k1 = float(bm25_k1)
+        self.bm25_b = float(bm25_b)
+        self.persistent = True
+
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = duckdb.connect(str(db_path))
+        except (OSError, duckdb.Error) as exc:
+            # Read-only dataset or file locked by another process: keep the
+            # index in memory for this process instead of failing search.
+            log.warning("Keyword index %s unavailable, using in-memory index: %s", db_path, exc)
+            self._conn = duckdb.connect(database=":memory:")
+            self.persistent = False
+
+        if memory_limit_mb is not None:
+            try:
+                self._conn.execute(f"PRAGMA memory_limit='{int(memory_limit_mb)}MB'")
+            except duckdb.Error as exc:
+                log.warning("Failed to set DuckDB memory limit: %s", exc)
+
+        self.stemmer = self._load_stemmer()
+        self._total_tokens_processed = 0
+        self._last_sync: KeywordIndexSyncStats | None = None
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        return self._conn
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _load_stemmer(self) -> str:
+        try:
+            self._conn.execute("INSTALL fts; LOAD fts;")
+            self._conn.execute(f"SELECT stem('testing', '{FTS_STEMMER}')").fetchone()
+            return FTS_STEMMER
+        except duckdb.Error as exc:
+            log.info("FTS stemmer unavailable, indexing unstemmed terms: %s", exc)
+            return "none"
+
+    def _term_expr(self, column: str) -> str:
+        if self.stemmer == "none":
+            return column
+        return f"stem({column}, '{self.stemmer}')"
+
+    def _schema_matches(self, cur: duckdb.DuckDBPyConnection) -> bool:
+        exists = cur.execute(
+            "SELECT count(*) FROM duckdb_tables() "
+            "WHERE table_name = 'kw_meta' AND NOT temporary"
+        ).fetchone()[0]
+        if not exists:
+            return False
+        rows = dict(cur.execute("SELECT key, value FROM kw_meta").fetchall())
+        return (
+            rows.get("format_version") == KEYWORD_INDEX_FORMAT_VERSION
+            and rows.get("stemmer") == self.stemmer
+        )
+
+    def _create_schema(self, cur: duckdb.DuckDBPyConnection) -> None:
+        cur.execute("DROP TABLE IF EXISTS kw_postings")
+        cur.execute("DROP TABLE IF EXISTS conversations")
+        cur.execute("DROP TABLE IF EXISTS kw_stopwords")
+        cur.execute("DROP TABLE IF EXISTS kw_meta")
+        cur.execute("""
+            CREATE TABLE conversations (
+                conversation_id VARCHAR PRIMARY KEY,
+                project_id      VARCHAR,
+                file_path       VARCHAR,
+                title           VARCHAR,
+                created_at      TIMESTAMP,
+                updated_at      TIMESTAMP,
+                message_count   INTEGER,
+                full_text       VARCHAR,
+                embedding_id    BIGINT,
+                file_hash       VARCHAR,
+                indexed_at      TIMESTAMP,
+                doc_len         INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cur.execute("""
+            CREATE TABLE kw_postings (
+                term            VARCHAR NOT NULL,
+                conversation_id VARCHAR NOT NULL,
+                tf              INTEGER NOT NULL
+            )
+        """)
+        cur.execute("CREATE TABLE kw_stopwords (word VARCHAR PRIMARY KEY)")
+        cur.executemany(
+            "INSERT INTO kw_stopwords VALUES (?)",
+            [(w,) for w in sorted(FTS_ENGLISH_STOPWORDS)],
+        )
+        cur.execute("CREATE TABLE kw_meta (key VARCHAR PRIMARY KEY, value VARCHAR)")
+        cur.executemany(
+            "INSERT INTO kw_meta VALUES (?, ?)",
+            [
+                ("format_version", KEYWORD_INDEX_FORMAT_VERSION),
+                ("stemmer", self.stemmer),
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Incremental sync
+    # ------------------------------------------------------------------
+
+    def sync(self, conversations_glob: str) -> KeywordIndexSyncStats:
+        """Merge new, changed, and removed parquet conversations into the index."""
+        start = time.perf_counter()
+        cols = ", ".join(_INDEXED_COLUMNS)
+        dedupe = (
+            "QUALIFY row_number() OVER ("
+            "PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST) = 1"
+        )
+
+        cur = self._conn.cursor()
+        try:
+            cur.begin()
+            full_rebuild = not self._schema_matches(cur)
+            if full_rebuild:
+                self._create_schema(cur)
+
+            cur.execute(f"""
+                CREATE OR REPLACE TEMP TABLE kw_manifest AS
+                SELECT conversation_id, file_hash, updated_at, message_count
+                FROM parquet_scan(?)
+                {dedupe}
+            """, [conversations_glob])
+            cur.execute("""
+                CREATE OR REPLACE TEMP TABLE kw_changed AS
+                SELECT m.conversation_id, c.conversation_id IS NOT NULL AS existed
+                FROM kw_manifest m
+                LEFT JOIN conversations c ON c.conversation_id = m.conversation_id
+                WHERE c.conversation_id IS NULL
+                   OR c.file_hash IS DISTINCT FROM m.file_hash
+                   OR c.updated_at IS DISTINCT FROM m.updated_at
+                   OR c.message_count IS DISTINCT FROM m.message_count
+            """)
+            cur.execute("""
+                CREATE OR REPLACE TEMP TABLE kw_removed AS
+                SELECT conversation_id FROM conversations
+                ANTI JOIN kw_manifest USING (conversation_id)
+            """)
+            added, updated = cur.execute(
+                "SELECT count(*) FILTER (WHERE NOT existed), "
+                "count(*) FILTER (WHERE existed) FROM kw_changed"
+            ).fetchone()
+            removed = cur.execute("SELECT count(*) FROM kw_removed").fetchone()[0]
+
+            tokens = 0
+            if added or updated or removed:
+                for table in ("kw_postings", "conversations"):
+                    cur.execute(f"""
+                        DELETE FROM {table}
+                        WHERE conversation_id IN (
+                            SELECT conversation_id FROM kw_changed WHERE existed
+                            UNION ALL
+                            SELECT conversation_id FROM kw_removed
+                        )
+                    """)
+                tokens = self._index_changed(cur, conversations_glob, cols, dedupe)
+
+            cur.commit()
+        except Exception:
+            cur.rollback()
+            raise
+        finally:
+            cur.close()
+
+        stats = KeywordIndexSyncStats(
+            added=int(added),
+            updated=int(updated),
+            removed=int(removed),
+            tokens_processed=tokens,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            full_rebuild=full_rebuild,
+        )
+        self._total_tokens_processed += tokens
+        self._last_sync = stats
+        log.info(
+            "Keyword index sync: +%d ~%d -%d, %d tokens in %.1fms%s",
+            stats.added, stats.updated, stats.removed, stats.tokens_processed,
+            stats.elapsed_ms, " (full rebuild)" if full_rebuild else "",
+        )
+        return stats
+
+    def _index_changed(
+        self,
+        cur: duckdb.DuckDBPyConnection,
+        conversations_glob: str,
+        cols: str,
+        dedupe: str,
+    ) -> int:
+        """Insert changed conversations and their postings; return tokens processed."""
+        cur.execute(f"""
+            INSERT INTO conversations ({cols})
+            SELECT {cols}
+            FROM parquet_scan(?)
+            WHERE conversation_id IN (SELECT conversation_id FROM kw_changed)
+            {dedupe}
+        """, [conversations_glob])
+        cur.execute(f"""
+            CREATE OR REPLACE TEMP TABLE kw_delta_tokens AS
+            SELECT conversation_id, {self._term_expr("token")} AS term
+            FROM (
+                SELECT conversation_id,
+                       unnest(regexp_split_to_array(
+                           lower(strip_accents(coalesce(title, '') || ' ' || coalesce(full_text, ''))),
+                           '{FTS_TOKEN_SPLIT_PATTERN}'
+                       )) AS token
+                FROM conversations
+                WHERE conversation_id IN (SELECT conversation_id FROM kw_changed)
+            )
+            WHERE token <> '' AND token NOT IN (SELECT word FROM kw_stopwords)
+        """)
+        cur.execute("""
+            INSERT INTO kw_postings (term, conversation_id, tf)
+            SELECT term, conversation_id, count(*)::INTEGER
+            FROM kw_delta_tokens
+            GROUP BY term, conversation_id
+        """)
+        cur.execute("""
+            UPDATE conversations SET doc_len = d.doc_len
+            FROM (
+                SELECT conversation_id, count(*)::INTEGER AS doc_len
+                FROM kw_delta_tokens
+                GROUP BY conversation_id
+            ) AS d
+            WHERE conversations.conversation_id = d.conversation_id
+        """)
+        tokens = cur.execute("SELECT count(*) FROM kw_delta_tokens").fetchone()[0]
+        cur.execute("DROP TABLE kw_delta_tokens")
+        return int(tokens)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def bm25_scores_sql(self) -> str:
+        """Subquery yielding ``(conversation_id, score)``; binds one query-text parameter."""
+        k1 = self.bm25_k1
+        b = self.bm25_b
+        return f"""
+            WITH q AS (
+                SELECT DISTINCT {self._term_expr("token")} AS term
+                FROM (
+                    SELECT unnest(regexp_split_to_array(
+                        lower(strip_accents(?)), '{FTS_TOKEN_SPLIT_PATTERN}'
+                    )) AS token
+                )
+                WHERE token <> '' AND token NOT IN (SELECT word FROM kw_stopwords)
+            ),
+            stats AS (
+                SELECT count(*)::DOUBLE AS n, avg(doc_len)::DOUBLE AS avgdl
+                FROM conversations
+            ),
+            df AS (
+                SELECT p.term, count(*)::DOUBLE AS df
+                FROM kw_postings p
+                JOIN q ON q.term = p.term
+                GROUP BY p.term
+            )
+            SELECT p.conversation_id,
+                   sum(
+                       ln((stats.n - df.df + 0.5) / (df.df + 0.5) + 1.0)
+                       * p.tf * ({k1} + 1.0)
+                       / (p.tf + {k1} * (1.0 - {b} + {b} * d.doc_len / greatest(stats.avgdl, 1.0)))
+                   ) AS score
+            FROM kw_postings p
+            JOIN df ON df.term = p.term
+            JOIN conversations d ON d.conversation_id = p.conversation_id
+            CROSS JOIN stats
+            GROUP BY p.conversation_id
+        """
+
+    def describe(self) -> KeywordIndexStatus:
+        cur = self._conn.cursor()
+        try:
+            try:
+                documents = cur.execute("SELECT count(*) FROM conversations").fetchone()[0]
+                postings = cur.execute("SELECT count(*) FROM kw_postings").fetchone()[0]
+            except duckdb.Error:
+                documents = postings = 0
+        finally:
+            cur.close()
+        return KeywordIndexStatus(
+            path=str(self.db_path) if self.persistent else ":memory:",
+            persistent=self.persistent,
+            stemmer=self.stemmer,
+            documents=int(documents),
+            postings=int(postings),
+            total_tokens_processed=self._total_tokens_processed,
+            last_sync=self._last_sync,
+        )
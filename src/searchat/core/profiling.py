@@ -0,0 +1,175 @@
+"""Per-stage timing for the search and indexing hot paths.
+
+Enabled with ``performance.enable_profiling`` (or ``SEARCHAT_ENABLE_PROFILING``).
+When on, :class:`UnifiedSearchEngine` times query parsing, FTS, embedding,
+FAISS, hydration SQL, merge, rerank and snippet building, and the indexers
+time parse, chunk, embed and write. Samples are kept per stage in bounded
+ring buffers, and each search also keeps its own stage breakdown in a ring of
+recent traces. Both are summarised (p50/p95/p99) by ``/api/status/profile``
+and ``searchat profile``.
+
+When profiling is off, :func:`get_profiler` returns None and
+:func:`stage_timer` is a no-op, so instrumented code pays nothing.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import ContextManager
+
+import numpy as np
+
+# Samples kept per stage, and recent per-request traces kept overall.
+DEFAULT_STAGE_CAPACITY = 1024
+DEFAULT_TRACE_CAPACITY = 50
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Latency summary for one stage over the samples in its ring buffer."""
+
+    stage: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class ProfileTrace:
+    """Stage timings of one search, in the order they ran."""
+
+    kind: str
+    label: str
+    started_at: float
+    total_ms: float = 0.0
+    stages: list[tuple[str, float]] = field(default_factory=list)
+
+
+class Profiler:
+    """Thread-safe ring buffers of stage timings."""
+
+    def __init__(
+        self,
+        *,
+        stage_capacity: int = DEFAULT_STAGE_CAPACITY,
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+    ) -> None:
+        self._stage_capacity = max(1, stage_capacity)
+        self._samples: dict[str, deque[float]] = {}
+        self._traces: deque[ProfileTrace] = deque(maxlen=max(1, trace_capacity))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Add one sample for ``stage`` (and to the current trace, if any)."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = deque(maxlen=self._stage_capacity)
+                self._samples[stage] = samples
+            samples.append(elapsed_ms)
+        trace: ProfileTrace | None = getattr(self._local, "trace", None)
+        if trace is not None:
+            trace.stages.append((stage, elapsed_ms))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    @contextmanager
+    def trace(self, kind: str, label: str = "") -> Iterator[ProfileTrace]:
+        """Group the stages run by this thread into one trace.
+
+        The whole block is also recorded as the ``<kind>.total`` stage.
+        Nested traces on the same thread are folded into the outer one.
+        """
+        if getattr(self._local, "trace", None) is not None:
+            with self.stage(f"{kind}.total"):
+                yield self._local.trace
+            return
+
+        current = ProfileTrace(kind=kind, label=label, started_at=time.time())
+        self._local.trace = current
+        start = time.perf_counter()
+        try:
+            yield current
+        finally:
+            self._local.trace = None
+            current.total_ms = (time.perf_counter() - start) * 1000
+            self.record(f"{kind}.total", current.total_ms)
+            with self._lock:
+                self._traces.append(current)
+
+    def stats(self) -> list[StageStats]:
+        """Per-stage summaries, sorted by stage name."""
+        with self._lock:
+            snapshot = {stage: list(samples) for stage, samples in self._samples.items()}
+        summaries: list[StageStats] = []
+        for stage in sorted(snapshot):
+            values = np.asarray(snapshot[stage], dtype=np.float64)
+            if values.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            summaries.append(StageStats(
+                stage=stage,
+                count=int(values.size),
+                mean_ms=float(values.mean()),
+                p50_ms=float(p50),
+                p95_ms=float(p95),
+                p99_ms=float(p99),
+                max_ms=float(values.max()),
+            ))
+        return summaries
+
+    def recent_traces(self, limit: int | None = None) -> list[ProfileTrace]:
+        """Most recent traces, newest first."""
+        with self._lock:
+            traces = list(self._traces)
+        traces.reverse()
+        return traces if limit is None else traces[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._traces.clear()
+
+
+_PROFILER: Profiler | None = None
+_PROFILER_LOCK = threading.Lock()
+
+
+def get_profiler(config) -> Profiler | None:
+    """Process-wide profiler; None when ``performance.enable_profiling`` is off."""
+    performance = getattr(config, "performance", None)
+    if getattr(performance, "enable_profiling", False) is not True:
+        return None
+    global _PROFILER
+    with _PROFILER_LOCK:
+        if _PROFILER is None:
+            _PROFILER = Profiler()
+        return _PROFILER
+
+
+def stage_timer(profiler: Profiler | None, name: str) -> ContextManager[object]:
+    """Time a block as ``name`` when ``profiler`` is set, else do nothing."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
+
+
+def trace_timer(profiler: Profiler | None, kind: str, label: str = "") -> ContextManager[object]:
+    """Open a :meth:`Profiler.trace` when ``profiler`` is set, else do nothing."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.trace(kind, label)
@@ -0,0 +1,206 @@
+"""Search result cache with generation-aware, per-project invalidation.
+
+Entries are keyed on the query, the resolved algorithm and every
+:class:`SearchFilters` field. Each entry remembers the index generation it
+was computed against and the project filter of its query, so a re-index
+that only touched some projects drops only the results those projects
+could change:
+
+  - queries filtered to other projects survive;
+  - unfiltered queries, and queries filtered to a changed project, go.
+
+The cache is bounded by entry count and by an estimate of the bytes held
+in cached :class:`SearchResults`. A search that started before an
+invalidation is not cached when it finishes, since it may have read the
+old index.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from searchat.models import SearchFilters, SearchResults
+
+# Rough per-object overhead (bytes) on top of the string payloads.
+_RESULTS_OVERHEAD = 256
+_RESULT_OVERHEAD = 400
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    """Point-in-time counters for the search result cache."""
+
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    ttl_seconds: int
+    generation: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    result: SearchResults
+    stored_at: float
+    generation: int
+    project_ids: frozenset[str] | None
+    size: int
+
+
+def result_cache_key(query: str, algorithm: str, filters: SearchFilters | None) -> str:
+    """Hash of the query, algorithm and every filter that shapes the results."""
+    parts = [query, algorithm]
+    if filters is not None:
+        if filters.project_ids:
+            parts.append(f"projects:{','.join(sorted(filters.project_ids))}")
+        if filters.date_from:
+            parts.append(f"from:{filters.date_from.isoformat()}")
+        if filters.date_to:
+            parts.append(f"to:{filters.date_to.isoformat()}")
+        if filters.min_messages > 0:
+            parts.append(f"min_msgs:{filters.min_messages}")
+        if filters.has_code is not None:
+            parts.append(f"has_code:{filters.has_code}")
+        if filters.tool:
+            parts.append(f"tool:{filters.tool}")
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def estimate_result_bytes(result: SearchResults) -> int:
+    size = _RESULTS_OVERHEAD + len(result.mode_used) + len(result.error or "")
+    for item in result.results:
+        size += _RESULT_OVERHEAD
+        size += len(item.conversation_id) + len(item.project_id) + len(item.title)
+        size += len(item.file_path) + len(item.snippet)
+        size += len(item.exchange_id or "") + len(item.exchange_text or "")
+    return size
+
+
+class ResultCache:
+    """Thread-safe LRU of search results bounded by entries and bytes."""
+
+    def __init__(self, *, max_entries: int, max_bytes: int, ttl_seconds: int) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = int(ttl_seconds)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: str) -> SearchResults | None:
+        """Return a copy of the cached results, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry.stored_at >= self.ttl_seconds:
+                self._drop_locked(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            # Callers stamp search_time_ms on what they get back.
+            return replace(entry.result, results=list(entry.result.results))
+
+    def put(
+        self,
+        key: str,
+        result: SearchResults,
+        *,
+        filters: SearchFilters | None,
+        generation: int,
+    ) -> None:
+        """Cache ``result`` unless the index changed since ``generation``."""
+        size = estimate_result_bytes(result)
+        project_ids = frozenset(filters.project_ids) if filters and filters.project_ids else None
+        with self._lock:
+            if generation != self._generation or size > self.max_bytes or not self.max_entries:
+                return
+            if key in self._entries:
+                self._drop_locked(key)
+            self._entries[key] = _Entry(
+                result=replace(result, results=list(result.results)),
+                stored_at=time.time(),
+                generation=generation,
+                project_ids=project_ids,
+                size=size,
+            )
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop_locked(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, changed_project_ids: Iterable[str] | None = None) -> int:
+        """Start a new generation and drop the entries it could change.
+
+        ``None`` means the scope of the change is unknown and clears
+        everything. Returns the number of entries dropped.
+        """
+        changed = None if changed_project_ids is None else frozenset(changed_project_ids)
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            if changed is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return dropped
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.project_ids is None or entry.project_ids & changed
+            ]
+            for key in stale:
+                self._drop_locked(key)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                ttl_seconds=self.ttl_seconds,
+                generation=self._generation,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def _drop_locked(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
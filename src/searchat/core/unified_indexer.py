@@ -9,13 +9,37 @@ Implements the IndexingBackend protocol from searchat.contracts.indexing.
 from __future__ import annotations
 
 import hashlib
+import os
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 from searchat.config import Config
-from searchat.core.connectors import detect_connector, discover_all_files
+from searchat.core.connectors import (
+    AgentConnector,
+    TailCursor,
+    TailParse,
+    detect_connector,
+    discover_all_files,
+    get_connectors,
+    supports_tail_parse,
+)
+from searchat.core.embedding_cache import cached_encode, get_embedding_cache
+from searchat.core.indexing_pipeline import (
+    BackgroundWriter,
+    EmbeddingAccumulator,
+    ParsedSource,
+    code_block_rows,
+    indexing_pass,
+    iter_parsed_sources,
+    resolve_max_batch_tokens,
+    resolve_max_workers,
+)
 from searchat.core.logging_config import get_logger
+from searchat.core.profiling import get_profiler, stage_timer
 from searchat.core.progress import NullProgressAdapter, ProgressCallback
 from searchat.models import ConversationRecord, IndexStats, UpdateStats
 from searchat.storage.unified_storage import UnifiedStorage
@@ -89,11 +113,59 @@ def _segment_exchanges(
     return exchanges
 
 
+@dataclass
+class _PendingFile:
+    """A parsed file waiting for its embeddings and then its write."""
+
+    source: ParsedSource
+    messages: list[dict]
+    exchanges: list[dict]
+    embeddings: np.ndarray | None = None
+
+
+@dataclass
+class _PendingTail:
+    """Lines appended to an already indexed file, waiting for embeddings and then the write.
+
+    ``exchanges`` are re-segmented from ``boundary`` (the start of the
+    conversation's last stored exchange) so a turn that continued the open
+    exchange replaces it.
+    """
+
+    path: Path
+    connector_name: str
+    conversation: dict
+    tail: TailParse
+    boundary: int
+    file_size: int
+    mtime_ns: int
+    messages: list[dict]
+    exchanges: list[dict]
+    code_blocks: list[dict]
+    embeddings: np.ndarray | None = None
+
+
+def _tail_cursor(state: dict) -> TailCursor | None:
+    values = (
+        state.get("byte_offset"),
+        state.get("next_sequence"),
+        state.get("tail_checkpoint"),
+        state.get("file_hash"),
+    )
+    if any(value is None for value in values):
+        return None
+    byte_offset, next_sequence, checkpoint, file_hash = values
+    return TailCursor(int(byte_offset), int(next_sequence), checkpoint, file_hash)
+
+
 class UnifiedIndexer:
     """DuckDB-native indexer implementing IndexingBackend protocol.
 
     Writes directly to DuckDB via UnifiedStorage. Segments conversations
-    into exchanges and generates per-exchange HNSW embeddings.
+    into exchanges and generates per-exchange HNSW embeddings. Files are
+    parsed in a process pool (``indexing.max_workers``), embedded in
+    cross-file batches, and written by one background thread; each file's
+    rows go in with the bulk storage APIs in a single transaction.
 
     Safety: index_all() raises RuntimeError (same guard as ConversationIndexer).
     """
@@ -122,6 +194,8 @@ class UnifiedIndexer:
             )
 
         self._embedder = None
+        self._embedding_cache = get_embedding_cache(config, search_dir)
+        self._profiler = get_profiler(config)
 
     @property
     def storage(self) -> UnifiedStorage:
@@ -161,6 +235,7 @@ class UnifiedIndexer:
             f"Index location: {self.search_dir / 'data'}"
         )
 
+    @indexing_pass
     def index_append_only(
         self,
         file_paths: list[str],
@@ -171,7 +246,10 @@ class UnifiedIndexer:
         Writes conversations, messages, exchanges, embeddings, code blocks,
         and file state directly to DuckDB via UnifiedStorage.
 
-        Never modifies or deletes existing data.
+        Already indexed files that have only grown since (live JSONL sessions)
+        are resumed from the byte offset in ``source_file_state``: only the
+        appended lines are parsed and only the new or continued trailing
+        exchanges are embedded. Nothing else is modified or deleted.
         """
         if progress is None:
             progress = NullProgressAdapter()
@@ -185,92 +263,124 @@ class UnifiedIndexer:
 
         indexed_paths = self.get_indexed_file_paths()
         new_files = [f for f in file_paths if f not in indexed_paths]
+        grown_files = self._grown_files([f for f in file_paths if f in indexed_paths])
 
-        if not new_files:
+        if not new_files and not grown_files:
             return UpdateStats(
                 new_conversations=0,
                 updated_conversations=0,
                 skipped_conversations=len(file_paths),
                 update_time_seconds=time.time() - start_time,
+                changed_project_ids=set(),
             )
 
-        processed_count = 0
-        empty_count = 0
-        total_exchanges = 0
-        total_embeddings = 0
-
-        for idx, file_path in enumerate(new_files, 1):
+        sources = []
+        for file_path in new_files:
             json_path = Path(file_path)
             if not json_path.exists():
                 logger.warning("File not found, skipping: %s", file_path)
                 continue
-
             try:
-                connector = detect_connector(json_path)
+                sources.append((json_path, detect_connector(json_path)))
             except ValueError as exc:
-                progress.update_file_progress(idx, len(new_files), f"unknown | {json_path.name}")
                 logger.warning("%s; skipping: %s", exc, file_path)
-                continue
 
-            display_name = f"{connector.name} | {json_path.name}"
-            progress.update_file_progress(idx, len(new_files), display_name)
+        empty_count = 0
+        totals = {"new": 0, "updated": 0, "exchanges": 0, "embeddings": 0}
+        changed_projects: set[str] = set()
 
+        def write(item: _PendingFile | _PendingTail) -> bool:
             try:
-                record = connector.parse(json_path, 0)
+                with stage_timer(self._profiler, "index.write"):
+                    if isinstance(item, _PendingTail):
+                        self._write_pending_tail(item)
+                    else:
+                        self._write_pending_file(item)
+            except Exception as e:
+                path = item.path if isinstance(item, _PendingTail) else item.source.path
+                logger.error("Failed to process %s: %s", path, e)
+                return False
+            if isinstance(item, _PendingTail):
+                totals["updated"] += bool(item.messages)
+                changed_projects.add(item.conversation["project_id"])
+            else:
+                totals["new"] += 1
+                changed_projects.add(item.source.record.project_id)
+            totals["exchanges"] += len(item.exchanges)
+            if item.embeddings is not None:
+                totals["embeddings"] += len(item.embeddings)
+            return True
+
+        # Stage 1 parses in worker processes, stage 2 embeds exchanges from
+        # many files per encode call here, stage 3 writes on a background thread.
+        with BackgroundWriter(write) as writer:
+            def embedded(item: _PendingFile | _PendingTail, vectors: np.ndarray) -> None:
+                item.embeddings = vectors if len(vectors) else None
+                writer.submit(item)
+
+            def embed_failed(item: _PendingFile | _PendingTail, exc: Exception) -> None:
+                path = item.path if isinstance(item, _PendingTail) else item.source.path
+                logger.error("Failed to process %s: %s", path, exc)
+
+            accumulator = EmbeddingAccumulator(
+                self._encode_texts,
+                embedded,
+                batch_size=self.config.embedding.batch_size,
+                max_batch_tokens=resolve_max_batch_tokens(self.config),
+                on_error=embed_failed,
+                progress=progress,
+            )
+            parsed_sources = iter_parsed_sources(
+                sources, max_workers=resolve_max_workers(self.config),
+            )
+            for idx, parsed in enumerate(parsed_sources, 1):
+                progress.update_file_progress(
+                    idx, len(sources), f"{parsed.connector_name} | {parsed.path.name}",
+                )
+                if parsed.error is not None:
+                    logger.error("Failed to process %s: %s", parsed.path, parsed.error)
+                    continue
+                if self._profiler is not None:
+                    self._profiler.record("index.parse", parsed.parse_ms)
 
+                record = parsed.record
                 if record.message_count == 0:
                     empty_count += 1
                     continue
 
-                # Write conversation to DuckDB
-                self._write_conversation(record)
-
-                # Write messages
-                msg_dicts = self._record_messages_to_dicts(record)
-                self._storage.insert_messages(record.conversation_id, msg_dicts)
-
-                # Segment into exchanges and write
-                exchanges = _segment_exchanges(
-                    record.conversation_id,
-                    record.project_id,
-                    msg_dicts,
-                    record.created_at,
-                )
-                for exc in exchanges:
-                    self._storage.upsert_exchange(**exc)
-                total_exchanges += len(exchanges)
-
-                # Generate and store embeddings for exchanges
-                if exchanges:
-                    n_embedded = self._embed_exchanges(exchanges, progress)
-                    total_embeddings += n_embedded
-
-                # Write code blocks
-                self._write_code_blocks(record, connector.name)
-
-                # Write file state
-                file_size = json_path.stat().st_size if json_path.exists() else 0
-                self._storage.upsert_file_state(
-                    file_path=record.file_path,
-                    conversation_id=record.conversation_id,
-                    project_id=record.project_id,
-                    connector_name=connector.name,
-                    file_size=file_size,
-                    file_hash=record.file_hash,
+                with stage_timer(self._profiler, "index.chunk"):
+                    msg_dicts = self._record_messages_to_dicts(record)
+                    exchanges = _segment_exchanges(
+                        record.conversation_id,
+                        record.project_id,
+                        msg_dicts,
+                        record.created_at,
+                    )
+                accumulator.add(
+                    _PendingFile(parsed, msg_dicts, exchanges),
+                    [exc["exchange_text"] for exc in exchanges],
                 )
 
-                processed_count += 1
+            for path, connector, state, cursor, stat in grown_files:
+                pending = self._parse_grown_file(path, connector, state, cursor, stat)
+                if pending is not None:
+                    accumulator.add(pending, [exc["exchange_text"] for exc in pending.exchanges])
 
-            except Exception as e:
-                logger.error("Failed to process %s: %s", file_path, e)
-                continue
+            accumulator.flush()
+
+        processed_count = totals["new"]
+        updated_count = totals["updated"]
+        if self._embedding_cache is not None:
+            self._embedding_cache.flush()
+        total_exchanges = totals["exchanges"]
+        total_embeddings = totals["embeddings"]
 
         # Run expertise extraction
-        if processed_count > 0:
+        if processed_count > 0 or updated_count > 0:
             self._run_expertise_extraction(progress)
 
         progress.update_stats(
-            conversations=processed_count,
+            conversations=processed_count + updated_count,
             chunks=total_exchanges,
             embeddings=total_embeddings,
         )
@@ -280,10 +390,111 @@ class UnifiedIndexer:
 
         return UpdateStats(
             new_conversations=processed_count,
-            updated_conversations=0,
-            skipped_conversations=len(file_paths) - processed_count - empty_count,
+            updated_conversations=updated_count,
+            skipped_conversations=len(file_paths) - processed_count - updated_count - empty_count,
             update_time_seconds=elapsed,
             empty_conversations=empty_count,
+            changed_project_ids=changed_projects,
+        )
+
+    def _grown_files(
+        self, indexed_file_paths: list[str]
+    ) -> list[tuple[Path, AgentConnector, dict, TailCursor, os.stat_result]]:
+        """Indexed append-only files that are now larger than their stored resume point."""
+        if not indexed_file_paths:
+            return []
+        connectors = {c.name: c for c in get_connectors() if supports_tail_parse(c)}
+        states = self._storage.get_file_states(indexed_file_paths)
+        grown = []
+        for file_path, state in states.items():
+            connector = connectors.get(state.get("connector_name"))
+            cursor = _tail_cursor(state)
+            if connector is None or cursor is None:
+                continue
+            path = Path(file_path)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_size > cursor.byte_offset:
+                grown.append((path, connector, state, cursor, stat))
+        return grown
+
+    def _parse_grown_file(
+        self,
+        path: Path,
+        connector: AgentConnector,
+        state: dict,
+        cursor: TailCursor,
+        stat: os.stat_result,
+    ) -> _PendingTail | None:
+        """Parse the tail of a grown file and re-segment its trailing exchanges."""
+        try:
+            with stage_timer(self._profiler, "index.parse"):
+                tail = connector.parse_tail(path, cursor)
+        except Exception as exc:
+            logger.error("Failed to process %s: %s", path, exc)
+            return None
+        if tail is None:
+            logger.info("%s was rewritten, not appended to; leaving its indexed copy as is", path)
+            return None
+        conversation = self._storage.get_conversation_meta(state["conversation_id"])
+        if conversation is None:
+            return None
+
+        boundary = state.get("last_exchange_start") or 0
+        messages = [
+            {
+                "sequence": m.sequence,
+                "role": m.role,
+                "content": m.content,
+                "timestamp": m.timestamp,
+                "has_code": m.has_code,
+                "code_blocks": m.code_blocks,
+            }
+            for m in tail.messages
+        ]
+        exchanges: list[dict] = []
+        code_blocks: list[dict] = []
+        if messages:
+            earlier = self._storage.get_messages(
+                conversation["conversation_id"], from_sequence=boundary,
+            )
+            with stage_timer(self._profiler, "index.chunk"):
+                exchanges = _segment_exchanges(
+                    conversation["conversation_id"],
+                    conversation["project_id"],
+                    earlier + messages,
+                    conversation["created_at"],
+                )
+            code_blocks = code_block_rows(
+                ConversationRecord(
+                    conversation_id=conversation["conversation_id"],
+                    project_id=conversation["project_id"],
+                    file_path=str(path),
+                    title=conversation["title"],
+                    created_at=conversation["created_at"],
+                    updated_at=tail.messages[-1].timestamp,
+                    message_count=conversation["message_count"] + len(messages),
+                    messages=tail.messages,
+                    full_text="",
+                    embedding_id=0,
+                    file_hash=tail.cursor.file_hash,
+                    indexed_at=datetime.now(),
+                ),
+                connector.name,
+            )
+        return _PendingTail(
+            path=path,
+            connector_name=connector.name,
+            conversation=conversation,
+            tail=tail,
+            boundary=boundary,
+            file_size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            messages=messages,
+            exchanges=exchanges,
+            code_blocks=code_blocks,
         )
 
     def index_from_source_files(
@@ -320,6 +531,71 @@ class UnifiedIndexer:
         except Exception:
             return set()
 
+    def _write_pending_file(self, item: _PendingFile) -> None:
+        """Write one parsed, embedded file; one transaction so failures leave nothing half-written."""
+        record = item.source.record
+        with self._storage.transaction():
+            self._write_conversation(record)
+            self._storage.insert_messages(record.conversation_id, item.messages)
+            self._storage.upsert_exchanges(item.exchanges)
+            if item.embeddings is not None:
+                self._storage.upsert_embeddings(
+                    [exc["exchange_id"] for exc in item.exchanges], item.embeddings,
+                )
+            self._storage.insert_code_blocks(item.source.code_blocks)
+            cursor = item.source.cursor
+            self._storage.upsert_file_state(
+                file_path=record.file_path,
+                conversation_id=record.conversation_id,
+                project_id=record.project_id,
+                connector_name=item.source.connector_name,
+                file_size=item.source.file_size,
+                file_hash=record.file_hash,
+                mtime_ns=item.source.mtime_ns,
+                byte_offset=cursor.byte_offset if cursor else None,
+                next_sequence=cursor.next_sequence if cursor else None,
+                tail_checkpoint=cursor.checkpoint if cursor else None,
+                last_exchange_start=item.exchanges[-1]["ply_start"] if item.exchanges else 0,
+            )
+
+    def _write_pending_tail(self, item: _PendingTail) -> None:
+        """Append a grown file's new messages and replace its trailing exchanges, in one transaction."""
+        conversation_id = item.conversation["conversation_id"]
+        tail = item.tail
+        with self._storage.transaction():
+            if item.messages:
+                self._storage.delete_exchanges_from(conversation_id, item.boundary)
+                self._storage.append_messages(conversation_id, item.messages)
+                self._storage.upsert_exchanges(item.exchanges)
+                if item.embeddings is not None:
+                    self._storage.upsert_embeddings(
+                        [exc["exchange_id"] for exc in item.exchanges], item.embeddings,
+                    )
+                self._storage.insert_code_blocks(item.code_blocks)
+                self._storage.extend_conversation(
+                    conversation_id=conversation_id,
+                    appended_text="\n\n".join(m["content"] for m in item.messages),
+                    appended_messages=len(item.messages),
+                    updated_at=tail.messages[-1].timestamp,
+                    file_hash=tail.cursor.file_hash,
+                    indexed_at=datetime.now(),
+                    title=tail.title,
+                    files_mentioned=tail.files_mentioned,
+                )
+            self._storage.upsert_file_state(
+                file_path=str(item.path),
+                conversation_id=conversation_id,
+                project_id=item.conversation["project_id"],
+                connector_name=item.connector_name,
+                file_size=item.file_size,
+                file_hash=tail.cursor.file_hash,
+                mtime_ns=item.mtime_ns,
+                byte_offset=tail.cursor.byte_offset,
+                next_sequence=tail.cursor.next_sequence,
+                tail_checkpoint=tail.cursor.checkpoint,
+                last_exchange_start=item.exchanges[-1]["ply_start"] if item.exchanges else item.boundary,
+            )
+
     def _write_conversation(self, record: ConversationRecord) -> None:
         """Write a ConversationRecord to DuckDB conversations table."""
         self._storage.upsert_conversation(
@@ -352,73 +628,20 @@ class UnifiedIndexer:
             for m in record.messages
         ]
 
-    def _embed_exchanges(
-        self,
-        exchanges: list[dict],
-        progress: ProgressCallback,
-    ) -> int:
-        """Generate embeddings for exchanges and store in DuckDB."""
-        texts = [exc["exchange_text"] for exc in exchanges]
-        embedder = self._get_embedder()
-
-        batch_size = self.config.embedding.batch_size
-        embedded = 0
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            embeddings = embedder.encode(
-                batch,
-                batch_size=batch_size,
-                show_progress_bar=False,
-                convert_to_numpy=True,
+    def _encode_texts(self, texts: list[str]) -> np.ndarray:
+        """Encode one batch of texts as an (n, dim) float32 matrix, via the embedding cache."""
+        with stage_timer(self._profiler, "index.embed"):
+            return cached_encode(
+                self._embedding_cache, self.config.embedding.model, texts, self._encode_uncached,
             )
 
-            for j, embedding in enumerate(embeddings):
-                exc = exchanges[i + j]
-                vec = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
-                self._storage.upsert_embedding(exc["exchange_id"], vec)
-                embedded += 1
-
-            progress.update_embedding_progress(
-                current=min(i + batch_size, len(texts)),
-                total=len(texts),
-            )
-
-        return embedded
-
-    def _write_code_blocks(self, record: ConversationRecord, connector_name: str) -> None:
-        """Extract and write code blocks from a conversation to DuckDB."""
-        from searchat.core.code_extractor import extract_code_blocks
-
-        for message in record.messages:
-            extracted = extract_code_blocks(
-                message_text=message.content,
-                message_index=message.sequence,
-                role=message.role,
-            )
-            for block in extracted:
-                self._storage.insert_code_block(
-                    conversation_id=record.conversation_id,
-                    project_id=record.project_id,
-                    connector=connector_name,
-                    file_path=record.file_path,
-                    title=record.title,
-                    conversation_created_at=record.created_at,
-                    conversation_updated_at=record.updated_at,
-                    message_index=block.message_index,
-                    block_index=block.block_index,
-                    role=block.role,
-                    message_timestamp=message.timestamp,
-                    fence_language=block.fence_language,
-                    language=block.language,
-                    language_source=block.language_source,
-                    functions=block.functions,
-                    classes=block.classes,
-                    imports=block.imports,
-                    code=block.code,
-                    code_hash=block.code_hash,
-                    lines=block.lines,
-                )
+    def _encode_uncached(self, texts: list[str]) -> np.ndarray:
+        return self._get_embedder().encode(
+            texts,
+            batch_size=len(texts),
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
 
     def _run_expertise_extraction(self, progress: ProgressCallback) -> None:
         """Best-effort expertise extraction on newly indexed conversations."""
@@ -7,31 +7,43 @@ and DISTILL (enabled in Phase 6).
 Delegates to:
   - DuckDB FTS for BM25 keyword search
   - FAISS (legacy) or DuckDB HNSW for vector search
+  - VectorLookup for resident O(k) FAISS hit hydration
   - QueryClassifier for adaptive weight selection
   - ResultMerger (CombMNZ) for fusion
   - ProgressiveFallback for degraded-mode resilience
   - ConversationFilter for noise removal
+  - Profiler for per-stage timings when performance.enable_profiling is on
 """
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
-from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from threading import Lock
+from typing import TYPE_CHECKING
 
-import duckdb
 import faiss
 import numpy as np
 
 from searchat.config import Config
-from searchat.config.constants import FTS_STEMMER, FTS_STOPWORDS, QUERY_SYNONYMS
+from searchat.config.constants import (
+    DEFAULT_QUERY_CACHE_MB,
+    DEFAULT_QUERY_CACHE_TTL_SECONDS,
+    KEYWORD_INDEX_FILENAME,
+    QUERY_SYNONYMS,
+)
 from searchat.core.conversation_filter import ConversationFilter
+from searchat.core.embedding_cache import cached_encode, get_embedding_cache
+from searchat.core.faiss_factory import search_parameters
+from searchat.core.keyword_index import KeywordIndexStatus, PersistentKeywordIndex
+from searchat.core.profiling import get_profiler, stage_timer, trace_timer
 from searchat.core.progressive_fallback import ProgressiveFallback
 from searchat.core.query_classifier import QueryClassifier
 from searchat.core.query_parser import QueryParser
+from searchat.core.result_cache import ResultCache, ResultCacheStats, result_cache_key
 from searchat.core.result_merger import MergeConfig, ResultMerger
+from searchat.core.vector_lookup import SNIPPET_CHARS, VectorLookup
 from searchat.core.filters import tool_sql_conditions
 from searchat.models import (
     AlgorithmType,
@@ -55,9 +67,18 @@ from searchat.services.semantic_model_service import (
     build_reranking_service,
 )
 from searchat.services.storage_contracts import read_index_metadata
+from searchat.storage.schema import EMBEDDING_DIM
+
+if TYPE_CHECKING:
+    from searchat.storage.unified_storage import UnifiedStorage
 
 log = logging.getLogger(__name__)
 
+# Semantic page size (distinct conversations) and the ceiling on how many
+# vectors a filtered query may pull from FAISS while filling that page.
+SEMANTIC_TOP_K = 100
+SEMANTIC_MAX_FETCH = 10_000
+
 
 class AlgorithmNotAvailable(RuntimeError):
     """Raised when a requested algorithm type is not yet implemented."""
@@ -66,27 +87,52 @@ class AlgorithmNotAvailable(RuntimeError):
 class UnifiedSearchEngine:
     """6-mode search engine implementing the RetrievalBackend protocol."""
 
-    def __init__(self, search_dir: Path, config: Config | None = None) -> None:
+    def __init__(
+        self,
+        search_dir: Path,
+        config: Config | None = None,
+        *,
+        storage: UnifiedStorage | None = None,
+        embedding_provider: Callable[[Config], EmbeddingService] | None = None,
+        reranking_provider: Callable[[Config], RerankingService] | None = None,
+    ) -> None:
         self.search_dir = search_dir
         self.faiss_index: faiss.Index | None = None
         self.embedder: EmbeddingService | None = None
         self.query_parser = QueryParser()
 
         self._init_lock = Lock()
+        # Builds the embedder on first semantic query; None means build_embedding_service.
+        self._embedding_provider = embedding_provider
+        # Same for the cross-encoder; None means build_reranking_service.
+        self._reranking_provider = reranking_provider
 
         if config is None:
             config = Config.load()
         self.config = config
+        self._embedding_cache = get_embedding_cache(config, search_dir)
+        # Without an embedding cache, warmed query vectors are pinned here
+        # (with a holder count) until the caller releases them.
+        self._pinned_queries: dict[str, tuple[np.ndarray, int]] = {}
+        self._pinned_lock = Lock()
+        self._profiler = get_profiler(config)
 
         self.conversations_dir = self.search_dir / "data" / "conversations"
         self.metadata_path = self.search_dir / "data" / "indices" / "embeddings.metadata.parquet"
         self.index_path = self.search_dir / "data" / "indices" / "embeddings.faiss"
         self.conversations_glob = str(self.conversations_dir / "*.parquet")
 
-        # LRU cache
-        self.cache_size = config.performance.query_cache_size
-        self.result_cache: OrderedDict[str, tuple[SearchResults, float]] = OrderedDict()
-        self.cache_ttl = 300
+        # Vector backend: legacy FAISS files or HNSW over the DuckDB store
+        self._vector_backend = getattr(getattr(config, "storage", None), "vector_backend", "faiss")
+        self._storage = storage
+
+        # Result cache, invalidated per project on refresh_index()
+        performance = config.performance
+        self.result_cache = ResultCache(
+            max_entries=performance.query_cache_size,
+            max_bytes=getattr(performance, "query_cache_mb", DEFAULT_QUERY_CACHE_MB) * 1024 * 1024,
+            ttl_seconds=DEFAULT_QUERY_CACHE_TTL_SECONDS,
+        )
 
         # Search columns (exclude large 'messages' column)
         self.search_columns = [
@@ -97,13 +143,23 @@ class UnifiedSearchEngine:
 
         self._validate_keyword_files()
 
-        # Persistent in-memory DuckDB for FTS over parquet
-        self._con = duckdb.connect(database=":memory:")
+        # Persistent BM25 index over parquet, delta-merged on refresh
         try:
-            mem_mb = int(config.performance.memory_limit_mb)
-            self._con.execute(f"PRAGMA memory_limit='{mem_mb}MB'")
-        except Exception as exc:
-            log.warning("Failed to set DuckDB memory limit: %s", exc)
+            mem_mb: int | None = int(config.performance.memory_limit_mb)
+        except (TypeError, ValueError):
+            mem_mb = None
+        self._keyword_index = PersistentKeywordIndex(
+            self.search_dir / "data" / "indices" / KEYWORD_INDEX_FILENAME,
+            memory_limit_mb=mem_mb,
+            bm25_k1=getattr(config.ranking, "bm25_k1", 1.2),
+            bm25_b=getattr(config.ranking, "bm25_b", 0.75),
+        )
+        self._con = self._keyword_index.connection
+
+        # Resident vector_id -> conversation map for FAISS hit hydration;
+        # snippet text may use up to a quarter of the memory budget.
+        self._vector_lookup: VectorLookup | None = None
+        self._lookup_snippet_budget = mem_mb * 1024 * 1024 // 4 if mem_mb else None
 
         # Lazy-loaded components
         self._reranker: RerankingService | None = None
@@ -125,13 +181,13 @@ class UnifiedSearchEngine:
         self._fallback = ProgressiveFallback()
         self._filter = ConversationFilter()
 
-        # Build FTS index
+        # Sync keyword index
         self._fts_ready = False
         try:
             self._build_fts_table()
             self._fts_ready = True
         except Exception as exc:
-            log.warning("FTS table init deferred: %s", exc)
+            log.warning("Keyword index init deferred: %s", exc)
 
     # ------------------------------------------------------------------
     # RetrievalBackend protocol methods
@@ -144,6 +200,46 @@ class UnifiedSearchEngine:
             self._ensure_embedder_loaded_locked()
 
     def find_similar_vector_hits(self, text: str, k: int) -> list[SemanticVectorHit]:
+        query_embedding = self._encode_faiss_query(text)
+        return self._search_faiss(query_embedding, k)
+
+    def warm_query_embeddings(self, texts: Sequence[str]) -> None:
+        """Embed ``texts`` once so concurrent searches sharing them reuse one vector.
+
+        With an embedding cache the vectors land there. Without one they are
+        pinned on the engine until :meth:`release_query_embeddings` is
+        called with the same texts.
+        """
+        if not texts or self._uses_duckdb_vectors():
+            return
+        unique = list(dict.fromkeys(texts))
+        if self._embedding_cache is not None:
+            self._encode_faiss_queries(unique)
+            return
+        vectors = self._encode_faiss_queries(unique)
+        with self._pinned_lock:
+            for text, vector in zip(unique, vectors):
+                held = self._pinned_queries.get(text)
+                self._pinned_queries[text] = (vector, held[1] + 1 if held else 1)
+
+    def release_query_embeddings(self, texts: Sequence[str]) -> None:
+        """Drop vectors pinned by :meth:`warm_query_embeddings` once no caller holds them."""
+        if self._embedding_cache is not None or self._uses_duckdb_vectors():
+            return
+        with self._pinned_lock:
+            for text in dict.fromkeys(texts):
+                held = self._pinned_queries.get(text)
+                if held is None:
+                    continue
+                if held[1] > 1:
+                    self._pinned_queries[text] = (held[0], held[1] - 1)
+                else:
+                    del self._pinned_queries[text]
+
+    def _encode_faiss_query(self, text: str) -> np.ndarray:
+        return self._encode_faiss_queries([text])[0]
+
+    def _encode_faiss_queries(self, texts: list[str]) -> np.ndarray:
         self._ensure_faiss_loaded()
         if self.faiss_index is None:
             raise SemanticSearchUnavailable("FAISS index not available")
@@ -152,10 +248,44 @@ class UnifiedSearchEngine:
         if self.embedder is None:
             raise SemanticSearchUnavailable("Embedder not available")
 
-        query_embedding = np.asarray(self.embedder.encode(text), dtype=np.float32)
-        distances, labels = self.faiss_index.search(
-            query_embedding.reshape(1, -1), k,
-        )
+        with self._pinned_lock:
+            pinned = {t: self._pinned_queries[t][0] for t in texts if t in self._pinned_queries}
+        if len(pinned) == len(texts):
+            return np.asarray([pinned[t] for t in texts], dtype=np.float32)
+        missing = [t for t in texts if t not in pinned]
+
+        # Similarity lookups re-embed stored conversation text; reuse its vector.
+        embedder = self.embedder
+        with stage_timer(self._profiler, "search.embed"):
+            vectors = cached_encode(
+                self._embedding_cache,
+                self.config.embedding.model,
+                missing,
+                lambda todo: np.asarray([embedder.encode(t) for t in todo], dtype=np.float32),
+            )
+        if not pinned:
+            return vectors
+        encoded = dict(zip(missing, vectors))
+        return np.asarray([pinned[t] if t in pinned else encoded[t] for t in texts], dtype=np.float32)
+
+    def _search_faiss(
+        self,
+        query_embedding: np.ndarray,
+        k: int,
+        *,
+        id_selector: faiss.IDSelector | None = None,
+    ) -> list[SemanticVectorHit]:
+        assert self.faiss_index is not None
+        with stage_timer(self._profiler, "search.faiss"):
+            if id_selector is None:
+                distances, labels = self.faiss_index.search(
+                    query_embedding.reshape(1, -1), k,
+                )
+            else:
+                distances, labels = self.faiss_index.search(
+                    query_embedding.reshape(1, -1), k,
+                    params=search_parameters(self.faiss_index, id_selector),
+                )
 
         valid_mask = labels[0] >= 0
         return [
@@ -173,10 +303,16 @@ class UnifiedSearchEngine:
             reranking_reason=reranking_reason,
         )
 
-    def refresh_index(self) -> None:
+    def refresh_index(self, changed_project_ids: Iterable[str] | None = None) -> None:
+        """Reload index state after indexing.
+
+        ``changed_project_ids`` limits result-cache invalidation to queries
+        those projects could affect; ``None`` drops every cached result.
+        """
         with self._init_lock:
-            self.result_cache.clear()
+            self.result_cache.invalidate(changed_project_ids)
             self.faiss_index = None
+            self._vector_lookup = None
             self._faiss_runtime_reason = None
             self._semantic_runtime_reason = None
             self._reranking_runtime_reason = None
@@ -185,7 +321,15 @@ class UnifiedSearchEngine:
                 self._fts_ready = True
             except Exception as exc:
                 self._fts_ready = False
-                log.warning("FTS table rebuild failed: %s", exc)
+                log.warning("Keyword index sync failed: %s", exc)
+
+    def describe_result_cache(self) -> ResultCacheStats:
+        """Return size, hit/miss and invalidation counters for the result cache."""
+        return self.result_cache.stats()
+
+    def describe_keyword_index(self) -> KeywordIndexStatus:
+        """Return size and last-sync statistics for the persistent keyword index."""
+        return self._keyword_index.describe()
 
     # ------------------------------------------------------------------
     # Main search dispatch
@@ -208,6 +352,16 @@ class UnifiedSearchEngine:
         # Resolve algorithm type
         algo = algorithm or AlgorithmType.from_search_mode(mode)
 
+        with trace_timer(self._profiler, "search", f"{algo.value}: {query[:80]}"):
+            return self._search(query, algo, filters, start_time)
+
+    def _search(
+        self,
+        query: str,
+        algo: AlgorithmType,
+        filters: SearchFilters | None,
+        start_time: float,
+    ) -> SearchResults:
         # Palace-powered search modes
         if algo in (AlgorithmType.CROSS_LAYER, AlgorithmType.DISTILL):
             if not self.config.palace.enabled:
@@ -220,8 +374,9 @@ class UnifiedSearchEngine:
             algo = AlgorithmType.KEYWORD
 
         # Cache check
-        cache_key = self._get_cache_key(query, algo, filters)
-        cached = self._get_from_cache(cache_key)
+        cache_key = result_cache_key(query, algo.value, filters)
+        generation = self.result_cache.generation
+        cached = self.result_cache.get(cache_key)
         if cached:
             cached.search_time_ms = (time.time() - start_time) * 1000
             return cached
@@ -235,7 +390,7 @@ class UnifiedSearchEngine:
             search_time_ms=elapsed_ms,
             mode_used=mode_used,
         )
-        self._add_to_cache(cache_key, search_result)
+        self.result_cache.put(cache_key, search_result, filters=filters, generation=generation)
         return search_result
 
     def _dispatch(
@@ -274,7 +429,8 @@ class UnifiedSearchEngine:
         def tier1() -> list[SearchResult]:
             keyword_results = self._keyword_search(query, filters)
             semantic_results = self._semantic_search(query, filters)
-            merged = self._merger.merge(keyword_results, semantic_results)
+            with stage_timer(self._profiler, "search.merge"):
+                merged = self._merger.merge(keyword_results, semantic_results)
             return self._rerank(query, merged)
 
         def tier2() -> list[SearchResult]:
@@ -296,7 +452,8 @@ class UnifiedSearchEngine:
         filters: SearchFilters | None,
     ) -> tuple[list[SearchResult], str]:
         """Adaptive search — uses QueryClassifier to select weights."""
-        weights = self._classifier.classify(query)
+        with stage_timer(self._profiler, "search.query_parse"):
+            weights = self._classifier.classify(query)
 
         # If classifier says keyword-only, skip semantic
         if weights.semantic_weight == 0.0:
@@ -306,12 +463,13 @@ class UnifiedSearchEngine:
         def tier1() -> list[SearchResult]:
             keyword_results = self._keyword_search(query, filters)
             semantic_results = self._semantic_search(query, filters)
-            merged = self._merger.merge(
-                keyword_results,
-                semantic_results,
-                keyword_weight=weights.keyword_weight,
-                semantic_weight=weights.semantic_weight,
-            )
+            with stage_timer(self._profiler, "search.merge"):
+                merged = self._merger.merge(
+                    keyword_results,
+                    semantic_results,
+                    keyword_weight=weights.keyword_weight,
+                    semantic_weight=weights.semantic_weight,
+                )
             return self._rerank(query, merged)
 
         def tier2() -> list[SearchResult]:
@@ -442,7 +600,8 @@ class UnifiedSearchEngine:
                 log.warning("FTS unavailable: %s", exc)
                 return []
 
-        parsed = self.query_parser.parse(query)
+        with stage_timer(self._profiler, "search.query_parse"):
+            parsed = self.query_parser.parse(query)
         is_wildcard = parsed.original.strip() == "*"
 
         if is_wildcard:
@@ -456,7 +615,8 @@ class UnifiedSearchEngine:
                 ORDER BY updated_at DESC
                 LIMIT 100
             """
-            rows = self._con.execute(sql, params).fetchall()
+            with stage_timer(self._profiler, "search.fts"):
+                rows = self._fetch_keyword_rows(sql, params)
             return [
                 SearchResult(
                     conversation_id=r[0], project_id=r[1], title=r[2],
@@ -488,111 +648,314 @@ class UnifiedSearchEngine:
             params.append(term)
 
         sql = f"""
+            WITH bm25 AS ({self._keyword_index.bm25_scores_sql()})
             SELECT conversation_id, project_id, title, created_at,
                    updated_at, message_count, file_path, full_text,
-                   fts_main_conversations.match_bm25(conversation_id, ?) AS score
+                   bm25.score AS score
             FROM conversations
-            WHERE score IS NOT NULL AND {where_clause}{exclude_conditions}
+            JOIN bm25 USING (conversation_id)
+            WHERE {where_clause}{exclude_conditions}
             ORDER BY score DESC
             LIMIT 100
         """
-        rows = self._con.execute(sql, params).fetchall()
+        with stage_timer(self._profiler, "search.fts"):
+            rows = self._fetch_keyword_rows(sql, params)
 
         if not rows:
             return []
 
         all_terms_lower = [t.lower() for t in all_terms]
         results: list[SearchResult] = []
-        for r in rows:
-            title = r[2] or ""
-            title_boost = 2.0 if any(t in title.lower() for t in all_terms_lower) else 1.0
-            message_boost = float(np.log1p(r[5]))
-            score = float(r[8]) * title_boost * message_boost
-
-            results.append(
-                SearchResult(
-                    conversation_id=r[0], project_id=r[1], title=r[2],
-                    created_at=r[3], updated_at=r[4], message_count=r[5],
-                    file_path=r[6], score=score,
-                    snippet=self._create_snippet(r[7] or "", parsed.original),
-                    bm25_score=float(r[8]),
+        with stage_timer(self._profiler, "search.snippet"):
+            for r in rows:
+                title = r[2] or ""
+                title_boost = 2.0 if any(t in title.lower() for t in all_terms_lower) else 1.0
+                message_boost = float(np.log1p(r[5]))
+                score = float(r[8]) * title_boost * message_boost
+
+                results.append(
+                    SearchResult(
+                        conversation_id=r[0], project_id=r[1], title=r[2],
+                        created_at=r[3], updated_at=r[4], message_count=r[5],
+                        file_path=r[6], score=score,
+                        snippet=self._create_snippet(r[7] or "", parsed.original),
+                        bm25_score=float(r[8]),
+                    )
                 )
-            )
 
         results.sort(key=lambda x: x.score, reverse=True)
         return results
 
+    def _fetch_keyword_rows(self, sql: str, params: list[object]) -> list[tuple]:
+        # Searches run concurrently on the retrieval pool; a DuckDB connection
+        # is not thread-safe, so each query gets its own cursor.
+        cur = self._con.cursor()
+        try:
+            return cur.execute(sql, params).fetchall()
+        finally:
+            cur.close()
+
     # ------------------------------------------------------------------
     # Semantic search (FAISS vector)
     # ------------------------------------------------------------------
 
     def _semantic_search(self, query: str, filters: SearchFilters | None) -> list[SearchResult]:
-        k = 100
-        hits = []
-        for order, hit in enumerate(self.find_similar_vector_hits(query, k)):
-            hits.append((hit.vector_id, hit.distance, order))
+        if self._uses_duckdb_vectors():
+            return self._semantic_search_duckdb(query, filters)
+
+        k = SEMANTIC_TOP_K
+        query_embedding = self._encode_faiss_query(query)
+        if not self._filters_restrict(filters):
+            return self._join_vector_hits(self._search_faiss(query_embedding, k), filters)
+
+        return self._filtered_semantic_search(query_embedding, filters, k)
 
-        if not hits:
+    def _filtered_semantic_search(
+        self,
+        query_embedding: np.ndarray,
+        filters: SearchFilters | None,
+        k: int,
+    ) -> list[SearchResult]:
+        """Fill a page of ``k`` conversations under restrictive filters.
+
+        Vectors of matching conversations are resolved first and passed to
+        FAISS as an IDSelector, so every hit survives the filter join. When
+        the index cannot search with a selector, fall back to over-fetching
+        unfiltered hits (x4 per round) until the page fills, the index is
+        exhausted, or ``SEMANTIC_MAX_FETCH`` is reached.
+        """
+        assert self.faiss_index is not None
+        allowed_ids = self._vector_ids_matching(filters)
+        if allowed_ids.size == 0:
             return []
 
-        values_clause = ", ".join(["(?, ?, ?)"] * len(hits))
+        from searchat.core.indexer import _build_id_selector
+
+        id_selector: faiss.IDSelector | None = _build_id_selector(allowed_ids)
+        limit = max(1, min(int(allowed_ids.size), SEMANTIC_MAX_FETCH))
+        fetch = min(k, limit)
+        while True:
+            try:
+                hits = self._search_faiss(query_embedding, fetch, id_selector=id_selector)
+            except Exception as exc:
+                if id_selector is None:
+                    raise
+                log.debug("FAISS IDSelector search unavailable, over-fetching: %s", exc)
+                id_selector = None
+                limit = max(1, min(int(self.faiss_index.ntotal), SEMANTIC_MAX_FETCH))
+                fetch = min(k, limit)
+                continue
+            results = self._join_vector_hits(hits, filters)
+            if len(results) >= k or len(hits) < fetch or fetch >= limit:
+                return results[:k]
+            fetch = min(fetch * 4, limit)
+
+    @staticmethod
+    def _filters_restrict(filters: SearchFilters | None) -> bool:
+        return bool(
+            filters
+            and (
+                filters.project_ids
+                or filters.tool
+                or filters.date_from
+                or filters.date_to
+                or filters.min_messages > 0
+            )
+        )
+
+    def _vector_ids_matching(self, filters: SearchFilters | None) -> np.ndarray:
+        """Vector ids whose conversations satisfy ``filters``."""
+        lookup = self._get_vector_lookup()
+        return lookup.vector_ids_for(self._allowed_conversations(lookup, filters))
+
+    def _allowed_conversations(
+        self, lookup: VectorLookup, filters: SearchFilters | None,
+    ) -> np.ndarray:
+        if not self._filters_restrict(filters):
+            return lookup.nonempty_conversations()
         params: list[object] = []
-        for vector_id, distance, order in hits:
-            params.extend([vector_id, distance, order])
+        where_clause = self._where_from_filters(filters, params, table_alias="c")
+        return lookup.conversation_mask(where_clause, params)
 
-        params.append(str(self.metadata_path))
-        params.append(self.conversations_glob)
+    def _join_vector_hits(
+        self,
+        vector_hits: list[SemanticVectorHit],
+        filters: SearchFilters | None,
+    ) -> list[SearchResult]:
+        if not vector_hits:
+            return []
 
-        filter_params: list[object] = []
-        where_clause = self._where_from_filters(filters, filter_params, table_alias="c")
-        params.extend(filter_params)
+        with stage_timer(self._profiler, "search.hydrate"):
+            lookup = self._get_vector_lookup()
+            rows = lookup.hydrate(
+                [hit.vector_id for hit in vector_hits],
+                [hit.distance for hit in vector_hits],
+                allowed=self._allowed_conversations(lookup, filters),
+            )
 
-        sql = f"""
-        WITH hits(vector_id, distance, faiss_order) AS (
-          VALUES {values_clause}
+        results = []
+        for row in rows:
+            score = 1.0 / (1.0 + row.distance)
+            snippet_text = row.chunk_text
+            snippet = snippet_text[:SNIPPET_CHARS] + (
+                "..." if len(snippet_text) > SNIPPET_CHARS else ""
+            )
+
+            results.append(
+                SearchResult(
+                    conversation_id=row.conversation_id,
+                    project_id=row.project_id,
+                    title=row.title,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                    message_count=row.message_count,
+                    file_path=row.file_path,
+                    score=score,
+                    snippet=snippet,
+                    message_start_index=row.message_start_index,
+                    message_end_index=row.message_end_index,
+                    semantic_score=score,
+                )
+            )
+
+        return results
+
+    def similar_conversation_rows(
+        self,
+        vector_hits: list[SemanticVectorHit],
+        *,
+        exclude_conversation_id: str,
+        limit: int,
+    ) -> list[tuple]:
+        """Hydrate similarity hits into one row per neighbouring conversation.
+
+        Rows are ``(conversation_id, project_id, title, created_at,
+        updated_at, message_count, file_path, distance)`` in rank order.
+        """
+        if not vector_hits:
+            return []
+        rows = self._get_vector_lookup().hydrate(
+            [hit.vector_id for hit in vector_hits],
+            [hit.distance for hit in vector_hits],
+            exclude_conversation_id=exclude_conversation_id,
+            limit=limit,
+            with_text=False,
+        )
+        return [
+            (
+                row.conversation_id, row.project_id, row.title, row.created_at,
+                row.updated_at, row.message_count, row.file_path, row.distance,
+            )
+            for row in rows
+        ]
+
+    def _semantic_search_duckdb(
+        self, query: str, filters: SearchFilters | None,
+    ) -> list[SearchResult]:
+        """Top-k cosine search over verbatim_embeddings joined in one statement.
+
+        The query vector is inlined as a constant so DuckDB VSS can rewrite
+        ``ORDER BY array_cosine_distance(...) LIMIT k`` into an HNSW index
+        scan; without VSS the same statement runs as a sequential scan.
+        """
+        k = SEMANTIC_TOP_K
+        self._ensure_embedder_loaded()
+        if self.embedder is None:
+            raise SemanticSearchUnavailable("Embedder not available")
+        store = self._get_vector_store()
+
+        with stage_timer(self._profiler, "search.embed"):
+            query_embedding = np.asarray(self.embedder.encode(query), dtype=np.float32).reshape(-1)
+        if query_embedding.shape[0] != EMBEDDING_DIM:
+            raise SemanticSearchUnavailable(
+                f"Query embedding dimension {query_embedding.shape[0]} "
+                f"does not match DuckDB vector dimension {EMBEDDING_DIM}"
+            )
+        vector_literal = "[" + ", ".join(repr(float(x)) for x in query_embedding) + "]"
+
+        params: list[object] = []
+        where_clause = self._where_from_filters(filters, params, table_alias="c")
+        distance_expr = (
+            f"array_cosine_distance(embedding, {vector_literal}::FLOAT[{EMBEDDING_DIM}])"
         )
+
+        if self._filters_restrict(filters):
+            # Filtered: exact scan over the matching conversations only, so a
+            # narrow project/date filter still fills the page.
+            sql = f"""
+            SELECT
+              c.conversation_id,
+              c.project_id,
+              c.title,
+              c.created_at,
+              c.updated_at,
+              c.message_count,
+              c.file_path,
+              e.exchange_id,
+              e.exchange_text,
+              e.ply_start,
+              e.ply_end,
+              {distance_expr} AS distance
+            FROM verbatim_embeddings AS v
+            JOIN exchanges AS e ON e.exchange_id = v.exchange_id
+            JOIN conversations AS c ON c.conversation_id = e.conversation_id
+            WHERE {where_clause}
+            QUALIFY row_number() OVER (PARTITION BY c.conversation_id ORDER BY distance) = 1
+            ORDER BY distance
+            LIMIT {int(k)}
+            """
+            return self._duckdb_vector_results(store, sql, params)
+
+        sql = f"""
         SELECT
-          m.conversation_id,
+          c.conversation_id,
           c.project_id,
           c.title,
           c.created_at,
           c.updated_at,
           c.message_count,
           c.file_path,
-          m.chunk_text,
-          m.message_start_index,
-          m.message_end_index,
-          hits.distance,
-          hits.faiss_order
-        FROM hits
-        JOIN parquet_scan(?) AS m
-          ON m.vector_id = hits.vector_id
-        JOIN (
-          SELECT conversation_id, project_id, title, created_at,
-                 updated_at, message_count, file_path
-          FROM parquet_scan(?)
-          QUALIFY row_number() OVER (
-              PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST
-          ) = 1
-        ) AS c
-          ON c.conversation_id = m.conversation_id
+          e.exchange_id,
+          e.exchange_text,
+          e.ply_start,
+          e.ply_end,
+          v.distance
+        FROM (
+          SELECT exchange_id, {distance_expr} AS distance
+          FROM verbatim_embeddings
+          ORDER BY distance
+          LIMIT {int(k)}
+        ) AS v
+        JOIN exchanges AS e ON e.exchange_id = v.exchange_id
+        JOIN conversations AS c ON c.conversation_id = e.conversation_id
         WHERE {where_clause}
-        QUALIFY row_number() OVER (PARTITION BY m.conversation_id ORDER BY hits.faiss_order) = 1
-        ORDER BY hits.faiss_order
+        QUALIFY row_number() OVER (PARTITION BY c.conversation_id ORDER BY v.distance) = 1
+        ORDER BY v.distance
         """
-        rows = self._con.execute(sql, params).fetchall()
+        return self._duckdb_vector_results(store, sql, params)
 
-        if not rows:
-            return []
+    def _duckdb_vector_results(
+        self,
+        store: UnifiedStorage,
+        sql: str,
+        params: list[object],
+    ) -> list[SearchResult]:
+        # Vector scan and hydration joins run as one statement on this backend.
+        with stage_timer(self._profiler, "search.hydrate"):
+            cur = store._read_cursor()
+            try:
+                rows = cur.execute(sql, params).fetchall()
+            finally:
+                cur.close()
 
-        results = []
+        results: list[SearchResult] = []
         for (
             conversation_id, project_id, title, created_at, updated_at,
-            message_count, file_path, chunk_text, message_start_index,
-            message_end_index, distance, _faiss_order,
+            message_count, file_path, exchange_id, exchange_text,
+            ply_start, ply_end, distance,
         ) in rows:
             score = 1.0 / (1.0 + float(distance))
-            snippet_text = chunk_text or ""
+            snippet_text = exchange_text or ""
             snippet = snippet_text[:300] + ("..." if len(snippet_text) > 300 else "")
 
             results.append(
@@ -606,8 +969,10 @@ class UnifiedSearchEngine:
                     file_path=file_path,
                     score=score,
                     snippet=snippet,
-                    message_start_index=int(message_start_index),
-                    message_end_index=int(message_end_index),
+                    message_start_index=int(ply_start),
+                    message_end_index=int(ply_end),
+                    exchange_id=exchange_id,
+                    exchange_text=exchange_text,
                     semantic_score=score,
                 )
             )
@@ -636,7 +1001,8 @@ class UnifiedSearchEngine:
 
         pairs = [(query, r.snippet) for r in candidates]
         try:
-            scores = self._reranker.predict(pairs)
+            with stage_timer(self._profiler, "search.rerank"):
+                scores = self._reranker.predict(pairs)
         except Exception as exc:
             log.warning("Reranking failed: %s", exc)
             return results
@@ -648,30 +1014,12 @@ class UnifiedSearchEngine:
         return candidates + remainder
 
     # ------------------------------------------------------------------
-    # FTS table management
+    # Keyword index management
     # ------------------------------------------------------------------
 
     def _build_fts_table(self) -> None:
-        cols = ", ".join(self.search_columns)
-        self._con.execute(f"""
-            CREATE OR REPLACE TABLE conversations AS
-            SELECT {cols}
-            FROM parquet_scan('{self.conversations_glob}')
-            QUALIFY row_number() OVER (
-                PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST
-            ) = 1
-        """)
-        self._con.execute("INSTALL fts; LOAD fts;")
-        self._con.execute(f"""
-            PRAGMA create_fts_index(
-                'conversations',
-                'conversation_id',
-                'full_text', 'title',
-                stemmer='{FTS_STEMMER}',
-                stopwords='{FTS_STOPWORDS}',
-                overwrite=1
-            )
-        """)
+        """Delta-merge new/changed/removed parquet conversations into the keyword index."""
+        self._keyword_index.sync(self.conversations_glob)
 
     def close(self) -> None:
         if self._con:
@@ -726,8 +1074,38 @@ class UnifiedSearchEngine:
         metadata = read_index_metadata(self.search_dir)
         metadata.validate_compatible(embedding_model=self.config.embedding.model)
 
+    def _get_vector_lookup(self) -> VectorLookup:
+        """Return the resident hit lookup, reloading it if the metadata parquet changed."""
+        lookup = self._vector_lookup
+        if lookup is not None and not lookup.is_stale():
+            return lookup
+        with self._init_lock:
+            lookup = self._vector_lookup
+            if lookup is None or lookup.is_stale():
+                lookup = VectorLookup.load(
+                    self._con,
+                    self.metadata_path,
+                    self.conversations_glob,
+                    max_snippet_bytes=self._lookup_snippet_budget,
+                )
+                self._vector_lookup = lookup
+        return lookup
+
+    def _uses_duckdb_vectors(self) -> bool:
+        return self._vector_backend == "duckdb"
+
+    def _get_vector_store(self) -> UnifiedStorage:
+        if self._storage is None:
+            from searchat.services.storage_service import build_storage_service
+
+            self._storage = build_storage_service(self.search_dir, config=self.config)
+        return self._storage
+
     def _ensure_metadata_ready_locked(self) -> None:
         self._validate_keyword_files()
+        if self._uses_duckdb_vectors():
+            self._get_vector_store()
+            return
         self._validate_index_metadata()
         if not self.metadata_path.exists():
             raise FileNotFoundError(
@@ -750,6 +1128,8 @@ class UnifiedSearchEngine:
 
     def _ensure_faiss_loaded_locked(self) -> None:
         self._ensure_metadata_ready_locked()
+        if self._uses_duckdb_vectors():
+            return
         if not self.index_path.exists():
             raise FileNotFoundError(
                 f"FAISS index not found at {self.index_path}. Run indexer first."
@@ -778,10 +1158,12 @@ class UnifiedSearchEngine:
             self._ensure_embedder_loaded_locked()
 
     def _ensure_embedder_loaded_locked(self) -> None:
-        self._validate_index_metadata()
+        if not self._uses_duckdb_vectors():
+            self._validate_index_metadata()
         if self.embedder is None:
             try:
-                self.embedder = build_embedding_service(self.config)
+                provider = self._embedding_provider or build_embedding_service
+                self.embedder = provider(self.config)
                 self._semantic_runtime_reason = None
             except EmbeddingModelUnavailable as exc:
                 self._semantic_runtime_reason = str(exc)
@@ -796,13 +1178,22 @@ class UnifiedSearchEngine:
             return
         if self._reranker is None:
             try:
-                self._reranker = build_reranking_service(self.config)
+                provider = self._reranking_provider or build_reranking_service
+                self._reranker = provider(self.config)
                 self._reranking_runtime_reason = None
             except RerankingModelUnavailable as exc:
                 self._reranking_runtime_reason = str(exc)
                 raise RerankingUnavailable(str(exc)) from exc
 
     def _semantic_unavailable_reason(self) -> str | None:
+        if self._uses_duckdb_vectors():
+            if self._storage is None:
+                db_path = self.config.storage.resolve_duckdb_path(self.search_dir)
+                if not Path(db_path).exists():
+                    return "DuckDB store not available"
+            if self.embedder is None and self._semantic_runtime_reason is not None:
+                return self._semantic_runtime_reason
+            return None
         if not self.metadata_path.exists():
             return "Metadata parquet not available"
         if not self.index_path.exists():
@@ -820,38 +1211,6 @@ class UnifiedSearchEngine:
             return self._reranking_runtime_reason
         return None
 
-    # ------------------------------------------------------------------
-    # Cache
-    # ------------------------------------------------------------------
-
-    def _get_cache_key(self, query: str, algo: AlgorithmType, filters: SearchFilters | None) -> str:
-        key_parts = [query, algo.value]
-        if filters:
-            if filters.project_ids:
-                key_parts.append(f"projects:{','.join(filters.project_ids)}")
-            if filters.date_from:
-                key_parts.append(f"from:{filters.date_from.isoformat()}")
-            if filters.date_to:
-                key_parts.append(f"to:{filters.date_to.isoformat()}")
-            if filters.min_messages > 0:
-                key_parts.append(f"min_msgs:{filters.min_messages}")
-        key_str = "|".join(key_parts)
-        return hashlib.md5(key_str.encode()).hexdigest()
-
-    def _get_from_cache(self, cache_key: str) -> SearchResults | None:
-        if cache_key in self.result_cache:
-            result, timestamp = self.result_cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
-                self.result_cache.move_to_end(cache_key)
-                return result
-            del self.result_cache[cache_key]
-        return None
-
-    def _add_to_cache(self, cache_key: str, result: SearchResults) -> None:
-        if len(self.result_cache) >= self.cache_size:
-            self.result_cache.popitem(last=False)
-        self.result_cache[cache_key] = (result, time.time())
-
     # ------------------------------------------------------------------
     # Snippet creation
     # ------------------------------------------------------------------
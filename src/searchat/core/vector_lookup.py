@@ -0,0 +1,343 @@
+"""Resident lookup tables for hydrating FAISS hits.
+
+Semantic search used to join every top-k hit list against
+``parquet_scan(embeddings.metadata.parquet)`` and a deduplicating window
+over all conversation parquet files, so hydrating 100 hits cost a full
+archive scan per query. ``VectorLookup`` loads both sides once:
+
+  - a vector map: sorted ``vector_id`` array with parallel conversation
+    row, ``message_start_index`` and ``message_end_index`` arrays
+    (20 bytes per vector)
+  - ``vector_lookup_conversations``: a TEMP table holding the newest row
+    per conversation, mirrored as Python tuples for O(1) gathers
+  - chunk snippets (first ``SNIPPET_CHARS + 1`` characters) when they fit
+    within ``max_snippet_bytes``; otherwise they are fetched per query for
+    the surviving hits only
+
+Hit hydration is then a ``searchsorted`` gather over k ids. Filters are
+evaluated once per query over the conversation table (not the chunks)
+and applied to the gathered rows as a boolean mask.
+
+The lookup runs its SQL on a private cursor of the connection it was
+loaded from (the TEMP table lives there), serialized by a lock because
+searches hydrate hits from several retrieval threads at once.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+import duckdb
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+SNIPPET_CHARS = 300
+
+# Rough per-string overhead of a CPython ``str`` held in an object array.
+_STR_OVERHEAD_BYTES = 56
+
+_CONVERSATIONS_TABLE = "vector_lookup_conversations"
+
+
+@dataclass(frozen=True)
+class VectorLookupRow:
+    """One hydrated vector hit: its conversation columns plus chunk span."""
+
+    conversation_id: str
+    project_id: str
+    title: str
+    created_at: datetime
+    updated_at: datetime
+    message_count: int
+    file_path: str
+    chunk_text: str
+    message_start_index: int
+    message_end_index: int
+    distance: float
+
+
+class VectorLookup:
+    """vector_id -> (conversation, chunk offsets) map resident in memory."""
+
+    def __init__(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        metadata_path: Path,
+        *,
+        vector_ids: np.ndarray,
+        conversation_rows: np.ndarray,
+        message_start: np.ndarray,
+        message_end: np.ndarray,
+        snippets: np.ndarray | None,
+        conversations: list[tuple],
+        signature: tuple[int, int],
+        load_ms: float,
+    ) -> None:
+        self._con = con
+        self._con_lock = threading.Lock()
+        self.metadata_path = metadata_path
+        self.vector_ids = vector_ids
+        self.conversation_rows = conversation_rows
+        self.message_start = message_start
+        self.message_end = message_end
+        self._snippets = snippets
+        self._conversations = conversations
+        self._conversation_index = {row[0]: i for i, row in enumerate(conversations)}
+        self._message_counts = np.fromiter(
+            (int(row[5] or 0) for row in conversations), dtype=np.int64, count=len(conversations),
+        )
+        self.signature = signature
+        self.load_ms = load_ms
+
+    @classmethod
+    def load(
+        cls,
+        con: duckdb.DuckDBPyConnection,
+        metadata_path: Path,
+        conversations_glob: str,
+        *,
+        max_snippet_bytes: int | None = None,
+    ) -> VectorLookup:
+        """Build the lookup from the metadata parquet and conversation parquet files.
+
+        The lookup keeps a cursor of ``con`` for itself; ``con`` stays free
+        for other callers.
+        """
+        start = time.perf_counter()
+        signature = cls.file_signature(metadata_path)
+        con = con.cursor()
+
+        con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE {_CONVERSATIONS_TABLE} AS
+            SELECT
+              (row_number() OVER (ORDER BY conversation_id) - 1)::INTEGER AS row_idx,
+              conversation_id, project_id, title, created_at,
+              updated_at, message_count, file_path
+            FROM (
+              SELECT conversation_id, project_id, title, created_at,
+                     updated_at, message_count, file_path
+              FROM parquet_scan(?)
+              QUALIFY row_number() OVER (
+                  PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST
+              ) = 1
+            )
+        """, [conversations_glob])
+        conversations = con.execute(f"""
+            SELECT conversation_id, project_id, title, created_at,
+                   updated_at, message_count, file_path
+            FROM {_CONVERSATIONS_TABLE}
+            ORDER BY row_idx
+        """).fetchall()
+
+        keep_snippets = True
+        if max_snippet_bytes is not None:
+            n_vectors, text_bytes = con.execute(
+                f"SELECT count(*), coalesce(sum(least(strlen(chunk_text), {SNIPPET_CHARS + 1})), 0) "
+                "FROM parquet_scan(?)",
+                [str(metadata_path)],
+            ).fetchone()
+            estimate = int(text_bytes) + int(n_vectors) * _STR_OVERHEAD_BYTES
+            keep_snippets = estimate <= max_snippet_bytes
+            if not keep_snippets:
+                log.info(
+                    "Vector lookup snippets (~%d MB) exceed budget (%d MB); fetching per query",
+                    estimate // (1024 * 1024), max_snippet_bytes // (1024 * 1024),
+                )
+
+        snippet_column = (
+            f", left(m.chunk_text, {SNIPPET_CHARS + 1}) AS snippet" if keep_snippets else ""
+        )
+        columns = con.execute(f"""
+            SELECT
+              m.vector_id::BIGINT AS vector_id,
+              coalesce(c.row_idx, -1)::INTEGER AS row_idx,
+              coalesce(m.message_start_index, 0)::INTEGER AS message_start_index,
+              coalesce(m.message_end_index, 0)::INTEGER AS message_end_index
+              {snippet_column}
+            FROM parquet_scan(?) AS m
+            LEFT JOIN {_CONVERSATIONS_TABLE} AS c
+              ON c.conversation_id = m.conversation_id
+            ORDER BY m.vector_id
+        """, [str(metadata_path)]).fetchnumpy()
+
+        snippets = None
+        if keep_snippets:
+            snippets = np.asarray(columns["snippet"], dtype=object)
+
+        lookup = cls(
+            con,
+            metadata_path,
+            vector_ids=np.asarray(columns["vector_id"], dtype=np.int64),
+            conversation_rows=np.asarray(columns["row_idx"], dtype=np.int32),
+            message_start=np.asarray(columns["message_start_index"], dtype=np.int32),
+            message_end=np.asarray(columns["message_end_index"], dtype=np.int32),
+            snippets=snippets,
+            conversations=conversations,
+            signature=signature,
+            load_ms=(time.perf_counter() - start) * 1000,
+        )
+        log.info(
+            "Vector lookup loaded: %d vectors, %d conversations, ~%.1f MB in %.0fms",
+            lookup.vector_count, lookup.conversation_count,
+            lookup.memory_bytes / (1024 * 1024), lookup.load_ms,
+        )
+        return lookup
+
+    @staticmethod
+    def file_signature(path: Path) -> tuple[int, int]:
+        """(mtime_ns, size) of ``path``; used to detect a rewritten metadata parquet."""
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def is_stale(self) -> bool:
+        try:
+            return self.file_signature(self.metadata_path) != self.signature
+        except OSError:
+            return True
+
+    @property
+    def vector_count(self) -> int:
+        return int(self.vector_ids.size)
+
+    @property
+    def conversation_count(self) -> int:
+        return len(self._conversations)
+
+    @property
+    def snippets_resident(self) -> bool:
+        return self._snippets is not None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate resident size of the arrays, snippets and conversation rows."""
+        total = (
+            self.vector_ids.nbytes + self.conversation_rows.nbytes
+            + self.message_start.nbytes + self.message_end.nbytes
+            + self._message_counts.nbytes
+        )
+        if self._snippets is not None:
+            total += sum(len(s) + _STR_OVERHEAD_BYTES for s in self._snippets if s is not None)
+        total += sum(
+            sum(len(v) for v in row if isinstance(v, str)) + 8 * len(row)
+            for row in self._conversations
+        )
+        return total
+
+    # ------------------------------------------------------------------
+    # Conversation filtering
+    # ------------------------------------------------------------------
+
+    def nonempty_conversations(self) -> np.ndarray:
+        """Boolean mask of conversations with at least one message."""
+        return self._message_counts > 0
+
+    def conversation_mask(self, where_clause: str, params: Sequence[object]) -> np.ndarray:
+        """Boolean mask of conversation rows satisfying ``where_clause`` (alias ``c``)."""
+        with self._con_lock:
+            rows = self._con.execute(
+                f"SELECT row_idx FROM {_CONVERSATIONS_TABLE} AS c WHERE {where_clause}",
+                list(params),
+            ).fetchall()
+        mask = np.zeros(self.conversation_count, dtype=bool)
+        if rows:
+            mask[np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))] = True
+        return mask
+
+    def conversation_row(self, conversation_id: str) -> int:
+        return self._conversation_index.get(conversation_id, -1)
+
+    def vector_ids_for(self, allowed: np.ndarray) -> np.ndarray:
+        """Vector ids whose conversation row is set in ``allowed``."""
+        rows = self.conversation_rows
+        keep = rows >= 0
+        keep[keep] = allowed[rows[keep]]
+        return self.vector_ids[keep]
+
+    # ------------------------------------------------------------------
+    # Hit hydration
+    # ------------------------------------------------------------------
+
+    def hydrate(
+        self,
+        vector_ids: Sequence[int],
+        distances: Sequence[float],
+        *,
+        allowed: np.ndarray | None = None,
+        exclude_conversation_id: str | None = None,
+        limit: int | None = None,
+        with_text: bool = True,
+    ) -> list[VectorLookupRow]:
+        """Resolve hits in rank order, keeping the best hit per conversation.
+
+        ``allowed`` is a conversation-row mask from :meth:`conversation_mask`;
+        hits whose vector or conversation is unknown are dropped.
+        """
+        if len(vector_ids) == 0 or self.vector_count == 0:
+            return []
+
+        ids = np.asarray(vector_ids, dtype=np.int64)
+        positions = np.searchsorted(self.vector_ids, ids)
+        positions = np.minimum(positions, self.vector_count - 1)
+        found = self.vector_ids[positions] == ids
+        rows = np.where(found, self.conversation_rows[positions], -1)
+        keep = rows >= 0
+        if allowed is not None:
+            keep[keep] = allowed[rows[keep]]
+        excluded = -1
+        if exclude_conversation_id is not None:
+            excluded = self.conversation_row(exclude_conversation_id)
+
+        chosen: list[tuple[int, int, float]] = []
+        seen: set[int] = set()
+        for i in np.flatnonzero(keep):
+            row = int(rows[i])
+            if row == excluded or row in seen:
+                continue
+            seen.add(row)
+            chosen.append((int(positions[i]), row, float(distances[i])))
+            if limit is not None and len(chosen) >= limit:
+                break
+
+        texts = self._snippets_for([pos for pos, _, _ in chosen]) if with_text else {}
+        results = []
+        for pos, row, distance in chosen:
+            conversation_id, project_id, title, created_at, updated_at, message_count, file_path = (
+                self._conversations[row]
+            )
+            results.append(VectorLookupRow(
+                conversation_id=conversation_id,
+                project_id=project_id,
+                title=title,
+                created_at=created_at,
+                updated_at=updated_at,
+                message_count=message_count,
+                file_path=file_path,
+                chunk_text=texts.get(pos) or "",
+                message_start_index=int(self.message_start[pos]),
+                message_end_index=int(self.message_end[pos]),
+                distance=distance,
+            ))
+        return results
+
+    def _snippets_for(self, positions: list[int]) -> dict[int, str | None]:
+        if not positions:
+            return {}
+        if self._snippets is not None:
+            return {pos: self._snippets[pos] for pos in positions}
+
+        ids = [int(self.vector_ids[pos]) for pos in positions]
+        placeholders = ",".join(["?"] * len(ids))
+        with self._con_lock:
+            rows = self._con.execute(
+                f"SELECT vector_id, left(chunk_text, {SNIPPET_CHARS + 1}) "
+                f"FROM parquet_scan(?) WHERE vector_id IN ({placeholders})",
+                [str(self.metadata_path), *ids],
+            ).fetchall()
+        by_id = {int(vid): text for vid, text in rows}
+        return {pos: by_id.get(vid) for pos, vid in zip(positions, ids)}
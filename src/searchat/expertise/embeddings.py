@@ -12,25 +12,36 @@ import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from searchat.core.embedding_cache import EmbeddingCache, cached_encode
 from searchat.expertise.models import ExpertiseRecord
 
 if TYPE_CHECKING:
-    from sentence_transformers import SentenceTransformer
+    from searchat.services.semantic_model_service import EmbeddingService
 
 _EMBEDDING_DIM = 384
 _logger = logging.getLogger(__name__)
 
 
 class ExpertiseEmbeddingIndex:
-    def __init__(self, data_dir: Path, embedding_model: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        data_dir: Path,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        *,
+        embedding_cache: EmbeddingCache | None = None,
+        embedding_provider: Callable[[], EmbeddingService] | None = None,
+    ) -> None:
         self._data_dir = data_dir
         self._embedding_model = embedding_model
+        self._embedding_cache = embedding_cache
+        # Supplies the (shared) model on first encode; None loads a private one.
+        self._embedding_provider = embedding_provider
         self._expertise_dir = data_dir / "expertise"
         self._faiss_path = self._expertise_dir / "expertise_embeddings.faiss"
         self._metadata_path = self._expertise_dir / "expertise_embeddings.metadata.parquet"
 
         self._lock = Lock()
-        self._embedder: SentenceTransformer | None = None
+        self._embedder: EmbeddingService | None = None
         self._index: faiss.Index | None = None
         # Maps record_id (str) -> vector_id (int)
         self._record_to_vec: dict[str, int] = {}
@@ -46,7 +57,6 @@ class ExpertiseEmbeddingIndex:
 
     def add(self, record: ExpertiseRecord) -> None:
         with self._lock:
-            self._ensure_embedder()
             vec = self._embed(record.content)
             self._add_vector(record.id, vec)
             self._save()
@@ -55,7 +65,6 @@ class ExpertiseEmbeddingIndex:
         if not records:
             return
         with self._lock:
-            self._ensure_embedder()
             texts = [r.content for r in records]
             vecs = self._embed_batch(texts)
             for record, vec in zip(records, vecs):
@@ -67,7 +76,6 @@ class ExpertiseEmbeddingIndex:
             assert self._index is not None
             if self._index.ntotal == 0:
                 return []
-            self._ensure_embedder()
             vec = self._embed(query)
             k = min(limit, self._index.ntotal)
             scores, ids = self._index.search(vec, k)
@@ -85,6 +93,18 @@ class ExpertiseEmbeddingIndex:
     def find_similar(self, content: str, limit: int = 3) -> list[tuple[str, float]]:
         return self.search(content, limit=limit)
 
+    def stored_vectors(self) -> tuple[list[str], np.ndarray]:
+        """Record ids and their normalized vectors, as stored, in index order."""
+        with self._lock:
+            assert self._index is not None
+            if self._index.ntotal == 0:
+                return [], np.empty((0, _EMBEDDING_DIM), dtype=np.float32)
+            vector_ids = faiss.vector_to_array(self._index.id_map)
+            base = faiss.downcast_index(self._index.index)
+            vectors = base.reconstruct_n(0, self._index.ntotal)
+            record_ids = [self._vec_to_record[int(vid)] for vid in vector_ids]
+            return record_ids, np.asarray(vectors, dtype=np.float32)
+
     def remove(self, record_id: str) -> None:
         with self._lock:
             assert self._index is not None
@@ -109,7 +129,6 @@ class ExpertiseEmbeddingIndex:
             self._vec_to_record = {}
             self._next_id = 0
             if records:
-                self._ensure_embedder()
                 total = len(records)
                 for start in range(0, total, batch_size):
                     chunk = records[start : start + batch_size]
@@ -120,6 +139,8 @@ class ExpertiseEmbeddingIndex:
                     if progress_callback is not None:
                         progress_callback(min(start + batch_size, total), total)
             self._save()
+            if self._embedding_cache is not None:
+                self._embedding_cache.flush()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -166,16 +187,26 @@ class ExpertiseEmbeddingIndex:
 
     def _ensure_embedder(self) -> None:
         if self._embedder is None:
+            if self._embedding_provider is not None:
+                self._embedder = self._embedding_provider()
+                return
             from sentence_transformers import SentenceTransformer
 
             self._embedder = SentenceTransformer(self._embedding_model)
 
-    def _embed(self, text: str) -> np.ndarray:
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        self._ensure_embedder()
         assert self._embedder is not None
-        vec = self._embedder.encode([text], convert_to_numpy=True, normalize_embeddings=True)
-        return vec.astype(np.float32)
+        return self._embedder.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+
+    def _embed(self, text: str) -> np.ndarray:
+        return self._embed_batch([text])
 
     def _embed_batch(self, texts: list[str]) -> np.ndarray:
-        assert self._embedder is not None
-        vecs = self._embedder.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
-        return vecs.astype(np.float32)
+        # Normalized vectors differ from the indexers' raw ones: separate cache key.
+        return cached_encode(
+            self._embedding_cache,
+            f"{self._embedding_model}:normalized",
+            texts,
+            self._encode,
+        )
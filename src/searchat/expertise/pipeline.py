@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from searchat.config.settings import Config
+from searchat.core.embedding_cache import get_embedding_cache
 from searchat.expertise.embeddings import ExpertiseEmbeddingIndex
 from searchat.expertise.extractor import HeuristicExtractor
 from searchat.expertise.models import ExpertiseRecord, RecordAction, RecordResult
 from searchat.expertise.store import ExpertiseStore
+from searchat.services.semantic_model_service import shared_embedding_service
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +77,15 @@ class ExtractionPipeline:
             records.extend(llm_records)
             stats.llm_extracted += len(llm_records)
 
-        for record in records:
-            result = self._store_with_dedup(record)
-            if result.action == RecordAction.CREATED:
-                stats.records_created += 1
-            elif result.action == RecordAction.REINFORCED:
-                stats.records_reinforced += 1
-            elif result.action == RecordAction.DUPLICATE_FLAGGED:
-                stats.records_flagged += 1
+        with self._store.session():
+            for record in records:
+                result = self._store_with_dedup(record)
+                if result.action == RecordAction.CREATED:
+                    stats.records_created += 1
+                elif result.action == RecordAction.REINFORCED:
+                    stats.records_reinforced += 1
+                elif result.action == RecordAction.DUPLICATE_FLAGGED:
+                    stats.records_flagged += 1
 
         stats.conversations_processed = 1
         return stats
@@ -189,5 +193,7 @@ def create_pipeline(config: Config, data_dir: Path) -> ExtractionPipeline:
         embedding_index = ExpertiseEmbeddingIndex(
             data_dir,
             embedding_model=config.embedding.model,
+            embedding_cache=get_embedding_cache(config, data_dir),
+            embedding_provider=partial(shared_embedding_service, config),
         )
     return ExtractionPipeline(store, embedding_index, config)
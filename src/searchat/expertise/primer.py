@@ -69,25 +69,24 @@ class ExpertisePrioritizer:
         if kg_store is not None:
             from searchat.knowledge_graph.models import EdgeType
 
-            for record in active:
-                edges = kg_store.get_edges_for_record(
-                    record.id, as_source=False, as_target=True
-                )
-                for edge in edges:
+            active_ids = {r.id for r in active}
+            # One query for every edge touching an active record, newest first.
+            for edge in kg_store.get_edges_for_records([r.id for r in active]):
+                if edge.target_id in active_ids:
                     if edge.edge_type == EdgeType.SUPERSEDES:
                         # This record has an incoming SUPERSEDES edge — it is superseded
-                        superseded_ids.add(record.id)
+                        superseded_ids.add(edge.target_id)
                     elif edge.edge_type == EdgeType.QUALIFIES:
                         # Another record qualifies this one — collect notes
-                        qualifying_notes.setdefault(record.id, []).append(edge.source_id)
-
-                # Check for unresolved outgoing CONTRADICTS edges
-                out_edges = kg_store.get_edges_for_record(
-                    record.id, as_source=True, as_target=False
-                )
-                for edge in out_edges:
-                    if edge.edge_type == EdgeType.CONTRADICTS and edge.resolution_id is None:
-                        contradiction_ids.add(record.id)
+                        qualifying_notes.setdefault(edge.target_id, []).append(edge.source_id)
+
+                # Unresolved outgoing CONTRADICTS edges
+                if (
+                    edge.source_id in active_ids
+                    and edge.edge_type == EdgeType.CONTRADICTS
+                    and edge.resolution_id is None
+                ):
+                    contradiction_ids.add(edge.source_id)
 
             active = [r for r in active if r.id not in superseded_ids]
 
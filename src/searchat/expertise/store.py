@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -78,12 +81,42 @@ class ExpertiseStore:
     def __init__(self, data_dir: Path) -> None:
         self._db_path = data_dir / "expertise" / "expertise.duckdb"
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connection held by the current thread's session(), if any.
+        self._local = threading.local()
         self._ensure_tables()
 
     def _connect(self):
+        """Cursor on this thread's session connection, else a new connection.
+
+        Closing the result closes a per-call connection but leaves a session
+        connection open.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn.cursor()
         import duckdb
         return duckdb.connect(database=str(self._db_path))
 
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """Share one connection across this thread's operations in the block.
+
+        The database file is locked only while a session is open, so other
+        processes (the CLI, the API server, MCP) can use it in between.
+        Sessions nest; the connection closes when the outermost one exits.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        import duckdb
+        conn = duckdb.connect(database=str(self._db_path))
+        self._local.conn = conn
+        try:
+            yield
+        finally:
+            self._local.conn = None
+            conn.close()
+
     def _ensure_tables(self) -> None:
         con = self._connect()
         try:
@@ -187,6 +220,22 @@ class ExpertiseStore:
             return None
         return _row_to_record(row)
 
+    def get_many(self, record_ids: list[str]) -> dict[str, ExpertiseRecord]:
+        """Fetch several records in one query, keyed by id; missing ids are absent."""
+        if not record_ids:
+            return {}
+        placeholders = ", ".join("?" * len(record_ids))
+        con = self._connect()
+        try:
+            rows = con.execute(
+                f"SELECT {_SELECT_COLS} FROM expertise_records WHERE id IN ({placeholders})",
+                record_ids,
+            ).fetchall()
+        finally:
+            con.close()
+        records = [_row_to_record(r) for r in rows]
+        return {record.id: record for record in records}
+
     def update(self, record_id: str, **fields: Any) -> bool:
         if not fields:
             return False
@@ -499,5 +548,5 @@ class ExpertiseStore:
         return count
 
     def close(self) -> None:
-        # Connections are per-operation; nothing to close globally.
+        # Connections are per-operation or per-session; nothing to close globally.
         pass
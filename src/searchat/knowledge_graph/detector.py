@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from searchat.expertise.models import ExpertiseRecord
 from searchat.knowledge_graph.models import ContradictionCandidate
 
@@ -13,6 +16,36 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Rows of the similarity matrix computed per block (rows x n float32).
+_PAIR_BLOCK_ROWS = 1024
+
+
+def similar_pairs(
+    vectors: np.ndarray,
+    threshold: float,
+    limit: int,
+) -> list[tuple[int, int, float]]:
+    """Row-index pairs ``(i, j)``, ``i < j``, with dot product >= ``threshold``.
+
+    ``vectors`` are normalized, so the dot product is cosine similarity. Each
+    row keeps at most ``limit`` neighbours, as a per-record top-``limit``
+    search would; a pair is kept when either side selects it.
+    """
+    n = len(vectors)
+    pairs: dict[tuple[int, int], float] = {}
+    for start in range(0, n, _PAIR_BLOCK_ROWS):
+        block = vectors[start:start + _PAIR_BLOCK_ROWS] @ vectors.T
+        rows = np.arange(len(block))
+        block[rows, rows + start] = -np.inf
+        for offset, sims in enumerate(block):
+            cols = np.flatnonzero(sims >= threshold)
+            if len(cols) > limit:
+                cols = cols[np.argpartition(sims[cols], -limit)[-limit:]]
+            i = start + offset
+            for j in cols.tolist():
+                pairs[(i, j) if i < j else (j, i)] = float(sims[j])
+    return [(i, j, score) for (i, j), score in sorted(pairs.items())]
+
 
 class ContradictionDetector:
     """Two-stage contradiction detection: semantic similarity + NLI classification."""
@@ -20,6 +53,7 @@ class ContradictionDetector:
     SIMILARITY_THRESHOLD: float = 0.75
     CONTRADICTION_THRESHOLD: float = 0.70
     NLI_MODEL: str = "cross-encoder/nli-deberta-v3-xsmall"
+    NLI_BATCH_SIZE: int = 256
 
     def __init__(self, nli_model: str | None = None) -> None:
         self._nli_model_name = nli_model or self.NLI_MODEL
@@ -81,6 +115,105 @@ class ContradictionDetector:
             _logger.warning("NLI prediction failed: %s", exc)
             return None
 
+    def _stage2_nli_batch(
+        self,
+        pairs: list[tuple[ExpertiseRecord, ExpertiseRecord]],
+    ) -> list[tuple[float, float, float] | None] | None:
+        """Score many pairs in one ``predict`` call; None when NLI is unavailable."""
+        if not self._ensure_cross_encoder():
+            return None
+        assert self._cross_encoder is not None
+        try:
+            scores = self._cross_encoder.predict(
+                [(a.content, b.content) for a, b in pairs],
+                batch_size=self.NLI_BATCH_SIZE,
+            )
+        except Exception as exc:
+            _logger.warning("NLI prediction failed: %s", exc)
+            return [None] * len(pairs)
+        results: list[tuple[float, float, float] | None] = []
+        for score_row in scores:
+            if hasattr(score_row, "__len__") and len(score_row) == 3:
+                results.append((float(score_row[0]), float(score_row[1]), float(score_row[2])))
+            else:
+                results.append(None)
+        return results
+
+    def _candidate(
+        self,
+        record_id_a: str,
+        record_id_b: str,
+        similarity: float,
+        nli_result: tuple[float, float, float] | None,
+    ) -> ContradictionCandidate | None:
+        """Stage-1-only candidate without NLI scores, else only above the threshold."""
+        if nli_result is None:
+            return ContradictionCandidate(
+                record_id_a=record_id_a,
+                record_id_b=record_id_b,
+                similarity_score=similarity,
+                nli_available=False,
+            )
+        contradiction_score, entailment_score, neutral_score = nli_result
+        if contradiction_score < self.CONTRADICTION_THRESHOLD:
+            return None
+        return ContradictionCandidate(
+            record_id_a=record_id_a,
+            record_id_b=record_id_b,
+            similarity_score=similarity,
+            contradiction_score=contradiction_score,
+            entailment_score=entailment_score,
+            neutral_score=neutral_score,
+            nli_available=True,
+        )
+
+    def scan(
+        self,
+        store: ExpertiseStore,
+        embedding_index: ExpertiseEmbeddingIndex,
+        *,
+        records: list[ExpertiseRecord] | None = None,
+        exclude: set[frozenset[str]] | None = None,
+        limit: int = 20,
+    ) -> Iterator[tuple[int, int, list[ContradictionCandidate]]]:
+        """All-pairs contradiction scan over the vectors in ``embedding_index``.
+
+        Stage 1 is a blocked similarity matrix over the stored vectors, so
+        nothing is re-embedded. Records not given in ``records`` are fetched
+        in one query, and Stage 2 scores pairs in batches of
+        NLI_BATCH_SIZE. Pairs in ``exclude`` (unordered id pairs) are
+        skipped. Yields ``(pairs_scored, total_pairs, candidates)`` per batch.
+        """
+        record_ids, vectors = embedding_index.stored_vectors()
+        pairs = [
+            (record_ids[i], record_ids[j], similarity)
+            for i, j, similarity in similar_pairs(vectors, self.SIMILARITY_THRESHOLD, limit)
+        ]
+        if exclude:
+            pairs = [p for p in pairs if frozenset(p[:2]) not in exclude]
+
+        by_id = {record.id: record for record in records or []}
+        missing = sorted({rid for a, b, _ in pairs for rid in (a, b)} - by_id.keys())
+        by_id.update(store.get_many(missing))
+        pairs = [
+            (a, b, similarity)
+            for a, b, similarity in pairs
+            if a in by_id and b in by_id and by_id[a].is_active and by_id[b].is_active
+        ]
+
+        total = len(pairs)
+        for start in range(0, total, self.NLI_BATCH_SIZE):
+            batch = pairs[start:start + self.NLI_BATCH_SIZE]
+            nli_results = self._stage2_nli_batch([(by_id[a], by_id[b]) for a, b, _ in batch])
+            candidates: list[ContradictionCandidate] = []
+            for k, (a, b, similarity) in enumerate(batch):
+                candidate = self._candidate(
+                    a, b, similarity, None if nli_results is None else nli_results[k]
+                )
+                if candidate is not None:
+                    candidates.append(candidate)
+            yield start + len(batch), total, candidates
+
     def check_record(
         self,
         record: ExpertiseRecord,
@@ -105,42 +238,10 @@ class ContradictionDetector:
             if other is None or not other.is_active:
                 continue
 
-            if not nli_available:
-                # Stage 1 only — flag all semantically similar as candidates
-                candidates.append(
-                    ContradictionCandidate(
-                        record_id_a=record.id,
-                        record_id_b=other_id,
-                        similarity_score=similarity,
-                        nli_available=False,
-                    )
-                )
-                continue
-
-            nli_result = self._stage2_nli(record, other)
-            if nli_result is None:
-                candidates.append(
-                    ContradictionCandidate(
-                        record_id_a=record.id,
-                        record_id_b=other_id,
-                        similarity_score=similarity,
-                        nli_available=False,
-                    )
-                )
-                continue
-
-            contradiction_score, entailment_score, neutral_score = nli_result
-            if contradiction_score >= self.CONTRADICTION_THRESHOLD:
-                candidates.append(
-                    ContradictionCandidate(
-                        record_id_a=record.id,
-                        record_id_b=other_id,
-                        similarity_score=similarity,
-                        contradiction_score=contradiction_score,
-                        entailment_score=entailment_score,
-                        neutral_score=neutral_score,
-                        nli_available=True,
-                    )
-                )
+            # Without NLI every Stage 1 match is flagged.
+            nli_result = self._stage2_nli(record, other) if nli_available else None
+            candidate = self._candidate(record.id, other_id, similarity, nli_result)
+            if candidate is not None:
+                candidates.append(candidate)
 
         return candidates
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -36,12 +39,42 @@ class KnowledgeGraphStore:
     def __init__(self, data_dir: Path) -> None:
         self._db_path = data_dir / "knowledge_graph" / "knowledge_graph.duckdb"
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connection held by the current thread's session(), if any.
+        self._local = threading.local()
         self._ensure_tables()
 
     def _connect(self):
+        """Cursor on this thread's session connection, else a new connection.
+
+        Closing the result closes a per-call connection but leaves a session
+        connection open.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn.cursor()
         import duckdb
         return duckdb.connect(database=str(self._db_path))
 
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """Share one connection across this thread's operations in the block.
+
+        The database file is locked only while a session is open, so other
+        processes (the CLI, the API server, MCP) can use it in between.
+        Sessions nest; the connection closes when the outermost one exits.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        import duckdb
+        conn = duckdb.connect(database=str(self._db_path))
+        self._local.conn = conn
+        try:
+            yield
+        finally:
+            self._local.conn = None
+            conn.close()
+
     def _ensure_tables(self) -> None:
         con = self._connect()
         try:
@@ -200,6 +233,42 @@ class KnowledgeGraphStore:
             con.close()
         return [_row_to_edge(r) for r in rows]
 
+    def get_edges_for_records(
+        self,
+        record_ids: list[str],
+        edge_type: EdgeType | None = None,
+        as_source: bool = True,
+        as_target: bool = True,
+    ) -> list[KnowledgeEdge]:
+        """Edges touching any of ``record_ids``, in one query, newest first."""
+        if not record_ids or not (as_source or as_target):
+            return []
+        placeholders = ", ".join("?" * len(record_ids))
+        direction_parts: list[str] = []
+        params: list[Any] = []
+        if as_source:
+            direction_parts.append(f"source_id IN ({placeholders})")
+            params.extend(record_ids)
+        if as_target:
+            direction_parts.append(f"target_id IN ({placeholders})")
+            params.extend(record_ids)
+
+        conditions = [f"({' OR '.join(direction_parts)})"]
+        if edge_type is not None:
+            conditions.append("edge_type = ?")
+            params.append(edge_type.value)
+
+        con = self._connect()
+        try:
+            rows = con.execute(
+                f"SELECT {_SELECT_COLS} FROM knowledge_edges "
+                f"WHERE {' AND '.join(conditions)} ORDER BY created_at DESC",
+                params,
+            ).fetchall()
+        finally:
+            con.close()
+        return [_row_to_edge(r) for r in rows]
+
     def get_contradictions(self, unresolved_only: bool = True) -> list[KnowledgeEdge]:
         if unresolved_only:
             sql = (
@@ -261,24 +330,32 @@ class KnowledgeGraphStore:
             return []
         con = self._connect()
         try:
-            for edge in edges:
-                con.execute(
+            con.execute("BEGIN TRANSACTION")
+            try:
+                con.executemany(
                     """
                     INSERT INTO knowledge_edges
                         (id, source_id, target_id, edge_type, metadata, created_at, created_by, resolution_id)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     [
-                        edge.id,
-                        edge.source_id,
-                        edge.target_id,
-                        edge.edge_type.value,
-                        json.dumps(edge.metadata) if edge.metadata is not None else None,
-                        edge.created_at,
-                        edge.created_by,
-                        edge.resolution_id,
+                        [
+                            edge.id,
+                            edge.source_id,
+                            edge.target_id,
+                            edge.edge_type.value,
+                            json.dumps(edge.metadata) if edge.metadata is not None else None,
+                            edge.created_at,
+                            edge.created_by,
+                            edge.resolution_id,
+                        ]
+                        for edge in edges
                     ],
                 )
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
         finally:
             con.close()
         return [e.id for e in edges]
@@ -304,5 +381,5 @@ class KnowledgeGraphStore:
         return count
 
     def close(self) -> None:
-        # Connections are per-operation; nothing to close globally.
+        # Connections are per-operation or per-session; nothing to close globally.
         pass
@@ -0,0 +1,156 @@
+"""Process-wide, per-dataset service registry for MCP tool calls.
+
+Agents call MCP tools dozens of times per session. Building a fresh
+``Config`` and ``UnifiedSearchEngine`` (keyword index sync, embedder) on
+every call made each one pay a cold start. The registry keeps them per
+dataset root for the life of the server process:
+
+  - services are built on the first call that names a dataset (lazy warm-up);
+  - when the dataset's index metadata ``last_updated`` changes, the engine is
+    refreshed in place, so an embedder that is already loaded stays loaded;
+  - engines load their embedding model through the caller's provider
+    (``shared_embedding_service``), so every dataset shares one model.
+
+``UnifiedStorage`` is not kept: even a read-only DuckDB handle stops other
+processes from opening the file for writing, so a long agent session would
+block ``searchat index`` and the API server. :meth:`ServiceRegistry.open_store`
+opens a store for one tool call and closes it afterwards.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from searchat.config import Config
+from searchat.services.retrieval_service import SemanticRetrievalService
+from searchat.services.storage_contracts import index_metadata_path, read_index_metadata
+from searchat.services.storage_service import StorageService
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class DatasetServices:
+    """Warm services for one dataset root."""
+
+    config: Config
+    engine: SemanticRetrievalService
+    # Index metadata (last_updated, file mtime_ns, file size) when built or refreshed.
+    last_updated: str | None
+    metadata_stat: tuple[int, int] | None
+
+
+def _metadata_stat(search_dir: Path) -> tuple[int, int] | None:
+    try:
+        stat = index_metadata_path(search_dir).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _last_updated(search_dir: Path) -> str | None:
+    try:
+        return read_index_metadata(search_dir).last_updated
+    except Exception:
+        return None
+
+
+def _close_store(store: StorageService) -> None:
+    close = getattr(store, "close", None)
+    if not callable(close):
+        return
+    try:
+        close()
+    except Exception as exc:  # pragma: no cover - best effort
+        log.warning("Failed to close storage: %s", exc)
+
+
+class ServiceRegistry:
+    """Lazily built, index-version-checked services keyed by dataset root."""
+
+    def __init__(
+        self,
+        *,
+        load_config: Callable[[], Config],
+        build_engine: Callable[[Path, Config], SemanticRetrievalService],
+        build_store: Callable[[Path, Config], StorageService],
+    ) -> None:
+        self._load_config = load_config
+        self._build_engine = build_engine
+        self._build_store = build_store
+        self._entries: dict[Path, DatasetServices] = {}
+        self._dataset_locks: dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, search_dir: Path) -> DatasetServices:
+        """Services for ``search_dir``, built on first use and refreshed after re-indexing."""
+        key = Path(search_dir).expanduser().resolve()
+        with self._lock:
+            dataset_lock = self._dataset_locks.setdefault(key, threading.Lock())
+
+        # Concurrent calls for one dataset wait for a single build; other
+        # datasets are not blocked.
+        with dataset_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._build(search_dir)
+                self._entries[key] = entry
+            else:
+                self._refresh_if_stale(entry, search_dir)
+            return entry
+
+    @contextmanager
+    def open_store(self, search_dir: Path) -> Iterator[StorageService]:
+        """Storage for one tool call on ``search_dir``, closed when the block exits."""
+        store = self._build_store(search_dir, self.get(search_dir).config)
+        try:
+            yield store
+        finally:
+            _close_store(store)
+
+    def _build(self, search_dir: Path) -> DatasetServices:
+        metadata_stat = _metadata_stat(search_dir)
+        config = self._load_config()
+        engine = self._build_engine(search_dir, config)
+        return DatasetServices(
+            config=config,
+            engine=engine,
+            last_updated=_last_updated(search_dir),
+            metadata_stat=metadata_stat,
+        )
+
+    def _refresh_if_stale(self, entry: DatasetServices, search_dir: Path) -> None:
+        # The stat is the cheap check; metadata JSON is only read once it moves.
+        metadata_stat = _metadata_stat(search_dir)
+        if metadata_stat == entry.metadata_stat:
+            return
+        last_updated = _last_updated(search_dir)
+        entry.metadata_stat = metadata_stat
+        if last_updated == entry.last_updated:
+            return
+
+        log.info("Index for %s updated at %s; refreshing MCP services", search_dir, last_updated)
+        entry.engine.refresh_index()
+        entry.last_updated = last_updated
+
+    def invalidate(self, search_dir: Path | None = None) -> None:
+        """Drop cached services for one dataset, or for all datasets."""
+        with self._lock:
+            if search_dir is None:
+                entries = list(self._entries.values())
+                self._entries.clear()
+            else:
+                key = Path(search_dir).expanduser().resolve()
+                entry = self._entries.pop(key, None)
+                entries = [entry] if entry is not None else []
+        for entry in entries:
+            close = getattr(entry.engine, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as exc:  # pragma: no cover - best effort
+                    log.warning("Failed to close search engine: %s", exc)
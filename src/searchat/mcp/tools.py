@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import threading
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from searchat.config import Config, PathResolver
 from searchat.config.constants import VALID_TOOL_NAMES, RAG_SYSTEM_PROMPT
@@ -35,6 +38,7 @@ from searchat.mcp.contracts import (
     serialize_similar_conversations_payload,
     serialize_statistics_payload,
 )
+from searchat.mcp.registry import ServiceRegistry
 from searchat.models import SearchFilters, SearchMode
 from searchat.services.llm_service import (
     LLMServiceError,
@@ -43,8 +47,12 @@ from searchat.services.llm_service import (
     resolve_generation_target,
 )
 from searchat.services.retrieval_service import SemanticRetrievalService, build_retrieval_service
+from searchat.services.semantic_model_service import shared_embedding_service
 from searchat.services.storage_service import StorageService, build_storage_service
 
+if TYPE_CHECKING:
+    from searchat.expertise.store import ExpertiseStore
+
 
 def _json_default(value: object) -> str:
     if isinstance(value, datetime):
@@ -67,11 +75,57 @@ def resolve_dataset(search_dir: str | None) -> Path:
     return resolved
 
 
-def build_services(search_dir: Path) -> tuple[Config, SemanticRetrievalService, StorageService]:
-    config = Config.load()
-    engine = build_retrieval_service(search_dir, config=config)
-    store = build_storage_service(search_dir, config=config)
-    return config, engine, store
+# Resolved through module globals at call time so tests can patch the builders.
+_SERVICE_REGISTRY = ServiceRegistry(
+    load_config=lambda: Config.load(),
+    build_engine=lambda search_dir, config: build_retrieval_service(
+        search_dir, config=config, embedding_provider=shared_embedding_service,
+    ),
+    build_store=lambda search_dir, config: build_storage_service(search_dir, config=config),
+)
+
+
+def get_service_registry() -> ServiceRegistry:
+    return _SERVICE_REGISTRY
+
+
+def build_services(search_dir: Path) -> tuple[Config, SemanticRetrievalService]:
+    """Warm config and search engine for ``search_dir`` from the process-wide registry.
+
+    The first call for a dataset builds them; later calls only re-check the
+    index metadata and pay query time.
+    """
+    services = _SERVICE_REGISTRY.get(search_dir)
+    return services.config, services.engine
+
+
+def open_store(search_dir: Path) -> AbstractContextManager[StorageService]:
+    """Storage for ``search_dir`` held only for the ``with`` block.
+
+    The DuckDB file is not kept open between tool calls, so indexing and the
+    API server can open it while an agent session is running.
+    """
+    return _SERVICE_REGISTRY.open_store(search_dir)
+
+
+_EXPERTISE_STORES: dict[Path, ExpertiseStore] = {}
+_EXPERTISE_STORES_LOCK = threading.Lock()
+
+
+def expertise_store(search_dir: Path) -> ExpertiseStore:
+    """Process-wide expertise store for ``search_dir``.
+
+    Reusing the store skips its schema check on every tool call. It opens
+    the database per call, so the file stays free for other processes.
+    """
+    from searchat.expertise.store import ExpertiseStore
+
+    with _EXPERTISE_STORES_LOCK:
+        store = _EXPERTISE_STORES.get(search_dir)
+        if store is None:
+            store = ExpertiseStore(search_dir)
+            _EXPERTISE_STORES[search_dir] = store
+        return store
 
 
 def parse_mode(mode: str) -> SearchMode:
@@ -141,7 +195,7 @@ def search_conversations(
     tool_value = parse_tool(tool)
 
     dataset_dir = resolve_dataset(search_dir)
-    _config, engine, _store = build_services(dataset_dir)
+    _config, engine = build_services(dataset_dir)
     if mode_value == SearchMode.SEMANTIC:
         ensure_semantic_capability(engine)
 
@@ -159,9 +213,8 @@ def search_conversations(
 
 def get_conversation(*, conversation_id: str, search_dir: str | None = None) -> str:
     dataset_dir = resolve_dataset(search_dir)
-    _config, _engine, store = build_services(dataset_dir)
-
-    record = store.get_conversation_record(conversation_id)
+    with open_store(dataset_dir) as store:
+        record = store.get_conversation_record(conversation_id)
     if record is None:
         raise ValueError(conversation_not_found_message(conversation_id))
 
@@ -170,14 +223,15 @@ def get_conversation(*, conversation_id: str, search_dir: str | None = None) ->
 
 def list_projects(*, search_dir: str | None = None) -> str:
     dataset_dir = resolve_dataset(search_dir)
-    _config, _engine, store = build_services(dataset_dir)
-    return _json_dumps(serialize_projects_payload(store.list_projects()))
+    with open_store(dataset_dir) as store:
+        projects = store.list_projects()
+    return _json_dumps(serialize_projects_payload(projects))
 
 
 def get_statistics(*, search_dir: str | None = None) -> str:
     dataset_dir = resolve_dataset(search_dir)
-    _config, _engine, store = build_services(dataset_dir)
-    stats = store.get_statistics()
+    with open_store(dataset_dir) as store:
+        stats = store.get_statistics()
     return _json_dumps(serialize_statistics_payload(stats))
 
 
@@ -191,37 +245,35 @@ def find_similar_conversations(
         raise ValueError(mcp_similarity_limit_message())
 
     dataset_dir = resolve_dataset(search_dir)
-    _config, engine, store = build_services(dataset_dir)
+    _config, engine = build_services(dataset_dir)
     ensure_semantic_capability(engine)
 
-    conv_meta = store.get_conversation_meta(conversation_id)
-    if not conv_meta:
-        raise ValueError(conversation_not_found_message(conversation_id))
+    with open_store(dataset_dir) as store:
+        conv_meta = store.get_conversation_meta(conversation_id)
+        if not conv_meta:
+            raise ValueError(conversation_not_found_message(conversation_id))
 
-    con = store._connect()
-    try:
-        row = con.execute(
-            """
-            SELECT chunk_text
-            FROM parquet_scan(?)
-            WHERE conversation_id = ?
-            ORDER BY vector_id
-            LIMIT 1
-            """,
-            [str(engine.metadata_path), conversation_id],
-        ).fetchone()
-    finally:
-        con.close()
+        con = store._connect()
+        try:
+            row = con.execute(
+                """
+                SELECT chunk_text
+                FROM parquet_scan(?)
+                WHERE conversation_id = ?
+                ORDER BY vector_id
+                LIMIT 1
+                """,
+                [str(engine.metadata_path), conversation_id],
+            ).fetchone()
+        finally:
+            con.close()
 
     if row is None:
         raise ValueError(no_embeddings_for_conversation_message())
 
     chunk_text = row[0]
     representative_text = f"{conv_meta['title']} {chunk_text}"
-    hits = [
-        (hit.vector_id, hit.distance)
-        for hit in engine.find_similar_vector_hits(representative_text, limit + 10)
-    ]
+    hits = engine.find_similar_vector_hits(representative_text, limit + 10)
 
     if not hits:
         return _json_dumps(
@@ -232,50 +284,11 @@ def find_similar_conversations(
             )
         )
 
-    values_clause = ", ".join(["(?, ?)"] * len(hits))
-    params: list[object] = []
-    for vid, distance in hits:
-        params.extend([vid, distance])
-    params.append(str(engine.metadata_path))
-    params.append(engine.conversations_glob)
-    params.append(conversation_id)
-    params.append(limit)
-
-    con = store._connect()
-    try:
-        sql = f"""
-            WITH hits(vector_id, distance) AS (
-                VALUES {values_clause}
-            )
-            SELECT
-                m.conversation_id,
-                c.project_id,
-                c.title,
-                c.created_at,
-                c.updated_at,
-                c.message_count,
-                c.file_path,
-                hits.distance
-            FROM hits
-            JOIN parquet_scan(?) AS m
-                ON m.vector_id = hits.vector_id
-            JOIN (
-                SELECT conversation_id, project_id, title, created_at,
-                       updated_at, message_count, file_path
-                FROM parquet_scan(?)
-                QUALIFY row_number() OVER (
-                    PARTITION BY conversation_id ORDER BY updated_at DESC NULLS LAST
-                ) = 1
-            ) AS c
-                ON c.conversation_id = m.conversation_id
-            WHERE m.conversation_id != ?
-            QUALIFY row_number() OVER (PARTITION BY m.conversation_id ORDER BY hits.distance) = 1
-            ORDER BY hits.distance
-            LIMIT ?
-        """
-        rows = con.execute(sql, params).fetchall()
-    finally:
-        con.close()
+    rows = engine.similar_conversation_rows(
+        hits,
+        exclude_conversation_id=conversation_id,
+        limit=limit,
+    )
 
     similar: list[dict[str, object]] = []
     for (
@@ -320,7 +333,7 @@ def ask_about_history(
 ) -> str:
     provider_value = parse_generation_provider(model_provider)
     dataset_dir = resolve_dataset(search_dir)
-    config, engine, _store = build_services(dataset_dir)
+    config, engine = build_services(dataset_dir)
     ensure_semantic_capability(engine)
 
     target = resolve_generation_target(
@@ -394,7 +407,7 @@ def extract_patterns(
 
     provider_value = parse_generation_provider(model_provider)
     dataset_dir = resolve_dataset(search_dir)
-    config, engine, _store = build_services(dataset_dir)
+    config, engine = build_services(dataset_dir)
     ensure_semantic_capability(engine)
 
     target = resolve_generation_target(
@@ -429,14 +442,13 @@ def prime_expertise(
     """
     from searchat.expertise.models import ExpertiseQuery
     from searchat.expertise.primer import ExpertisePrioritizer, PrimeFormatter
-    from searchat.expertise.store import ExpertiseStore
 
     if max_tokens < 100 or max_tokens > 32000:
         raise ValueError(mcp_prime_max_tokens_message())
 
     dataset_dir = resolve_dataset(search_dir)
     config = Config.load()
-    store = ExpertiseStore(dataset_dir)
+    store = expertise_store(dataset_dir)
 
     q = ExpertiseQuery(
         domain=domain,
@@ -474,7 +486,6 @@ def record_expertise(
     Returns JSON with the created record's ID and action taken.
     """
     from searchat.expertise.models import ExpertiseRecord, ExpertiseSeverity, ExpertiseType
-    from searchat.expertise.store import ExpertiseStore
 
     try:
         record_type = ExpertiseType(type)
@@ -506,7 +517,7 @@ def record_expertise(
     )
 
     dataset_dir = resolve_dataset(search_dir)
-    store = ExpertiseStore(dataset_dir)
+    store = expertise_store(dataset_dir)
     record_id = store.insert(record)
 
     return _json_dumps(
@@ -536,7 +547,6 @@ def search_expertise(
     Returns JSON with matching active expertise records.
     """
     from searchat.expertise.models import ExpertiseQuery, ExpertiseType
-    from searchat.expertise.store import ExpertiseStore
 
     if limit < 1 or limit > 100:
         raise ValueError(mcp_search_limit_message())
@@ -551,7 +561,7 @@ def search_expertise(
             )
 
     dataset_dir = resolve_dataset(search_dir)
-    store = ExpertiseStore(dataset_dir)
+    store = expertise_store(dataset_dir)
 
     q = ExpertiseQuery(
         q=query,
@@ -650,7 +660,7 @@ def generate_agent_config(
 
     provider_value = parse_generation_provider(model_provider)
     dataset_dir = resolve_dataset(search_dir)
-    config, engine, _store = build_services(dataset_dir)
+    config, engine = build_services(dataset_dir)
     ensure_semantic_capability(engine)
 
     target = resolve_generation_target(
@@ -95,6 +95,8 @@ class UpdateStats:
     skipped_conversations: int
     update_time_seconds: float
     empty_conversations: int = 0
+    # Projects whose conversations were written; None when not tracked.
+    changed_project_ids: set[str] | None = None
 
 
 @dataclass
@@ -49,6 +49,12 @@ FILE_STATE_SCHEMA = pa.schema([
     ('connector_name', pa.string()),
     ('conversation_id', pa.string()),
     ('project_id', pa.string()),
+    # Resume point for append-only sources (see connectors.TailCursor).
+    ('mtime_ns', pa.int64()),
+    ('byte_offset', pa.int64()),
+    ('next_sequence', pa.int64()),
+    ('tail_checkpoint', pa.string()),
+    ('tail_chunk_start', pa.int64()),
 ])
 
 
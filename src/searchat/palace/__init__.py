@@ -9,6 +9,7 @@ from searchat.palace.llm import (
 )
 from searchat.palace.storage import PalaceStorage
 from searchat.palace.faiss_index import DistilledFaissIndex
+from searchat.palace.scheduler import DistillationScheduler, SchedulerStats
 from searchat.palace.distiller import Distiller
 from searchat.palace.query import PalaceQuery
 
@@ -20,5 +21,7 @@ __all__ = [
     "PalaceStorage",
     "DistilledFaissIndex",
     "Distiller",
+    "DistillationScheduler",
+    "SchedulerStats",
     "PalaceQuery",
 ]
@@ -7,16 +7,16 @@ import re
 import threading
 import time
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
 from searchat.config import Config
+from searchat.core.embedding_cache import cached_encode, get_embedding_cache
 from searchat.models.domain import (
     DistilledObject,
     DistillationStats,
@@ -25,7 +25,8 @@ from searchat.models.domain import (
     RoomObject,
 )
 from searchat.palace.faiss_index import DistilledFaissIndex
-from searchat.palace.llm import DistillationInput, DistillationLLM, RoomAssignment
+from searchat.palace.llm import DistillationInput, DistillationLLM, DistillationOutput
+from searchat.palace.scheduler import DistillationScheduler, SchedulerStats
 from searchat.palace.storage import PalaceStorage
 
 logger = logging.getLogger(__name__)
@@ -105,6 +106,8 @@ class Distiller:
         self.duckdb_store = duckdb_store
         self._indexing_lock = indexing_lock or threading.Lock()
         self._distill_lock = threading.Lock()
+        self.last_run: SchedulerStats | None = None
+        self._embedding_cache = get_embedding_cache(config, search_dir)
         if embedder is not None:
             self.embedder = embedder
         else:
@@ -116,6 +119,15 @@ class Distiller:
         if self.llm is None:
             raise RuntimeError("No LLM configured for distillation.")
 
+        inputs = self.pending_inputs(conversation_id)
+        if not inputs:
+            return []
+
+        outputs = self.llm.distill(inputs)
+        return self.store_outputs(inputs, outputs)
+
+    def pending_inputs(self, conversation_id: str) -> list[DistillationInput]:
+        """LLM inputs for the exchanges of a conversation not yet distilled."""
         conv = self._read_conversation(conversation_id)
         if conv is None:
             raise KeyError(f"Conversation not found: {conversation_id}")
@@ -130,7 +142,6 @@ class Distiller:
 
         existing_keys = self.storage.get_existing_object_keys(conversation_id)
         inputs = []
-        exchange_meta = []
 
         for ply_start, ply_end in exchanges:
             if (conversation_id, ply_start, ply_end) in existing_keys:
@@ -145,20 +156,23 @@ class Distiller:
                 ply_start=ply_start,
                 ply_end=ply_end,
             ))
-            exchange_meta.append((ply_start, ply_end, exchange_msgs))
 
-        if not inputs:
-            return []
-
-        outputs = self.llm.distill(inputs)
+        return inputs
 
+    def store_outputs(
+        self,
+        inputs: list[DistillationInput],
+        outputs: list[DistillationOutput],
+    ) -> list[DistilledObject]:
+        """Turn LLM outputs into objects and rooms, then embed and write them."""
         objects = []
         rooms = []
         junctions = []
         now = datetime.utcnow()
 
-        for i, output in enumerate(outputs):
-            ply_start, ply_end, exchange_msgs = exchange_meta[i]
+        for inp, output in zip(inputs, outputs):
+            project_id = inp.project_id
+            exchange_msgs = inp.messages
 
             exchange_at = now
             if exchange_msgs:
@@ -181,9 +195,9 @@ class Distiller:
             obj = DistilledObject(
                 object_id=object_id,
                 project_id=project_id,
-                conversation_id=conversation_id,
-                ply_start=ply_start,
-                ply_end=ply_end,
+                conversation_id=inp.conversation_id,
+                ply_start=inp.ply_start,
+                ply_end=inp.ply_end,
                 files_touched=files_touched,
                 exchange_core=output.exchange_core,
                 specific_context=output.specific_context,
@@ -217,8 +231,16 @@ class Distiller:
         self.flush(objects, rooms, junctions)
         return objects
 
-    def distill_all_pending(self, project_id: str | None = None) -> DistillationStats:
-        """Distill all conversations not yet fully distilled."""
+    def distill_all_pending(
+        self,
+        project_id: str | None = None,
+        on_progress: Callable[[SchedulerStats], None] | None = None,
+    ) -> DistillationStats:
+        """Distill all conversations not yet fully distilled.
+
+        Runs on a ``DistillationScheduler`` sized by ``[distillation]``;
+        its final counters are kept on ``last_run``.
+        """
         if not self._distill_lock.acquire(blocking=False):
             logger.info("Distillation already in progress, skipping")
             return DistillationStats(
@@ -230,34 +252,27 @@ class Distiller:
             )
 
         try:
-            return self._distill_all_pending_locked(project_id)
+            return self._distill_all_pending_locked(project_id, on_progress)
         finally:
             self._distill_lock.release()
 
-    def _distill_all_pending_locked(self, project_id: str | None = None) -> DistillationStats:
+    def _distill_all_pending_locked(
+        self,
+        project_id: str | None = None,
+        on_progress: Callable[[SchedulerStats], None] | None = None,
+    ) -> DistillationStats:
+        if self.llm is None:
+            raise RuntimeError("No LLM configured for distillation.")
+
         start = time.time()
         conversation_ids = self.list_pending_conversations(project_id)
-
-        total_objects = 0
-        conversations_processed = 0
-
-        for conv_id in conversation_ids:
-            try:
-                new_objects = self.distill_conversation(conv_id)
-                total_objects += len(new_objects)
-                conversations_processed += 1
-            except (KeyError, ValueError, AttributeError) as e:
-                logger.warning("Failed to distill conversation %s: %s", conv_id, e)
-                self.storage.mark_conversation_skipped(conv_id, f"llm_error: {e}")
-                continue
-            except RuntimeError as e:
-                logger.warning("Failed to distill conversation %s (will retry): %s", conv_id, e)
-                continue
+        scheduler = DistillationScheduler.from_config(self.llm, self.config.distillation)
+        self.last_run = scheduler.run(self, conversation_ids, on_progress=on_progress)
 
         elapsed = time.time() - start
         return DistillationStats(
-            conversations_processed=conversations_processed,
-            objects_created=total_objects,
+            conversations_processed=self.last_run.conversations_done,
+            objects_created=self.last_run.objects_created,
             rooms_created=0,
             rooms_updated=0,
             distillation_time_seconds=elapsed,
@@ -274,8 +289,12 @@ class Distiller:
             return
 
         texts = [obj.distilled_text for obj in objects]
-        embeddings = self.embedder.encode(texts, batch_size=self.config.embedding.batch_size)
-        embeddings = np.array(embeddings, dtype=np.float32)
+        embeddings = cached_encode(
+            self._embedding_cache,
+            self.config.embedding.model,
+            texts,
+            lambda batch: self.embedder.encode(batch, batch_size=self.config.embedding.batch_size),
+        )
 
         vector_ids = self.faiss_index.append_vectors(
             object_ids=[obj.object_id for obj in objects],
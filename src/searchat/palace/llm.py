@@ -3,6 +3,10 @@
 Two execution modes:
 - Interactive: current agent session drives distillation directly.
 - Batch: CLIDistillationLLM invokes a subscription-backed CLI subprocess.
+
+``distill_packed`` distills several exchanges with one call; the CLI
+provider sends them as a single prompt and falls back to one call per
+exchange when the packed reply does not line up with the inputs.
 """
 from __future__ import annotations
 
@@ -20,6 +24,8 @@ from pathlib import Path
 from searchat.config.constants import (
     DEFAULT_DISTILLATION_CLI_MODEL,
     DEFAULT_DISTILLATION_CLI_MODEL_OPENAI,
+    DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS,
+    DEFAULT_DISTILLATION_PACKED_PROMPT,
     DEFAULT_DISTILLATION_PROMPT,
 )
 
@@ -56,10 +62,17 @@ class DistillationOutput:
 class DistillationLLM(ABC):
     """Abstract base for distillation LLM providers."""
 
+    # Key for per-provider concurrency limits in the scheduler.
+    provider: str = "default"
+
     @abstractmethod
     def distill(self, inputs: list[DistillationInput]) -> list[DistillationOutput]:
         ...
 
+    def distill_packed(self, inputs: list[DistillationInput]) -> list[DistillationOutput]:
+        """Distill ``inputs`` in as few calls as the provider allows."""
+        return self.distill(inputs)
+
 
 DISTILLATION_OUTPUT_SCHEMA = {
     "type": "object",
@@ -87,6 +100,15 @@ DISTILLATION_OUTPUT_SCHEMA = {
     "additionalProperties": False,
 }
 
+PACKED_DISTILLATION_OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "exchanges": {"type": "array", "items": DISTILLATION_OUTPUT_SCHEMA},
+    },
+    "required": ["exchanges"],
+    "additionalProperties": False,
+}
+
 
 class CLIDistillationLLM(DistillationLLM):
     """Batch mode: invokes a subscription-backed CLI subprocess."""
@@ -102,12 +124,16 @@ class CLIDistillationLLM(DistillationLLM):
         provider: str = "auto",
         model: str = DEFAULT_DISTILLATION_CLI_MODEL,
         prompt_template: str | None = None,
+        packed_prompt_template: str | None = None,
+        timeout_seconds: float = DEFAULT_DISTILLATION_CALL_TIMEOUT_SECONDS,
     ) -> None:
         requested = (provider or "auto").strip().lower()
         if requested not in {"claude", "openai", "auto"}:
             raise ValueError(f"Unsupported distillation provider: {provider!r}")
         self.provider, self.model = self._resolve_provider(requested, model)
         self.prompt_template = prompt_template or DEFAULT_DISTILLATION_PROMPT
+        self.packed_prompt_template = packed_prompt_template or DEFAULT_DISTILLATION_PACKED_PROMPT
+        self.timeout_seconds = timeout_seconds
 
     def distill(self, inputs: list[DistillationInput]) -> list[DistillationOutput]:
         cli_path = self._find_cli()
@@ -131,26 +157,75 @@ class CLIDistillationLLM(DistillationLLM):
             self._cleanup_side_effect_jsonls(session_dir, before_jsonls)
         return results
 
+    def distill_packed(self, inputs: list[DistillationInput]) -> list[DistillationOutput]:
+        if len(inputs) <= 1:
+            return self.distill(inputs)
+
+        cli_path = self._find_cli()
+        session_dir = self._get_session_dir()
+        before_jsonls = self._snapshot_jsonl_files(session_dir)
+        try:
+            prompt = self._build_packed_prompt(inputs)
+            try:
+                raw = self._invoke_cli(
+                    prompt, cli_path=cli_path, schema=PACKED_DISTILLATION_OUTPUT_SCHEMA,
+                )
+            except subprocess.TimeoutExpired as e:
+                raise RuntimeError(
+                    f"{self.provider} distillation CLI timed out for {len(inputs)} packed "
+                    f"exchanges (plies {inputs[0].ply_start}-{inputs[-1].ply_end})"
+                ) from e
+        finally:
+            self._cleanup_side_effect_jsonls(session_dir, before_jsonls)
+
+        try:
+            return self._parse_packed_response(raw, expected=len(inputs))
+        except (RuntimeError, KeyError, TypeError) as e:
+            logger.warning(
+                "Packed distillation reply unusable (%s); distilling %d exchanges one by one",
+                e, len(inputs),
+            )
+            return self.distill(inputs)
+
     def _build_prompt(self, inp: DistillationInput) -> str:
-        messages_text = "\n".join(
-            f"[{m.get('role', 'unknown')}] (seq {m.get('sequence', '?')}): {m.get('content', '')}"
-            for m in inp.messages
-        )
         return self.prompt_template.format(
             project_id=inp.project_id,
             ply_start=inp.ply_start,
             ply_end=inp.ply_end,
-            messages_text=messages_text,
+            messages_text=self._messages_text(inp),
         )
 
-    def _invoke_cli(self, prompt: str, cli_path: str | None = None) -> str:
+    def _build_packed_prompt(self, inputs: list[DistillationInput]) -> str:
+        exchanges_text = "\n\n".join(
+            f"### Exchange {i} (plies {inp.ply_start} - {inp.ply_end})\n{self._messages_text(inp)}"
+            for i, inp in enumerate(inputs, start=1)
+        )
+        return self.packed_prompt_template.format(
+            project_id=inputs[0].project_id,
+            exchange_count=len(inputs),
+            exchanges_text=exchanges_text,
+        )
+
+    @staticmethod
+    def _messages_text(inp: DistillationInput) -> str:
+        return "\n".join(
+            f"[{m.get('role', 'unknown')}] (seq {m.get('sequence', '?')}): {m.get('content', '')}"
+            for m in inp.messages
+        )
+
+    def _invoke_cli(
+        self,
+        prompt: str,
+        cli_path: str | None = None,
+        schema: dict = DISTILLATION_OUTPUT_SCHEMA,
+    ) -> str:
         if cli_path is None:
             cli_path = self._find_cli()
         output_path: Path | None = None
         schema_path: Path | None = None
 
         try:
-            cmd, output_path, schema_path = self._build_command(cli_path)
+            cmd, output_path, schema_path = self._build_command(cli_path, schema)
             result = subprocess.run(
                 cmd,
                 input=prompt,
@@ -158,7 +233,7 @@ class CLIDistillationLLM(DistillationLLM):
                 text=True,
                 encoding="utf-8",
                 errors="replace",
-                timeout=300,
+                timeout=self.timeout_seconds,
             )
             raw = self._extract_output(result, output_path)
         finally:
@@ -228,7 +303,7 @@ class CLIDistillationLLM(DistillationLLM):
         return cli_path
 
     def _build_command(
-        self, cli_path: str,
+        self, cli_path: str, schema: dict = DISTILLATION_OUTPUT_SCHEMA,
     ) -> tuple[list[str], Path | None, Path | None]:
         base_command = self._wrap_cli_command(cli_path)
         if self.provider == "claude":
@@ -236,7 +311,7 @@ class CLIDistillationLLM(DistillationLLM):
                 base_command + [
                     "--print", "--model", self.model,
                     "--output-format", "json",
-                    "--json-schema", json.dumps(DISTILLATION_OUTPUT_SCHEMA),
+                    "--json-schema", json.dumps(schema),
                     "--no-session-persistence",
                 ],
                 None,
@@ -250,7 +325,7 @@ class CLIDistillationLLM(DistillationLLM):
             mode="w", suffix=".json", encoding="utf-8", delete=False,
         )
         try:
-            json.dump(DISTILLATION_OUTPUT_SCHEMA, schema_file)
+            json.dump(schema, schema_file)
             schema_file.flush()
         finally:
             schema_file.close()
@@ -357,6 +432,29 @@ class CLIDistillationLLM(DistillationLLM):
         return "no stdout/stderr captured."
 
     def _parse_response(self, raw: str) -> DistillationOutput:
+        data = self._load_json(raw)
+        if not isinstance(data, dict):
+            raise RuntimeError(
+                f"Expected JSON object from distillation LLM, got {type(data).__name__}. "
+                f"Raw: {raw[:500]}"
+            )
+        return self._output_from_dict(data)
+
+    def _parse_packed_response(self, raw: str, expected: int) -> list[DistillationOutput]:
+        data = self._load_json(raw)
+        items = data.get("exchanges") if isinstance(data, dict) else data
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise RuntimeError(
+                f"Expected an 'exchanges' list from distillation LLM. Raw: {raw[:500]}"
+            )
+        if len(items) != expected:
+            raise RuntimeError(
+                f"Distillation LLM returned {len(items)} exchanges for {expected} packed inputs"
+            )
+        return [self._output_from_dict(item) for item in items]
+
+    @staticmethod
+    def _load_json(raw: str) -> object:
         text = raw.strip()
         if text.startswith("```"):
             lines = text.split("\n")
@@ -366,18 +464,14 @@ class CLIDistillationLLM(DistillationLLM):
             text = "\n".join(lines)
 
         try:
-            data = json.loads(text)
+            return json.loads(text)
         except json.JSONDecodeError as e:
             raise RuntimeError(
                 f"Malformed JSON response from distillation LLM: {e}\nRaw: {raw[:500]}"
             ) from e
 
-        if not isinstance(data, dict):
-            raise RuntimeError(
-                f"Expected JSON object from distillation LLM, got {type(data).__name__}. "
-                f"Raw: {raw[:500]}"
-            )
-
+    @staticmethod
+    def _output_from_dict(data: dict) -> DistillationOutput:
         rooms = [
             RoomAssignment(
                 room_type=r["room_type"],
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 if TYPE_CHECKING:
-    from sentence_transformers import SentenceTransformer
+    from searchat.services.semantic_model_service import EmbeddingService
 
 from searchat.config import Config
 from searchat.models.domain import DistilledObject, PalaceSearchResult, Room
@@ -42,7 +42,7 @@ class PalaceQuery:
         self,
         data_dir: Path,
         config: Config,
-        embedder: SentenceTransformer | None = None,
+        embedder: EmbeddingService | None = None,
         palace_storage: PalaceStorage | None = None,
     ) -> None:
         self.data_dir = data_dir
@@ -52,8 +52,8 @@ class PalaceQuery:
         if embedder is not None:
             self.embedder = embedder
         else:
-            from sentence_transformers import SentenceTransformer as ST
-            self.embedder = ST(config.embedding.model, device=config.embedding.get_device())
+            from searchat.services.semantic_model_service import shared_embedding_service
+            self.embedder = shared_embedding_service(config)
         self.bm25_index = PalaceBM25Index()
         self._bm25_initialized = False
         self._bm25_change_token = -1
@@ -0,0 +1,351 @@
+"""Concurrent job scheduler for ``Distiller.distill_all_pending``.
+
+Each pending conversation becomes a job. Its undistilled exchanges are
+packed into LLM calls of at most ``distillation.batch_size`` exchanges and
+about ``distillation.pack_token_budget`` prompt tokens, and the calls run on
+a pool of ``distillation.workers`` threads. ``provider_concurrency`` caps
+how many calls may be open against one provider at a time, whatever the
+pool size.
+
+Calls that fail with ``RuntimeError`` (CLI timeout or failure, malformed
+reply) are retried up to ``max_retries`` times with jittered exponential
+backoff. Any other error marks the conversation skipped, as the serial loop
+did.
+
+A conversation is written only once all its calls have succeeded, in one
+transaction, so committed conversations are the checkpoint: an interrupted
+run resumes with whatever ``list_pending_conversations`` still returns.
+Writes (embedding, FAISS, DuckDB) happen on the calling thread.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from searchat.core.indexing_pipeline import estimate_tokens
+from searchat.palace.llm import DistillationInput, DistillationLLM, DistillationOutput
+
+if TYPE_CHECKING:
+    from searchat.config.settings import DistillationConfig
+    from searchat.palace.distiller import Distiller
+
+logger = logging.getLogger(__name__)
+
+# Conversations prepared ahead of the pool, per worker.
+CONVERSATIONS_IN_FLIGHT_PER_WORKER = 2
+# Most recent call latencies kept for percentiles.
+LATENCY_SAMPLES = 4096
+
+_RETRYABLE = (RuntimeError,)
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Point-in-time counters for one scheduler run."""
+
+    conversations_total: int
+    conversations_done: int
+    conversations_skipped: int
+    conversations_failed: int
+    pending_conversations: int
+    queued_calls: int
+    running_calls: int
+    calls: int
+    retries: int
+    failed_calls: int
+    exchanges_distilled: int
+    objects_created: int
+    elapsed_seconds: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+
+    @property
+    def queue_depth(self) -> int:
+        """Conversations not yet dispatched plus calls waiting for a slot."""
+        return self.pending_conversations + self.queued_calls
+
+    @property
+    def exchanges_per_second(self) -> float:
+        return self.exchanges_distilled / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def conversations_per_minute(self) -> float:
+        return 60 * self.conversations_done / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def input_tokens(inp: DistillationInput) -> int:
+    return estimate_tokens("\n".join(m.get("content", "") or "" for m in inp.messages))
+
+
+def pack_inputs(
+    inputs: list[DistillationInput],
+    *,
+    token_budget: int,
+    max_exchanges: int,
+) -> list[list[DistillationInput]]:
+    """Group consecutive exchanges into calls within both limits.
+
+    An exchange larger than the budget gets a call of its own; a budget of
+    zero disables packing.
+    """
+    max_exchanges = max(1, max_exchanges) if token_budget > 0 else 1
+    batches: list[list[DistillationInput]] = []
+    current: list[DistillationInput] = []
+    current_tokens = 0
+    for inp in inputs:
+        tokens = input_tokens(inp)
+        if current and (len(current) >= max_exchanges or current_tokens + tokens > token_budget):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(inp)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass
+class _Job:
+    conversation_id: str
+    batches: list[list[DistillationInput]]
+    outputs: list[list[DistillationOutput] | None] = field(default_factory=list)
+    remaining: int = 0
+    error: BaseException | None = None
+
+    def __post_init__(self) -> None:
+        self.outputs = [None] * len(self.batches)
+        self.remaining = len(self.batches)
+
+
+class DistillationScheduler:
+    """Runs distillation jobs for many conversations on a bounded pool."""
+
+    def __init__(
+        self,
+        llm: DistillationLLM,
+        *,
+        workers: int,
+        provider_concurrency: Mapping[str, int] | None = None,
+        pack_token_budget: int = 0,
+        max_exchanges_per_call: int = 1,
+        max_retries: int = 0,
+        retry_backoff_seconds: float = 0.0,
+    ) -> None:
+        self.llm = llm
+        self.workers = max(1, int(workers))
+        self.provider = getattr(llm, "provider", "default")
+        limit = (provider_concurrency or {}).get(self.provider, self.workers)
+        self.provider_limit = max(1, min(self.workers, int(limit)))
+        self.pack_token_budget = max(0, int(pack_token_budget))
+        self.max_exchanges_per_call = max(1, int(max_exchanges_per_call))
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff_seconds = max(0.0, float(retry_backoff_seconds))
+
+        self._slots = threading.BoundedSemaphore(self.provider_limit)
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._started = time.perf_counter()
+        self._conversations_total = 0
+        self._conversations_done = 0
+        self._conversations_skipped = 0
+        self._conversations_failed = 0
+        self._pending_conversations = 0
+        self._queued_calls = 0
+        self._running_calls = 0
+        self._calls = 0
+        self._retries = 0
+        self._failed_calls = 0
+        self._exchanges = 0
+        self._objects = 0
+
+    @classmethod
+    def from_config(cls, llm: DistillationLLM, config: DistillationConfig) -> DistillationScheduler:
+        return cls(
+            llm,
+            workers=config.workers,
+            provider_concurrency=config.provider_concurrency,
+            pack_token_budget=config.pack_token_budget,
+            max_exchanges_per_call=config.batch_size,
+            max_retries=config.max_retries,
+            retry_backoff_seconds=config.retry_backoff_seconds,
+        )
+
+    def run(
+        self,
+        distiller: Distiller,
+        conversation_ids: Iterable[str],
+        on_progress: Callable[[SchedulerStats], None] | None = None,
+    ) -> SchedulerStats:
+        """Distill ``conversation_ids``; returns the final counters."""
+        waiting = deque(conversation_ids)
+        with self._lock:
+            self._started = time.perf_counter()
+            self._conversations_total = len(waiting)
+            self._pending_conversations = len(waiting)
+
+        window = self.workers * CONVERSATIONS_IN_FLIGHT_PER_WORKER
+        futures: dict[Future, tuple[_Job, int]] = {}
+        jobs_in_flight = 0
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="searchat-distill")
+        try:
+            while waiting or futures:
+                while waiting and jobs_in_flight < window:
+                    conversation_id = waiting.popleft()
+                    with self._lock:
+                        self._pending_conversations -= 1
+                    job = self._prepare(distiller, conversation_id)
+                    if job is None:
+                        self._progress(on_progress)
+                        continue
+                    jobs_in_flight += 1
+                    for index, batch in enumerate(job.batches):
+                        with self._lock:
+                            self._queued_calls += 1
+                        futures[pool.submit(self._call, batch)] = (job, index)
+
+                if not futures:
+                    continue
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, index = futures.pop(future)
+                    try:
+                        job.outputs[index] = future.result()
+                    except Exception as e:
+                        job.error = job.error or e
+                    job.remaining -= 1
+                    if job.remaining == 0:
+                        jobs_in_flight -= 1
+                        self._finish(distiller, job)
+                        self._progress(on_progress)
+        finally:
+            # Uncommitted conversations stay pending for the next run.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return self.stats()
+
+    def stats(self) -> SchedulerStats:
+        with self._lock:
+            latencies = np.array(self._latencies) if self._latencies else None
+            p50, p95 = np.percentile(latencies, [50, 95]) if latencies is not None else (0.0, 0.0)
+            return SchedulerStats(
+                conversations_total=self._conversations_total,
+                conversations_done=self._conversations_done,
+                conversations_skipped=self._conversations_skipped,
+                conversations_failed=self._conversations_failed,
+                pending_conversations=self._pending_conversations,
+                queued_calls=self._queued_calls,
+                running_calls=self._running_calls,
+                calls=self._calls,
+                retries=self._retries,
+                failed_calls=self._failed_calls,
+                exchanges_distilled=self._exchanges,
+                objects_created=self._objects,
+                elapsed_seconds=time.perf_counter() - self._started,
+                latency_p50_ms=float(p50),
+                latency_p95_ms=float(p95),
+                latency_max_ms=float(latencies.max()) if latencies is not None else 0.0,
+            )
+
+    def _prepare(self, distiller: Distiller, conversation_id: str) -> _Job | None:
+        try:
+            inputs = distiller.pending_inputs(conversation_id)
+        except (KeyError, ValueError, AttributeError) as e:
+            logger.warning("Failed to distill conversation %s: %s", conversation_id, e)
+            distiller.storage.mark_conversation_skipped(conversation_id, f"llm_error: {e}")
+            with self._lock:
+                self._conversations_skipped += 1
+            return None
+        if not inputs:
+            with self._lock:
+                self._conversations_done += 1
+            return None
+        batches = pack_inputs(
+            inputs,
+            token_budget=self.pack_token_budget,
+            max_exchanges=self.max_exchanges_per_call,
+        )
+        return _Job(conversation_id=conversation_id, batches=batches)
+
+    def _call(self, batch: list[DistillationInput]) -> list[DistillationOutput]:
+        """One packed LLM call with retries; runs on a pool thread."""
+        attempt = 0
+        while True:
+            with self._slots:
+                with self._lock:
+                    if attempt == 0:
+                        self._queued_calls -= 1
+                    self._running_calls += 1
+                start = time.perf_counter()
+                try:
+                    outputs = self.llm.distill_packed(batch)
+                    error: BaseException | None = None
+                except Exception as e:
+                    outputs, error = [], e
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._running_calls -= 1
+                    self._calls += 1
+                    self._latencies.append(elapsed_ms)
+                    if error is not None:
+                        self._failed_calls += 1
+
+            if error is None:
+                if len(outputs) != len(batch):
+                    raise ValueError(
+                        f"Distillation LLM returned {len(outputs)} outputs for {len(batch)} exchanges"
+                    )
+                return outputs
+            if not isinstance(error, _RETRYABLE) or attempt >= self.max_retries:
+                raise error
+            delay = self.retry_backoff_seconds * (2 ** attempt) * (0.5 + random.random() / 2)
+            attempt += 1
+            with self._lock:
+                self._retries += 1
+            logger.info(
+                "Distillation call failed (%s); retry %d/%d in %.1fs",
+                error, attempt, self.max_retries, delay,
+            )
+            time.sleep(delay)
+
+    def _finish(self, distiller: Distiller, job: _Job) -> None:
+        conversation_id = job.conversation_id
+        if job.error is not None:
+            if isinstance(job.error, _RETRYABLE):
+                logger.warning(
+                    "Failed to distill conversation %s (will retry): %s", conversation_id, job.error,
+                )
+                with self._lock:
+                    self._conversations_failed += 1
+            else:
+                logger.warning("Failed to distill conversation %s: %s", conversation_id, job.error)
+                distiller.storage.mark_conversation_skipped(conversation_id, f"llm_error: {job.error}")
+                with self._lock:
+                    self._conversations_skipped += 1
+            return
+
+        inputs = [inp for batch in job.batches for inp in batch]
+        outputs = [out for batch_outputs in job.outputs for out in batch_outputs or []]
+        try:
+            objects = distiller.store_outputs(inputs, outputs)
+        except Exception as e:
+            logger.warning("Failed to store distillation for %s (will retry): %s", conversation_id, e)
+            with self._lock:
+                self._conversations_failed += 1
+            return
+        with self._lock:
+            self._conversations_done += 1
+            self._exchanges += len(inputs)
+            self._objects += len(objects)
+
+    def _progress(self, on_progress: Callable[[SchedulerStats], None] | None) -> None:
+        if on_progress is not None:
+            on_progress(self.stats())
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import logging
 import re
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -10,7 +16,14 @@ import duckdb
 import numpy as np
 
 from searchat.config import Config
+from searchat.config.constants import (
+    DEFAULT_ANALYTICS_BUFFER_SIZE,
+    DEFAULT_ANALYTICS_FLUSH_BATCH,
+    DEFAULT_ANALYTICS_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_ANALYTICS_RETENTION_INTERVAL_SECONDS,
+)
 
+logger = logging.getLogger(__name__)
 
 _FILENAME_DATE_RE = re.compile(r"^search_logs_(\d{4}-\d{2}-\d{2})$")
 
@@ -22,14 +35,41 @@ class AnalyticsConfigSnapshot:
 
 
 class SearchAnalyticsService:
-    """Service for tracking and analyzing search queries."""
+    """Service for tracking and analyzing search queries.
 
-    def __init__(self, config: Config):
+    ``log_search`` only appends to an in-memory ring buffer; a background
+    writer drains it in batched inserts and applies retention on a timer.
+    Reads flush pending events first, and ``close`` flushes on shutdown.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        buffer_size: int = DEFAULT_ANALYTICS_BUFFER_SIZE,
+        flush_interval_seconds: float = DEFAULT_ANALYTICS_FLUSH_INTERVAL_SECONDS,
+        flush_batch: int = DEFAULT_ANALYTICS_FLUSH_BATCH,
+        retention_interval_seconds: float = DEFAULT_ANALYTICS_RETENTION_INTERVAL_SECONDS,
+    ):
         self._config = config
         self.logs_dir = Path(config.paths.search_directory) / "analytics"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self._db_path = self.logs_dir / "analytics.duckdb"
 
+        self._buffer: deque[list[Any]] = deque(maxlen=max(1, int(buffer_size)))
+        self._buffer_lock = threading.Lock()
+        # Serializes every connection this service opens: DuckDB refuses a
+        # read-only open while a read-write one is live in the same process.
+        self._db_lock = threading.RLock()
+        self._flush_interval = float(flush_interval_seconds)
+        self._flush_batch = max(1, int(flush_batch))
+        self._retention_interval = float(retention_interval_seconds)
+        self._last_retention: float | None = None
+        self._dropped = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer: threading.Thread | None = None
+
         self._ensure_db()
 
     def config_snapshot(self) -> AnalyticsConfigSnapshot:
@@ -47,7 +87,7 @@ class SearchAnalyticsService:
         *,
         tool_filter: str | None = None,
     ) -> None:
-        """Log a search query (opt-in)."""
+        """Queue a search query for logging (opt-in); never touches the database."""
 
         if not self._config.analytics.enabled:
             return
@@ -55,32 +95,82 @@ class SearchAnalyticsService:
         normalized_query = query.strip()
         now = datetime.now(timezone.utc)
         tool_value = (tool_filter or "all").strip().lower() or "all"
+        row = [normalized_query, int(result_count), str(search_mode), now, int(search_time_ms), tool_value]
+
+        with self._buffer_lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(row)
+            pending = len(self._buffer)
+            self._ensure_writer()
+        if pending >= self._flush_batch:
+            self._wake.set()
+
+    @property
+    def pending_count(self) -> int:
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    @property
+    def dropped_count(self) -> int:
+        """Events discarded because the buffer was full."""
+        with self._buffer_lock:
+            return self._dropped
+
+    def flush(self) -> int:
+        """Write pending events in one batch; returns how many were written."""
+
+        with self._db_lock:
+            with self._buffer_lock:
+                rows = list(self._buffer)
+                self._buffer.clear()
+            if rows:
+                try:
+                    with self._connect() as con:
+                        con.executemany(
+                            """
+                            INSERT INTO search_history (
+                                query,
+                                result_count,
+                                search_mode,
+                                timestamp,
+                                search_time_ms,
+                                tool_filter
+                            ) VALUES (?, ?, ?, ?, ?, ?)
+                            """,
+                            rows,
+                        )
+                except Exception:
+                    # Put the batch back (ahead of newer events) for the next flush.
+                    with self._buffer_lock:
+                        self._buffer.extendleft(reversed(rows))
+                    raise
+        return len(rows)
+
+    def apply_retention(self) -> None:
+        """Delete rows and legacy parquet logs older than the retention window."""
+
+        cutoff = self._cutoff(int(self._config.analytics.retention_days))
+        with self._db_lock:
+            with self._connect() as con:
+                con.execute("DELETE FROM search_history WHERE timestamp < ?", [cutoff])
+        self._rotate_old_parquet_logs()
 
-        with self._connect() as con:
-            con.execute(
-                """
-                INSERT INTO search_history (
-                    query,
-                    result_count,
-                    search_mode,
-                    timestamp,
-                    search_time_ms,
-                    tool_filter
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                [normalized_query, int(result_count), str(search_mode), now, int(search_time_ms), tool_value],
-            )
-
-            cutoff = now - timedelta(days=int(self._config.analytics.retention_days))
-            con.execute("DELETE FROM search_history WHERE timestamp < ?", [cutoff])
+    def close(self) -> None:
+        """Stop the background writer and flush pending events."""
 
-        self._rotate_old_parquet_logs()
+        self._stop.set()
+        self._wake.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=max(5.0, self._flush_interval * 2))
+        self.flush()
 
     def get_stats_summary(self, *, days: int = 7) -> dict[str, Any]:
         """Get summary statistics for recent searches."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             result = con.execute(
                 """
                 SELECT
@@ -126,7 +216,7 @@ class SearchAnalyticsService:
         """Get most frequent search queries."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT
@@ -155,11 +245,33 @@ class SearchAnalyticsService:
             for row in rows
         ]
 
+    def get_successful_queries(self, *, limit: int = 1000, days: int = 90) -> list[tuple[str, int]]:
+        """``(query, search_count)`` for queries that returned results, most frequent first."""
+
+        cutoff = self._cutoff(days)
+        with self._read() as con:
+            rows = con.execute(
+                """
+                SELECT query, COUNT(*) AS search_count
+                FROM search_history
+                WHERE timestamp >= ?
+                  AND result_count > 0
+                  AND query != ''
+                  AND query != '*'
+                GROUP BY query
+                ORDER BY search_count DESC, query
+                LIMIT ?
+                """,
+                [cutoff, int(limit)],
+            ).fetchall()
+
+        return [(row[0], int(row[1])) for row in rows]
+
     def get_dead_end_queries(self, *, limit: int = 10, days: int = 7) -> list[dict[str, Any]]:
         """Get queries that returned few or no results (dead ends)."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT
@@ -191,7 +303,7 @@ class SearchAnalyticsService:
         """Get daily trends for searches and latency."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT
@@ -223,7 +335,7 @@ class SearchAnalyticsService:
         """Get hour-of-day x day-of-week heatmap counts."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT
@@ -245,7 +357,7 @@ class SearchAnalyticsService:
         """Compare tool-filter usage and performance."""
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT
@@ -278,7 +390,7 @@ class SearchAnalyticsService:
             raise ValueError("k must be between 2 and 20")
 
         cutoff = self._cutoff(days)
-        with self._connect(read_only=True) as con:
+        with self._read() as con:
             rows = con.execute(
                 """
                 SELECT query, COUNT(*) AS count
@@ -352,6 +464,45 @@ class SearchAnalyticsService:
                 """
             )
 
+    @contextmanager
+    def _read(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Read-only connection that sees every event logged so far."""
+
+        with self._db_lock:
+            self.flush()
+            with self._connect(read_only=True) as con:
+                yield con
+
+    def _ensure_writer(self) -> None:
+        # Caller holds _buffer_lock.
+        if self._writer is not None or self._stop.is_set():
+            return
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="searchat-analytics-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+                self._apply_retention_if_due()
+            except Exception as exc:
+                logger.warning("Failed to flush search analytics: %s", exc)
+
+    def _apply_retention_if_due(self) -> None:
+        now = time.monotonic()
+        if self._last_retention is not None and now - self._last_retention < self._retention_interval:
+            return
+        self.apply_retention()
+        self._last_retention = now
+
     def _connect(self, *, read_only: bool = False) -> duckdb.DuckDBPyConnection:
         if read_only:
             return duckdb.connect(str(self._db_path), read_only=True)
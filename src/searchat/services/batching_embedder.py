@@ -0,0 +1,189 @@
+"""Micro-batching wrapper around a process-wide embedding model.
+
+Query-time callers (search engines, palace, expertise and the contradiction
+detector through its expertise index) embed one short text per request.
+Under concurrent load that is many batch-size-1 forward passes. Wrapped in
+:class:`BatchingEmbeddingService`, single texts and small lists that arrive
+within ``window_ms`` of each other (or while the model is busy with the
+previous batch) are encoded together, one forward pass at a time. A small
+LRU keeps recent query vectors, so repeated queries skip the model.
+
+Large lists (indexing batches) and calls with options that change the output
+type (tensors, token embeddings) go straight to the model.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from searchat.services.semantic_model_service import EmbeddingService
+
+# Inputs with more texts than this are already batched by the caller.
+DEFAULT_COALESCE_LIMIT = 8
+DEFAULT_MAX_BATCH = 64
+
+# encode() options that keep the result a numpy array; anything else bypasses
+# batching. Only normalize_embeddings changes the vectors, so it keys batches.
+_BATCHABLE_KWARGS = frozenset({"normalize_embeddings", "convert_to_numpy", "show_progress_bar"})
+
+
+@dataclass(frozen=True)
+class BatchingStats:
+    """Counters for one batching embedder."""
+
+    requests: int
+    batches: int
+    batched_texts: int
+    cache_hits: int
+    cache_entries: int
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.batched_texts / self.batches if self.batches else 0.0
+
+
+class _Batch:
+    __slots__ = ("texts", "full", "done", "vectors", "error")
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.vectors: np.ndarray | None = None
+        self.error: BaseException | None = None
+
+
+class BatchingEmbeddingService:
+    """Coalesces concurrent small ``encode`` calls into shared forward passes."""
+
+    def __init__(
+        self,
+        model: EmbeddingService,
+        *,
+        window_ms: float,
+        cache_size: int,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        coalesce_limit: int = DEFAULT_COALESCE_LIMIT,
+    ) -> None:
+        self.model = model
+        self._window_s = max(0.0, float(window_ms)) / 1000
+        self._cache_size = max(0, int(cache_size))
+        self._max_batch = max(1, int(max_batch))
+        self._coalesce_limit = max(1, min(int(coalesce_limit), self._max_batch))
+
+        self._lock = threading.Lock()
+        # One forward pass at a time; a batch keeps filling while it waits.
+        self._model_lock = threading.Lock()
+        self._open: dict[bool, _Batch] = {}
+        self._cache: OrderedDict[tuple[bool, str], np.ndarray] = OrderedDict()
+        self._requests = 0
+        self._batches = 0
+        self._batched_texts = 0
+        self._cache_hits = 0
+
+    def encode(self, sentences: Any, **kwargs: Any) -> Any:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else sentences
+        if not self._batchable(texts, kwargs):
+            with self._model_lock:
+                return self.model.encode(sentences, **kwargs)
+
+        normalize = bool(kwargs.get("normalize_embeddings", False))
+        vectors: list[np.ndarray | None] = [None] * len(texts)
+        missing: list[int] = []
+        with self._lock:
+            self._requests += 1
+            for i, text in enumerate(texts):
+                hit = self._cache.get((normalize, text))
+                if hit is None:
+                    missing.append(i)
+                else:
+                    self._cache.move_to_end((normalize, text))
+                    self._cache_hits += 1
+                    vectors[i] = hit
+
+        if missing:
+            rows = self._encode_coalesced(normalize, [texts[i] for i in missing])
+            with self._lock:
+                for i, row in zip(missing, rows):
+                    vectors[i] = row
+                    if self._cache_size:
+                        self._cache[(normalize, texts[i])] = row
+                        self._cache.move_to_end((normalize, texts[i]))
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        # Callers own the result (e.g. faiss.normalize_L2 works in place).
+        if single:
+            return np.array(vectors[0], copy=True)
+        return np.stack(vectors)
+
+    def stats(self) -> BatchingStats:
+        with self._lock:
+            return BatchingStats(
+                requests=self._requests,
+                batches=self._batches,
+                batched_texts=self._batched_texts,
+                cache_hits=self._cache_hits,
+                cache_entries=len(self._cache),
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    def _batchable(self, texts: Any, kwargs: dict[str, Any]) -> bool:
+        if not isinstance(texts, (list, tuple)) or not texts:
+            return False
+        if len(texts) > self._coalesce_limit or not all(isinstance(t, str) for t in texts):
+            return False
+        if not _BATCHABLE_KWARGS.issuperset(kwargs):
+            return False
+        return kwargs.get("convert_to_numpy", True) is True
+
+    def _encode_coalesced(self, normalize: bool, texts: list[str]) -> np.ndarray:
+        with self._lock:
+            batch = self._open.get(normalize)
+            leader = batch is None or len(batch.texts) + len(texts) > self._max_batch
+            if leader:
+                batch = _Batch()
+                self._open[normalize] = batch
+            start = len(batch.texts)
+            batch.texts.extend(texts)
+            if len(batch.texts) >= self._max_batch:
+                batch.full.set()
+
+        if not leader:
+            batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+            assert batch.vectors is not None
+            return batch.vectors[start:start + len(texts)]
+
+        batch.full.wait(self._window_s)
+        try:
+            with self._model_lock:
+                # Close the batch only once the model is free, so requests
+                # arriving during the previous forward pass ride along.
+                with self._lock:
+                    if self._open.get(normalize) is batch:
+                        del self._open[normalize]
+                    batch_texts = list(batch.texts)
+                    self._batches += 1
+                    self._batched_texts += len(batch_texts)
+                encoded = self.model.encode(
+                    batch_texts,
+                    convert_to_numpy=True,
+                    normalize_embeddings=normalize,
+                    show_progress_bar=False,
+                )
+                batch.vectors = np.asarray(encoded, dtype=np.float32).reshape(len(batch_texts), -1)
+        except BaseException as exc:
+            batch.error = exc
+            raise
+        finally:
+            batch.done.set()
+        return batch.vectors[start:start + len(texts)]
@@ -1,11 +1,16 @@
 """Retrieval-facing service contracts and construction helpers."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from searchat.config import Config
+
+if TYPE_CHECKING:
+    from searchat.services.semantic_model_service import EmbeddingService, RerankingService
+    from searchat.storage.unified_storage import UnifiedStorage
 from searchat.models import SearchFilters, SearchMode, SearchResults
 
 
@@ -54,6 +59,15 @@ class SemanticRetrievalService(RetrievalService, Protocol):
     def find_similar_vector_hits(self, text: str, k: int) -> list[SemanticVectorHit]:
         """Search the semantic index for nearest-neighbor vector hits."""
 
+    def similar_conversation_rows(
+        self,
+        vector_hits: list[SemanticVectorHit],
+        *,
+        exclude_conversation_id: str,
+        limit: int,
+    ) -> list[tuple]:
+        """Hydrate vector hits into one conversation row per neighbour."""
+
     def describe_capabilities(self) -> RetrievalCapabilities:
         """Describe the current semantic and reranking capabilities."""
 
@@ -65,8 +79,25 @@ def build_retrieval_service(
     search_dir: Path,
     *,
     config: Config,
+    storage: UnifiedStorage | None = None,
+    embedding_provider: Callable[[Config], EmbeddingService] | None = None,
+    reranking_provider: Callable[[Config], RerankingService] | None = None,
 ) -> SemanticRetrievalService:
-    """Create the retrieval service for a dataset root."""
+    """Create the retrieval service for a dataset root.
+
+    ``storage`` shares an already-open DuckDB store with the engine when
+    ``[storage].vector_backend = "duckdb"``; otherwise the engine opens
+    its own store lazily on first semantic query. ``embedding_provider``
+    replaces the per-engine model load (e.g. ``shared_embedding_service``),
+    and ``reranking_provider`` does the same for the cross-encoder.
+    """
     from searchat.core.unified_search import UnifiedSearchEngine
 
-    return UnifiedSearchEngine(search_dir, config)
+    kwargs: dict[str, Any] = {}
+    if storage is not None:
+        kwargs["storage"] = storage
+    if embedding_provider is not None:
+        kwargs["embedding_provider"] = embedding_provider
+    if reranking_provider is not None:
+        kwargs["reranking_provider"] = reranking_provider
+    return UnifiedSearchEngine(search_dir, config, **kwargs)
@@ -1,6 +1,7 @@
 """Service-layer builders for semantic embedding and reranking models."""
 from __future__ import annotations
 
+import threading
 from typing import Any, Protocol
 
 from searchat.config import Config
@@ -43,6 +44,42 @@ def build_embedding_service(config: Config) -> EmbeddingService:
         ) from exc
 
 
+_SHARED_EMBEDDERS: dict[tuple[str, str], EmbeddingService] = {}
+_SHARED_EMBEDDERS_LOCK = threading.Lock()
+
+
+def shared_embedding_service(config: Config) -> EmbeddingService:
+    """Process-wide embedding model per (model, device), built on first use.
+
+    Long-lived processes that hold several search engines (the MCP server's
+    per-dataset registry, the API's engines, palace and expertise indexes)
+    load the model once instead of once per consumer. The model is wrapped in
+    a :class:`~searchat.services.batching_embedder.BatchingEmbeddingService`,
+    so concurrent query embeddings share forward passes.
+    """
+    from searchat.config.constants import (
+        DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS,
+        DEFAULT_EMBEDDING_QUERY_CACHE_SIZE,
+    )
+    from searchat.services.batching_embedder import BatchingEmbeddingService
+
+    key = (config.embedding.model, str(config.embedding.get_device()))
+    with _SHARED_EMBEDDERS_LOCK:
+        service = _SHARED_EMBEDDERS.get(key)
+        if service is None:
+            service = BatchingEmbeddingService(
+                build_embedding_service(config),
+                window_ms=getattr(
+                    config.embedding, "query_batch_window_ms", DEFAULT_EMBEDDING_QUERY_BATCH_WINDOW_MS
+                ),
+                cache_size=getattr(
+                    config.embedding, "query_cache_size", DEFAULT_EMBEDDING_QUERY_CACHE_SIZE
+                ),
+            )
+            _SHARED_EMBEDDERS[key] = service
+        return service
+
+
 def build_reranking_service(config: Config) -> RerankingService:
     """Build the configured reranking model."""
     try:
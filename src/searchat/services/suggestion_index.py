@@ -0,0 +1,293 @@
+"""In-memory prefix index behind ``/api/search/suggestions``."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+import numpy as np
+
+from searchat.config.constants import DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES
+from searchat.core.code_index import CodeIndex, code_index_path
+
+logger = logging.getLogger(__name__)
+
+MAX_SUGGESTIONS = 20
+MIN_WORD_LENGTH = 3
+# Prefixes matching more keys than this get their top suggestions precomputed;
+# smaller ranges are ranked per request.
+HEAVY_PREFIX_KEYS = 256
+# A query that already found results counts as much as this many title hits.
+QUERY_WEIGHT = 5
+SUCCESSFUL_QUERY_LIMIT = 5000
+
+_KEY_END = chr(0x10FFFF)
+
+# key -> [weight, display text]
+_Terms = dict[str, list]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    keys: list[str]
+    display: list[str]
+    rank: np.ndarray
+    top: dict[str, list[int]]
+
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        key = prefix.strip().lower()
+        if not key:
+            return []
+        ids = self.top.get(key)
+        if ids is None:
+            lo = bisect_left(self.keys, key)
+            hi = bisect_left(self.keys, key + _KEY_END, lo)
+            ids = _best(self.rank, lo, hi, limit)
+        return [self.display[i] for i in ids[:limit]]
+
+
+class SuggestionIndex:
+    """Frequency-weighted prefix index over the search vocabulary.
+
+    Entries are title words, bigrams and full titles, project names, code
+    symbols and past queries that returned results, weighted by how often
+    they occur. Lower-cased keys live in one sorted list, so a prefix is a
+    contiguous range found by binary search.
+
+    The first lookup builds the index. Counts are kept per project, so after
+    ``invalidate(changed_project_ids)`` a background thread reloads only those
+    projects while lookups keep using the previous snapshot. At most
+    ``max_entries`` of the heaviest entries are served.
+    """
+
+    def __init__(
+        self,
+        store,
+        search_dir: Path,
+        *,
+        analytics=None,
+        max_entries: int = DEFAULT_SUGGESTION_INDEX_MAX_ENTRIES,
+    ) -> None:
+        self._store = store
+        self._search_dir = Path(search_dir)
+        self._analytics = analytics
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        # Guards the pending-reload flags, so invalidation never waits on a build.
+        self._pending_lock = threading.Lock()
+        self._projects: dict[str, _Terms] = {}
+        self._snapshot: _Snapshot | None = None
+        self._reload_all = True
+        self._changed: set[str] = set()
+        self._refresher: threading.Thread | None = None
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        """Up to ``limit`` suggestions starting with ``prefix``, heaviest first."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        elif self._reload_all or self._changed:
+            self._refresh_in_background()
+        return snapshot.suggest(prefix, min(int(limit), MAX_SUGGESTIONS))
+
+    def invalidate(self, changed_project_ids: Iterable[str] | None = None) -> None:
+        """Mark ``changed_project_ids`` (``None``: everything) for reloading."""
+        with self._pending_lock:
+            if changed_project_ids is None:
+                self._reload_all = True
+            else:
+                self._changed.update(changed_project_ids)
+
+    @property
+    def size(self) -> int:
+        snapshot = self._snapshot
+        return len(snapshot.keys) if snapshot is not None else 0
+
+    def _refresh_in_background(self) -> None:
+        with self._pending_lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._background_refresh, name="searchat-suggestions-refresh", daemon=True,
+            )
+            self._refresher.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:
+            # Pending changes stay queued; the next lookup tries again.
+            logger.warning("Failed to refresh search suggestions: %s", exc)
+
+    def refresh(self) -> _Snapshot:
+        """Apply pending invalidations now (blocking)."""
+        with self._lock:
+            with self._pending_lock:
+                reload_all, changed = self._reload_all, self._changed
+                self._reload_all, self._changed = False, set()
+            if self._snapshot is not None and not reload_all and not changed:
+                return self._snapshot
+            try:
+                if reload_all:
+                    projects = self._load_projects(None)
+                else:
+                    projects = dict(self._projects)
+                    for project_id in changed:
+                        projects.pop(project_id, None)
+                    projects.update(self._load_projects(sorted(changed)))
+                snapshot = _freeze(projects, self._load_queries(), self._max_entries)
+            except BaseException:
+                with self._pending_lock:
+                    self._reload_all = self._reload_all or reload_all
+                    self._changed |= changed
+                raise
+            self._projects = projects
+            self._snapshot = snapshot
+            return snapshot
+
+    def _load_projects(self, project_ids: Sequence[str] | None) -> dict[str, _Terms]:
+        projects: dict[str, _Terms] = {}
+        for project_id, title in self._store.list_conversation_titles(project_ids):
+            terms = projects.setdefault(project_id, {})
+            _add(terms, project_id, 1)
+            for phrase in _title_phrases(title):
+                _add(terms, phrase, 1)
+        for project_id, symbol, blocks in self._symbol_counts(project_ids):
+            _add(projects.setdefault(project_id, {}), symbol, int(blocks))
+        return projects
+
+    def _symbol_counts(self, project_ids: Sequence[str] | None) -> list[tuple[str, str, int]]:
+        code_dir = self._search_dir / "data" / "code"
+        if not code_dir.exists() or not any(code_dir.glob("*.parquet")):
+            return []
+        rows = CodeIndex(code_index_path(self._search_dir)).symbol_counts(code_dir, project_ids)
+        if rows is not None:
+            return rows
+
+        where = "WHERE list_contains(?, project_id)" if project_ids is not None else ""
+        params: list[object] = [str(code_dir / "*.parquet")]
+        if project_ids is not None:
+            params.append(list(project_ids))
+        con = duckdb.connect(database=":memory:")
+        try:
+            return con.execute(
+                f"""
+                SELECT project_id, symbol, count(*)
+                FROM (
+                    SELECT project_id, unnest(list_distinct(list_concat(functions, classes, imports))) AS symbol
+                    FROM parquet_scan(?)
+                    {where}
+                )
+                WHERE symbol IS NOT NULL AND symbol <> ''
+                GROUP BY ALL
+                """,
+                params,
+            ).fetchall()
+        except duckdb.Error as exc:
+            # Code files written before symbol extraction existed.
+            logger.debug("Skipping code symbols for suggestions: %s", exc)
+            return []
+        finally:
+            con.close()
+
+    def _load_queries(self) -> list[tuple[str, int]]:
+        if self._analytics is None:
+            return []
+        try:
+            return self._analytics.get_successful_queries(limit=SUCCESSFUL_QUERY_LIMIT)
+        except Exception as exc:
+            logger.debug("Skipping analytics queries for suggestions: %s", exc)
+            return []
+
+
+def _title_phrases(title: str) -> Iterator[str]:
+    """The title itself, its words and word bigrams, each once."""
+    words = [
+        cleaned
+        for cleaned in ("".join(c for c in word if c.isalnum() or c in "-_") for word in title.split())
+        if cleaned
+    ]
+    phrases = [title.strip()]
+    phrases.extend(word for word in words if len(word) >= MIN_WORD_LENGTH)
+    phrases.extend(f"{first} {second}" for first, second in zip(words, words[1:]))
+    seen: set[str] = set()
+    for phrase in phrases:
+        key = phrase.lower()
+        if phrase and key not in seen:
+            seen.add(key)
+            yield phrase
+
+
+def _add(terms: _Terms, text: str, weight: int) -> None:
+    key = text.lower()
+    entry = terms.get(key)
+    if entry is None:
+        terms[key] = [weight, text]
+    else:
+        entry[0] += weight
+
+
+def _freeze(projects: dict[str, _Terms], queries: list[tuple[str, int]], max_entries: int) -> _Snapshot:
+    merged: _Terms = {}
+    for project_id in sorted(projects):
+        for key, (weight, text) in projects[project_id].items():
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [weight, text]
+            else:
+                entry[0] += weight
+    for query, count in queries:
+        _add(merged, query.strip(), count * QUERY_WEIGHT)
+
+    items: Iterable[tuple[str, list]] = merged.items()
+    if len(merged) > max_entries:
+        items = heapq.nlargest(max_entries, items, key=lambda item: item[1][0])
+    ordered = sorted(items)
+    keys = [key for key, _ in ordered]
+    display = [entry[1] for _, entry in ordered]
+    weights = np.fromiter((entry[0] for _, entry in ordered), dtype=np.int64, count=len(ordered))
+    lengths = np.fromiter((len(key) for key in keys), dtype=np.int64, count=len(keys))
+
+    # Heaviest first, then shorter, then alphabetical (keys are sorted).
+    order = np.lexsort((np.arange(len(keys)), lengths, -weights))
+    rank = np.empty(len(keys), dtype=np.int64)
+    rank[order] = np.arange(len(keys))
+    return _Snapshot(keys=keys, display=display, rank=rank, top=_heavy_prefixes(keys, rank))
+
+
+def _heavy_prefixes(keys: list[str], rank: np.ndarray) -> dict[str, list[int]]:
+    """Top suggestions for every prefix matching more than ``HEAVY_PREFIX_KEYS`` keys."""
+    top: dict[str, list[int]] = {}
+    stack = [("", 0, len(keys))]
+    while stack:
+        prefix, lo, hi = stack.pop()
+        depth = len(prefix) + 1
+        i = lo
+        while i < hi:
+            if len(keys[i]) < depth:
+                i += 1
+                continue
+            child = keys[i][:depth]
+            j = bisect_left(keys, child + _KEY_END, i, hi)
+            if j - i > HEAVY_PREFIX_KEYS:
+                top[child] = _best(rank, i, j, MAX_SUGGESTIONS)
+                stack.append((child, i, j))
+            i = j
+    return top
+
+
+def _best(rank: np.ndarray, lo: int, hi: int, limit: int) -> list[int]:
+    """Positions in ``[lo, hi)`` with the ``limit`` best ranks, best first."""
+    segment = rank[lo:hi]
+    if segment.size > limit:
+        picked = np.argpartition(segment, limit)[:limit]
+    else:
+        picked = np.arange(segment.size)
+    picked = picked[np.argsort(segment[picked])]
+    return (picked + lo).tolist()
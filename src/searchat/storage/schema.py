@@ -77,7 +77,11 @@ CREATE TABLE IF NOT EXISTS source_file_state (
     file_hash       VARCHAR,
     mtime_ns        BIGINT DEFAULT 0,
     error_message   TEXT,
-    updated_at      TIMESTAMP NOT NULL
+    updated_at      TIMESTAMP NOT NULL,
+    byte_offset     BIGINT,
+    next_sequence   INTEGER,
+    tail_checkpoint VARCHAR,
+    last_exchange_start INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS code_blocks (
@@ -128,6 +132,17 @@ def _run_migrations(conn: duckdb.DuckDBPyConnection) -> None:
     """Idempotent ALTER TABLE migrations for forward compatibility."""
     # Future migrations go here using ADD COLUMN IF NOT EXISTS
 
+    # Tail-append resume point for growing JSONL sessions.
+    for column, column_type in (
+        ("byte_offset", "BIGINT"),
+        ("next_sequence", "INTEGER"),
+        ("tail_checkpoint", "VARCHAR"),
+        ("last_exchange_start", "INTEGER"),
+    ):
+        conn.execute(
+            f"ALTER TABLE source_file_state ADD COLUMN IF NOT EXISTS {column} {column_type}"
+        )
+
 
 # ---------------------------------------------------------------------------
 # VSS (HNSW) indexes
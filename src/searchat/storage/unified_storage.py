@@ -4,18 +4,28 @@ Replaces per-query in-memory DuckDB connections with a persistent file
 that owns conversations, messages, exchanges, embeddings, file state,
 and code blocks. Thread safety: one shared connection, fresh cursors
 per read, thread-local cursors for writes.
+
+Bulk ingest (``upsert_exchanges``, ``upsert_embeddings``,
+``insert_code_blocks``, ``insert_messages``) registers a column batch as an
+Arrow table and issues a single ``INSERT ... SELECT``; wrap a file's writes
+in ``transaction()`` so they commit once.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 from dataclasses import dataclass
 
 import duckdb
+import numpy as np
+import pyarrow as pa
 
 from searchat.storage.schema import (
     EMBEDDING_DIM,
@@ -77,6 +87,15 @@ class UnifiedStorage:
         if not read_only:
             ensure_tables(self._conn)
 
+        if self._vss_available:
+            # Query-time beam width for HNSW top-k scans (read-only opens too).
+            # GLOBAL: extension options set per session are not seen by the
+            # cursors every query runs on.
+            try:
+                self._conn.execute(f"SET GLOBAL hnsw_ef_search = {int(hnsw_ef_search)}")
+            except duckdb.Error as exc:
+                log.warning("Failed to set hnsw_ef_search: %s", exc)
+
         if self._vss_available and not read_only:
             # Enable HNSW persistence for on-disk databases
             try:
@@ -123,6 +142,44 @@ class UnifiedStorage:
             self._local.write_cursor = cursor
         return cursor
 
+    @contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Group writes on this thread's write cursor into one transaction.
+
+        Nested calls join the outermost transaction. On error everything
+        written inside the block is rolled back.
+        """
+        cur = self._write_cursor()
+        depth = getattr(self._local, "tx_depth", 0)
+        if depth:
+            self._local.tx_depth = depth + 1
+            try:
+                yield cur
+            finally:
+                self._local.tx_depth = depth
+            return
+
+        cur.begin()
+        self._local.tx_depth = 1
+        try:
+            yield cur
+        except BaseException:
+            cur.rollback()
+            raise
+        else:
+            cur.commit()
+        finally:
+            self._local.tx_depth = 0
+
+    def _insert_table(self, sql: str, table: pa.Table) -> None:
+        """Run ``sql`` (which selects from ``batch``) against a registered Arrow table."""
+        cur = self._write_cursor()
+        cur.register("batch", table)
+        try:
+            cur.execute(sql)
+        finally:
+            cur.unregister("batch")
+
     # ------------------------------------------------------------------
     # StorageBackend protocol — V1 read methods
     # ------------------------------------------------------------------
@@ -138,6 +195,21 @@ class UnifiedStorage:
         finally:
             cur.close()
 
+    def list_conversation_titles(
+        self, project_ids: Sequence[str] | None = None,
+    ) -> list[tuple[str, str]]:
+        """``(project_id, title)`` for every titled conversation, optionally per project."""
+        sql = "SELECT project_id, title FROM conversations WHERE title IS NOT NULL AND title <> ''"
+        params: list[object] = []
+        if project_ids is not None:
+            sql += " AND list_contains(?, project_id)"
+            params.append(list(project_ids))
+        cur = self._read_cursor()
+        try:
+            return cur.execute(sql, params).fetchall()
+        finally:
+            cur.close()
+
     def list_project_summaries(self) -> list[dict]:
         cur = self._read_cursor()
         try:
@@ -371,8 +443,6 @@ class UnifiedStorage:
         git_branch: str | None = None,
     ) -> None:
         """Insert or replace a conversation row."""
-        import json
-
         cur = self._write_cursor()
         cur.execute(
             "INSERT OR REPLACE INTO conversations "
@@ -406,28 +476,125 @@ class UnifiedStorage:
         Deletes existing messages for the conversation_id first (upsert
         semantics at the conversation level).
         """
-        import json
+        with self.transaction() as cur:
+            cur.execute(
+                "DELETE FROM messages WHERE conversation_id = ?",
+                [conversation_id],
+            )
+            self.append_messages(conversation_id, messages)
+
+    def append_messages(
+        self,
+        conversation_id: str,
+        messages: list[dict],
+    ) -> None:
+        """Bulk insert messages after the ones already stored for a conversation."""
+        if not messages:
+            return
+        table = pa.table({
+            "conversation_id": [conversation_id] * len(messages),
+            "sequence": [m["sequence"] for m in messages],
+            "role": [m["role"] for m in messages],
+            "content": [m["content"] for m in messages],
+            "timestamp": [m.get("timestamp") for m in messages],
+            "has_code": [bool(m.get("has_code", False)) for m in messages],
+            "code_blocks": [
+                json.dumps(m["code_blocks"]) if m.get("code_blocks") else None
+                for m in messages
+            ],
+        })
+        self._insert_table(
+            "INSERT INTO messages "
+            "(conversation_id, sequence, role, content, timestamp, "
+            "has_code, code_blocks) "
+            "SELECT conversation_id, sequence, role, content, timestamp, "
+            "has_code, code_blocks FROM batch",
+            table,
+        )
+
+    def get_messages(self, conversation_id: str, *, from_sequence: int = 0) -> list[dict]:
+        """Messages of a conversation with ``sequence >= from_sequence``, in order."""
+        cur = self._read_cursor()
+        try:
+            rows = cur.execute(
+                "SELECT sequence, role, content, timestamp, has_code, code_blocks "
+                "FROM messages WHERE conversation_id = ? AND sequence >= ? "
+                "ORDER BY sequence",
+                [conversation_id, from_sequence],
+            ).fetchall()
+        finally:
+            cur.close()
+        return [
+            {
+                "sequence": seq,
+                "role": role,
+                "content": content,
+                "timestamp": ts,
+                "has_code": hc,
+                "code_blocks": json.loads(cb) if cb else None,
+            }
+            for seq, role, content, ts, hc, cb in rows
+        ]
+
+    def extend_conversation(
+        self,
+        *,
+        conversation_id: str,
+        appended_text: str,
+        appended_messages: int,
+        updated_at: datetime,
+        file_hash: str,
+        indexed_at: datetime,
+        title: str | None = None,
+        files_mentioned: list[str] | None = None,
+    ) -> None:
+        """Grow a conversation row in place after messages were appended to it.
 
+        ``title`` only replaces a placeholder "Untitled"; ``files_mentioned``
+        is merged into the stored list.
+        """
         cur = self._write_cursor()
-        cur.execute(
-            "DELETE FROM messages WHERE conversation_id = ?",
+        row = cur.execute(
+            "SELECT files_mentioned FROM conversations WHERE conversation_id = ?",
             [conversation_id],
+        ).fetchone()
+        if row is None:
+            raise KeyError(conversation_id)
+        merged = sorted(set(json.loads(row[0]) if row[0] else []) | set(files_mentioned or []))
+        cur.execute(
+            "UPDATE conversations SET "
+            "full_text = CASE WHEN full_text = '' THEN ? ELSE full_text || ? END, "
+            "message_count = message_count + ?, "
+            "updated_at = ?, file_hash = ?, indexed_at = ?, "
+            "title = CASE WHEN title = 'Untitled' AND ? IS NOT NULL THEN ? ELSE title END, "
+            "files_mentioned = ? "
+            "WHERE conversation_id = ?",
+            [
+                appended_text,
+                "\n\n" + appended_text,
+                appended_messages,
+                updated_at,
+                file_hash,
+                indexed_at,
+                title,
+                title,
+                json.dumps(merged) if merged else None,
+                conversation_id,
+            ],
         )
-        for msg in messages:
-            code_blocks = msg.get("code_blocks")
+
+    def delete_exchanges_from(self, conversation_id: str, ply_start: int) -> None:
+        """Delete a conversation's exchanges (and their embeddings) starting at ``ply_start`` or later."""
+        with self.transaction() as cur:
             cur.execute(
-                "INSERT INTO messages "
-                "(conversation_id, sequence, role, content, timestamp, "
-                "has_code, code_blocks) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                [
-                    conversation_id,
-                    msg["sequence"],
-                    msg["role"],
-                    msg["content"],
-                    msg.get("timestamp"),
-                    msg.get("has_code", False),
-                    json.dumps(code_blocks) if code_blocks else None,
-                ],
+                "DELETE FROM verbatim_embeddings WHERE exchange_id IN ("
+                "SELECT exchange_id FROM exchanges "
+                "WHERE conversation_id = ? AND ply_start >= ?)",
+                [conversation_id, ply_start],
+            )
+            cur.execute(
+                "DELETE FROM exchanges WHERE conversation_id = ? AND ply_start >= ?",
+                [conversation_id, ply_start],
             )
 
     def upsert_exchange(
@@ -478,6 +645,64 @@ class UnifiedStorage:
             [exchange_id, embedding],
         )
 
+    def upsert_exchanges(self, exchanges: Sequence[dict]) -> None:
+        """Bulk variant of :meth:`upsert_exchange` (one statement per batch)."""
+        if not exchanges:
+            return
+        rows = list({exc["exchange_id"]: exc for exc in exchanges}.values())
+        table = pa.table({
+            "exchange_id": [r["exchange_id"] for r in rows],
+            "conversation_id": [r["conversation_id"] for r in rows],
+            "project_id": [r.get("project_id") for r in rows],
+            "ply_start": [r["ply_start"] for r in rows],
+            "ply_end": [r["ply_end"] for r in rows],
+            "exchange_text": [r["exchange_text"] for r in rows],
+            "created_at": [r["created_at"] for r in rows],
+        })
+        self._insert_table(
+            "INSERT INTO exchanges "
+            "(exchange_id, conversation_id, project_id, ply_start, "
+            "ply_end, exchange_text, created_at) "
+            "SELECT exchange_id, conversation_id, project_id, ply_start, "
+            "ply_end, exchange_text, created_at FROM batch "
+            "ON CONFLICT (exchange_id) DO UPDATE SET "
+            "exchange_text = EXCLUDED.exchange_text, "
+            "created_at = EXCLUDED.created_at",
+            table,
+        )
+
+    def upsert_embeddings(
+        self,
+        exchange_ids: Sequence[str],
+        embeddings: np.ndarray | Sequence[Sequence[float]],
+    ) -> None:
+        """Bulk variant of :meth:`upsert_embedding` for an (n, EMBEDDING_DIM) matrix."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if len(exchange_ids) == 0:
+            return
+        if matrix.ndim != 2 or matrix.shape[1] != EMBEDDING_DIM:
+            raise ValueError(
+                f"Embedding dimension mismatch: got shape {matrix.shape}, "
+                f"expected (n, {EMBEDDING_DIM})"
+            )
+        if matrix.shape[0] != len(exchange_ids):
+            raise ValueError(
+                f"Got {matrix.shape[0]} embeddings for {len(exchange_ids)} exchange ids"
+            )
+        last = {exchange_id: i for i, exchange_id in enumerate(exchange_ids)}
+        matrix = matrix[list(last.values())]
+        table = pa.table({
+            "exchange_id": list(last),
+            "embedding": pa.FixedSizeListArray.from_arrays(
+                pa.array(matrix.reshape(-1)), EMBEDDING_DIM,
+            ),
+        })
+        self._insert_table(
+            "INSERT OR REPLACE INTO verbatim_embeddings (exchange_id, embedding) "
+            f"SELECT exchange_id, embedding::FLOAT[{EMBEDDING_DIM}] FROM batch",
+            table,
+        )
+
     def upsert_file_state(
         self,
         *,
@@ -489,13 +714,19 @@ class UnifiedStorage:
         file_size: int = 0,
         file_hash: str | None = None,
         updated_at: datetime | None = None,
+        mtime_ns: int = 0,
+        byte_offset: int | None = None,
+        next_sequence: int | None = None,
+        tail_checkpoint: str | None = None,
+        last_exchange_start: int | None = None,
     ) -> None:
         cur = self._write_cursor()
         cur.execute(
             "INSERT OR REPLACE INTO source_file_state "
             "(file_path, conversation_id, project_id, connector_name, "
-            "status, file_size, file_hash, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            "status, file_size, file_hash, mtime_ns, updated_at, "
+            "byte_offset, next_sequence, tail_checkpoint, last_exchange_start) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             [
                 file_path,
                 conversation_id,
@@ -504,10 +735,33 @@ class UnifiedStorage:
                 status,
                 file_size,
                 file_hash,
+                mtime_ns,
                 updated_at or datetime.now(),
+                byte_offset,
+                next_sequence,
+                tail_checkpoint,
+                last_exchange_start,
             ],
         )
 
+    def get_file_states(self, file_paths: Sequence[str]) -> dict[str, dict]:
+        """``source_file_state`` rows for ``file_paths``, keyed by path."""
+        if not file_paths:
+            return {}
+        cur = self._read_cursor()
+        try:
+            result = cur.execute(
+                "SELECT * FROM source_file_state "
+                "WHERE file_path IN (SELECT unnest(?::VARCHAR[]))",
+                [list(file_paths)],
+            )
+            columns = [d[0] for d in result.description]
+            rows = result.fetchall()
+        finally:
+            cur.close()
+        states = [dict(zip(columns, row)) for row in rows]
+        return {state["file_path"]: state for state in states}
+
     def insert_code_block(
         self,
         *,
@@ -532,8 +786,6 @@ class UnifiedStorage:
         classes: list[str] | None = None,
         imports: list[str] | None = None,
     ) -> None:
-        import json
-
         cur = self._write_cursor()
         cur.execute(
             "INSERT OR REPLACE INTO code_blocks "
@@ -567,6 +819,46 @@ class UnifiedStorage:
             ],
         )
 
+    def insert_code_blocks(self, blocks: Sequence[dict]) -> None:
+        """Bulk variant of :meth:`insert_code_block`; keys mirror its keyword arguments."""
+        if not blocks:
+            return
+        rows = list({
+            (b["conversation_id"], b["message_index"], b["block_index"]): b
+            for b in blocks
+        }.values())
+
+        def _json_list(values: list[str] | None) -> str | None:
+            return json.dumps(values) if values else None
+
+        table = pa.table({
+            "conversation_id": [b["conversation_id"] for b in rows],
+            "project_id": [b["project_id"] for b in rows],
+            "connector": [b.get("connector") for b in rows],
+            "file_path": [b.get("file_path") for b in rows],
+            "title": [b.get("title") for b in rows],
+            "conversation_created_at": [b.get("conversation_created_at") for b in rows],
+            "conversation_updated_at": [b.get("conversation_updated_at") for b in rows],
+            "message_index": [b["message_index"] for b in rows],
+            "block_index": [b["block_index"] for b in rows],
+            "role": [b.get("role") for b in rows],
+            "message_timestamp": [b.get("message_timestamp") for b in rows],
+            "fence_language": [b.get("fence_language") for b in rows],
+            "language": [b.get("language") for b in rows],
+            "language_source": [b.get("language_source") for b in rows],
+            "functions": [_json_list(b.get("functions")) for b in rows],
+            "classes": [_json_list(b.get("classes")) for b in rows],
+            "imports": [_json_list(b.get("imports")) for b in rows],
+            "code": [b["code"] for b in rows],
+            "code_hash": [b["code_hash"] for b in rows],
+            "lines": [b["lines"] for b in rows],
+        })
+        columns = ", ".join(table.column_names)
+        self._insert_table(
+            f"INSERT OR REPLACE INTO code_blocks ({columns}) SELECT {columns} FROM batch",
+            table,
+        )
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
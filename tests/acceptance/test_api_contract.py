@@ -12,6 +12,7 @@ from searchat.api.app import app
 from searchat.api.routers.expertise import prime_expertise
 from searchat.models import SearchResult, SearchResults
 from searchat.services.llm_service import LLMServiceError
+from searchat.services.suggestion_index import SuggestionIndex
 
 
 def test_status_features_exposes_retrieval_capability_snapshot() -> None:
@@ -1420,12 +1421,14 @@ def test_search_and_similarity_routes_preserve_stable_error_messages() -> None:
 def test_search_auxiliary_routes_preserve_stable_contracts() -> None:
     client = TestClient(app)
 
-    conn = Mock()
-    conn.execute.return_value.fetchall.return_value = [("Python testing guide",), ("Pytest fixtures",)]
     store = Mock()
-    store._connect.return_value = conn
+    store.list_conversation_titles.return_value = [
+        ("project-one", "Python testing guide"),
+        ("project-one", "Pytest fixtures"),
+    ]
+    suggestions = SuggestionIndex(store, Path("/tmp/nonexistent-suggestions-searchat"))
 
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=store):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=suggestions):
         suggestions_response = client.get("/api/search/suggestions?q=py")
 
     assert suggestions_response.status_code == 200
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -56,7 +57,7 @@ def test_ask_about_history_generation_outage_returns_grounded_fallback(tmp_path:
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, engine)),
         patch("searchat.mcp.tools.build_generation_service") as mock_builder,
     ):
         mock_builder.return_value.completion.side_effect = LLMServiceError("provider down")
@@ -100,7 +101,7 @@ def test_ask_about_history_fails_closed_from_capability_snapshot(tmp_path: Path)
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, engine)),
     ):
         with pytest.raises(
             RuntimeError,
@@ -124,7 +125,7 @@ def test_ask_about_history_wraps_capability_introspection_failures(tmp_path: Pat
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, engine)),
     ):
         with pytest.raises(
             RuntimeError,
@@ -161,7 +162,7 @@ def test_search_conversations_preserves_stable_result_contract(tmp_path: Path) -
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
     ):
         payload = json.loads(search_conversations(query="contract", search_dir=str(tmp_path)))
 
@@ -192,7 +193,7 @@ def test_search_conversations_fails_closed_from_semantic_capability_snapshot(tmp
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
     ):
         with pytest.raises(
             RuntimeError,
@@ -234,7 +235,7 @@ def test_search_conversations_hybrid_mode_preserves_keyword_fallback_contract(tm
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
     ):
         payload = json.loads(
             search_conversations(query="how to sort data structures", mode="hybrid", search_dir=str(tmp_path))
@@ -250,7 +251,7 @@ def test_search_conversations_wraps_capability_introspection_failures(tmp_path:
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
     ):
         with pytest.raises(
             RuntimeError,
@@ -295,7 +296,7 @@ def test_search_conversations_star_query_preserves_keyword_fallback_contract(tmp
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
     ):
         payload = json.loads(
             search_conversations(query="*", mode="semantic", search_dir=str(tmp_path))
@@ -321,7 +322,8 @@ def test_project_and_statistics_tools_preserve_stable_top_level_contracts(tmp_pa
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         projects_payload = json.loads(list_projects(search_dir=str(tmp_path)))
         stats_payload = json.loads(get_statistics(search_dir=str(tmp_path)))
@@ -354,7 +356,8 @@ def test_get_conversation_preserves_stable_payload_contract(tmp_path: Path) -> N
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         payload = json.loads(get_conversation(conversation_id="conv-123", search_dir=str(tmp_path)))
 
@@ -385,7 +388,8 @@ def test_find_similar_conversations_surfaces_semantic_capability_failure(tmp_pat
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         with pytest.raises(RuntimeError, match="FAISS index not available"):
             find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path))
@@ -410,7 +414,7 @@ def test_extract_patterns_generation_outage_returns_fallback_payload(tmp_path: P
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, engine)),
         patch("searchat.services.pattern_mining.extract_patterns", return_value=[fake_pattern]),
     ):
         payload = json.loads(
@@ -429,14 +433,7 @@ def test_find_similar_conversations_preserves_stable_similarity_contract(tmp_pat
     engine.find_similar_vector_hits.return_value = [
         SemanticVectorHit(vector_id=100, distance=0.25),
     ]
-    store = MagicMock()
-    store.get_conversation_meta.return_value = {
-        "conversation_id": "conv-123",
-        "title": "Original conversation",
-    }
-    conn = MagicMock()
-    conn.execute.return_value.fetchone.return_value = ("representative chunk",)
-    conn.execute.return_value.fetchall.return_value = [
+    engine.similar_conversation_rows.return_value = [
         (
             "conv-456",
             "project-a",
@@ -448,11 +445,19 @@ def test_find_similar_conversations_preserves_stable_similarity_contract(tmp_pat
             0.25,
         )
     ]
+    store = MagicMock()
+    store.get_conversation_meta.return_value = {
+        "conversation_id": "conv-123",
+        "title": "Original conversation",
+    }
+    conn = MagicMock()
+    conn.execute.return_value.fetchone.return_value = ("representative chunk",)
     store._connect.return_value = conn
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         payload = json.loads(
             find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path))
@@ -488,7 +493,8 @@ def test_find_similar_conversations_empty_results_preserves_full_envelope(tmp_pa
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         payload = json.loads(
             find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path))
@@ -519,7 +525,8 @@ def test_mcp_tools_preserve_stable_validation_and_not_found_messages(tmp_path: P
     store.get_conversation_meta.return_value = None
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         with pytest.raises(ValueError, match=r"^Conversation not found: conv-404$"):
             find_similar_conversations(conversation_id="conv-404", search_dir=str(tmp_path))
@@ -548,7 +555,8 @@ def test_find_similar_conversations_fails_closed_from_capability_snapshot(tmp_pa
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine, store)),
+        patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), engine)),
+        patch("searchat.mcp.tools.open_store", return_value=nullcontext(store)),
     ):
         with pytest.raises(
             RuntimeError,
@@ -577,7 +585,7 @@ def test_generate_agent_config_fails_closed_from_capability_snapshot(tmp_path: P
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, engine, MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, engine)),
         patch(
             "searchat.services.pattern_mining.extract_patterns",
             side_effect=AssertionError("should not extract"),
@@ -627,7 +635,7 @@ def test_mcp_expertise_and_agent_config_contracts_are_stable(tmp_path: Path) ->
 
     with (
         patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-        patch("searchat.mcp.tools.build_services", return_value=(config, MagicMock(), MagicMock())),
+        patch("searchat.mcp.tools.build_services", return_value=(config, MagicMock())),
         patch("searchat.services.pattern_mining.extract_patterns", return_value=[pattern]),
     ):
         payload = json.loads(generate_agent_config(format="claude.md", search_dir=str(tmp_path)))
@@ -128,6 +128,94 @@ def test_status_features_endpoint_returns_flags(
     )
 
 
+def test_status_embedding_cache_endpoint_reports_hit_rate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from searchat.api.app import app
+    from searchat.core.embedding_cache import EmbeddingCacheStats
+
+    stats = EmbeddingCacheStats(
+        path="/x/data/indices/embedding_cache.duckdb",
+        persistent=True,
+        hits=3,
+        misses=1,
+        memory_entries=4,
+        persistent_entries=10,
+        evictions=0,
+    )
+    monkeypatch.setattr("searchat.api.routers.status.embedding_cache_stats", lambda: [stats])
+
+    resp = TestClient(app).get("/api/status/embedding-cache")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["enabled"] is True
+    assert data["caches"][0]["hit_rate"] == 0.75
+    assert data["caches"][0]["persistent_entries"] == 10
+
+
+def test_status_profile_endpoint_reports_stage_percentiles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from searchat.api.app import app
+    from searchat.core.profiling import Profiler
+
+    profiler = Profiler()
+    with profiler.trace("search", "hybrid: auth"):
+        profiler.record("search.embed", 12.0)
+        profiler.record("search.fts", 3.0)
+    monkeypatch.setattr("searchat.api.dependencies.get_config", lambda: SimpleNamespace())
+    monkeypatch.setattr("searchat.api.routers.status.get_profiler", lambda config: profiler)
+
+    resp = TestClient(app).get("/api/status/profile")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["enabled"] is True
+    stages = {s["stage"]: s for s in data["stages"]}
+    assert stages["search.embed"]["p50_ms"] == 12.0
+    assert "search.total" in stages
+    assert data["recent"][0]["label"] == "hybrid: auth"
+    assert [s["stage"] for s in data["recent"][0]["stages"]] == ["search.embed", "search.fts"]
+
+
+def test_status_profile_endpoint_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from searchat.api.app import app
+
+    monkeypatch.setattr("searchat.api.dependencies.get_config", lambda: SimpleNamespace())
+    monkeypatch.setattr("searchat.api.routers.status.get_profiler", lambda config: None)
+
+    resp = TestClient(app).get("/api/status/profile")
+
+    assert resp.json() == {"enabled": False, "stages": [], "recent": []}
+
+
+def test_status_executors_endpoint_reports_pool_depth(monkeypatch: pytest.MonkeyPatch) -> None:
+    from searchat.api.app import app
+    from searchat.api.executors import ExecutorStats
+
+    stats = ExecutorStats(
+        name="retrieval",
+        workers=4,
+        queue_limit=32,
+        running=4,
+        queued=6,
+        peak_depth=12,
+        completed=100,
+        rejected=2,
+        avg_job_ms=41.25,
+    )
+    monkeypatch.setattr("searchat.api.routers.status.executor_stats", lambda: [stats])
+
+    resp = TestClient(app).get("/api/status/executors")
+
+    assert resp.status_code == 200
+    pool = resp.json()["executors"][0]
+    assert pool["name"] == "retrieval"
+    assert pool["queued"] == 6
+    assert pool["rejected"] == 2
+
+
 @pytest.mark.asyncio
 async def test_status_endpoint_includes_retrieval_capabilities(
     monkeypatch: pytest.MonkeyPatch,
@@ -1199,7 +1287,7 @@ def test_get_or_create_search_engine_for_caches_per_dataset(
     monkeypatch.setattr(
         retrieval_mod,
         "build_retrieval_service",
-        lambda search_dir, *, config: FakeEngine(search_dir, config),
+        lambda search_dir, *, config, **_kwargs: FakeEngine(search_dir, config),
     )
 
     assert deps.get_or_create_search_engine_for(base) is deps._search_engine
@@ -1228,7 +1316,7 @@ def test_ensure_search_engine_sets_readiness_error_on_failure(
     monkeypatch.setattr(
         retrieval_mod,
         "build_retrieval_service",
-        lambda search_dir, *, config: BoomEngine(search_dir, config),
+        lambda search_dir, *, config, **_kwargs: BoomEngine(search_dir, config),
     )
 
     with pytest.raises(RuntimeError):
@@ -1258,3 +1346,94 @@ def test_ensure_indexer_sets_readiness_error_on_failure(
         deps.get_indexer()
 
     assert get_readiness().snapshot().components["indexer"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_keyword_index_status_reports_last_sync(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from searchat.api.routers.status import get_keyword_index_status
+    from searchat.core.keyword_index import KeywordIndexStatus, KeywordIndexSyncStats
+
+    status = KeywordIndexStatus(
+        path="/tmp/keyword_index.duckdb",
+        persistent=True,
+        stemmer="english",
+        documents=10,
+        postings=120,
+        total_tokens_processed=450,
+        last_sync=KeywordIndexSyncStats(
+            added=1, updated=2, removed=0, tokens_processed=30,
+            elapsed_ms=12.3456, full_rebuild=False,
+        ),
+    )
+    monkeypatch.setattr(
+        "searchat.api.dependencies._search_engine",
+        SimpleNamespace(describe_keyword_index=lambda: status),
+    )
+
+    payload = await get_keyword_index_status()
+
+    assert payload["available"] is True
+    assert payload["keyword_index"]["documents"] == 10
+    assert payload["keyword_index"]["total_tokens_processed"] == 450
+    assert payload["keyword_index"]["last_sync"] == {
+        "added": 1,
+        "updated": 2,
+        "removed": 0,
+        "tokens_processed": 30,
+        "elapsed_ms": 12.35,
+        "full_rebuild": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_keyword_index_status_without_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    from searchat.api.routers.status import get_keyword_index_status
+
+    monkeypatch.setattr("searchat.api.dependencies._search_engine", None)
+
+    payload = await get_keyword_index_status()
+
+    assert payload == {"available": False, "keyword_index": None}
+
+
+@pytest.mark.asyncio
+async def test_result_cache_status_reports_counters(monkeypatch: pytest.MonkeyPatch) -> None:
+    from searchat.api.routers.status import get_result_cache_status
+    from searchat.core.result_cache import ResultCacheStats
+
+    stats = ResultCacheStats(
+        entries=3, bytes=4096, max_entries=100, max_bytes=1 << 20, ttl_seconds=300,
+        generation=2, hits=3, misses=1, evictions=0, invalidations=2,
+    )
+    monkeypatch.setattr(
+        "searchat.api.dependencies._search_engine",
+        SimpleNamespace(describe_result_cache=lambda: stats),
+    )
+
+    payload = await get_result_cache_status()
+
+    assert payload["available"] is True
+    assert payload["result_cache"]["generation"] == 2
+    assert payload["result_cache"]["hit_rate"] == 0.75
+    assert payload["result_cache"]["bytes"] == 4096
+
+
+def test_on_new_conversations_passes_changed_projects(monkeypatch: pytest.MonkeyPatch) -> None:
+    api_app = _api_app_module()
+    import searchat.api.dependencies as deps
+
+    fake_stats = SimpleNamespace(
+        new_conversations=1, update_time_seconds=0.01, changed_project_ids={"proj-a"}
+    )
+    indexer = SimpleNamespace(index_append_only=MagicMock(return_value=fake_stats))
+
+    monkeypatch.setattr(api_app, "get_indexer", lambda: indexer)
+    monkeypatch.setattr(deps, "get_or_create_search_engine", lambda: object())
+    invalidate = MagicMock()
+    monkeypatch.setattr(api_app, "invalidate_search_index", invalidate)
+
+    api_app.on_new_conversations(["a.jsonl"])
+
+    invalidate.assert_called_once_with({"proj-a"})
@@ -12,6 +12,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from searchat.api.app import app
+from searchat.core.code_index import CodeIndex, code_index_path
 from searchat.models.schemas import CODE_BLOCK_SCHEMA
 
 
@@ -101,6 +102,46 @@ def test_search_code_filters_by_function_name(client: TestClient, tmp_path: Path
     assert len(payload["results"]) == 1
 
 
+@pytest.mark.unit
+def test_search_code_uses_code_index_for_terms_and_regex(client: TestClient, tmp_path: Path) -> None:
+    search_dir = tmp_path / "search"
+    _write_code_parquet(search_dir)
+    CodeIndex(code_index_path(search_dir)).rebuild(search_dir / "data" / "code")
+
+    class NoScanStore:
+        def _connect(self):
+            raise AssertionError("code index should answer without a Parquet scan")
+
+    with patch(
+        "searchat.api.routers.search.get_dataset_store",
+        return_value=SimpleNamespace(search_dir=search_dir, snapshot_name=None, store=NoScanStore()),
+    ):
+        by_term = client.get("/api/search/code?q=GREET")
+        by_regex = client.get("/api/search/code", params={"q": r"def \w+\(\)", "regex": "true"})
+        missing = client.get("/api/search/code?q=farewell")
+
+    assert by_term.status_code == 200
+    assert by_term.json()["total"] == 1
+    assert by_regex.status_code == 200
+    assert by_regex.json()["results"][0]["conversation_id"] == "conv-1"
+    assert missing.json()["total"] == 0
+
+
+@pytest.mark.unit
+def test_search_code_rejects_invalid_regex(client: TestClient, tmp_path: Path) -> None:
+    search_dir = tmp_path / "search"
+    _write_code_parquet(search_dir)
+
+    with patch(
+        "searchat.api.routers.search.get_dataset_store",
+        return_value=SimpleNamespace(search_dir=search_dir, snapshot_name=None, store=_InMemoryStore()),
+    ):
+        resp = client.get("/api/search/code", params={"q": "(greet", "regex": "true"})
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"].startswith("Invalid regular expression")
+
+
 @pytest.mark.unit
 def test_search_code_returns_503_when_no_code_index(client: TestClient, tmp_path: Path) -> None:
     search_dir = tmp_path / "search"
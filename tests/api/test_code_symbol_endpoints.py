@@ -12,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from searchat.api.app import app
 import duckdb
+from searchat.core.code_index import CodeIndex, code_index_path
 from searchat.models.schemas import CODE_BLOCK_SCHEMA
 
 
@@ -112,6 +113,28 @@ def test_code_imports_endpoint_filters_by_module(client: TestClient, tmp_path: P
     assert len(payload["results"]) == 1
 
 
+@pytest.mark.unit
+def test_code_symbol_endpoints_probe_code_index(client: TestClient, tmp_path: Path) -> None:
+    search_dir = tmp_path / "search"
+    _write_code_parquet(search_dir)
+    CodeIndex(code_index_path(search_dir)).rebuild(search_dir / "data" / "code")
+
+    def no_scan():
+        raise AssertionError("code index should answer without a Parquet scan")
+
+    with patch(
+        "searchat.api.routers.code.get_dataset_store",
+        return_value=SimpleNamespace(search_dir=search_dir, snapshot_name=None, store=SimpleNamespace(_connect=no_scan)),
+    ):
+        symbols = client.get("/api/conversation/conv-1/code-symbols")
+        functions = client.get("/api/code/functions?name=greet&language=PYTHON")
+        imports = client.get("/api/code/imports?module=sys")
+
+    assert symbols.json()["classes"] == ["Greeter"]
+    assert functions.json()["total"] == 1
+    assert imports.json()["total"] == 0
+
+
 @pytest.mark.unit
 def test_code_symbol_endpoints_return_503_when_no_code_index(client: TestClient, tmp_path: Path) -> None:
     search_dir = tmp_path / "search"
@@ -11,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from searchat.api.app import app
 from searchat.api.dataset_access import _DatasetNotReady
+from searchat.core.result_cache import ResultCache
 from searchat.models import SearchResult, SearchResults, SearchMode
 
 
@@ -632,3 +633,122 @@ def test_dashboards_render_sorts_results_by_messages(client, monkeypatch):
     assert resp.status_code == 200
     widget_results = resp.json()["widgets"][0]["results"]
     assert [r["conversation_id"] for r in widget_results] == ["conv-b", "conv-a"]
+
+
+class RecordingSearchEngine:
+    def __init__(self, results: SearchResults) -> None:
+        self._results = results
+        self.result_cache = ResultCache(max_entries=16, max_bytes=1_000_000, ttl_seconds=300)
+        self.searches: list[tuple[str, SearchMode, list[str] | None]] = []
+        self.warmed: list[list[str]] = []
+        self.released: list[list[str]] = []
+
+    def search(self, q: str, mode: SearchMode, filters) -> SearchResults:
+        self.searches.append((q, mode, filters.project_ids))
+        return self._results
+
+    def warm_query_embeddings(self, texts: list[str]) -> None:
+        self.warmed.append(list(texts))
+
+    def release_query_embeddings(self, texts: list[str]) -> None:
+        self.released.append(list(texts))
+
+
+def _message_results(counts: list[int]) -> SearchResults:
+    now = datetime.now(timezone.utc)
+    results = [
+        SearchResult(
+            conversation_id=f"conv-{count}",
+            project_id="proj",
+            title=f"Conversation {count}",
+            created_at=now,
+            updated_at=now,
+            message_count=count,
+            file_path=f"/home/user/.claude/projects/proj/{count}.jsonl",
+            score=0.5,
+            snippet="s",
+            message_start_index=0,
+            message_end_index=0,
+        )
+        for count in counts
+    ]
+    return SearchResults(results=results, total_count=len(results), search_time_ms=1.0, mode_used="hybrid")
+
+
+def _shared_query_dashboard(monkeypatch, engine):
+    dashboards_service = InMemoryDashboardsService()
+    dashboard = dashboards_service.create_dashboard(
+        {
+            "name": "Shared",
+            "description": None,
+            "queries": ["q-1", "q-2"],
+            "layout": {
+                "widgets": [
+                    {"id": "top", "query_id": "q-1", "limit": 1},
+                    {"id": "busiest", "query_id": "q-1", "limit": 2, "sort_by": "messages"},
+                    {"id": "project", "query_id": "q-2", "limit": 5},
+                ]
+            },
+            "refresh_interval": None,
+        }
+    )
+    queries = {
+        "q-1": {"id": "q-1", "name": "All", "query": "deploy failures", "mode": "hybrid"},
+        "q-2": {
+            "id": "q-2",
+            "name": "Project",
+            "query": "deploy failures",
+            "filters": {"project": "proj"},
+            "mode": "hybrid",
+        },
+    }
+    monkeypatch.setattr("searchat.api.routers.dashboards.deps.get_dashboards_service", lambda: dashboards_service)
+    monkeypatch.setattr(
+        "searchat.api.routers.dashboards.deps.get_saved_queries_service",
+        lambda: SimpleNamespace(get_query=queries.get),
+    )
+    monkeypatch.setattr("searchat.api.routers.dashboards.deps.get_config", _enabled_config)
+    monkeypatch.setattr(
+        "searchat.api.routers.dashboards.get_dataset_retrieval",
+        lambda snapshot, search_mode: _dataset_retrieval(engine),
+    )
+    return dashboard
+
+
+def test_dashboards_render_runs_each_distinct_search_once(client, monkeypatch):
+    engine = RecordingSearchEngine(_message_results([2, 9, 5]))
+    dashboard = _shared_query_dashboard(monkeypatch, engine)
+
+    resp = client.get(f"/api/dashboards/{dashboard['id']}/render")
+    assert resp.status_code == 200
+    widgets = resp.json()["widgets"]
+
+    assert sorted(engine.searches, key=str) == [
+        ("deploy failures", SearchMode.HYBRID, None),
+        ("deploy failures", SearchMode.HYBRID, ["proj"]),
+    ]
+    assert engine.warmed == [["deploy failures"]]
+    assert engine.released == [["deploy failures"]]
+    assert [w["id"] for w in widgets] == ["top", "busiest", "project"]
+    assert [r["conversation_id"] for r in widgets[0]["results"]] == ["conv-2"]
+    assert [r["conversation_id"] for r in widgets[1]["results"]] == ["conv-9", "conv-5"]
+    assert len(widgets[2]["results"]) == 3
+    assert all(w["total"] == 3 and w["render_ms"] >= 0 and w["cached"] is False for w in widgets)
+
+
+def test_dashboards_render_reuses_widgets_until_index_generation_changes(client, monkeypatch):
+    engine = RecordingSearchEngine(_message_results([2, 9]))
+    dashboard = _shared_query_dashboard(monkeypatch, engine)
+
+    first = client.get(f"/api/dashboards/{dashboard['id']}/render").json()["widgets"]
+    second = client.get(f"/api/dashboards/{dashboard['id']}/render").json()["widgets"]
+
+    assert len(engine.searches) == 2
+    assert [w["cached"] for w in second] == [True, True, True]
+    assert [w["results"] for w in second] == [w["results"] for w in first]
+
+    engine.result_cache.invalidate(["proj"])
+    third = client.get(f"/api/dashboards/{dashboard['id']}/render").json()["widgets"]
+
+    assert len(engine.searches) == 4
+    assert [w["cached"] for w in third] == [False, False, False]
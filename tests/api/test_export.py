@@ -194,6 +194,30 @@ def test_bulk_export_json(client, mock_conversation_response):
         assert ".zip" in response.headers["content-disposition"]
 
 
+def test_bulk_export_streams_valid_archive_skipping_missing(client, mock_conversation_response):
+    """Bulk export writes one member per loadable conversation, in request order."""
+    import io
+    import zipfile
+
+    from fastapi import HTTPException
+
+    async def fake_get_conversation(conversation_id, snapshot=None):
+        if conversation_id == "missing":
+            raise HTTPException(status_code=404, detail="Conversation not found")
+        return mock_conversation_response
+
+    with patch("searchat.api.routers.conversations.get_conversation", side_effect=fake_get_conversation):
+        response = client.post(
+            "/api/conversations/bulk-export",
+            json={"conversation_ids": ["conv-1", "missing", "conv-2"], "format": "json"},
+        )
+
+    assert response.status_code == 200
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.namelist() == ["Test Conversation_conv-1.json", "Test Conversation_conv-2.json"]
+    assert json.loads(archive.read("Test Conversation_conv-1.json"))["conversation_id"] == "conv-123"
+
+
 def test_bulk_export_markdown(client, mock_conversation_response):
     """Test POST /api/conversations/bulk-export with markdown format."""
     with patch("searchat.api.routers.conversations.get_conversation", return_value=mock_conversation_response):
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
 from searchat.api.app import app
+from searchat.services.suggestion_index import SuggestionIndex
 
 
 @pytest.fixture
@@ -16,25 +17,18 @@ def client():
 
 
 @pytest.fixture
-def mock_duckdb_store_for_suggestions():
-    """Mock DuckDBStore for suggestions endpoint."""
+def mock_suggestion_index(tmp_path):
+    """Suggestion index over a mock store's conversation titles."""
     mock = Mock()
-
-    # Mock _connect and query results
-    mock_conn = Mock()
-
-    # Mock conversation titles for suggestions
-    mock_conn.execute.return_value.fetchall.return_value = [
-        ("Python Testing Best Practices",),
-        ("Python Async Programming",),
-        ("JavaScript Testing Framework",),
-        ("Building REST APIs with Python",),
-        ("Python Type Hints Guide",),
+    mock.list_conversation_titles.return_value = [
+        ("project-one", "Python Testing Best Practices"),
+        ("project-one", "Python Async Programming"),
+        ("project-two", "JavaScript Testing Framework"),
+        ("project-two", "Building REST APIs with Python"),
+        ("project-two", "Python Type Hints Guide"),
     ]
 
-    mock._connect.return_value = mock_conn
-
-    return mock
+    return SuggestionIndex(mock, tmp_path)
 
 
 @pytest.fixture
@@ -72,9 +66,9 @@ def mock_search_results():
 # SUGGESTIONS TESTS
 # ============================================================================
 
-def test_get_search_suggestions(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions(client, mock_suggestion_index):
     """Test GET /api/search/suggestions with query."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response = client.get("/api/search/suggestions?q=python")
 
         assert response.status_code == 200
@@ -87,9 +81,9 @@ def test_get_search_suggestions(client, mock_duckdb_store_for_suggestions):
         assert isinstance(data["suggestions"], list)
 
 
-def test_get_search_suggestions_word_extraction(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_word_extraction(client, mock_suggestion_index):
     """Test suggestions extract words and phrases from titles."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response = client.get("/api/search/suggestions?q=test")
 
         assert response.status_code == 200
@@ -99,9 +93,9 @@ def test_get_search_suggestions_word_extraction(client, mock_duckdb_store_for_su
         assert any("test" in s.lower() for s in data["suggestions"])
 
 
-def test_get_search_suggestions_limit(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_limit(client, mock_suggestion_index):
     """Test suggestions endpoint respects limit parameter."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response = client.get("/api/search/suggestions?q=python&limit=5")
 
         assert response.status_code == 200
@@ -111,9 +105,9 @@ def test_get_search_suggestions_limit(client, mock_duckdb_store_for_suggestions)
         assert len(data["suggestions"]) <= 5
 
 
-def test_get_search_suggestions_limit_validation(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_limit_validation(client, mock_suggestion_index):
     """Test limit parameter validation for suggestions."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         # limit < 1 should fail
         response = client.get("/api/search/suggestions?q=test&limit=0")
         assert response.status_code == 422
@@ -134,9 +128,9 @@ def test_get_search_suggestions_min_length_validation(client):
     assert response.status_code == 422
 
 
-def test_get_search_suggestions_prefix_priority(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_prefix_priority(client, mock_suggestion_index):
     """Test suggestions prioritize prefix matches."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response = client.get("/api/search/suggestions?q=py")
 
         assert response.status_code == 200
@@ -148,9 +142,9 @@ def test_get_search_suggestions_prefix_priority(client, mock_duckdb_store_for_su
             assert isinstance(data["suggestions"], list)
 
 
-def test_get_search_suggestions_case_insensitive(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_case_insensitive(client, mock_suggestion_index):
     """Test suggestions are case-insensitive."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response1 = client.get("/api/search/suggestions?q=python")
         response2 = client.get("/api/search/suggestions?q=PYTHON")
 
@@ -165,9 +159,9 @@ def test_get_search_suggestions_case_insensitive(client, mock_duckdb_store_for_s
         assert len(data2["suggestions"]) > 0
 
 
-def test_get_search_suggestions_deduplication(client, mock_duckdb_store_for_suggestions):
+def test_get_search_suggestions_deduplication(client, mock_suggestion_index):
     """Test suggestions deduplicate results."""
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=mock_duckdb_store_for_suggestions):
+    with patch("searchat.api.routers.search.deps.get_suggestion_index", return_value=mock_suggestion_index):
         response = client.get("/api/search/suggestions?q=test")
 
         assert response.status_code == 200
@@ -178,11 +172,14 @@ def test_get_search_suggestions_deduplication(client, mock_duckdb_store_for_sugg
         assert len(suggestions) == len(set(suggestions))
 
 
-def test_get_search_suggestions_returns_500_on_store_error(client):
+def test_get_search_suggestions_returns_500_on_store_error(client, tmp_path):
     broken_store = Mock()
-    broken_store._connect.side_effect = RuntimeError("boom")
+    broken_store.list_conversation_titles.side_effect = RuntimeError("boom")
 
-    with patch("searchat.api.routers.search.deps.get_duckdb_store", return_value=broken_store):
+    with patch(
+        "searchat.api.routers.search.deps.get_suggestion_index",
+        return_value=SuggestionIndex(broken_store, tmp_path),
+    ):
         response = client.get("/api/search/suggestions?q=test")
 
     assert response.status_code == 500
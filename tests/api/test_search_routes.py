@@ -684,6 +684,23 @@ class TestSearchEndpoint:
             assert response.status_code == 500
             assert response.json()["detail"] == "Internal server error"
 
+    def test_search_returns_503_with_retry_after_when_saturated(self, client, mock_search_engine):
+        """A full retrieval pool sheds load instead of queueing on the event loop."""
+        from searchat.api.executors import ExecutorSaturated
+
+        saturated = Mock()
+        saturated.run.side_effect = ExecutorSaturated("retrieval", retry_after=3)
+
+        with patch(
+            'searchat.api.routers.search.get_dataset_retrieval',
+            return_value=make_retrieval_context(mock_search_engine),
+        ), patch('searchat.api.executors.get_executor', return_value=saturated):
+            response = client.get("/api/search?q=test")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        mock_search_engine.search.assert_not_called()
+
     def test_search_rejects_invalid_tool_filter(self, client, mock_search_engine):
         with patch(
             'searchat.api.routers.search.get_dataset_retrieval',
@@ -45,8 +45,28 @@ def mock_duckdb_store():
         "This is a tutorial about Python testing frameworks like pytest.",
     )
 
-    # Mock similar conversations query result
-    mock_conn.execute.return_value.fetchall.return_value = [
+    mock._connect.return_value = mock_conn
+
+    return mock
+
+
+@pytest.fixture
+def mock_search_engine():
+    """Mock SearchEngine."""
+    mock = Mock()
+
+    # Mock FAISS index
+    mock.metadata_path = "/path/to/metadata.parquet"
+    mock.conversations_glob = "/path/to/conversations/*.parquet"
+    mock.find_similar_vector_hits.return_value = [
+        SemanticVectorHit(vector_id=100, distance=0.15),
+        SemanticVectorHit(vector_id=200, distance=0.25),
+        SemanticVectorHit(vector_id=300, distance=0.35),
+        SemanticVectorHit(vector_id=400, distance=0.45),
+    ]
+
+    # Mock hydrated similar conversation rows
+    mock.similar_conversation_rows.return_value = [
         (
             "conv-456",  # conversation_id
             "project-a",  # project_id
@@ -69,26 +89,6 @@ def mock_duckdb_store():
         )
     ]
 
-    mock._connect.return_value = mock_conn
-
-    return mock
-
-
-@pytest.fixture
-def mock_search_engine():
-    """Mock SearchEngine."""
-    mock = Mock()
-
-    # Mock FAISS index
-    mock.metadata_path = "/path/to/metadata.parquet"
-    mock.conversations_glob = "/path/to/conversations/*.parquet"
-    mock.find_similar_vector_hits.return_value = [
-        SemanticVectorHit(vector_id=100, distance=0.15),
-        SemanticVectorHit(vector_id=200, distance=0.25),
-        SemanticVectorHit(vector_id=300, distance=0.35),
-        SemanticVectorHit(vector_id=400, distance=0.45),
-    ]
-
     return mock
 
 
@@ -32,6 +32,15 @@ def _make_config() -> MagicMock:
     return config
 
 
+def _make_embedder() -> MagicMock:
+    """Fake model returning one 384-d vector per input text."""
+    embedder = MagicMock()
+    embedder.encode.side_effect = lambda texts, **_kw: [
+        [0.1 * (i % 2 + 1)] * 384 for i in range(len(texts))
+    ]
+    return embedder
+
+
 def _make_record(
     file_path: str,
     conversation_id: str = "conv-1",
@@ -81,8 +90,7 @@ class TestUnifiedIndexerIntegration:
         fake_connector.name = "test"
         fake_connector.parse.return_value = record
 
-        fake_embedder = MagicMock()
-        fake_embedder.encode.return_value = [[0.1] * 384, [0.2] * 384]
+        fake_embedder = _make_embedder()
 
         indexer = UnifiedIndexer(tmp_path, config, storage=storage)
 
@@ -136,8 +144,7 @@ class TestUnifiedIndexerIntegration:
         fake_connector.name = "test"
         fake_connector.parse.return_value = record
 
-        fake_embedder = MagicMock()
-        fake_embedder.encode.return_value = [[0.1] * 384, [0.2] * 384]
+        fake_embedder = _make_embedder()
 
         indexer = UnifiedIndexer(tmp_path, config, storage=storage)
 
@@ -166,8 +173,7 @@ class TestUnifiedIndexerIntegration:
         fake_connector.name = "test"
         fake_connector.parse.return_value = record
 
-        fake_embedder = MagicMock()
-        fake_embedder.encode.return_value = [[0.1] * 384, [0.2] * 384]
+        fake_embedder = _make_embedder()
 
         indexer = UnifiedIndexer(tmp_path, config, storage=storage)
 
@@ -198,8 +204,7 @@ class TestUnifiedIndexerIntegration:
         fake_connector.name = "test"
         fake_connector.parse.side_effect = records
 
-        fake_embedder = MagicMock()
-        fake_embedder.encode.return_value = [[0.1] * 384, [0.2] * 384]
+        fake_embedder = _make_embedder()
 
         indexer = UnifiedIndexer(tmp_path, config, storage=storage)
 
@@ -256,8 +261,7 @@ class TestUnifiedIndexerIntegration:
         fake_connector.name = "test"
         fake_connector.parse.return_value = record
 
-        fake_embedder = MagicMock()
-        fake_embedder.encode.return_value = [[0.1] * 384, [0.2] * 384]
+        fake_embedder = _make_embedder()
 
         indexer = UnifiedIndexer(tmp_path, config, storage=storage)
 
@@ -287,3 +291,59 @@ class TestUnifiedIndexerIntegration:
         assert "How about Rust?" in exchanges[1][2]
         assert "Rust is systems programming." in exchanges[1][2]
         assert "memory safety" in exchanges[1][2]
+
+    def test_grown_session_only_embeds_trailing_exchanges(self, tmp_path: Path) -> None:
+        """A live JSONL session that gains a turn is extended in place from its byte offset."""
+        import json
+
+        storage = _make_storage(tmp_path)
+        config = _make_config()
+        embedder = _make_embedder()
+        indexer = UnifiedIndexer(tmp_path, config, storage=storage)
+
+        session = tmp_path / "proj-live" / "live-session.jsonl"
+        session.parent.mkdir()
+
+        def append(*turns: tuple[str, str]) -> None:
+            with open(session, "a", encoding="utf-8") as f:
+                for role, text in turns:
+                    f.write(json.dumps({
+                        "type": role,
+                        "timestamp": "2026-03-29T10:00:00",
+                        "message": {"content": text},
+                    }) + "\n")
+
+        append(*[("user" if i % 2 == 0 else "assistant", f"turn {i}") for i in range(8)])
+
+        with patch.object(indexer, "_get_embedder", return_value=embedder):
+            first = indexer.index_append_only([str(session)])
+            embedder.encode.reset_mock()
+
+            append(("assistant", "turn 8 continues the open exchange"), ("user", "turn 9"))
+            second = indexer.index_append_only([str(session)])
+            third = indexer.index_append_only([str(session)])
+
+        assert first.new_conversations == 1
+        assert second.updated_conversations == 1
+        assert third.skipped_conversations == 1
+        encoded = [text for call in embedder.encode.call_args_list for text in call.args[0]]
+        assert len(encoded) == 2
+        assert "turn 8 continues" in encoded[0] or "turn 8 continues" in encoded[1]
+
+        cur = storage._read_cursor()
+        exchanges = cur.execute(
+            "SELECT ply_start, ply_end FROM exchanges "
+            "WHERE conversation_id = 'live-session' ORDER BY ply_start"
+        ).fetchall()
+        assert exchanges == [(0, 1), (2, 3), (4, 5), (6, 8), (9, 9)]
+        assert storage.get_embedding_count() == 5
+        message_count, full_text = cur.execute(
+            "SELECT message_count, full_text FROM conversations "
+            "WHERE conversation_id = 'live-session'"
+        ).fetchone()
+        assert message_count == 10
+        assert full_text.endswith("turn 8 continues the open exchange\n\nturn 9")
+        sequences = [row[0] for row in cur.execute(
+            "SELECT sequence FROM messages WHERE conversation_id = 'live-session' ORDER BY sequence"
+        ).fetchall()]
+        assert sequences == list(range(10))
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import numpy as np
@@ -62,6 +63,7 @@ def test_adaptive_reindex_updates_vectors(tmp_path, claude_project_dir, monkeypa
 
     stats = indexer.index_adaptive([str(conv_path)])
     assert stats.updated_conversations == 1
+    assert stats.changed_project_ids == {"project-one"}
 
     import pyarrow.parquet as pq
 
@@ -75,6 +77,7 @@ def test_adaptive_reindex_updates_vectors(tmp_path, claude_project_dir, monkeypa
 
     stats_skip = indexer.index_adaptive([str(conv_path)])
     assert stats_skip.skipped_conversations == 1
+    assert stats_skip.changed_project_ids == set()
 
     conv2_path = claude_project_dir / "project-one" / "conv2.jsonl"
     _write_jsonl(
@@ -96,3 +99,214 @@ def test_adaptive_reindex_updates_vectors(tmp_path, claude_project_dir, monkeypa
     assert file_state_path.exists()
     file_state_table = pq.read_table(file_state_path)
     assert len(file_state_table) == 2
+
+
+def test_append_only_encodes_chunks_across_files(tmp_path, claude_project_dir, monkeypatch):
+    calls: list[int] = []
+
+    def counting_encode(self, chunks_with_meta, progress=None):
+        calls.append(len(chunks_with_meta))
+        return _fake_encode(self, chunks_with_meta, progress)
+
+    monkeypatch.setattr(ConversationIndexer, "_batch_encode_chunks", counting_encode)
+    search_dir = tmp_path / "search"
+    indexer = ConversationIndexer(search_dir)
+
+    first = claude_project_dir / "project-one" / "conv0.jsonl"
+    _write_jsonl(
+        first,
+        [
+            {"type": "user", "message": {"content": "Hello"}, "timestamp": "2025-09-01T10:00:00"},
+            {"type": "assistant", "message": {"content": "Hi"}, "timestamp": "2025-09-01T10:00:30"},
+        ],
+    )
+    indexer.index_all()
+    calls.clear()
+
+    new_paths = []
+    for i in range(1, 4):
+        path = claude_project_dir / "project-one" / f"conv{i}.jsonl"
+        _write_jsonl(
+            path,
+            [
+                {"type": "user", "message": {"content": f"Question {i}"}, "timestamp": "2025-09-02T10:00:00"},
+                {"type": "assistant", "message": {"content": f"Answer {i}"}, "timestamp": "2025-09-02T10:00:30"},
+            ],
+        )
+        new_paths.append(str(path))
+
+    stats = indexer.index_append_only(new_paths)
+
+    assert stats.new_conversations == 3
+    assert calls == [3]
+
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_table(search_dir / "data" / "indices" / "embeddings.metadata.parquet").to_pylist()
+    assert [(row["conversation_id"], row["vector_id"]) for row in metadata] == [
+        ("conv0", 0), ("conv1", 1), ("conv2", 2), ("conv3", 3),
+    ]
+
+
+def test_adaptive_tail_append_reembeds_only_trailing_chunks(tmp_path, claude_project_dir, monkeypatch):
+    encoded: list[str] = []
+
+    def recording_encode(self, chunks_with_meta, progress=None):
+        encoded.extend(chunk["text"] for chunk in chunks_with_meta)
+        return _fake_encode(self, chunks_with_meta, progress)
+
+    monkeypatch.setattr(ConversationIndexer, "_batch_encode_chunks", recording_encode)
+    search_dir = tmp_path / "search"
+    indexer = ConversationIndexer(search_dir)
+
+    conv_path = claude_project_dir / "project-one" / "live.jsonl"
+    lines = [
+        {
+            "type": "user" if i % 2 == 0 else "assistant",
+            "message": {"content": f"turn {i} " + "words " * 100},
+            "timestamp": f"2025-09-01T10:00:{i:02d}",
+        }
+        for i in range(12)
+    ]
+    _write_jsonl(conv_path, lines)
+    indexer.index_all()
+
+    import pyarrow.parquet as pq
+
+    metadata_path = search_dir / "data" / "indices" / "embeddings.metadata.parquet"
+    before = pq.read_table(metadata_path).to_pylist()
+    assert len(before) > 2
+    encoded.clear()
+
+    with open(conv_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "user", "message": {"content": "one more question"},
+                            "timestamp": "2025-09-01T10:01:00"}) + "\n")
+
+    monkeypatch.setattr(
+        ConversationIndexer, "_chunk_by_messages",
+        _forbid_full_rechunk(ConversationIndexer._chunk_by_messages),
+    )
+    stats = indexer.index_adaptive([str(conv_path)])
+
+    assert stats.updated_conversations == 1
+    assert stats.changed_project_ids == {"project-one"}
+    after = pq.read_table(metadata_path).to_pylist()
+    # Closed chunks keep their vectors; only the open trailing chunk is redone.
+    assert after[: len(before) - 1] == before[:-1]
+    assert len(encoded) == len(after) - len(before) + 1
+    assert "one more question" in encoded[-1]
+    assert [row["chunk_index"] for row in after] == list(range(len(after)))
+
+    conversations = pq.read_table(search_dir / "data" / "conversations" / "project_project-one.parquet").to_pylist()
+    assert len(conversations) == 1
+    assert conversations[0]["message_count"] == 13
+    assert conversations[0]["full_text"].endswith("one more question")
+    assert conversations[0]["embedding_id"] == 0
+
+    # Unchanged size and mtime: skipped without reading the file.
+    monkeypatch.setattr(Path, "read_bytes", _forbid_read)
+    assert indexer.index_adaptive([str(conv_path)]).skipped_conversations == 1
+
+    # Touched but not grown: the tail checkpoint still matches, so the file is
+    # skipped without a full hash, parse or re-embed.
+    mtime_ns = conv_path.stat().st_mtime_ns + 5_000_000_000
+    os.utime(conv_path, ns=(mtime_ns, mtime_ns))
+    encoded.clear()
+    stats = indexer.index_adaptive([str(conv_path)])
+    assert stats.skipped_conversations == 1
+    assert stats.updated_conversations == 0
+    assert encoded == []
+    assert pq.read_table(metadata_path).to_pylist() == after
+
+
+def test_adaptive_reports_old_project_of_moved_conversation(tmp_path, claude_project_dir, monkeypatch):
+    monkeypatch.setattr(ConversationIndexer, "_batch_encode_chunks", _fake_encode)
+    search_dir = tmp_path / "search"
+    indexer = ConversationIndexer(search_dir)
+
+    conv_path = claude_project_dir / "project-one" / "conv1.jsonl"
+    _write_jsonl(conv_path, [
+        {"type": "user", "message": {"content": "Hello"}, "timestamp": "2025-09-01T10:00:00"},
+        {"type": "assistant", "message": {"content": "Hi"}, "timestamp": "2025-09-01T10:00:30"},
+    ])
+    indexer.index_all()
+
+    # The stored state says the conversation was last indexed under another project.
+    load_file_state = ConversationIndexer._load_file_state
+
+    def moved_file_state(self):
+        state = load_file_state(self)
+        state[str(conv_path)]["project_id"] = "project-old"
+        return state
+
+    monkeypatch.setattr(ConversationIndexer, "_load_file_state", moved_file_state)
+    _write_jsonl(conv_path, [
+        {"type": "user", "message": {"content": "Hello again"}, "timestamp": "2025-09-02T10:00:00"},
+        {"type": "assistant", "message": {"content": "Hi again"}, "timestamp": "2025-09-02T10:00:30"},
+    ])
+
+    stats = indexer.index_adaptive([str(conv_path)])
+
+    assert stats.updated_conversations == 1
+    assert stats.changed_project_ids == {"project-one", "project-old"}
+
+
+def _forbid_full_rechunk(chunk_by_messages):
+    def wrapper(self, messages, title, start=0):
+        assert start > 0, "tail append should not re-chunk the whole conversation"
+        return chunk_by_messages(self, messages, title, start)
+    return wrapper
+
+
+def _forbid_read(self):
+    raise AssertionError(f"unexpected read of {self}")
+
+
+def test_index_all_streams_windows_into_row_groups(tmp_path, claude_project_dir, monkeypatch):
+    import searchat.core.indexer as indexer_module
+
+    windows: list[int] = []
+
+    def recording_encode(self, chunks_with_meta, progress=None):
+        windows.append(len(chunks_with_meta))
+        return _fake_encode(self, chunks_with_meta, progress)
+
+    monkeypatch.setattr(ConversationIndexer, "_batch_encode_chunks", recording_encode)
+    monkeypatch.setattr(indexer_module, "_REBUILD_WINDOW_CONVERSATIONS", 2)
+    search_dir = tmp_path / "search"
+    indexer = ConversationIndexer(search_dir)
+
+    for i in range(5):
+        project = "project-one" if i % 2 == 0 else "project-two"
+        _write_jsonl(
+            claude_project_dir / project / f"conv{i}.jsonl",
+            [
+                {"type": "user", "message": {"content": f"Question {i}"}, "timestamp": "2025-09-01T10:00:00"},
+                {"type": "assistant", "message": {"content": f"Answer {i}"}, "timestamp": "2025-09-01T10:00:30"},
+            ],
+        )
+
+    stats = indexer.index_all()
+
+    import pyarrow.parquet as pq
+
+    assert stats.total_conversations == 5
+    assert windows == [2, 2, 1]
+    indices_dir = search_dir / "data" / "indices"
+    assert not (indices_dir / "embeddings.rebuild.f32").exists()
+
+    metadata = pq.read_table(indices_dir / "embeddings.metadata.parquet").to_pylist()
+    assert [row["vector_id"] for row in metadata] == list(range(5))
+    first_vector = {row["conversation_id"]: row["vector_id"] for row in metadata}
+
+    conversations_dir = search_dir / "data" / "conversations"
+    one = pq.ParquetFile(conversations_dir / "project_project-one.parquet")
+    assert one.metadata.num_rows == 3
+    assert one.metadata.num_row_groups > 1
+    rows = one.read().to_pylist() + pq.read_table(conversations_dir / "project_project-two.parquet").to_pylist()
+    assert {row["conversation_id"]: row["embedding_id"] for row in rows} == first_vector
+
+    code_dir = search_dir / "data" / "code"
+    assert sorted(p.name for p in code_dir.glob("*.parquet")) == [
+        "project_project-one.parquet", "project_project-two.parquet",
+    ]
@@ -433,7 +433,7 @@ def test_ensure_search_engine_creates_instance(
         sys.modules,
         "searchat.services.retrieval_service",
         types.SimpleNamespace(
-            build_retrieval_service=lambda search_dir, *, config: _SearchEngine(
+            build_retrieval_service=lambda search_dir, *, config, **_kwargs: _SearchEngine(
                 search_dir, config
             )
         ),
@@ -462,7 +462,7 @@ def test_ensure_search_engine_sets_error_on_failure(
         sys.modules,
         "searchat.services.retrieval_service",
         types.SimpleNamespace(
-            build_retrieval_service=lambda search_dir, *, config: _SearchEngine(
+            build_retrieval_service=lambda search_dir, *, config, **_kwargs: _SearchEngine(
                 search_dir, config
             )
         ),
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from searchat.api import executors
+from searchat.api.executors import (
+    BoundedExecutor,
+    ExecutorSaturated,
+    PooledModel,
+)
+
+
+@pytest.fixture
+def pool():
+    executor = BoundedExecutor("test", workers=1, queue_limit=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_executors():
+    executors.shutdown_executors()
+    yield
+    executors.shutdown_executors()
+    executors.configure_executors(SimpleNamespace())
+
+
+def _block(pool: BoundedExecutor, gate: threading.Event, jobs: int) -> list:
+    started = threading.Event()
+
+    def wait() -> str:
+        started.set()
+        gate.wait(5)
+        return "done"
+
+    futures = [pool.submit(wait) for _ in range(jobs)]
+    assert started.wait(5)
+    return futures
+
+
+def test_run_returns_result_off_the_event_loop(pool: BoundedExecutor) -> None:
+    loop_thread = threading.get_ident()
+
+    async def main() -> int:
+        return await pool.run(threading.get_ident)
+
+    assert asyncio.run(main()) != loop_thread
+    stats = pool.stats()
+    assert stats.completed == 1
+    assert stats.running == 0
+    assert stats.queued == 0
+
+
+def test_submit_rejects_beyond_workers_plus_queue(pool: BoundedExecutor) -> None:
+    gate = threading.Event()
+    futures = _block(pool, gate, jobs=2)
+
+    with pytest.raises(ExecutorSaturated) as exc_info:
+        pool.submit(lambda: None)
+    assert exc_info.value.retry_after >= 1
+
+    stats = pool.stats()
+    assert stats.running == 1
+    assert stats.queued == 1
+    assert stats.peak_depth == 2
+    assert stats.rejected == 1
+
+    gate.set()
+    assert [f.result(5) for f in futures] == ["done", "done"]
+    assert pool.submit(lambda: 7).result(5) == 7
+
+
+def test_call_waits_instead_of_rejecting(pool: BoundedExecutor) -> None:
+    gate = threading.Event()
+    futures = _block(pool, gate, jobs=2)
+
+    result: list[int] = []
+    caller = threading.Thread(target=lambda: result.append(pool.call(lambda: 3)))
+    caller.start()
+    gate.set()
+    caller.join(5)
+
+    assert result == [3]
+    assert pool.stats().rejected == 0
+    for future in futures:
+        future.result(5)
+
+
+def test_call_from_own_worker_runs_inline(pool: BoundedExecutor) -> None:
+    # With one worker, a nested submit would wait on itself forever.
+    assert pool.submit(lambda: pool.call(lambda: "inner")).result(5) == "inner"
+
+
+def test_pooled_model_routes_calls_to_executor(pool: BoundedExecutor) -> None:
+    threads: list[int] = []
+
+    class Model:
+        dimension = 384
+
+        def encode(self, text):
+            threads.append(threading.get_ident())
+            return [len(text)]
+
+        def predict(self, pairs):
+            return [0.5 for _ in pairs]
+
+    model = PooledModel(Model(), pool)
+
+    assert model.encode("abc") == [3]
+    assert model.predict([("q", "d")]) == [0.5]
+    assert model.dimension == 384
+    assert threads and threads[0] != threading.get_ident()
+    assert pool.stats().completed == 2
+
+
+def test_run_retrieval_maps_saturation_to_503() -> None:
+    executors.configure_executors(
+        SimpleNamespace(performance=SimpleNamespace(retrieval_workers=1, executor_queue_limit=0))
+    )
+    retrieval = executors.get_executor(executors.RETRIEVAL)
+    gate = threading.Event()
+    futures = _block(retrieval, gate, jobs=1)
+
+    async def main() -> None:
+        await executors.run_retrieval(lambda: None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main())
+    gate.set()
+    futures[0].result(5)
+
+    assert exc_info.value.status_code == 503
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+    names = {stats.name for stats in executors.executor_stats()}
+    assert executors.RETRIEVAL in names
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from searchat.api import exports
+from searchat.api.exports import ExportCache, ExportRenderer, ZipStream, iter_exports
+from searchat.api.models.responses import ConversationMessage, ConversationResponse
+from searchat.services.export_service import ExportResult
+
+
+def _conversation(conversation_id: str, content: str = "hello") -> ConversationResponse:
+    return ConversationResponse(
+        conversation_id=conversation_id,
+        title=f"Title {conversation_id}",
+        project_id="proj",
+        file_path=f"/tmp/{conversation_id}.jsonl",
+        message_count=1,
+        tool="claude",
+        messages=[ConversationMessage(role="user", content=content, timestamp="2026-01-01T00:00:00")],
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_exports():
+    exports.shutdown_exports()
+    yield
+    exports.shutdown_exports()
+    exports.configure_exports(SimpleNamespace())
+
+
+@pytest.mark.unit
+def test_cache_evicts_least_recently_used_by_bytes() -> None:
+    cache = ExportCache(max_bytes=10)
+    for key in ("a", "b"):
+        cache.put((key, "h", "json"), ExportResult(content=b"12345", media_type="x", filename=key))
+    assert cache.get(("a", "h", "json")) is not None
+
+    cache.put(("c", "h", "json"), ExportResult(content=b"12345", media_type="x", filename="c"))
+    cache.put(("big", "h", "json"), ExportResult(content=b"x" * 11, media_type="x", filename="big"))
+
+    assert cache.get(("b", "h", "json")) is None
+    assert cache.get(("a", "h", "json")) is not None
+    assert cache.get(("big", "h", "json")) is None
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_renderer_caches_by_content_hash(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_export(conversation, *, format):
+        calls.append(conversation.messages[0].content)
+        return ExportResult(content=conversation.messages[0].content.encode(), media_type="x", filename="f")
+
+    monkeypatch.setattr(exports, "export_conversation", fake_export)
+    renderer = ExportRenderer(workers=1, cache_mb=1)
+
+    async def run() -> list[bytes]:
+        return [
+            (await renderer.render(_conversation("c-1", "one"), "json")).content,
+            (await renderer.render(_conversation("c-1", "one"), "json")).content,
+            (await renderer.render(_conversation("c-1", "edited"), "json")).content,
+        ]
+
+    assert asyncio.run(run()) == [b"one", b"one", b"edited"]
+    assert calls == ["one", "edited"]
+
+
+@pytest.mark.unit
+def test_renderer_renders_pdf_in_worker_process(monkeypatch) -> None:
+    monkeypatch.setattr(exports.os, "cpu_count", lambda: 2)
+    renderer = ExportRenderer(workers=2, cache_mb=1)
+    try:
+        result = asyncio.run(renderer.render(_conversation("c-1", "```python\nx = 1\n```"), "pdf"))
+        pool = renderer._pool
+        assert pool is not None
+    finally:
+        renderer.shutdown()
+    pool.shutdown(wait=True)
+
+    assert result.content.startswith(b"%PDF")
+    assert result.media_type == "application/pdf"
+
+
+@pytest.mark.unit
+def test_streamed_archive_keeps_order_skips_failures_and_bounds_window(monkeypatch) -> None:
+    monkeypatch.setattr(exports, "EXPORT_WINDOW_PER_WORKER", 2)
+    renderer = ExportRenderer(workers=1, cache_mb=1)
+    active = 0
+    peak = 0
+
+    async def load(conversation_id: str):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01 if conversation_id == "c-0" else 0)
+        active -= 1
+        if conversation_id == "missing":
+            raise HTTPException(status_code=404)
+        return _conversation(conversation_id)
+
+    async def collect() -> list[bytes]:
+        ids = ["c-0", "missing", "c-2", "c-3", "c-4"]
+        stream = ZipStream().stream(iter_exports(ids, load, "markdown", renderer))
+        return [chunk async for chunk in stream]
+
+    chunks = asyncio.run(collect())
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+    assert len(chunks) > 2
+    assert archive.namelist() == [f"Title c-{i}_c-{i}.md" for i in (0, 2, 3, 4)]
+    assert archive.read("Title c-2_c-2.md").startswith(b"# Title c-2")
+    assert peak == 2
@@ -111,3 +111,63 @@ class TestClaudeBuildResumeCommand:
         path.write_text("{}\n", encoding="utf-8")
         cmd = connector.build_resume_command(path)
         assert cmd == "claude --conversation my-session-id"
+
+
+def _line(role: str, text: str, second: int) -> str:
+    return json.dumps({
+        "type": role,
+        "timestamp": f"2026-03-29T10:00:{second:02d}",
+        "message": {"content": text},
+    }) + "\n"
+
+
+class TestClaudeTailParse:
+    def test_parse_tail_returns_only_appended_messages(self, connector: ClaudeConnector, tmp_path) -> None:
+        path = tmp_path / "live.jsonl"
+        path.write_text(_line("user", "first", 0) + _line("assistant", "reply", 1), encoding="utf-8")
+        record, cursor = connector.parse_with_cursor(path, 0)
+        assert cursor is not None
+        assert cursor.byte_offset == path.stat().st_size
+        assert cursor.next_sequence == record.message_count == 2
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(_line("user", "second", 2) + _line("assistant", "more", 3))
+
+        tail = connector.parse_tail(path, cursor)
+
+        assert tail is not None
+        assert [(m.sequence, m.content) for m in tail.messages] == [(2, "second"), (3, "more")]
+        assert tail.cursor.byte_offset == path.stat().st_size
+        assert tail.cursor.next_sequence == 4
+        assert tail.cursor.file_hash != cursor.file_hash
+        # Resuming from the new cursor finds nothing further.
+        assert connector.parse_tail(path, tail.cursor).messages == []
+
+    def test_partial_trailing_line_is_left_for_next_call(self, connector: ClaudeConnector, tmp_path) -> None:
+        path = tmp_path / "live.jsonl"
+        path.write_text(_line("user", "first", 0), encoding="utf-8")
+        _record, cursor = connector.parse_with_cursor(path, 0)
+        complete = _line("assistant", "done", 1)
+        partial = _line("user", "half written", 2)
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(complete + partial[:10])
+        tail = connector.parse_tail(path, cursor)
+
+        assert [m.content for m in tail.messages] == ["done"]
+        assert tail.cursor.byte_offset == cursor.byte_offset + len(complete)
+
+    def test_rewritten_file_returns_none(self, connector: ClaudeConnector, tmp_path) -> None:
+        path = tmp_path / "live.jsonl"
+        path.write_text(_line("user", "first", 0), encoding="utf-8")
+        _record, cursor = connector.parse_with_cursor(path, 0)
+
+        path.write_text(_line("user", "FIRST", 0) + _line("assistant", "reply", 1), encoding="utf-8")
+
+        assert connector.parse_tail(path, cursor) is None
+
+    def test_no_cursor_without_trailing_newline(self, connector: ClaudeConnector, claude_jsonl) -> None:
+        record, cursor = connector.parse_with_cursor(claude_jsonl, 0)
+
+        assert record.message_count == 3
+        assert cursor is None
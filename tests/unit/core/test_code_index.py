@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from searchat.core.code_index import CodeIndex, parquet_signature, regex_literals
+from searchat.models.schemas import CODE_BLOCK_SCHEMA
+
+_NOW = datetime(2026, 2, 2, 12, 0, 0)
+
+
+def _row(conversation_id: str, code: str, *, functions: tuple[str, ...] = (), message_index: int = 0) -> dict:
+    return {
+        "conversation_id": conversation_id,
+        "project_id": "project-one",
+        "connector": "claude",
+        "file_path": f"/tmp/{conversation_id}.jsonl",
+        "title": conversation_id,
+        "conversation_created_at": _NOW,
+        "conversation_updated_at": _NOW,
+        "message_index": message_index,
+        "block_index": 0,
+        "role": "assistant",
+        "message_timestamp": _NOW,
+        "fence_language": "python",
+        "language": "python",
+        "language_source": "fence",
+        "functions": list(functions),
+        "classes": [],
+        "imports": ["os"],
+        "code": code,
+        "code_hash": conversation_id,
+        "lines": code.count("\n") + 1,
+    }
+
+
+def _write(code_dir: Path, rows: list[dict]) -> None:
+    pq.write_table(pa.Table.from_pylist(rows, schema=CODE_BLOCK_SCHEMA), code_dir / "project_project-one.parquet")
+
+
+@pytest.fixture
+def indexed(tmp_path: Path) -> tuple[CodeIndex, Path]:
+    code_dir = tmp_path / "data" / "code"
+    code_dir.mkdir(parents=True)
+    _write(
+        code_dir,
+        [
+            _row("conv-1", "def greet():\n    print('Hello')", functions=("greet",)),
+            _row("conv-2", "total = compute_total(items)", functions=("compute_total",)),
+        ],
+    )
+    index = CodeIndex(tmp_path / "data" / "indices" / "code_index.duckdb")
+    assert index.rebuild(code_dir) == 2
+    return index, code_dir
+
+
+def _ids(rows: list[tuple] | None) -> list[str]:
+    assert rows is not None
+    return sorted(row[0] for row in rows)
+
+
+@pytest.mark.unit
+def test_search_by_symbol_term_and_regex(indexed: tuple[CodeIndex, Path]) -> None:
+    index, code_dir = indexed
+
+    assert _ids(index.search(code_dir, symbols={"functions": "compute_total"}, limit=10, offset=0)) == ["conv-2"]
+    assert _ids(index.search(code_dir, terms=["HELLO"], limit=10, offset=0)) == ["conv-1"]
+    assert _ids(index.search(code_dir, terms=["print", "greet"], limit=10, offset=0)) == ["conv-1"]
+    assert _ids(index.search(code_dir, regex=r"compute_\w+\(", limit=10, offset=0)) == ["conv-2"]
+    assert _ids(index.search(code_dir, terms=["nowhere"], limit=10, offset=0)) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern", [r"Hello", r"\x48ello", r"\x{48}ello", r"\110ello", r"\pLello"])
+def test_regex_escapes_do_not_prefilter_out_matches(indexed: tuple[CodeIndex, Path], pattern: str) -> None:
+    index, code_dir = indexed
+
+    assert _ids(index.search(code_dir, regex=pattern, limit=10, offset=0)) == ["conv-1"]
+    assert _ids(index.search(code_dir, terms=["to"], limit=10, offset=0)) == ["conv-2"]
+
+    rows = index.search(code_dir, filters=["project_id = ?"], params=["project-one"], limit=1, offset=0)
+    assert rows is not None and len(rows) == 1 and rows[0][-1] == 2
+
+
+@pytest.mark.unit
+def test_conversation_symbols(indexed: tuple[CodeIndex, Path]) -> None:
+    index, code_dir = indexed
+
+    assert index.conversation_symbols(code_dir, "conv-1") == {
+        "functions": ["greet"],
+        "classes": [],
+        "imports": ["os"],
+    }
+
+
+@pytest.mark.unit
+def test_incremental_add_and_remove(indexed: tuple[CodeIndex, Path]) -> None:
+    index, code_dir = indexed
+    path = code_dir / "project_project-one.parquet"
+
+    added = [_row("conv-3", "HELLO_WORLD = 1", message_index=1)]
+    before = parquet_signature(code_dir)
+    _write(code_dir, pq.read_table(path).to_pylist() + added)
+    index.apply(code_dir, before=before, add=added)
+    assert _ids(index.search(code_dir, terms=["hello"], limit=10, offset=0)) == ["conv-1", "conv-3"]
+
+    before = parquet_signature(code_dir)
+    pq.write_table(pq.read_table(path).filter(pc.field("conversation_id") != "conv-1"), path)
+    index.apply(code_dir, before=before, remove_conversation_ids=["conv-1"])
+    assert _ids(index.search(code_dir, terms=["hello"], limit=10, offset=0)) == ["conv-3"]
+    assert index.conversation_symbols(code_dir, "conv-1") == {"functions": [], "classes": [], "imports": []}
+
+
+@pytest.mark.unit
+def test_stale_index_is_not_used_and_missed_change_rebuilds(indexed: tuple[CodeIndex, Path]) -> None:
+    index, code_dir = indexed
+    path = code_dir / "project_project-one.parquet"
+
+    _write(code_dir, pq.read_table(path).to_pylist() + [_row("conv-3", "print('hello again')", message_index=1)])
+    assert index.search(code_dir, terms=["hello"], limit=10, offset=0) is None
+    assert index.conversation_symbols(code_dir, "conv-1") is None
+
+    # The index never saw that write, so the next change rebuilds from Parquet.
+    before = parquet_signature(code_dir)
+    pq.write_table(pq.read_table(path).filter(pc.field("conversation_id") != "conv-2"), path)
+    index.apply(code_dir, before=before, remove_conversation_ids=["conv-2"])
+    assert _ids(index.search(code_dir, terms=["hello"], limit=10, offset=0)) == ["conv-1", "conv-3"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("pattern", "literals"),
+    [
+        (r"compute_\w+\(", ["compute_", "("]),
+        (r"def\s+greet", ["def", "greet"]),
+        (r"colou?r", ["colo", "r"]),
+        (r"foo|bar", []),
+        (r"(?i)[abc]xyz", ["xyz"]),
+        (r"\x41bcd", ["bcd"]),
+        (r"\x{41}bcd", ["bcd"]),
+        (r"\pLfoo", ["foo"]),
+        (r"\p{Greek}foo", ["foo"]),
+        (r"\PLfoo", ["foo"]),
+        (r"\141bcd", ["bcd"]),
+        (r"\Qa.b\Efoo", ["foo"]),
+    ],
+)
+def test_regex_literals(pattern: str, literals: list[str]) -> None:
+    assert regex_literals(pattern) == literals
@@ -8,6 +8,7 @@ import pyarrow.parquet as pq
 import pytest
 
 from searchat.config import PathResolver
+from searchat.core.code_index import CodeIndex
 from searchat.core.indexer import ConversationIndexer
 
 
@@ -58,3 +59,8 @@ def test_index_all_writes_code_blocks_parquet(tmp_path: Path, monkeypatch) -> No
     assert table.num_rows >= 1
     assert "code" in table.column_names
     assert "language" in table.column_names
+
+    rows = CodeIndex(search_dir / "data" / "indices" / "code_index.duckdb").search(
+        code_dir, terms=["print"], limit=10, offset=0,
+    )
+    assert rows is not None and len(rows) == 1
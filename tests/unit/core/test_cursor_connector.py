@@ -71,3 +71,120 @@ def test_cursor_connector_parses_minimal_sqlite(tmp_path: Path) -> None:
     assert record.messages[0].content == "Hello from user"
     assert record.messages[1].role == "assistant"
     assert record.messages[1].content == "Hello from assistant"
+
+
+def _write_workspace_db(db_path: Path, composers: dict[str, list[str]], updated_at: int = 1_700_000_010_000) -> None:
+    con = sqlite3.connect(db_path)
+    try:
+        con.execute("CREATE TABLE IF NOT EXISTS cursorDiskKV (key TEXT PRIMARY KEY, value TEXT)")
+        for composer_id, texts in composers.items():
+            headers = []
+            for i, text in enumerate(texts):
+                bubble_id = f"{composer_id}-b{i}"
+                headers.append({"bubbleId": bubble_id, "type": 1 if i % 2 == 0 else 2})
+                con.execute(
+                    "INSERT OR REPLACE INTO cursorDiskKV(key, value) VALUES(?, ?)",
+                    (
+                        f"bubbleId:{composer_id}:{bubble_id}",
+                        json.dumps({"bubbleId": bubble_id, "rawText": text, "timestamp": updated_at}),
+                    ),
+                )
+            composer = {
+                "composerId": composer_id,
+                "createdAt": 1_700_000_000_000,
+                "lastUpdatedAt": updated_at,
+                "fullConversationHeadersOnly": headers,
+            }
+            con.execute(
+                "INSERT OR REPLACE INTO cursorDiskKV(key, value) VALUES(?, ?)",
+                (f"composerData:{composer_id}", json.dumps(composer)),
+            )
+        con.commit()
+    finally:
+        con.close()
+
+
+def test_cursor_connector_reads_each_db_once(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "state.vscdb"
+    _write_workspace_db(db_path, {"c1": ["hi", "hello"], "c2": ["question", "answer", "more"]})
+
+    connector = CursorConnector()
+    loads: list[Path] = []
+    original = connector._load_session
+
+    def counting_load(path: Path):
+        loads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(connector, "_load_session", counting_load)
+
+    records = [
+        connector.parse(Path(f"{db_path.as_posix()}.cursor/{cid}.json"), embedding_id=0)
+        for cid in connector._list_composer_ids(db_path)
+    ]
+
+    assert [r.message_count for r in records] == [2, 3]
+    assert records[1].messages[2].content == "more"
+    assert loads == [db_path]
+
+    # Rewriting the DB invalidates the cached session.
+    _write_workspace_db(db_path, {"c3": ["new"]})
+    assert "c3" in connector._list_composer_ids(db_path)
+    assert len(loads) == 2
+
+
+def test_cursor_session_sees_uncheckpointed_wal_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "state.vscdb"
+    _write_workspace_db(db_path, {"c1": ["hi"]})
+    writer = sqlite3.connect(db_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        connector = CursorConnector()
+        assert connector._list_composer_ids(db_path) == ["c1"]
+        main_stat = db_path.stat()
+
+        writer.execute(
+            "INSERT INTO cursorDiskKV(key, value) VALUES(?, ?)",
+            ("composerData:c2", json.dumps({"composerId": "c2"})),
+        )
+        writer.commit()
+
+        assert (db_path.stat().st_mtime_ns, db_path.stat().st_size) == (
+            main_stat.st_mtime_ns, main_stat.st_size,
+        )
+        assert connector._list_composer_ids(db_path) == ["c1", "c2"]
+    finally:
+        writer.close()
+
+
+def test_cursor_sessions_are_released_after_indexing_pass(tmp_path: Path) -> None:
+    db_path = tmp_path / "state.vscdb"
+    _write_workspace_db(db_path, {"c1": ["hi"]})
+    connector = CursorConnector()
+    connector._list_composer_ids(db_path)
+    assert connector._sessions
+
+    connector.release_parse_cache()
+
+    assert not connector._sessions
+
+
+def test_cursor_file_hash_follows_last_updated_at(tmp_path: Path) -> None:
+    first_db = tmp_path / "a" / "state.vscdb"
+    second_db = tmp_path / "b" / "state.vscdb"
+    third_db = tmp_path / "c" / "state.vscdb"
+    for path in (first_db, second_db, third_db):
+        path.parent.mkdir()
+    _write_workspace_db(first_db, {"c1": ["hi"]})
+    _write_workspace_db(second_db, {"c1": ["hi"]})
+    _write_workspace_db(third_db, {"c1": ["hi"]}, updated_at=1_700_000_020_000)
+
+    connector = CursorConnector()
+    hashes = [
+        connector.parse(Path(f"{db.as_posix()}.cursor/c1.json"), embedding_id=0).file_hash
+        for db in (first_db, second_db, third_db)
+    ]
+
+    assert hashes[0] == hashes[1]
+    assert hashes[0] != hashes[2]
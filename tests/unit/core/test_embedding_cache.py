@@ -0,0 +1,175 @@
+"""Tests for the content-addressed embedding cache."""
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from searchat.core.embedding_cache import (
+    EmbeddingCache,
+    cached_encode,
+    get_embedding_cache,
+    text_key,
+)
+
+
+class CountingEncoder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.array([[float(len(t)), float(sum(map(ord, t)) % 97)] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    instance = EmbeddingCache(tmp_path / "indices" / "embedding_cache.duckdb")
+    yield instance
+    instance.close()
+
+
+def test_text_key_ignores_whitespace_layout() -> None:
+    assert text_key("hello   world\n") == text_key(" hello world")
+    assert text_key("hello world") != text_key("hello worlds")
+
+
+def test_encodes_only_unseen_texts(cache: EmbeddingCache) -> None:
+    encoder = CountingEncoder()
+
+    first = cache.encode("m", ["alpha", "beta", "alpha"], encoder)
+    second = cache.encode("m", ["beta", "gamma"], encoder)
+
+    assert encoder.calls == [["alpha", "beta"], ["gamma"]]
+    assert first.shape == (3, 2)
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(second[0], first[1])
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 4)
+    assert stats.hit_rate == pytest.approx(0.2)
+
+
+def test_model_key_separates_entries(cache: EmbeddingCache) -> None:
+    encoder = CountingEncoder()
+
+    cache.encode("model-a", ["text"], encoder)
+    cache.encode("model-a:normalized", ["text"], encoder)
+
+    assert len(encoder.calls) == 2
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    db_path = tmp_path / "embedding_cache.duckdb"
+    encoder = CountingEncoder()
+    first = EmbeddingCache(db_path)
+    expected = first.encode("m", ["persist me"], encoder)
+    first.close()
+
+    second = EmbeddingCache(db_path)
+    try:
+        vectors = second.encode("m", ["persist me"], encoder)
+        assert second.stats().persistent_entries == 1
+    finally:
+        second.close()
+
+    assert len(encoder.calls) == 1
+    np.testing.assert_array_equal(vectors, expected)
+
+
+def test_evicts_least_recently_used_rows(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path / "embedding_cache.duckdb", max_entries=2, memory_entries=1)
+    encoder = CountingEncoder()
+    try:
+        for text in ("one", "two", "three"):
+            cache.encode("m", [text], encoder)
+            cache.flush()
+        stats = cache.stats()
+        assert stats.persistent_entries == 2
+        assert stats.evictions == 1
+
+        cache.encode("m", ["one"], encoder)
+    finally:
+        cache.close()
+
+    assert encoder.calls[-1] == ["one"]
+
+
+def test_hits_do_not_rewrite_persisted_rows(cache: EmbeddingCache) -> None:
+    encoder = CountingEncoder()
+    cache.encode("m", ["hot"], encoder)
+    cache.flush()
+    conn = cache._conn
+    before = conn.execute("SELECT last_used FROM embedding_cache").fetchall()
+
+    for _ in range(3):
+        cache.encode("m", ["hot"], encoder)
+    cache.flush()
+
+    assert cache._dirty == {}
+    assert conn.execute("SELECT last_used FROM embedding_cache").fetchall() == before
+    assert len(encoder.calls) == 1
+
+
+def test_eviction_keeps_recently_hit_rows(tmp_path: Path) -> None:
+    db_path = tmp_path / "embedding_cache.duckdb"
+    cache = EmbeddingCache(db_path, max_entries=2)
+    encoder = CountingEncoder()
+    try:
+        cache.encode("m", ["one", "two"], encoder)
+        cache.flush()
+        cache.encode("m", ["one"], encoder)
+        cache.encode("m", ["three"], encoder)
+        cache.flush()
+    finally:
+        cache.close()
+
+    reopened = EmbeddingCache(db_path, max_entries=2)
+    try:
+        reopened.encode("m", ["one", "three"], encoder)
+        reopened.encode("m", ["two"], encoder)
+    finally:
+        reopened.close()
+
+    assert encoder.calls == [["one", "two"], ["three"], ["two"]]
+
+
+def test_falls_back_to_memory_when_file_unavailable(tmp_path: Path) -> None:
+    blocked = tmp_path / "blocked"
+    blocked.mkdir()
+    cache = EmbeddingCache(blocked)
+    encoder = CountingEncoder()
+
+    cache.encode("m", ["x"], encoder)
+    cache.encode("m", ["x"], encoder)
+    cache.flush()
+
+    assert cache.persistent is False
+    assert len(encoder.calls) == 1
+
+
+def test_rejects_mismatched_encoder_output(cache: EmbeddingCache) -> None:
+    with pytest.raises(ValueError, match="for 2 texts"):
+        cache.encode("m", ["a", "b"], lambda texts: np.zeros((3, 2), dtype=np.float32))
+
+
+def test_get_embedding_cache_honors_config(tmp_path: Path) -> None:
+    enabled = SimpleNamespace(embedding=SimpleNamespace(cache_embeddings=True, cache_max_entries=10))
+    disabled = SimpleNamespace(embedding=SimpleNamespace(cache_embeddings=False))
+
+    shared = get_embedding_cache(enabled, tmp_path)
+
+    assert get_embedding_cache(disabled, tmp_path) is None
+    assert shared is get_embedding_cache(enabled, tmp_path)
+    assert shared.db_path == tmp_path / "data" / "indices" / "embedding_cache.duckdb"
+    assert shared.max_entries == 10
+
+
+def test_cached_encode_without_cache_calls_encoder() -> None:
+    encoder = CountingEncoder()
+
+    vectors = cached_encode(None, "m", ["a", "a"], encoder)
+
+    assert encoder.calls == [["a", "a"]]
+    assert vectors.dtype == np.float32
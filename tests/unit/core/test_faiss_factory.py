@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import math
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import searchat.core.faiss_factory as faiss_factory
+from searchat.core.faiss_factory import (
+    FLAT_MAX_VECTORS,
+    TARGET_RECALL,
+    FaissRetrainer,
+    build_index,
+    choose_index_plan,
+    estimate_index_bytes,
+    index_kind,
+    ivf_list_imbalance,
+    reconstruct_all,
+    retrain_reason,
+    search_parameters,
+    write_index_atomic,
+)
+
+DIM = 16
+
+
+def _load_real_faiss():
+    """The installed faiss module; tests/conftest.py puts a mock in sys.modules."""
+    mocked = sys.modules.pop("faiss", None)
+    try:
+        return importlib.import_module("faiss")
+    except ImportError:
+        return None
+    finally:
+        if mocked is not None:
+            sys.modules["faiss"] = mocked
+
+
+faiss = _load_real_faiss()
+
+requires_faiss = pytest.mark.skipif(faiss is None, reason="faiss-cpu not installed")
+
+
+@pytest.fixture
+def real_faiss(monkeypatch):
+    monkeypatch.setattr(faiss_factory, "faiss", faiss)
+
+
+def _config(index_type: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        performance=SimpleNamespace(faiss_memory_budget_mb=2048, faiss_index_type=index_type),
+    )
+
+
+def _clustered(n: int, *, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(32, DIM)).astype(np.float32)
+    noise = rng.normal(scale=0.1, size=(n, DIM)).astype(np.float32)
+    return centers[rng.integers(0, len(centers), size=n)] + noise
+
+
+def _build(kind: str, vectors: np.ndarray, ids: np.ndarray) -> faiss.Index:
+    plan = choose_index_plan(len(vectors), DIM, index_type=kind)
+    assert plan.kind == kind
+    return build_index(vectors, ids, plan)
+
+
+def _filtered_ids(index: faiss.Index, query: np.ndarray, allowed: np.ndarray, k: int = 10) -> set[int]:
+    params = search_parameters(index, faiss.IDSelectorBatch(allowed))
+    _, labels = index.search(query.reshape(1, -1), k, params=params)
+    return {int(i) for i in labels[0] if i >= 0}
+
+
+def test_small_corpora_use_exact_search() -> None:
+    plan = choose_index_plan(FLAT_MAX_VECTORS - 1, 384, memory_budget_mb=2048)
+
+    assert plan.kind == "flat"
+    assert plan.factory_string == "Flat"
+
+
+@pytest.mark.parametrize(
+    ("n_vectors", "budget_mb", "kind"),
+    [
+        (100_000, 2048, "hnsw"),
+        (1_000_000, 2048, "ivf"),
+        (1_000_000, 256, "ivfpq"),
+    ],
+)
+def test_auto_plan_follows_size_and_memory_budget(n_vectors: int, budget_mb: int, kind: str) -> None:
+    plan = choose_index_plan(n_vectors, 384, memory_budget_mb=budget_mb)
+
+    assert plan.kind == kind
+    if kind in ("ivf", "ivfpq"):
+        assert plan.nlist == round(math.sqrt(n_vectors))
+    if kind == "ivfpq":
+        assert 384 % plan.pq_m == 0
+        assert plan.factory_string == f"IVF{plan.nlist},PQ{plan.pq_m}x8"
+        assert plan.estimated_bytes <= budget_mb * 1024 * 1024
+    assert plan.estimated_bytes == estimate_index_bytes(kind, n_vectors, 384)
+
+
+def test_pinned_type_is_honoured_until_too_small_to_train() -> None:
+    assert choose_index_plan(50_000, 384, index_type="ivf").kind == "ivf"
+    assert choose_index_plan(50_000, 384, index_type="hnsw").kind == "hnsw"
+    assert choose_index_plan(100, 384, index_type="ivfpq").kind == "flat"
+    assert choose_index_plan(100, 384, index_type="bogus").kind == "flat"
+
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+@pytest.mark.parametrize(("kind", "param"), [("ivf", "nprobe"), ("hnsw", "efSearch")])
+def test_build_tunes_search_param_for_target_recall(kind: str, param: str) -> None:
+    vectors = _clustered(2000)
+    index = _build(kind, vectors, np.arange(2000, dtype=np.int64) * 3)
+    base = faiss.downcast_index(index.index)
+
+    tuned = getattr(base if kind == "ivf" else base.hnsw, param)
+    upper = base.nlist if kind == "ivf" else max(faiss_factory._EF_SEARCH_CANDIDATES)
+    assert 1 <= tuned <= upper
+
+    queries = vectors[:100]
+    exact = faiss.IndexFlatL2(DIM)
+    exact.add(vectors)
+    _, truth = exact.search(queries, 10)
+    _, found = index.search(queries, 10)
+    hits = sum(len(set(f // 3) & set(t)) for f, t in zip(found, truth))
+    assert hits / truth.size >= TARGET_RECALL - 0.05
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+def test_search_parameters_carry_tuned_settings() -> None:
+    vectors = _clustered(2000)
+    ids = np.arange(2000, dtype=np.int64)
+    sel = faiss.IDSelectorBatch(ids[:10])
+
+    ivf = _build("ivf", vectors, ids)
+    ivf_params = search_parameters(ivf, sel)
+    assert isinstance(ivf_params, faiss.SearchParametersIVF)
+    assert ivf_params.nprobe == faiss.extract_index_ivf(ivf.index).nprobe
+
+    hnsw = _build("hnsw", vectors, ids)
+    hnsw_params = search_parameters(hnsw, sel)
+    assert isinstance(hnsw_params, faiss.SearchParametersHNSW)
+    assert hnsw_params.efSearch == faiss.downcast_index(hnsw.index).hnsw.efSearch
+
+    flat = faiss.IndexIDMap2(faiss.IndexFlatL2(DIM))
+    assert type(search_parameters(flat, sel)) is faiss.SearchParameters
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+@pytest.mark.parametrize("kind", ["ivf", "hnsw"])
+def test_reconstruct_all_returns_every_id_and_vector(kind: str) -> None:
+    vectors = _clustered(1000)
+    ids = np.arange(1000, dtype=np.int64)[::-1].copy() + 100
+    index = _build(kind, vectors, ids)
+
+    got_ids, got_vectors = reconstruct_all(index)
+
+    assert index_kind(index) == kind
+    np.testing.assert_array_equal(got_ids, ids)
+    np.testing.assert_allclose(got_vectors, vectors, atol=1e-5)
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+def test_retrain_reason_detects_kind_undersized_lists_and_imbalance() -> None:
+    vectors = _clustered(2000)
+    ids = np.arange(2000, dtype=np.int64)
+    index = _build("ivf", vectors, ids)
+
+    assert retrain_reason(index, _config("ivf")) is None
+    assert "flat fits better" in retrain_reason(index, _config("auto"))
+
+    plan = choose_index_plan(2000, DIM, index_type="ivf")
+    undersized = build_index(vectors, ids, dataclasses.replace(plan, nlist=16))
+    assert "16 lists" in retrain_reason(undersized, _config("ivf"))
+
+    # Appends piling into one inverted list skew the structure.
+    skewed = np.repeat(vectors[:1], 6000, axis=0)
+    index.add_with_ids(skewed, np.arange(2000, 8000, dtype=np.int64))
+    assert ivf_list_imbalance(index) > faiss_factory.IMBALANCE_RETRAIN
+    assert "imbalance" in retrain_reason(index, _config("ivf"))
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+@pytest.mark.parametrize(("kind", "retrain_as"), [("ivf", "ivf"), ("hnsw", "ivf"), ("ivf", "hnsw")])
+def test_append_then_retrain_keeps_filtered_search(tmp_path: Path, kind: str, retrain_as: str) -> None:
+    path = tmp_path / "embeddings.faiss"
+    vectors = _clustered(2000)
+    index = _build(kind, vectors, np.arange(2000, dtype=np.int64))
+    appended = np.repeat(vectors[:1], 3000, axis=0) + _clustered(3000, seed=1) * 0.01
+    index.add_with_ids(appended, np.arange(2000, 5000, dtype=np.int64))
+    write_index_atomic(index, path)
+
+    allowed = np.arange(1, 5000, 7, dtype=np.int64)
+    query = vectors[0]
+    assert _filtered_ids(index, query, allowed) <= set(allowed.tolist())
+
+    retrainer = FaissRetrainer(path, _config(retrain_as), threading.Lock())
+    assert retrainer.maybe_schedule(index) is not None
+    retrainer.wait(timeout=120)
+
+    assert retrainer.completed == 1
+    rebuilt = faiss.read_index(str(path))
+    assert index_kind(rebuilt) == retrain_as
+    assert rebuilt.ntotal == 5000
+    np.testing.assert_array_equal(np.sort(reconstruct_all(rebuilt)[0]), np.arange(5000))
+    assert retrain_reason(rebuilt, _config(retrain_as)) is None
+    found = _filtered_ids(rebuilt, query, allowed)
+    assert len(found) == 10
+    assert found <= set(allowed.tolist())
+
+
+@requires_faiss
+@pytest.mark.usefixtures("real_faiss")
+def test_retrain_is_dropped_when_file_changes_meanwhile(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "embeddings.faiss"
+    lock = threading.Lock()
+    vectors = _clustered(2000)
+    index = _build("ivf", vectors, np.arange(2000, dtype=np.int64))
+    write_index_atomic(index, path)
+
+    concurrent = faiss.IndexIDMap2(faiss.IndexFlatL2(DIM))
+    concurrent.add_with_ids(vectors[:5], np.arange(5, dtype=np.int64))
+    original_build = faiss_factory.build_index
+
+    def build_while_appending(*args, **kwargs):
+        rebuilt = original_build(*args, **kwargs)
+        with lock:
+            write_index_atomic(concurrent, path)
+        return rebuilt
+
+    monkeypatch.setattr(faiss_factory, "build_index", build_while_appending)
+    retrainer = FaissRetrainer(path, _config("hnsw"), lock)
+    assert retrainer.maybe_schedule(index) is not None
+    retrainer.wait(timeout=120)
+
+    assert retrainer.completed == 0
+    assert faiss.read_index(str(path)).ntotal == 5
@@ -0,0 +1,245 @@
+"""Tests for the staged parse -> embed -> write indexing pipeline."""
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import searchat.core.indexing_pipeline as pipeline
+from searchat.core.connectors import get_connectors
+from searchat.core.indexing_pipeline import (
+    BackgroundWriter,
+    EmbeddingAccumulator,
+    indexing_pass,
+    iter_parsed_sources,
+    resolve_max_batch_tokens,
+    resolve_max_workers,
+)
+from searchat.models import ConversationRecord, MessageRecord
+
+
+def _record(path: Path, content: str = "hello") -> ConversationRecord:
+    now = datetime(2026, 1, 1)
+    return ConversationRecord(
+        conversation_id=path.stem,
+        project_id="proj",
+        file_path=str(path),
+        title="T",
+        created_at=now,
+        updated_at=now,
+        message_count=1,
+        messages=[MessageRecord(sequence=0, role="assistant", content=content, timestamp=now, has_code=False)],
+        full_text=content,
+        embedding_id=0,
+        file_hash="h",
+        indexed_at=now,
+    )
+
+
+def _write_claude_session(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [
+        {"type": "user", "timestamp": "2026-02-06T12:00:00", "message": {"content": text}},
+        {"type": "assistant", "timestamp": "2026-02-06T12:00:01",
+         "message": {"content": "```python\ndef answer():\n    return 42\n```"}},
+    ]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+
+class TestResolveMaxWorkers:
+    def test_reads_config(self) -> None:
+        config = MagicMock()
+        config.indexing.max_workers = 6
+        assert resolve_max_workers(config) == 6
+
+    @pytest.mark.parametrize("value", [0, -2, None, "many"])
+    def test_invalid_values_fall_back_to_inline(self, value) -> None:
+        config = MagicMock()
+        config.indexing.max_workers = value
+        assert resolve_max_workers(config) == 1
+
+
+class TestResolveMaxBatchTokens:
+    def test_reads_config(self) -> None:
+        config = MagicMock()
+        config.embedding.max_batch_tokens = 4096
+        assert resolve_max_batch_tokens(config) == 4096
+
+    def test_non_int_disables_token_cap(self) -> None:
+        assert resolve_max_batch_tokens(MagicMock()) == 0
+
+
+class TestEmbeddingAccumulator:
+    @staticmethod
+    def _encoder(calls: list[list[str]]):
+        def encode(texts: list[str]) -> np.ndarray:
+            calls.append(list(texts))
+            return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+        return encode
+
+    def test_sorts_by_length_and_scatters_back_per_key(self) -> None:
+        calls: list[list[str]] = []
+        ready: list[tuple[str, list[float]]] = []
+        acc = EmbeddingAccumulator(
+            self._encoder(calls),
+            lambda key, vectors: ready.append((key, vectors[:, 0].tolist())),
+            batch_size=2,
+        )
+
+        acc.add("a", ["x", "xxxx"])
+        acc.add("empty", [])
+        acc.add("b", ["xx", "xxx", "xxxxx"])
+        acc.flush()
+
+        assert calls == [["xxxxx", "xxxx"], ["xxx", "xx"], ["x"]]
+        assert ready == [("a", [1.0, 4.0]), ("empty", []), ("b", [2.0, 3.0, 5.0])]
+        assert acc.pending_texts == 0
+
+    def test_flushes_automatically_once_pool_is_full(self) -> None:
+        calls: list[list[str]] = []
+        ready: list[str] = []
+        acc = EmbeddingAccumulator(self._encoder(calls), lambda key, _v: ready.append(key), batch_size=2)
+
+        for i in range(4):
+            acc.add(f"k{i}", [f"text {i}", f"more {i}"])
+
+        assert ready == ["k0", "k1", "k2", "k3"]
+        assert [len(c) for c in calls] == [2, 2, 2, 2]
+
+    def test_token_budget_splits_long_batches(self) -> None:
+        calls: list[list[str]] = []
+        acc = EmbeddingAccumulator(
+            self._encoder(calls), lambda *_: None, batch_size=8, max_batch_tokens=60,
+        )
+
+        acc.add("k", ["y" * 200, "y" * 200, "z" * 8, "z" * 8, "z" * 8])
+        acc.flush()
+
+        # 200 chars ~ 51 tokens: one long text per batch; the short ones share one.
+        assert [len(c) for c in calls] == [1, 1, 3]
+
+    def test_encode_failure_reported_per_key(self) -> None:
+        errors: list[str] = []
+
+        def encode(_texts: list[str]) -> np.ndarray:
+            raise RuntimeError("cuda oom")
+
+        acc = EmbeddingAccumulator(
+            encode, lambda *_: None, batch_size=4, on_error=lambda key, _exc: errors.append(key),
+        )
+        acc.add("a", ["1"])
+        acc.add("b", ["2"])
+        acc.flush()
+
+        assert errors == ["a", "b"]
+
+    def test_encode_failure_raises_without_handler(self) -> None:
+        acc = EmbeddingAccumulator(
+            lambda texts: np.zeros((len(texts) - 1, 2)), lambda *_: None, batch_size=4,
+        )
+        acc.add("a", ["1", "2"])
+
+        with pytest.raises(ValueError, match="1 vectors for 2 texts"):
+            acc.flush()
+
+
+class TestIterParsedSources:
+    def test_inline_preserves_order_and_captures_errors(self, tmp_path: Path) -> None:
+        good = tmp_path / "a.jsonl"
+        good.write_text("x")
+        bad = tmp_path / "b.jsonl"
+
+        def parse(path: Path, _embedding_id: int) -> ConversationRecord:
+            if path != good:
+                raise ValueError("boom")
+            return _record(path, "```python\nx = 1\n```")
+
+        connector = MagicMock()
+        connector.name = "fake"
+        connector.parse.side_effect = parse
+
+        results = list(iter_parsed_sources([(good, connector), (bad, connector)], max_workers=4))
+
+        assert [r.path for r in results] == [good, bad]
+        assert results[0].record.conversation_id == "a"
+        assert results[0].file_size == 1
+        assert [row["code"] for row in results[0].code_blocks] == ["x = 1"]
+        assert isinstance(results[1].error, ValueError)
+
+    def test_process_pool_matches_inline(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(pipeline, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(pipeline.os, "cpu_count", lambda: 4)
+        claude = next(c for c in get_connectors() if c.name == "claude")
+        paths = [tmp_path / "proj" / f"s{i}.jsonl" for i in range(5)]
+        for i, path in enumerate(paths):
+            _write_claude_session(path, f"question {i}")
+        items = [(path, claude) for path in paths]
+
+        parallel = list(iter_parsed_sources(items, max_workers=2))
+        inline = list(iter_parsed_sources(items, max_workers=1))
+
+        assert [r.path for r in parallel] == paths
+        assert all(r.error is None for r in parallel)
+        assert [r.record.full_text for r in parallel] == [r.record.full_text for r in inline]
+        assert [r.code_blocks for r in parallel] == [r.code_blocks for r in inline]
+
+    def test_unregistered_connector_parses_in_process(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(pipeline, "PARALLEL_PARSE_MIN_FILES", 1)
+        monkeypatch.setattr(pipeline.os, "cpu_count", lambda: 4)
+        path = tmp_path / "a.jsonl"
+        connector = MagicMock()
+        connector.name = "adhoc"
+        connector.parse.side_effect = lambda p, _eid: _record(p)
+
+        results = list(iter_parsed_sources([(path, connector)], max_workers=2))
+
+        assert results[0].record.conversation_id == "a"
+        connector.parse.assert_called_once()
+
+
+class TestIndexingPass:
+    def test_releases_connector_parse_caches_after_pass(self, monkeypatch) -> None:
+        released: list[str] = []
+        monkeypatch.setattr(pipeline, "release_parse_caches", lambda: released.append("pass"))
+
+        @indexing_pass
+        def run(fail: bool) -> str:
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+        assert run(False) == "ok"
+        with pytest.raises(RuntimeError):
+            run(True)
+        assert released == ["pass", "pass"]
+
+
+class TestBackgroundWriter:
+    def test_writes_in_order_on_one_thread(self) -> None:
+        seen: list[tuple[int, str]] = []
+
+        def write(item: int) -> bool:
+            seen.append((item, threading.current_thread().name))
+            return item != 2
+
+        with BackgroundWriter(write, max_pending=1) as writer:
+            for item in range(4):
+                writer.submit(item)
+
+        assert [item for item, _ in seen] == [0, 1, 2, 3]
+        assert {name for _, name in seen} == {"searchat-index-writer"}
+        assert (writer.succeeded, writer.failed) == (3, 1)
+
+    def test_exceptions_count_as_failures(self) -> None:
+        def write(item: int) -> bool:
+            raise RuntimeError("disk full")
+
+        with BackgroundWriter(write) as writer:
+            writer.submit(1)
+
+        assert (writer.succeeded, writer.failed) == (0, 1)
@@ -0,0 +1,130 @@
+"""Tests for the persistent, incrementally synced BM25 keyword index."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from searchat.core.keyword_index import PersistentKeywordIndex
+
+
+def _row(conversation_id: str, text: str, *, file_hash: str = "h1") -> dict:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    return {
+        "conversation_id": conversation_id,
+        "project_id": "proj",
+        "file_path": f"/tmp/{conversation_id}.jsonl",
+        "title": f"Title {conversation_id}",
+        "created_at": now,
+        "updated_at": now,
+        "message_count": 2,
+        "full_text": text,
+        "embedding_id": 0,
+        "file_hash": file_hash,
+        "indexed_at": now,
+    }
+
+
+def _write(conv_dir: Path, rows: list[dict]) -> str:
+    conv_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_parquet(conv_dir / "project_test.parquet", index=False)
+    return str(conv_dir / "*.parquet")
+
+
+def _scores(index: PersistentKeywordIndex, query: str) -> list[tuple[str, float]]:
+    return index.connection.execute(
+        f"SELECT conversation_id, score FROM ({index.bm25_scores_sql()}) "
+        "ORDER BY score DESC",
+        [query],
+    ).fetchall()
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    idx = PersistentKeywordIndex(tmp_path / "indices" / "keyword_index.duckdb")
+    yield idx
+    idx.close()
+
+
+class TestKeywordIndexSync:
+    def test_initial_sync_is_full_rebuild(self, index: PersistentKeywordIndex, tmp_path: Path) -> None:
+        glob = _write(tmp_path / "conv", [
+            _row("c1", "python packaging wheels"),
+            _row("c2", "rust borrow checker"),
+        ])
+
+        stats = index.sync(glob)
+
+        assert stats.full_rebuild is True
+        assert stats.added == 2
+        assert stats.tokens_processed > 0
+
+    def test_unchanged_sync_processes_no_tokens(self, index: PersistentKeywordIndex, tmp_path: Path) -> None:
+        glob = _write(tmp_path / "conv", [_row("c1", "python packaging wheels")])
+        index.sync(glob)
+
+        stats = index.sync(glob)
+
+        assert stats.full_rebuild is False
+        assert (stats.added, stats.updated, stats.removed) == (0, 0, 0)
+        assert stats.tokens_processed == 0
+
+    def test_delta_merges_changed_added_and_removed(self, index: PersistentKeywordIndex, tmp_path: Path) -> None:
+        conv_dir = tmp_path / "conv"
+        index.sync(_write(conv_dir, [
+            _row("c1", "python packaging"),
+            _row("c2", "rust borrow checker"),
+        ]))
+
+        stats = index.sync(_write(conv_dir, [
+            _row("c1", "python packaging with poetry", file_hash="h2"),
+            _row("c3", "poetry lockfiles"),
+        ]))
+
+        assert (stats.added, stats.updated, stats.removed) == (1, 1, 1)
+        assert {cid for cid, _ in _scores(index, "poetry")} == {"c1", "c3"}
+        assert _scores(index, "rust") == []
+
+    def test_index_survives_reopen(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "keyword_index.duckdb"
+        glob = _write(tmp_path / "conv", [_row("c1", "python packaging")])
+        first = PersistentKeywordIndex(db_path)
+        first.sync(glob)
+        first.close()
+
+        reopened = PersistentKeywordIndex(db_path)
+        try:
+            stats = reopened.sync(glob)
+            assert stats.full_rebuild is False
+            assert stats.tokens_processed == 0
+            assert [cid for cid, _ in _scores(reopened, "packaging")] == ["c1"]
+        finally:
+            reopened.close()
+
+
+class TestKeywordIndexScoring:
+    def test_ranks_by_term_frequency_and_ignores_stopwords(
+        self, index: PersistentKeywordIndex, tmp_path: Path,
+    ) -> None:
+        index.sync(_write(tmp_path / "conv", [
+            _row("c1", "docker docker docker compose"),
+            _row("c2", "docker images and the registry"),
+            _row("c3", "unrelated text"),
+        ]))
+
+        ranked = _scores(index, "the docker")
+
+        assert [cid for cid, _ in ranked] == ["c1", "c2"]
+        assert all(score > 0 for _, score in ranked)
+
+    def test_describe_reports_counts(self, index: PersistentKeywordIndex, tmp_path: Path) -> None:
+        index.sync(_write(tmp_path / "conv", [_row("c1", "alpha beta")]))
+
+        status = index.describe()
+
+        assert status.persistent is True
+        assert status.documents == 1
+        assert status.postings > 0
+        assert status.total_tokens_processed == status.last_sync.tokens_processed
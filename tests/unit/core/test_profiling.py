@@ -0,0 +1,60 @@
+"""Tests for per-stage profiling."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from searchat.core.profiling import Profiler, get_profiler, stage_timer, trace_timer
+
+
+def test_stats_report_percentiles_per_stage() -> None:
+    profiler = Profiler()
+    for ms in range(1, 101):
+        profiler.record("search.fts", float(ms))
+    profiler.record("search.embed", 5.0)
+
+    stats = {s.stage: s for s in profiler.stats()}
+
+    assert list(stats) == ["search.embed", "search.fts"]
+    fts = stats["search.fts"]
+    assert fts.count == 100
+    assert round(fts.p50_ms, 1) == 50.5
+    assert 95.0 <= fts.p95_ms <= 96.0
+    assert 99.0 <= fts.p99_ms <= 100.0
+    assert fts.max_ms == 100.0
+    assert stats["search.embed"].count == 1
+
+
+def test_stage_samples_are_a_ring_buffer() -> None:
+    profiler = Profiler(stage_capacity=3)
+    for ms in (100.0, 1.0, 2.0, 3.0):
+        profiler.record("index.write", ms)
+
+    (stats,) = profiler.stats()
+    assert stats.count == 3
+    assert stats.max_ms == 3.0
+
+
+def test_trace_groups_stages_of_one_request() -> None:
+    profiler = Profiler(trace_capacity=2)
+    for label in ("a", "b", "c"):
+        with profiler.trace("search", label):
+            with profiler.stage("search.fts"):
+                pass
+            profiler.record("search.merge", 1.0)
+
+    traces = profiler.recent_traces()
+    assert [t.label for t in traces] == ["c", "b"]
+    assert [name for name, _ in traces[0].stages] == ["search.fts", "search.merge"]
+    assert {s.stage for s in profiler.stats()} == {"search.fts", "search.merge", "search.total"}
+
+
+def test_disabled_profiling_is_a_no_op() -> None:
+    config = SimpleNamespace(performance=SimpleNamespace(enable_profiling=False))
+    assert get_profiler(config) is None
+    with stage_timer(None, "search.fts"), trace_timer(None, "search"):
+        pass
+
+
+def test_enabled_profiling_shares_one_profiler() -> None:
+    config = SimpleNamespace(performance=SimpleNamespace(enable_profiling=True))
+    assert get_profiler(config) is get_profiler(config)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from searchat.core.result_cache import ResultCache, estimate_result_bytes, result_cache_key
+from searchat.models import SearchFilters, SearchResult, SearchResults
+
+
+def _results(snippet: str = "snippet", n: int = 1) -> SearchResults:
+    now = datetime(2026, 1, 1)
+    return SearchResults(
+        results=[
+            SearchResult(
+                conversation_id=f"c{i}",
+                project_id="p",
+                title="t",
+                created_at=now,
+                updated_at=now,
+                message_count=1,
+                file_path="/f",
+                score=1.0,
+                snippet=snippet,
+            )
+            for i in range(n)
+        ],
+        total_count=n,
+        search_time_ms=1.0,
+        mode_used="keyword",
+    )
+
+
+def _cache(**kwargs) -> ResultCache:
+    params = {"max_entries": 10, "max_bytes": 1_000_000, "ttl_seconds": 300}
+    params.update(kwargs)
+    return ResultCache(**params)
+
+
+def test_key_covers_every_filter_field() -> None:
+    base = result_cache_key("q", "hybrid", SearchFilters())
+    variants = [
+        SearchFilters(project_ids=["a"]),
+        SearchFilters(date_from=datetime(2026, 1, 1)),
+        SearchFilters(date_to=datetime(2026, 1, 1)),
+        SearchFilters(min_messages=3),
+        SearchFilters(has_code=True),
+        SearchFilters(has_code=False),
+        SearchFilters(tool="codex"),
+    ]
+
+    keys = {result_cache_key("q", "hybrid", f) for f in variants}
+
+    assert base == result_cache_key("q", "hybrid", None)
+    assert base not in keys
+    assert len(keys) == len(variants)
+    assert result_cache_key("q", "keyword", None) != base
+    assert result_cache_key("q", "hybrid", SearchFilters(project_ids=["a", "b"])) == result_cache_key(
+        "q", "hybrid", SearchFilters(project_ids=["b", "a"])
+    )
+
+
+def test_hits_return_copies_and_count() -> None:
+    cache = _cache()
+    cache.put("k", _results(), filters=None, generation=cache.generation)
+
+    first = cache.get("k")
+    assert first is not None
+    first.search_time_ms = 99.0
+    first.results.clear()
+
+    second = cache.get("k")
+    assert cache.get("missing") is None
+    assert second is not None
+    assert second.search_time_ms == 1.0
+    assert len(second.results) == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_invalidation_only_drops_entries_the_changed_projects_affect() -> None:
+    cache = _cache()
+    gen = cache.generation
+    cache.put("all", _results(), filters=None, generation=gen)
+    cache.put("a", _results(), filters=SearchFilters(project_ids=["a"]), generation=gen)
+    cache.put("b", _results(), filters=SearchFilters(project_ids=["b", "c"]), generation=gen)
+
+    dropped = cache.invalidate({"c"})
+
+    assert dropped == 2
+    assert cache.get("a") is not None
+    assert cache.get("all") is None
+    assert cache.get("b") is None
+    assert cache.stats().generation == gen + 1
+
+    cache.invalidate(None)
+    assert len(cache) == 0
+    assert cache.stats().bytes == 0
+
+
+def test_results_computed_before_invalidation_are_not_cached() -> None:
+    cache = _cache()
+    started = cache.generation
+
+    cache.invalidate(set())
+    cache.put("k", _results(), filters=None, generation=started)
+
+    assert cache.get("k") is None
+
+
+def test_byte_bound_evicts_least_recently_used() -> None:
+    size = estimate_result_bytes(_results("x" * 1000))
+    cache = _cache(max_bytes=size * 2)
+    gen = cache.generation
+    cache.put("a", _results("x" * 1000), filters=None, generation=gen)
+    cache.put("b", _results("x" * 1000), filters=None, generation=gen)
+    cache.get("a")
+    cache.put("c", _results("x" * 1000), filters=None, generation=gen)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    stats = cache.stats()
+    assert stats.bytes <= stats.max_bytes
+    assert stats.evictions == 1
+
+    cache.put("huge", _results("x" * 1000, n=3), filters=None, generation=gen)
+    assert cache.get("huge") is None
+
+
+def test_expired_entries_miss(monkeypatch) -> None:
+    import searchat.core.result_cache as result_cache
+
+    clock = [1000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: clock[0])
+    cache = _cache(ttl_seconds=10)
+    cache.put("k", _results(), filters=None, generation=cache.generation)
+
+    clock[0] += 11
+
+    assert cache.get("k") is None
+    assert len(cache) == 0
@@ -255,9 +255,71 @@ class TestIndexAppendOnly:
         assert stats.empty_conversations == 0
         storage.upsert_conversation.assert_called_once()
         storage.insert_messages.assert_called_once()
-        storage.upsert_exchange.assert_called()
-        storage.upsert_embedding.assert_called()
+        storage.upsert_exchanges.assert_called_once()
+        exchange_ids, embeddings = storage.upsert_embeddings.call_args.args
+        assert len(exchange_ids) == 1
+        assert embeddings.shape == (1, 384)
         storage.upsert_file_state.assert_called_once()
+        storage.transaction.assert_called_once()
+
+    def test_embeds_across_files_and_writes_each_file(self, tmp_path: Path) -> None:
+        storage = MagicMock()
+        cursor = MagicMock()
+        cursor.execute.return_value.fetchall.return_value = []
+        storage._read_cursor.return_value = cursor
+
+        now = datetime.now()
+        files = []
+        records = {}
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.jsonl"
+            path.write_text("")
+            files.append(str(path))
+            records[path] = ConversationRecord(
+                conversation_id=f"conv-{name}",
+                project_id="proj-1",
+                file_path=str(path),
+                title=name,
+                created_at=now,
+                updated_at=now,
+                message_count=2,
+                messages=[
+                    MessageRecord(sequence=0, role="user", content=f"Q {name}", timestamp=now, has_code=False),
+                    MessageRecord(sequence=1, role="assistant", content=f"A {name}", timestamp=now, has_code=False),
+                ],
+                full_text=f"Q {name}\nA {name}",
+                embedding_id=0,
+                file_hash=name,
+                indexed_at=now,
+            )
+
+        fake_connector = MagicMock()
+        fake_connector.name = "test"
+        fake_connector.parse.side_effect = lambda path, _eid: records[path]
+
+        config = MagicMock()
+        config.indexing.enable_connectors = True
+        config.indexing.max_workers = 1
+        config.embedding.batch_size = 32
+        config.expertise.enabled = False
+
+        fake_embedder = MagicMock()
+        fake_embedder.encode.side_effect = lambda texts, **_kw: [[float(i)] * 384 for i in range(len(texts))]
+
+        indexer = UnifiedIndexer(tmp_path, config, storage=storage)
+
+        with (
+            patch("searchat.core.unified_indexer.detect_connector", return_value=fake_connector),
+            patch.object(indexer, "_get_embedder", return_value=fake_embedder),
+        ):
+            stats = indexer.index_append_only(files)
+
+        assert stats.new_conversations == 3
+        fake_embedder.encode.assert_called_once()
+        assert fake_embedder.encode.call_args.args[0] == ["Q a\n\nA a", "Q b\n\nA b", "Q c\n\nA c"]
+        written = [c.args[1][0, 0] for c in storage.upsert_embeddings.call_args_list]
+        assert written == [0.0, 1.0, 2.0]
+        assert storage.transaction.call_count == 3
 
     def test_skips_empty_conversations(self, tmp_path: Path) -> None:
         convo_file = tmp_path / "empty.jsonl"
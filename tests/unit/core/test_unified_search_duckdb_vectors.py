@@ -0,0 +1,163 @@
+"""Tests for the DuckDB HNSW vector backend in UnifiedSearchEngine."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from searchat.config import Config
+from searchat.config.settings import StorageConfig
+from searchat.core.unified_search import UnifiedSearchEngine
+from searchat.models import SearchFilters, SearchMode
+from searchat.storage.schema import EMBEDDING_DIM
+from searchat.storage.unified_storage import UnifiedStorage
+
+
+def _unit(axis: int) -> list[float]:
+    vec = [0.0] * EMBEDDING_DIM
+    vec[axis] = 1.0
+    return vec
+
+
+class _AxisEmbedder:
+    """Embeds every query onto a fixed axis."""
+
+    def __init__(self, axis: int) -> None:
+        self.axis = axis
+
+    def encode(self, text: str) -> np.ndarray:
+        return np.asarray(_unit(self.axis), dtype=np.float32)
+
+
+def _write_conversations_parquet(search_dir: Path, rows: list[dict]) -> None:
+    conv_dir = search_dir / "data" / "conversations"
+    conv_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_parquet(conv_dir / "project_test.parquet", index=False)
+
+
+def _seed(search_dir: Path, storage: UnifiedStorage) -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    conversations = [
+        ("conv-a", "proj-a", "Python packaging", 0),
+        ("conv-b", "proj-b", "Rust lifetimes", 1),
+    ]
+    parquet_rows = []
+    for conversation_id, project_id, title, axis in conversations:
+        full_text = f"{title} discussion"
+        storage.upsert_conversation(
+            conversation_id=conversation_id,
+            project_id=project_id,
+            file_path=f"/tmp/{conversation_id}.jsonl",
+            title=title,
+            created_at=now,
+            updated_at=now,
+            message_count=2,
+            full_text=full_text,
+            file_hash="h",
+            indexed_at=now,
+        )
+        exchange_id = f"{conversation_id}-x0"
+        storage.upsert_exchange(
+            exchange_id=exchange_id,
+            conversation_id=conversation_id,
+            project_id=project_id,
+            ply_start=0,
+            ply_end=1,
+            exchange_text=f"Exchange about {title}",
+            created_at=now,
+        )
+        storage.upsert_embedding(exchange_id, _unit(axis))
+        parquet_rows.append({
+            "conversation_id": conversation_id,
+            "project_id": project_id,
+            "file_path": f"/tmp/{conversation_id}.jsonl",
+            "title": title,
+            "created_at": now,
+            "updated_at": now,
+            "message_count": 2,
+            "full_text": full_text,
+            "embedding_id": 0,
+            "file_hash": "h",
+            "indexed_at": now,
+        })
+    _write_conversations_parquet(search_dir, parquet_rows)
+
+
+@pytest.fixture
+def duckdb_engine(tmp_path: Path):
+    search_dir = tmp_path / "dataset"
+    storage = UnifiedStorage(tmp_path / "test.duckdb")
+    _seed(search_dir, storage)
+
+    config = Config.load()
+    config.storage.vector_backend = "duckdb"
+    engine = UnifiedSearchEngine(search_dir, config, storage=storage)
+    yield engine
+    engine.close()
+    storage.close()
+
+
+class TestStorageConfigVectorBackend:
+    def test_defaults_to_faiss(self) -> None:
+        assert StorageConfig.from_dict({}).vector_backend == "faiss"
+
+    def test_accepts_duckdb(self) -> None:
+        assert StorageConfig.from_dict({"vector_backend": "DuckDB"}).vector_backend == "duckdb"
+
+    def test_unknown_value_falls_back_to_faiss(self) -> None:
+        assert StorageConfig.from_dict({"vector_backend": "annoy"}).vector_backend == "faiss"
+
+    def test_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SEARCHAT_VECTOR_BACKEND", "duckdb")
+        assert StorageConfig.from_dict({}).vector_backend == "duckdb"
+
+
+class TestDuckDBSemanticSearch:
+    def test_returns_nearest_exchange_first(self, duckdb_engine: UnifiedSearchEngine) -> None:
+        duckdb_engine.embedder = _AxisEmbedder(1)
+
+        results = duckdb_engine.search("lifetimes", mode=SearchMode.SEMANTIC)
+
+        assert [r.conversation_id for r in results.results] == ["conv-b", "conv-a"]
+        top = results.results[0]
+        assert top.exchange_id == "conv-b-x0"
+        assert top.exchange_text == "Exchange about Rust lifetimes"
+        assert top.message_start_index == 0
+        assert top.message_end_index == 1
+        assert top.score == pytest.approx(1.0)
+        assert results.results[1].score == pytest.approx(0.5)
+
+    def test_applies_conversation_filters(self, duckdb_engine: UnifiedSearchEngine) -> None:
+        duckdb_engine.embedder = _AxisEmbedder(1)
+
+        results = duckdb_engine.search(
+            "lifetimes",
+            mode=SearchMode.SEMANTIC,
+            filters=SearchFilters(project_ids=["proj-a"]),
+        )
+
+        assert [r.conversation_id for r in results.results] == ["conv-a"]
+
+    def test_rejects_mismatched_query_dimension(self, duckdb_engine: UnifiedSearchEngine) -> None:
+        from searchat.services.retrieval_service import SemanticSearchUnavailable
+
+        class _ShortEmbedder:
+            def encode(self, text: str) -> np.ndarray:
+                return np.zeros(8, dtype=np.float32)
+
+        duckdb_engine.embedder = _ShortEmbedder()
+        with pytest.raises(SemanticSearchUnavailable, match="dimension"):
+            duckdb_engine._semantic_search("anything", None)
+
+    def test_semantic_ready_without_faiss_files(self, duckdb_engine: UnifiedSearchEngine) -> None:
+        duckdb_engine.embedder = _AxisEmbedder(0)
+
+        duckdb_engine.ensure_semantic_ready()
+        capabilities = duckdb_engine.describe_capabilities()
+
+        assert not duckdb_engine.index_path.exists()
+        assert capabilities.semantic_available is True
+        assert duckdb_engine.faiss_index is None
@@ -0,0 +1,259 @@
+"""Tests for filter-aware FAISS retrieval in UnifiedSearchEngine."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from searchat.api.dashboard_render import WidgetRequest, clear_widget_caches, render_widgets
+from searchat.config import Config
+from searchat.config.constants import INDEX_FORMAT, INDEX_FORMAT_VERSION, INDEX_SCHEMA_VERSION
+from searchat.core.unified_search import UnifiedSearchEngine
+from searchat.models import SearchFilters, SearchMode
+from searchat.services.storage_contracts import IndexMetadata, write_index_metadata
+
+N_PER_PROJECT = 150
+
+
+class _OrderedIndex:
+    """Fake FAISS index: distance grows with vector id; honours IDSelectors."""
+
+    def __init__(self, ntotal: int, *, supports_selector: bool = True) -> None:
+        self.ntotal = ntotal
+        self.supports_selector = supports_selector
+        self.calls: list[tuple[int, bool]] = []
+
+    def search(self, queries, k, params=None):
+        if params is not None and not self.supports_selector:
+            raise RuntimeError("search parameters not supported")
+        self.calls.append((k, params is not None))
+        if params is not None:
+            candidates = sorted(int(i) for i in params.sel.ids)
+        else:
+            candidates = list(range(self.ntotal))
+        ids = candidates[:k]
+        labels = np.full((1, k), -1, dtype=np.int64)
+        distances = np.full((1, k), np.inf, dtype=np.float32)
+        labels[0, :len(ids)] = ids
+        distances[0, :len(ids)] = [i * 0.01 for i in ids]
+        return distances, labels
+
+
+class _Embedder:
+    def encode(self, text):
+        return np.zeros(384, dtype=np.float32)
+
+
+@pytest.fixture
+def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import faiss
+
+    monkeypatch.setattr(faiss, "SearchParameters", lambda sel: SimpleNamespace(sel=sel), raising=False)
+
+    search_dir = tmp_path / "dataset"
+    conv_dir = search_dir / "data" / "conversations"
+    indices_dir = search_dir / "data" / "indices"
+    conv_dir.mkdir(parents=True)
+    indices_dir.mkdir(parents=True)
+
+    now = datetime(2025, 1, 1)
+    conversations = []
+    metadata = []
+    # proj-b owns the nearest vectors (ids 0..149); proj-a sits behind them.
+    for vector_id in range(2 * N_PER_PROJECT):
+        project_id = "proj-b" if vector_id < N_PER_PROJECT else "proj-a"
+        conversation_id = f"conv-{vector_id}"
+        conversations.append({
+            "conversation_id": conversation_id,
+            "project_id": project_id,
+            "file_path": f"/tmp/{conversation_id}.jsonl",
+            "title": conversation_id,
+            "created_at": now,
+            "updated_at": now,
+            "message_count": 2,
+            "full_text": "text",
+            "embedding_id": vector_id,
+            "file_hash": "h",
+            "indexed_at": now,
+        })
+        metadata.append({
+            "vector_id": vector_id,
+            "conversation_id": conversation_id,
+            "chunk_text": f"chunk {vector_id}",
+            "message_start_index": 0,
+            "message_end_index": 1,
+        })
+    pd.DataFrame(conversations).to_parquet(conv_dir / "project_test.parquet", index=False)
+    pd.DataFrame(metadata).to_parquet(indices_dir / "embeddings.metadata.parquet", index=False)
+    (indices_dir / "embeddings.faiss").touch()
+
+    config = Config.load()
+    write_index_metadata(search_dir, IndexMetadata(
+        schema_version=INDEX_SCHEMA_VERSION,
+        index_format_version=INDEX_FORMAT_VERSION,
+        created_at=now.isoformat(),
+        embedding_model=config.embedding.model,
+        format=INDEX_FORMAT,
+    ))
+
+    eng = UnifiedSearchEngine(search_dir, config)
+    eng.embedder = _Embedder()
+    yield eng
+    eng.close()
+
+
+class TestFilteredSemanticSearch:
+    def test_selector_prefilter_fills_page(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+
+        results = engine._semantic_search("query", SearchFilters(project_ids=["proj-a"]))
+
+        assert len(results) == 100
+        assert {r.project_id for r in results} == {"proj-a"}
+        assert results[0].conversation_id == f"conv-{N_PER_PROJECT}"
+        assert all(used_selector for _, used_selector in engine.faiss_index.calls)
+
+    def test_overfetch_fallback_fills_page(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT, supports_selector=False)
+
+        results = engine._semantic_search("query", SearchFilters(project_ids=["proj-a"]))
+
+        assert len(results) == 100
+        assert {r.project_id for r in results} == {"proj-a"}
+        assert [k for k, _ in engine.faiss_index.calls] == [100, 300]
+
+    def test_no_matching_conversations_skips_faiss(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+
+        results = engine._semantic_search("query", SearchFilters(project_ids=["missing"]))
+
+        assert results == []
+        assert engine.faiss_index.calls == []
+
+    def test_unfiltered_search_uses_single_topk(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+
+        results = engine._semantic_search("query", None)
+
+        assert len(results) == 100
+        assert engine.faiss_index.calls == [(100, False)]
+
+
+class TestVectorLookupLifecycle:
+    def test_lookup_is_loaded_once_and_dropped_on_refresh(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+
+        engine._semantic_search("query", None)
+        first = engine._vector_lookup
+        engine._semantic_search("other query", SearchFilters(project_ids=["proj-a"]))
+
+        assert first is not None
+        assert engine._vector_lookup is first
+
+        engine.refresh_index()
+
+        assert engine._vector_lookup is None
+
+    def test_similar_rows_exclude_source_conversation(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+        hits = engine.find_similar_vector_hits("text", 5)
+
+        rows = engine.similar_conversation_rows(hits, exclude_conversation_id="conv-0", limit=3)
+
+        assert [row[0] for row in rows] == ["conv-1", "conv-2", "conv-3"]
+        assert rows[0][1] == "proj-b"
+
+
+class TestConcurrentSearch:
+    def test_parallel_keyword_and_filtered_semantic_searches(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+
+        def run(i: int) -> tuple[str, int, set[str]]:
+            # Distinct filters per call so every search reaches DuckDB, not the result cache.
+            project = "proj-a" if i % 2 else "proj-b"
+            filters = SearchFilters(
+                project_ids=[project], date_from=datetime(2024, 1, 1) + timedelta(minutes=i),
+            )
+            mode = (SearchMode.KEYWORD, SearchMode.SEMANTIC)[i % 3 == 0]
+            query = "*" if i % 4 == 1 else "text"
+            results = engine.search(query, mode=mode, filters=filters)
+            return project, len(results.results), {r.project_id for r in results.results}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outcomes = list(pool.map(run, range(48)))
+
+        for project, count, projects in outcomes:
+            assert count == 100
+            assert projects == {project}
+
+    def test_dashboard_render_runs_distinct_widget_searches_in_parallel(
+        self, engine: UnifiedSearchEngine,
+    ) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+        clear_widget_caches()
+        requests = [
+            WidgetRequest(
+                widget={"id": f"w{i}"},
+                query={"id": f"q{i}", "query": "text" if i % 2 else "*"},
+                mode=(SearchMode.KEYWORD, SearchMode.SEMANTIC)[i % 3 == 0],
+                filters=SearchFilters(
+                    project_ids=["proj-a"], date_from=datetime(2024, 1, 1) + timedelta(minutes=i),
+                ),
+                sort_by="relevance",
+                limit=3,
+            )
+            for i in range(12)
+        ]
+
+        widgets = asyncio.run(render_widgets(engine, requests))
+
+        assert [w["id"] for w in widgets] == [f"w{i}" for i in range(12)]
+        assert all(w["total"] == 100 for w in widgets)
+        assert all(r.project_id == "proj-a" for w in widgets for r in w["results"])
+
+
+class _CountingEmbedder(_Embedder):
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def encode(self, text):
+        self.texts.append(text)
+        return super().encode(text)
+
+
+class TestQueryEmbeddingWarmup:
+    def test_warmed_text_is_encoded_once_across_filtered_searches(self, engine: UnifiedSearchEngine) -> None:
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+        engine.embedder = _CountingEmbedder()
+
+        engine.warm_query_embeddings(["shared query", "shared query", "other"])
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-a"]))
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-b"]))
+
+        assert engine.embedder.texts == ["shared query", "other"]
+
+    def test_without_cache_warmed_text_is_pinned_until_released(self, engine: UnifiedSearchEngine) -> None:
+        engine._embedding_cache = None
+        engine.faiss_index = _OrderedIndex(2 * N_PER_PROJECT)
+        engine.embedder = _CountingEmbedder()
+
+        engine.warm_query_embeddings(["shared query", "shared query"])
+        engine.warm_query_embeddings(["shared query"])
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-a"]))
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-b"]))
+        assert engine.embedder.texts == ["shared query"]
+
+        engine.release_query_embeddings(["shared query"])
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-a"]))
+        assert engine.embedder.texts == ["shared query"]
+
+        engine.release_query_embeddings(["shared query"])
+        engine._semantic_search("shared query", SearchFilters(project_ids=["proj-b"]))
+        assert engine.embedder.texts == ["shared query"] * 2
+        assert engine._pinned_queries == {}
@@ -0,0 +1,112 @@
+"""Tests for the resident vector_id -> conversation lookup."""
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from searchat.core.vector_lookup import SNIPPET_CHARS, VectorLookup
+
+
+def _write_dataset(root: Path, *, chunk_text: str = "chunk") -> tuple[Path, str]:
+    conv_dir = root / "conversations"
+    conv_dir.mkdir(parents=True, exist_ok=True)
+    old, new = datetime(2025, 1, 1), datetime(2025, 2, 1)
+    pd.DataFrame([
+        {"conversation_id": "a", "project_id": "p1", "title": "A old", "created_at": old,
+         "updated_at": old, "message_count": 2, "file_path": "/tmp/a.jsonl"},
+        {"conversation_id": "a", "project_id": "p1", "title": "A", "created_at": old,
+         "updated_at": new, "message_count": 4, "file_path": "/tmp/a.jsonl"},
+        {"conversation_id": "b", "project_id": "p2", "title": "B", "created_at": old,
+         "updated_at": new, "message_count": 2, "file_path": "/tmp/b.jsonl"},
+        {"conversation_id": "c", "project_id": "p1", "title": "C", "created_at": old,
+         "updated_at": new, "message_count": 0, "file_path": "/tmp/c.jsonl"},
+    ]).to_parquet(conv_dir / "project.parquet", index=False)
+
+    metadata_path = root / "embeddings.metadata.parquet"
+    pd.DataFrame([
+        {"vector_id": 10, "conversation_id": "a", "chunk_text": f"{chunk_text} a0",
+         "message_start_index": 0, "message_end_index": 1},
+        {"vector_id": 11, "conversation_id": "a", "chunk_text": f"{chunk_text} a1",
+         "message_start_index": 2, "message_end_index": 3},
+        {"vector_id": 20, "conversation_id": "b", "chunk_text": f"{chunk_text} b0",
+         "message_start_index": 0, "message_end_index": 1},
+        {"vector_id": 30, "conversation_id": "c", "chunk_text": f"{chunk_text} c0",
+         "message_start_index": 0, "message_end_index": 1},
+        {"vector_id": 40, "conversation_id": "gone", "chunk_text": "orphan",
+         "message_start_index": 0, "message_end_index": 1},
+    ]).to_parquet(metadata_path, index=False)
+    return metadata_path, str(conv_dir / "*.parquet")
+
+
+@pytest.fixture
+def con():
+    connection = duckdb.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def lookup(tmp_path: Path, con) -> VectorLookup:
+    metadata_path, glob = _write_dataset(tmp_path)
+    return VectorLookup.load(con, metadata_path, glob)
+
+
+class TestVectorLookupHydrate:
+    def test_keeps_best_hit_per_conversation_in_rank_order(self, lookup: VectorLookup) -> None:
+        rows = lookup.hydrate([11, 20, 10, 999, 40], [0.1, 0.2, 0.3, 0.4, 0.5])
+
+        assert [r.conversation_id for r in rows] == ["a", "b"]
+        assert rows[0].chunk_text == "chunk a1"
+        assert (rows[0].message_start_index, rows[0].message_end_index) == (2, 3)
+        assert rows[0].distance == pytest.approx(0.1)
+
+    def test_uses_newest_conversation_row(self, lookup: VectorLookup) -> None:
+        row = lookup.hydrate([10], [0.0])[0]
+
+        assert row.title == "A"
+        assert row.message_count == 4
+        assert isinstance(row.updated_at, datetime)
+
+    def test_allowed_mask_and_exclusion(self, lookup: VectorLookup) -> None:
+        mask = lookup.conversation_mask("c.project_id = ?", ["p1"])
+
+        assert [r.conversation_id for r in lookup.hydrate([20, 30, 10], [0, 1, 2], allowed=mask)] == ["c", "a"]
+        assert [
+            r.conversation_id
+            for r in lookup.hydrate([10, 20, 30], [0, 1, 2], exclude_conversation_id="a", limit=1)
+        ] == ["b"]
+
+    def test_vector_ids_for_mask(self, lookup: VectorLookup) -> None:
+        ids = lookup.vector_ids_for(lookup.nonempty_conversations())
+
+        assert ids.tolist() == [10, 11, 20]
+
+    def test_snippets_fetched_per_query_when_over_budget(self, tmp_path: Path, con) -> None:
+        metadata_path, glob = _write_dataset(tmp_path, chunk_text="x" * (SNIPPET_CHARS * 2))
+
+        lookup = VectorLookup.load(con, metadata_path, glob, max_snippet_bytes=0)
+        rows = lookup.hydrate([20], [0.0])
+
+        assert lookup.snippets_resident is False
+        assert len(rows[0].chunk_text) == SNIPPET_CHARS + 1
+
+    def test_detects_rewritten_metadata(self, tmp_path: Path, lookup: VectorLookup) -> None:
+        assert lookup.is_stale() is False
+
+        stat = lookup.metadata_path.stat()
+        os.utime(lookup.metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert lookup.is_stale() is True
+
+    def test_arrays_are_compact(self, lookup: VectorLookup) -> None:
+        assert lookup.vector_ids.dtype == np.int64
+        assert lookup.conversation_rows.dtype == np.int32
+        assert lookup.vector_count == 5
+        assert lookup.conversation_count == 3
+        assert lookup.memory_bytes > 0
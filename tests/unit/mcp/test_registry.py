@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from searchat.mcp.registry import ServiceRegistry
+
+
+def _write_metadata(search_dir: Path, last_updated: str, *, mtime_ns: int) -> None:
+    path = search_dir / "data" / "indices" / "index_metadata.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "schema_version": "1",
+        "index_format_version": "1",
+        "created_at": "2026-01-01T00:00:00",
+        "embedding_model": "all-MiniLM-L6-v2",
+        "format": "parquet+faiss",
+        "last_updated": last_updated,
+    }))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _registry() -> tuple[ServiceRegistry, dict[str, int]]:
+    calls = {"config": 0, "engine": 0, "store": 0}
+
+    def load_config():
+        calls["config"] += 1
+        return SimpleNamespace()
+
+    def build_engine(search_dir, config):
+        calls["engine"] += 1
+        return MagicMock()
+
+    def build_store(search_dir, config):
+        calls["store"] += 1
+        return MagicMock()
+
+    registry = ServiceRegistry(
+        load_config=load_config, build_engine=build_engine, build_store=build_store,
+    )
+    return registry, calls
+
+
+def test_second_call_reuses_services(tmp_path: Path) -> None:
+    _write_metadata(tmp_path, "2026-01-01T00:00:00", mtime_ns=1_000_000_000)
+    registry, calls = _registry()
+
+    first = registry.get(tmp_path)
+    second = registry.get(tmp_path)
+
+    assert second is first
+    assert calls == {"config": 1, "engine": 1, "store": 0}
+    first.engine.refresh_index.assert_not_called()
+
+
+def test_index_update_refreshes_engine_in_place(tmp_path: Path) -> None:
+    _write_metadata(tmp_path, "2026-01-01T00:00:00", mtime_ns=1_000_000_000)
+    registry, calls = _registry()
+    engine = registry.get(tmp_path).engine
+
+    # Rewritten with the same last_updated: nothing to refresh.
+    _write_metadata(tmp_path, "2026-01-01T00:00:00", mtime_ns=2_000_000_000)
+    registry.get(tmp_path)
+    engine.refresh_index.assert_not_called()
+
+    _write_metadata(tmp_path, "2026-01-02T00:00:00", mtime_ns=3_000_000_000)
+    refreshed = registry.get(tmp_path)
+
+    assert refreshed.engine is engine
+    engine.refresh_index.assert_called_once()
+    assert calls == {"config": 1, "engine": 1, "store": 0}
+
+
+def test_store_is_opened_and_closed_per_call(tmp_path: Path) -> None:
+    _write_metadata(tmp_path, "2026-01-01T00:00:00", mtime_ns=1_000_000_000)
+    registry, calls = _registry()
+
+    with registry.open_store(tmp_path) as first:
+        first.close.assert_not_called()
+    first.close.assert_called_once()
+
+    with pytest.raises(RuntimeError):
+        with registry.open_store(tmp_path) as second:
+            raise RuntimeError("tool failed")
+    second.close.assert_called_once()
+
+    assert second is not first
+    assert calls == {"config": 1, "engine": 1, "store": 2}
+
+
+def test_datasets_are_cached_separately(tmp_path: Path) -> None:
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+    registry, calls = _registry()
+
+    assert registry.get(a) is not registry.get(b)
+    assert registry.get(a) is registry.get(a)
+    assert calls["engine"] == 2
+
+    registry.invalidate(a)
+    registry.get(a)
+    assert calls["engine"] == 3
@@ -15,6 +15,11 @@ class TestDistillationConfig:
         assert config.batch_size == 10
         assert config.max_ply_length == 20
         assert config.min_exchange_chars == 50
+        assert config.workers == 4
+        assert config.provider_concurrency == {"claude": 4, "openai": 4}
+        assert config.pack_token_budget == 4000
+        assert config.max_retries == 3
+        assert config.call_timeout_seconds == 300
 
     def test_from_dict(self):
         config = DistillationConfig.from_dict({
@@ -40,6 +45,19 @@ class TestDistillationConfig:
             assert config.provider == "openai"
 
 
+    def test_scheduler_settings(self):
+        config = DistillationConfig.from_dict({
+            "workers": 8,
+            "provider_concurrency": {"Claude": 6, "openai": 0},
+            "pack_token_budget": 2000,
+        })
+        assert config.workers == 8
+        assert config.provider_concurrency == {"claude": 6, "openai": 1}
+        assert config.pack_token_budget == 2000
+        with patch.dict(os.environ, {"SEARCHAT_DISTILLATION_WORKERS": "2"}):
+            assert DistillationConfig.from_dict({"workers": 8}).workers == 2
+
+
 class TestPalaceConfig:
     def test_default_disabled(self):
         config = PalaceConfig.from_dict({})
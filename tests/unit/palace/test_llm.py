@@ -65,6 +65,74 @@ class TestParseResponse:
         assert result.room_assignments == []
 
 
+class TestPackedResponse:
+    def _llm(self) -> CLIDistillationLLM:
+        llm = CLIDistillationLLM.__new__(CLIDistillationLLM)
+        llm.provider = "claude"
+        llm.model = "claude-haiku-4-5-20251001"
+        llm.prompt_template = "{project_id} {ply_start} {ply_end} {messages_text}"
+        llm.packed_prompt_template = "{project_id} {exchange_count}\n{exchanges_text}"
+        llm.timeout_seconds = 5
+        return llm
+
+    def _inputs(self, n: int) -> list[DistillationInput]:
+        return [
+            DistillationInput(
+                conversation_id="conv-1",
+                project_id="proj-1",
+                messages=[{"role": "user", "sequence": i, "content": f"step {i}"}],
+                ply_start=i,
+                ply_end=i,
+            )
+            for i in range(n)
+        ]
+
+    def _item(self, core: str) -> dict:
+        return {"exchange_core": core, "specific_context": "ctx", "room_assignments": []}
+
+    def test_parse_packed_exchanges(self):
+        raw = json.dumps({"exchanges": [self._item("a"), self._item("b")]})
+        outputs = self._llm()._parse_packed_response(raw, expected=2)
+        assert [o.exchange_core for o in outputs] == ["a", "b"]
+
+    def test_parse_packed_count_mismatch(self):
+        raw = json.dumps({"exchanges": [self._item("a")]})
+        with pytest.raises(RuntimeError, match="1 exchanges for 2"):
+            self._llm()._parse_packed_response(raw, expected=2)
+
+    def test_distill_packed_sends_one_prompt(self, tmp_path):
+        llm = self._llm()
+        prompts: list[str] = []
+
+        def invoke(prompt, cli_path=None, schema=None):
+            prompts.append(prompt)
+            return json.dumps({"exchanges": [self._item("a"), self._item("b"), self._item("c")]})
+
+        with patch.object(llm, "_find_cli", return_value="claude"), \
+                patch.object(llm, "_get_session_dir", return_value=tmp_path), \
+                patch.object(llm, "_invoke_cli", side_effect=invoke):
+            outputs = llm.distill_packed(self._inputs(3))
+
+        assert len(prompts) == 1
+        assert "Exchange 3 (plies 2 - 2)" in prompts[0]
+        assert [o.exchange_core for o in outputs] == ["a", "b", "c"]
+
+    def test_distill_packed_falls_back_per_exchange(self, tmp_path):
+        llm = self._llm()
+        replies = iter([
+            json.dumps({"exchanges": [self._item("a")]}),
+            json.dumps(self._item("x")),
+            json.dumps(self._item("y")),
+        ])
+
+        with patch.object(llm, "_find_cli", return_value="claude"), \
+                patch.object(llm, "_get_session_dir", return_value=tmp_path), \
+                patch.object(llm, "_invoke_cli", side_effect=lambda *a, **k: next(replies)):
+            outputs = llm.distill_packed(self._inputs(2))
+
+        assert [o.exchange_core for o in outputs] == ["x", "y"]
+
+
 class TestFormatFailureOutput:
     def test_stderr_only(self):
         result = CLIDistillationLLM._format_failure_output(stdout="", stderr="error msg")
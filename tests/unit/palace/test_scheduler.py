@@ -0,0 +1,235 @@
+"""Tests for the concurrent distillation scheduler."""
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from searchat.config import Config
+from searchat.palace.distiller import Distiller
+from searchat.palace.llm import (
+    DistillationInput,
+    DistillationLLM,
+    DistillationOutput,
+    RoomAssignment,
+)
+from searchat.palace.scheduler import DistillationScheduler, pack_inputs
+from searchat.palace.storage import PalaceStorage
+
+
+class FakeLLM(DistillationLLM):
+    """Backend with injected latency and scripted failures."""
+
+    def __init__(self, latency: float = 0.0, provider: str = "fake", failures: dict | None = None):
+        self.latency = latency
+        self.provider = provider
+        self.failures = dict(failures or {})
+        self.calls: list[list[str]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def distill(self, inputs: list[DistillationInput]) -> list[DistillationOutput]:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append([inp.conversation_id for inp in inputs])
+        try:
+            time.sleep(self.latency)
+            with self._lock:
+                for inp in inputs:
+                    remaining = self.failures.get(inp.conversation_id)
+                    if remaining:
+                        error, count = remaining
+                        if count is not None:
+                            self.failures[inp.conversation_id] = (error, count - 1) if count > 1 else None
+                        raise error
+            return [
+                DistillationOutput(
+                    exchange_core=f"core {inp.conversation_id} {inp.ply_start}",
+                    specific_context="ctx",
+                    room_assignments=[RoomAssignment("concept", "retry", "Retry", 0.9)],
+                )
+                for inp in inputs
+            ]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _input(conversation_id: str, ply_start: int, chars: int = 40) -> DistillationInput:
+    return DistillationInput(
+        conversation_id=conversation_id,
+        project_id="proj",
+        messages=[{"sequence": ply_start, "role": "user", "content": "x" * chars}],
+        ply_start=ply_start,
+        ply_end=ply_start,
+    )
+
+
+class StubStorage:
+    def __init__(self) -> None:
+        self.skipped: dict[str, str] = {}
+
+    def mark_conversation_skipped(self, conversation_id: str, reason: str) -> None:
+        self.skipped[conversation_id] = reason
+
+
+class StubDistiller:
+    def __init__(self, exchanges: dict[str, int]) -> None:
+        self.exchanges = exchanges
+        self.storage = StubStorage()
+        self.stored: dict[str, int] = {}
+
+    def pending_inputs(self, conversation_id: str) -> list[DistillationInput]:
+        if conversation_id not in self.exchanges:
+            raise KeyError(f"Conversation not found: {conversation_id}")
+        return [_input(conversation_id, i) for i in range(self.exchanges[conversation_id])]
+
+    def store_outputs(self, inputs, outputs):
+        assert len(inputs) == len(outputs)
+        self.stored[inputs[0].conversation_id] = len(outputs)
+        return list(outputs)
+
+
+class TestPackInputs:
+    def test_packs_up_to_budget_and_count(self):
+        inputs = [_input("c", i, chars=400) for i in range(5)]  # ~101 tokens each
+        batches = pack_inputs(inputs, token_budget=250, max_exchanges=10)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+        batches = pack_inputs(inputs, token_budget=10_000, max_exchanges=3)
+        assert [len(b) for b in batches] == [3, 2]
+
+    def test_oversized_exchange_gets_own_call(self):
+        inputs = [_input("c", 0, chars=40), _input("c", 1, chars=4000), _input("c", 2, chars=40)]
+        batches = pack_inputs(inputs, token_budget=100, max_exchanges=10)
+        assert [[inp.ply_start for inp in b] for b in batches] == [[0], [1], [2]]
+
+    def test_zero_budget_disables_packing(self):
+        inputs = [_input("c", i) for i in range(3)]
+        assert [len(b) for b in pack_inputs(inputs, token_budget=0, max_exchanges=10)] == [1, 1, 1]
+
+
+class TestDistillationScheduler:
+    def test_runs_concurrently_within_provider_limit(self):
+        llm = FakeLLM(latency=0.05)
+        distiller = StubDistiller({f"c-{i}": 1 for i in range(8)})
+        scheduler = DistillationScheduler(llm, workers=4, provider_concurrency={"fake": 2})
+
+        start = time.perf_counter()
+        stats = scheduler.run(distiller, list(distiller.exchanges))
+        elapsed = time.perf_counter() - start
+
+        assert llm.peak == 2
+        assert elapsed < 8 * 0.05
+        assert set(distiller.stored) == set(distiller.exchanges)
+        assert stats.conversations_done == 8
+        assert stats.calls == 8
+        assert stats.queue_depth == 0
+        assert stats.latency_p50_ms >= 50
+        assert stats.exchanges_per_second > 0
+
+    def test_packs_exchanges_into_fewer_calls(self):
+        llm = FakeLLM()
+        distiller = StubDistiller({"c-1": 6})
+        scheduler = DistillationScheduler(
+            llm, workers=2, pack_token_budget=1000, max_exchanges_per_call=4,
+        )
+
+        stats = scheduler.run(distiller, ["c-1"])
+
+        assert [len(call) for call in llm.calls] == [4, 2]
+        assert distiller.stored == {"c-1": 6}
+        assert stats.exchanges_distilled == 6
+
+    def test_retries_transient_failures_with_backoff(self):
+        llm = FakeLLM(failures={"c-1": (RuntimeError("CLI timed out"), 2)})
+        distiller = StubDistiller({"c-1": 1})
+        scheduler = DistillationScheduler(llm, workers=1, max_retries=2, retry_backoff_seconds=0.01)
+
+        stats = scheduler.run(distiller, ["c-1"])
+
+        assert distiller.stored == {"c-1": 1}
+        assert stats.calls == 3
+        assert stats.retries == 2
+        assert stats.failed_calls == 2
+
+    def test_exhausted_retries_leave_conversation_pending(self):
+        llm = FakeLLM(failures={"c-1": (RuntimeError("CLI failed"), None)})
+        distiller = StubDistiller({"c-1": 2, "c-2": 1})
+        scheduler = DistillationScheduler(llm, workers=2, max_retries=1)
+
+        stats = scheduler.run(distiller, ["c-1", "c-2"])
+
+        assert distiller.stored == {"c-2": 1}
+        assert distiller.storage.skipped == {}
+        assert stats.conversations_failed == 1
+        assert stats.conversations_done == 1
+
+    def test_permanent_errors_mark_conversation_skipped(self):
+        llm = FakeLLM(failures={"c-1": (ValueError("bad reply"), None)})
+        distiller = StubDistiller({"c-1": 1})
+        scheduler = DistillationScheduler(llm, workers=1, max_retries=3)
+
+        stats = scheduler.run(distiller, ["c-1", "missing"])
+
+        assert stats.calls == 1
+        assert stats.conversations_skipped == 2
+        assert set(distiller.storage.skipped) == {"c-1", "missing"}
+        assert distiller.storage.skipped["c-1"].startswith("llm_error")
+
+
+class FakeConversationStore:
+    def __init__(self, conversations: dict[str, int]) -> None:
+        self.conversations = conversations
+
+    def get_all_conversation_ids(self, project_id=None):
+        return list(self.conversations)
+
+    def get_conversation(self, conversation_id):
+        return {"conversation_id": conversation_id, "project_id": "proj"}
+
+    def get_conversation_messages(self, conversation_id):
+        messages = []
+        for i in range(self.conversations[conversation_id]):
+            messages.append({"sequence": 2 * i, "role": "user", "content": f"question {i} " * 10})
+            messages.append({"sequence": 2 * i + 1, "role": "assistant", "content": f"answer {i} " * 10})
+        return messages
+
+
+class FakeEmbedder:
+    def encode(self, texts, batch_size=32):
+        return np.ones((len(texts), 384), dtype=np.float32)
+
+
+@pytest.mark.unit
+def test_distill_all_pending_checkpoints_per_conversation(tmp_path):
+    config = Config.load()
+    config.embedding.cache_embeddings = False
+    config.distillation.workers = 2
+    config.distillation.max_retries = 0
+    store = FakeConversationStore({"c-1": 3, "c-2": 2, "c-3": 1})
+    storage = PalaceStorage(tmp_path / "data")
+    llm = FakeLLM(latency=0.01, failures={"c-2": (RuntimeError("CLI timed out"), 1)})
+    distiller = Distiller(
+        search_dir=tmp_path, config=config, llm=llm, duckdb_store=store,
+        embedder=FakeEmbedder(), palace_storage=storage,
+    )
+
+    first = distiller.distill_all_pending()
+
+    assert first.conversations_processed == 2
+    assert first.objects_created == 4
+    assert distiller.last_run is not None and distiller.last_run.conversations_failed == 1
+    assert distiller.list_pending_conversations() == ["c-2"]
+
+    second = distiller.distill_all_pending()
+
+    assert second.conversations_processed == 1
+    assert second.objects_created == 2
+    assert distiller.list_pending_conversations() == []
+    assert storage.get_stats()["total_objects"] == 6
+    distiller.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import Mock
@@ -49,6 +50,7 @@ def test_log_search_inserts_row(analytics_service):
         search_time_ms=123,
         tool_filter="claude",
     )
+    assert analytics_service.flush() == 1
     db_path = str(analytics_service.logs_dir / "analytics.duckdb")
     assert _count_rows(db_path) == 1
 
@@ -68,6 +70,7 @@ def test_log_search_respects_opt_in(tmp_path):
         tool_filter="all",
     )
 
+    assert service.pending_count == 0
     db_path = str(service.logs_dir / "analytics.duckdb")
     assert _count_rows(db_path) == 0
 
@@ -100,6 +103,11 @@ def test_get_stats_summary_and_top_queries(analytics_service):
     assert top[0]["query"] == "python"
     assert top[0]["search_count"] == 3
 
+    analytics_service.log_search(
+        query="cobol", result_count=0, search_mode="hybrid", search_time_ms=10, tool_filter="all",
+    )
+    assert analytics_service.get_successful_queries(days=7) == [("python", 3), ("javascript", 1)]
+
 
 def test_retention_deletes_old_rows(tmp_path):
     config = Mock(spec=Config)
@@ -135,10 +143,98 @@ def test_retention_deletes_old_rows(tmp_path):
         search_time_ms=1,
         tool_filter="all",
     )
+    service.flush()
+    assert _count_rows(db_path) == 2
 
+    service.apply_retention()
     assert _count_rows(db_path) == 1
 
 
+def _buffered_service(tmp_path, **kwargs) -> SearchAnalyticsService:
+    config = Mock(spec=Config)
+    config.paths = Mock()
+    config.paths.search_directory = str(tmp_path / ".searchat")
+    config.analytics = SimpleNamespace(enabled=True, retention_days=1)
+    # Long interval so only explicit flushes (or a full batch) write.
+    params = {"flush_interval_seconds": 3600.0}
+    params.update(kwargs)
+    return SearchAnalyticsService(config, **params)
+
+
+def _log(service: SearchAnalyticsService, query: str) -> None:
+    service.log_search(query=query, result_count=1, search_mode="hybrid", search_time_ms=1)
+
+
+def test_log_search_buffers_until_flush_and_reads_see_pending(tmp_path):
+    service = _buffered_service(tmp_path)
+    db_path = str(service.logs_dir / "analytics.duckdb")
+
+    _log(service, "a")
+    _log(service, "b")
+
+    assert service.pending_count == 2
+    assert _count_rows(db_path) == 0
+    assert service.get_stats_summary(days=7)["total_searches"] == 2
+    assert service.pending_count == 0
+    service.close()
+
+
+def test_full_batch_wakes_writer(tmp_path):
+    service = _buffered_service(tmp_path, flush_batch=3)
+    db_path = str(service.logs_dir / "analytics.duckdb")
+
+    for q in ("a", "b", "c"):
+        _log(service, q)
+
+    deadline = time.monotonic() + 5
+    while service.pending_count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    service.close()
+    assert _count_rows(db_path) == 3
+
+
+def test_close_flushes_pending_events(tmp_path):
+    service = _buffered_service(tmp_path)
+    _log(service, "a")
+
+    service.close()
+
+    assert _count_rows(str(service.logs_dir / "analytics.duckdb")) == 1
+
+
+def test_full_buffer_drops_oldest(tmp_path):
+    service = _buffered_service(tmp_path, buffer_size=2)
+    for q in ("a", "b", "c"):
+        _log(service, q)
+
+    assert service.dropped_count == 1
+    top = {row["query"] for row in service.get_top_queries(days=7)}
+    assert top == {"b", "c"}
+    service.close()
+
+
+def test_retention_runs_on_timer_not_per_search(tmp_path, monkeypatch):
+    import searchat.services.analytics as analytics
+
+    clock = [1000.0]
+    monkeypatch.setattr(analytics.time, "monotonic", lambda: clock[0])
+    service = _buffered_service(tmp_path, retention_interval_seconds=60)
+    calls: list[float] = []
+    monkeypatch.setattr(service, "apply_retention", lambda: calls.append(clock[0]))
+
+    _log(service, "a")
+    service.flush()
+    service._apply_retention_if_due()
+    _log(service, "b")
+    service.flush()
+    service._apply_retention_if_due()
+    clock[0] += 61
+    service._apply_retention_if_due()
+
+    assert calls == [1000.0, 1061.0]
+    service.close()
+
+
 def test_trends_heatmap_and_agent_comparison(tmp_path):
     config = Mock(spec=Config)
     config.paths = Mock()
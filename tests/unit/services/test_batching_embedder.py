@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from searchat.services.batching_embedder import BatchingEmbeddingService
+
+
+class _FakeModel:
+    """Encodes each text as [len(text), normalized flag]; records every call."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[object, dict]] = []
+        self.dimension = 2
+
+    def encode(self, sentences, **kwargs):
+        self.calls.append((sentences, kwargs))
+        flag = 1.0 if kwargs.get("normalize_embeddings") else 0.0
+        if isinstance(sentences, str):
+            return np.array([len(sentences), flag], dtype=np.float32)
+        return np.array([[len(t), flag] for t in sentences], dtype=np.float32)
+
+
+def test_single_text_returns_vector_and_list_returns_matrix() -> None:
+    model = _FakeModel()
+    service = BatchingEmbeddingService(model, window_ms=0, cache_size=0)
+
+    single = service.encode("abc")
+    many = service.encode(["a", "bb"], normalize_embeddings=True)
+
+    assert single.tolist() == [3.0, 0.0]
+    assert many.tolist() == [[1.0, 1.0], [2.0, 1.0]]
+    # The model always sees a list, so single texts can share a batch.
+    assert model.calls[0][0] == ["abc"]
+    assert service.dimension == 2
+
+
+def test_concurrent_queries_share_one_forward_pass() -> None:
+    model = _FakeModel()
+    service = BatchingEmbeddingService(model, window_ms=200, cache_size=0)
+    queries = [f"q{'x' * i}" for i in range(6)]
+    results: dict[str, list[float]] = {}
+    barrier = threading.Barrier(len(queries))
+
+    def worker(text: str) -> None:
+        barrier.wait()
+        results[text] = service.encode(text).tolist()
+
+    threads = [threading.Thread(target=worker, args=(q,)) for q in queries]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert {q: results[q] for q in queries} == {q: [float(len(q)), 0.0] for q in queries}
+    stats = service.stats()
+    assert stats.requests == 6
+    assert stats.batches < 6
+    assert stats.mean_batch_size > 1
+
+
+def test_recent_query_vectors_come_from_lru() -> None:
+    model = _FakeModel()
+    service = BatchingEmbeddingService(model, window_ms=0, cache_size=1)
+
+    first = service.encode("auth flow")
+    first[0] = -1.0  # callers own their copy
+    again = service.encode("auth flow")
+    service.encode("other")
+    service.encode("auth flow")
+
+    assert again.tolist() == [9.0, 0.0]
+    assert len(model.calls) == 3
+    assert service.stats().cache_hits == 1
+    assert service.stats().cache_entries == 1
+
+
+def test_normalized_and_raw_vectors_are_cached_separately() -> None:
+    model = _FakeModel()
+    service = BatchingEmbeddingService(model, window_ms=0, cache_size=8)
+
+    raw = service.encode("abc")
+    normalized = service.encode(["abc"], convert_to_numpy=True, normalize_embeddings=True)
+
+    assert raw.tolist() == [3.0, 0.0]
+    assert normalized.tolist() == [[3.0, 1.0]]
+
+
+def test_large_lists_and_tensor_outputs_bypass_batching() -> None:
+    model = _FakeModel()
+    service = BatchingEmbeddingService(model, window_ms=0, cache_size=8, coalesce_limit=2)
+    texts = ["a", "b", "c"]
+
+    service.encode(texts, batch_size=32)
+    service.encode("a", convert_to_tensor=True)
+
+    assert model.calls == [(texts, {"batch_size": 32}), ("a", {"convert_to_tensor": True})]
+    assert service.stats().requests == 0
+
+
+def test_model_errors_reach_every_waiting_caller() -> None:
+    class _Broken:
+        def encode(self, sentences, **kwargs):
+            raise RuntimeError("model crashed")
+
+    service = BatchingEmbeddingService(_Broken(), window_ms=100, cache_size=0)
+    errors: list[str] = []
+    barrier = threading.Barrier(3)
+
+    def worker(text: str) -> None:
+        barrier.wait()
+        try:
+            service.encode(text)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in ("a", "b", "c")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["model crashed"] * 3
+
+
+def test_shared_embedding_service_wraps_model_in_batcher(monkeypatch: pytest.MonkeyPatch) -> None:
+    from searchat.services import semantic_model_service
+
+    model = _FakeModel()
+    monkeypatch.setattr(semantic_model_service, "build_embedding_service", lambda config: model)
+    monkeypatch.setattr(semantic_model_service, "_SHARED_EMBEDDERS", {})
+    config = SimpleNamespace(
+        embedding=SimpleNamespace(
+            model="m",
+            get_device=lambda: "cpu",
+            query_batch_window_ms=0,
+            query_cache_size=4,
+        )
+    )
+
+    service = semantic_model_service.shared_embedding_service(config)
+
+    assert isinstance(service, BatchingEmbeddingService)
+    assert service.model is model
+    assert service.encode("ab").tolist() == [2.0, 0.0]
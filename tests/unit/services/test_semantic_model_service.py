@@ -105,3 +105,27 @@ def test_build_reranking_service_wraps_load_failures(monkeypatch):
         raise AssertionError("expected RerankingModelUnavailable")
     except RerankingModelUnavailable as exc:
         assert str(exc) == "Reranking model unavailable: cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+def test_shared_embedding_service_loads_each_model_once(monkeypatch):
+    from searchat.services import semantic_model_service
+
+    loads: list[str] = []
+
+    def _fake_build(config):
+        loads.append(config.embedding.model)
+        return object()
+
+    monkeypatch.setattr(semantic_model_service, "build_embedding_service", _fake_build)
+    monkeypatch.setattr(semantic_model_service, "_SHARED_EMBEDDERS", {})
+
+    def _config(model: str):
+        return SimpleNamespace(embedding=SimpleNamespace(model=model, get_device=lambda: "cpu"))
+
+    first = semantic_model_service.shared_embedding_service(_config("model-a"))
+    again = semantic_model_service.shared_embedding_service(_config("model-a"))
+    other = semantic_model_service.shared_embedding_service(_config("model-b"))
+
+    assert first is again
+    assert other is not first
+    assert loads == ["model-a", "model-b"]
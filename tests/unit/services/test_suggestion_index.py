@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from searchat.models.schemas import CODE_BLOCK_SCHEMA
+from searchat.services import suggestion_index
+from searchat.services.suggestion_index import SuggestionIndex
+
+
+class _TitleStore:
+    def __init__(self, titles: list[tuple[str, str]]) -> None:
+        self.titles = titles
+        self.calls: list[list[str] | None] = []
+
+    def list_conversation_titles(self, project_ids=None):  # noqa: ANN001
+        self.calls.append(None if project_ids is None else list(project_ids))
+        return [row for row in self.titles if project_ids is None or row[0] in project_ids]
+
+
+def _write_code(search_dir: Path) -> None:
+    code_dir = search_dir / "data" / "code"
+    code_dir.mkdir(parents=True)
+    now = datetime(2026, 1, 1)
+    row = {
+        "conversation_id": "conv-1", "project_id": "alpha", "connector": "claude", "file_path": "/f",
+        "title": "t", "conversation_created_at": now, "conversation_updated_at": now, "message_index": 0,
+        "block_index": 0, "role": "assistant", "message_timestamp": now, "fence_language": "python",
+        "language": "python", "language_source": "fence", "functions": ["parse_config"], "classes": [],
+        "imports": ["pathlib"], "code": "def parse_config(): ...", "code_hash": "h", "lines": 1,
+    }
+    pq.write_table(pa.Table.from_pylist([row], schema=CODE_BLOCK_SCHEMA), code_dir / "project_alpha.parquet")
+
+
+@pytest.mark.unit
+def test_suggests_weighted_prefix_matches_from_every_source(tmp_path: Path) -> None:
+    store = _TitleStore([
+        ("alpha", "Python Testing Best Practices"),
+        ("alpha", "Python Async Programming"),
+        ("beta", "Parsing Python ASTs"),
+    ])
+    _write_code(tmp_path)
+    analytics = Mock()
+    analytics.get_successful_queries.return_value = [("pandas merge", 3)]
+    index = SuggestionIndex(store, tmp_path, analytics=analytics)
+
+    assert index.suggest("p", limit=3) == ["pandas merge", "Python", "Parsing"]
+    assert index.suggest("PYTHON", limit=3) == ["Python", "Python ASTs", "Python Async"]
+    assert index.suggest("pars") == ["Parsing", "parse_config", "Parsing Python", "Parsing Python ASTs"]
+    assert index.suggest("pathl") == ["pathlib"]
+    assert index.suggest("bet") == ["beta"]
+    assert index.suggest("best practices") == ["Best Practices"]
+    assert index.suggest("practices python") == []
+    assert index.suggest("python testing best") == ["Python Testing Best Practices"]
+    assert index.suggest("zzz") == []
+
+
+@pytest.mark.unit
+def test_invalidate_reloads_only_changed_projects(tmp_path: Path) -> None:
+    store = _TitleStore([("alpha", "Kafka consumers"), ("beta", "Kubernetes probes")])
+    index = SuggestionIndex(store, tmp_path)
+    assert index.suggest("k") == ["Kafka", "Kubernetes", "Kafka consumers", "Kubernetes probes"]
+
+    store.titles = [("alpha", "Kotlin coroutines"), ("beta", "Kubernetes probes")]
+    assert index.suggest("kaf") == ["Kafka", "Kafka consumers"]  # unchanged until invalidated
+
+    index.invalidate({"alpha"})
+    index.refresh()
+    assert index.suggest("k") == ["Kotlin", "Kubernetes", "Kotlin coroutines", "Kubernetes probes"]
+    assert store.calls == [None, ["alpha"]]
+
+    index.invalidate()
+    index.refresh()
+    assert store.calls[-1] is None
+
+
+@pytest.mark.unit
+def test_lookups_serve_previous_snapshot_while_refreshing(tmp_path: Path) -> None:
+    store = _TitleStore([("alpha", "Kafka consumers")])
+    index = SuggestionIndex(store, tmp_path)
+    assert index.suggest("kaf") == ["Kafka", "Kafka consumers"]
+
+    store.titles = [("alpha", "Kotlin coroutines")]
+    index.invalidate({"alpha"})
+    assert index.suggest("kaf") == ["Kafka", "Kafka consumers"]
+
+    assert index._refresher is not None
+    index._refresher.join(timeout=5)
+    assert index.suggest("kaf") == []
+    assert index.suggest("kot") == ["Kotlin", "Kotlin coroutines"]
+
+
+@pytest.mark.unit
+def test_heavy_prefixes_are_precomputed_and_size_is_capped(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(suggestion_index, "HEAVY_PREFIX_KEYS", 4)
+    titles = [("alpha", f"term{i:03d}") for i in range(50)] + [("alpha", "term007")] * 3
+    index = SuggestionIndex(_TitleStore(titles), tmp_path, max_entries=40)
+
+    assert index.suggest("term", limit=1) == ["term007"]
+    assert index.size == 40
+    snapshot = index._snapshot
+    assert snapshot is not None and "term0" in snapshot.top
+    assert index.suggest("term00", limit=20)[0] == "term007"
+
+
+@pytest.mark.unit
+def test_failed_build_is_retried(tmp_path: Path) -> None:
+    store = Mock()
+    store.list_conversation_titles.side_effect = [RuntimeError("boom"), [("alpha", "Retry logic")]]
+    index = SuggestionIndex(store, tmp_path)
+
+    with pytest.raises(RuntimeError):
+        index.suggest("ret")
+    assert index.suggest("ret") == ["Retry", "Retry logic"]
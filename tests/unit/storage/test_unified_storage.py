@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pytest
 
 from searchat.storage.schema import EMBEDDING_DIM, ensure_tables
@@ -34,6 +35,17 @@ class TestSchema:
         counts = storage.get_row_counts()
         assert all(v == 0 for v in counts.values())
 
+    def test_hnsw_ef_search_reaches_read_cursors(self, tmp_path):
+        s = UnifiedStorage(tmp_path / "ef.duckdb", hnsw_ef_search=97)
+        try:
+            if not s._vss_available:
+                pytest.skip("DuckDB vss extension unavailable")
+            cur = s._read_cursor()
+            value = cur.execute("SELECT current_setting('hnsw_ef_search')").fetchone()[0]
+            assert int(value) == 97
+        finally:
+            s.close()
+
 
 # -- Conversation CRUD --
 
@@ -74,6 +86,15 @@ class TestConversationCRUD:
         projects = storage.list_projects()
         assert projects == ["a", "b"]
 
+    def test_list_conversation_titles(self, storage):
+        storage.upsert_conversation(**self._sample_conversation(project_id="a", title="Alpha"))
+        storage.upsert_conversation(
+            **self._sample_conversation(conversation_id="conv-002", project_id="b", title="Beta")
+        )
+        assert sorted(storage.list_conversation_titles()) == [("a", "Alpha"), ("b", "Beta")]
+        assert storage.list_conversation_titles(["b"]) == [("b", "Beta")]
+        assert storage.list_conversation_titles([]) == []
+
     def test_list_project_summaries(self, storage):
         storage.upsert_conversation(**self._sample_conversation())
         summaries = storage.list_project_summaries()
@@ -203,6 +224,28 @@ class TestExchanges:
         storage.upsert_exchange(**{**kwargs, "exchange_text": "v2"})
         assert storage.get_exchange_count() == 1
 
+    def test_upsert_exchanges_bulk_updates_existing(self, storage):
+        rows = [
+            {
+                "exchange_id": f"ex-{i}",
+                "conversation_id": "c1",
+                "project_id": "p1",
+                "ply_start": 2 * i,
+                "ply_end": 2 * i + 1,
+                "exchange_text": f"v1-{i}",
+                "created_at": datetime.now(),
+            }
+            for i in range(3)
+        ]
+        storage.upsert_exchanges(rows)
+        storage.upsert_exchanges([{**rows[0], "exchange_text": "v2"}])
+
+        assert storage.get_exchange_count() == 3
+        text = storage.connection.execute(
+            "SELECT exchange_text FROM exchanges WHERE exchange_id = 'ex-0'"
+        ).fetchone()[0]
+        assert text == "v2"
+
 
 # -- Embeddings --
 
@@ -216,6 +259,46 @@ class TestEmbeddings:
         with pytest.raises(ValueError, match="dimension mismatch"):
             storage.upsert_embedding("ex-001", [0.1] * 10)
 
+    def test_upsert_embeddings_bulk(self, storage):
+        matrix = np.random.default_rng(0).random((4, EMBEDDING_DIM), dtype=np.float32)
+        storage.upsert_embeddings([f"ex-{i}" for i in range(4)], matrix)
+        storage.upsert_embeddings(["ex-0"], matrix[1:2])
+
+        assert storage.get_embedding_count() == 4
+        stored = storage.connection.execute(
+            "SELECT embedding FROM verbatim_embeddings WHERE exchange_id = 'ex-0'"
+        ).fetchone()[0]
+        assert np.allclose(stored, matrix[1])
+
+    def test_upsert_embeddings_wrong_dimension_raises(self, storage):
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            storage.upsert_embeddings(["ex-001"], np.zeros((1, 10)))
+
+
+# -- Transactions --
+
+class TestTransactions:
+    def test_transaction_rolls_back_all_writes(self, storage):
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                storage.insert_messages("c1", [
+                    {"sequence": 0, "role": "user", "content": "hello"},
+                ])
+                storage.upsert_embeddings(["ex-0"], np.zeros((1, EMBEDDING_DIM)))
+                raise RuntimeError("boom")
+
+        counts = storage.get_row_counts()
+        assert counts["messages"] == 0
+        assert counts["verbatim_embeddings"] == 0
+
+    def test_nested_transaction_commits_once(self, storage):
+        with storage.transaction():
+            with storage.transaction():
+                storage.insert_messages("c1", [
+                    {"sequence": 0, "role": "user", "content": "hello"},
+                ])
+        assert storage.get_row_counts()["messages"] == 1
+
 
 # -- File State --
 
@@ -232,6 +315,84 @@ class TestFileState:
         counts = storage.get_row_counts()
         assert counts["source_file_state"] == 1
 
+    def test_get_file_states_returns_tail_cursor(self, storage):
+        storage.upsert_file_state(
+            file_path="/data/conv.jsonl",
+            conversation_id="c1",
+            connector_name="claude",
+            file_size=1024,
+            file_hash="abc",
+            mtime_ns=7,
+            byte_offset=1024,
+            next_sequence=12,
+            tail_checkpoint="cp",
+            last_exchange_start=10,
+        )
+
+        states = storage.get_file_states(["/data/conv.jsonl", "/data/missing.jsonl"])
+
+        assert list(states) == ["/data/conv.jsonl"]
+        state = states["/data/conv.jsonl"]
+        assert (state["byte_offset"], state["next_sequence"], state["last_exchange_start"]) == (1024, 12, 10)
+        assert state["mtime_ns"] == 7
+
+    def test_migration_adds_tail_columns_to_existing_table(self, tmp_path):
+        import duckdb
+
+        conn = duckdb.connect(str(tmp_path / "old.duckdb"))
+        conn.execute(
+            "CREATE TABLE source_file_state (file_path VARCHAR PRIMARY KEY, conversation_id VARCHAR, "
+            "project_id VARCHAR, connector_name VARCHAR, status VARCHAR NOT NULL DEFAULT 'indexed', "
+            "file_size BIGINT NOT NULL, file_hash VARCHAR, mtime_ns BIGINT DEFAULT 0, "
+            "error_message TEXT, updated_at TIMESTAMP NOT NULL)"
+        )
+        ensure_tables(conn)
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info('source_file_state')").fetchall()}
+        conn.close()
+        assert {"byte_offset", "next_sequence", "tail_checkpoint", "last_exchange_start"} <= columns
+
+
+class TestTailAppend:
+    def test_extend_conversation_appends_text_and_merges_files(self, storage):
+        storage.upsert_conversation(
+            conversation_id="c1", project_id="p1", file_path="/c1.jsonl", title="Untitled",
+            created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1), message_count=2,
+            full_text="a\n\nb", file_hash="h0", indexed_at=datetime(2026, 1, 1),
+            files_mentioned=["/x.py"],
+        )
+
+        storage.extend_conversation(
+            conversation_id="c1", appended_text="c", appended_messages=1,
+            updated_at=datetime(2026, 1, 2), file_hash="h1", indexed_at=datetime(2026, 1, 2),
+            title="c", files_mentioned=["/y.py"],
+        )
+
+        record = storage.get_conversation_record("c1")
+        row = storage.connection.execute(
+            "SELECT full_text, file_hash, files_mentioned FROM conversations"
+        ).fetchone()
+        assert record["message_count"] == 3
+        assert record["title"] == "c"
+        assert row[0] == "a\n\nb\n\nc"
+        assert row[1] == "h1"
+        assert row[2] == '["/x.py", "/y.py"]'
+
+    def test_delete_exchanges_from_drops_trailing_exchanges_and_vectors(self, storage):
+        now = datetime(2026, 1, 1)
+        exchanges = [
+            {"exchange_id": f"e{start}", "conversation_id": "c1", "project_id": "p1",
+             "ply_start": start, "ply_end": start + 1, "exchange_text": "t", "created_at": now}
+            for start in (0, 2, 4)
+        ]
+        storage.upsert_exchanges(exchanges)
+        storage.upsert_embeddings(["e0", "e2", "e4"], np.zeros((3, EMBEDDING_DIM), dtype=np.float32))
+
+        storage.delete_exchanges_from("c1", 2)
+
+        assert storage.get_exchange_count() == 1
+        assert storage.get_embedding_count() == 1
+
 
 # -- Code Blocks --
 
@@ -248,3 +409,26 @@ class TestCodeBlocks:
         )
         counts = storage.get_row_counts()
         assert counts["code_blocks"] == 1
+
+    def test_insert_code_blocks_bulk(self, storage):
+        blocks = [
+            {
+                "conversation_id": "c1",
+                "project_id": "p1",
+                "message_index": 0,
+                "block_index": i,
+                "code": f"x = {i}",
+                "code_hash": f"h{i}",
+                "lines": 1,
+                "functions": ["f"] if i == 0 else None,
+            }
+            for i in range(3)
+        ]
+        storage.insert_code_blocks(blocks)
+        storage.insert_code_blocks(blocks[:1])
+
+        assert storage.get_row_counts()["code_blocks"] == 3
+        functions = storage.connection.execute(
+            "SELECT functions FROM code_blocks WHERE block_index = 0"
+        ).fetchone()[0]
+        assert functions == '["f"]'
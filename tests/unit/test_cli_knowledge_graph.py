@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -123,6 +124,7 @@ class TestStats:
                 return_value=MagicMock(),
             ),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.__init__", return_value=None),
+            patch("searchat.knowledge_graph.KnowledgeGraphStore.session", return_value=nullcontext()),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.get_contradictions", return_value=[]),
             patch(
                 "searchat.knowledge_graph.KnowledgeGraphStore.get_edges_for_record",
@@ -152,6 +154,7 @@ class TestStats:
                 return_value=MagicMock(),
             ),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.__init__", return_value=None),
+            patch("searchat.knowledge_graph.KnowledgeGraphStore.session", return_value=nullcontext()),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.get_contradictions", return_value=[]),
             patch(
                 "searchat.knowledge_graph.KnowledgeGraphStore.get_edges_for_record",
@@ -226,6 +229,7 @@ class TestContradictions:
             ),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.close", return_value=None),
             patch("searchat.expertise.store.ExpertiseStore.__init__", return_value=None),
+            patch("searchat.expertise.store.ExpertiseStore.session", return_value=nullcontext()),
             patch("searchat.expertise.store.ExpertiseStore.get", side_effect=_get_rec),
         ):
             result = run_graph(["contradictions"])
@@ -283,6 +287,7 @@ class TestContradictions:
             ),
             patch("searchat.knowledge_graph.KnowledgeGraphStore.close", return_value=None),
             patch("searchat.expertise.store.ExpertiseStore.__init__", return_value=None),
+            patch("searchat.expertise.store.ExpertiseStore.session", return_value=nullcontext()),
             patch("searchat.expertise.store.ExpertiseStore.get", side_effect=_get_rec),
         ):
             result = run_graph(["contradictions", "--domain", "auth"])
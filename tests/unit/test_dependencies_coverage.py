@@ -210,7 +210,7 @@ class TestGetOrCreateSearchEngineFor:
             sys.modules,
             "searchat.services.retrieval_service",
             types.SimpleNamespace(
-                build_retrieval_service=lambda search_dir, *, config: _SE(
+                build_retrieval_service=lambda search_dir, *, config, **_kwargs: _SE(
                     search_dir, config
                 )
             ),
@@ -238,7 +238,7 @@ class TestGetOrCreateSearchEngineFor:
             sys.modules,
             "searchat.services.retrieval_service",
             types.SimpleNamespace(
-                build_retrieval_service=lambda search_dir, *, config: _SE(
+                build_retrieval_service=lambda search_dir, *, config, **_kwargs: _SE(
                     search_dir, config
                 )
             ),
@@ -307,3 +307,31 @@ class TestIndexStructure:
         assert embedding_index._faiss_path.name == "expertise_embeddings.faiss"
         assert embedding_index._metadata_path.name == "expertise_embeddings.metadata.parquet"
         assert embedding_index._faiss_path.parent == embedding_index._expertise_dir
+
+
+class TestEmbeddingProvider:
+    def test_provider_model_loaded_on_first_encode(self, tmp_path: Path) -> None:
+        encoded: list[list[str]] = []
+
+        class _Model:
+            def encode(self, texts, **kwargs):
+                encoded.append(list(texts))
+                vectors = np.zeros((len(texts), _EMBEDDING_DIM), dtype=np.float32)
+                vectors[:, 0] = 1.0
+                return vectors
+
+        built: list[_Model] = []
+
+        def _provider() -> _Model:
+            built.append(_Model())
+            return built[-1]
+
+        idx = ExpertiseEmbeddingIndex(data_dir=tmp_path, embedding_provider=_provider)
+        assert built == []
+
+        idx.add(_make_record(record_id="exp_shared"))
+        results = idx.search("uv packages", limit=1)
+
+        assert len(built) == 1
+        assert encoded == [["Use uv for Python packages"], ["uv packages"]]
+        assert results[0][0] == "exp_shared"
@@ -13,6 +13,7 @@ from searchat.expertise.models import (
     RecordResult,
 )
 from searchat.expertise.pipeline import ExtractionPipeline, ExtractionStats, create_pipeline
+from searchat.services.semantic_model_service import shared_embedding_service
 
 
 def _make_config(
@@ -353,7 +354,15 @@ class TestCreatePipeline:
                 mock_index_cls.return_value = MagicMock()
                 pipeline = create_pipeline(config, tmp_path)
 
-        mock_index_cls.assert_called_once_with(tmp_path, embedding_model="all-MiniLM-L6-v2")
+        mock_index_cls.assert_called_once()
+        args, kwargs = mock_index_cls.call_args
+        assert args == (tmp_path,)
+        assert kwargs["embedding_model"] == "all-MiniLM-L6-v2"
+        assert kwargs["embedding_cache"] is None
+        # Embeddings come from the process-wide shared service for this config.
+        provider = kwargs["embedding_provider"]
+        assert provider.func is shared_embedding_service
+        assert provider.args == (config,)
         assert pipeline._embedding_index is not None
 
     def test_create_pipeline_with_expertise_disabled_skips_embedding_index(self, tmp_path: Path) -> None:
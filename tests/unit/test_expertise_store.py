@@ -1,6 +1,8 @@
 """Tests for ExpertiseStore DuckDB backend."""
 from __future__ import annotations
 
+import subprocess
+import sys
 import time
 from pathlib import Path
 
@@ -91,6 +93,18 @@ class TestInsertAndGet:
     def test_get_nonexistent_returns_none(self, expertise_store: ExpertiseStore) -> None:
         assert expertise_store.get("exp_doesnotexist") is None
 
+    def test_get_many_returns_found_records_by_id(self, expertise_store: ExpertiseStore) -> None:
+        first = _make_record(content="first")
+        second = _make_record(content="second")
+        expertise_store.insert(first)
+        expertise_store.insert(second)
+
+        fetched = expertise_store.get_many([first.id, second.id, "exp_doesnotexist"])
+
+        assert set(fetched) == {first.id, second.id}
+        assert fetched[second.id].content == "second"
+        assert expertise_store.get_many([]) == {}
+
 
 class TestInsertAllTypes:
     def test_insert_all_expertise_types(self, expertise_store: ExpertiseStore) -> None:
@@ -374,3 +388,38 @@ class TestUpdateRecord:
         expertise_store.insert(rec)
         result = expertise_store.update(rec.id)
         assert result is False
+
+
+def _open_in_other_process(db_path: Path) -> subprocess.CompletedProcess:
+    script = "import duckdb, sys; duckdb.connect(sys.argv[1]).close()"
+    return subprocess.run(
+        [sys.executable, "-c", script, str(db_path)], capture_output=True, text=True, timeout=60
+    )
+
+
+class TestConnectionLifetime:
+    def test_idle_store_leaves_file_free_for_other_processes(
+        self, expertise_store: ExpertiseStore, tmp_path: Path
+    ) -> None:
+        expertise_store.insert(_make_record())
+
+        result = _open_in_other_process(tmp_path / "expertise" / "expertise.duckdb")
+
+        assert result.returncode == 0, result.stderr
+
+    def test_session_shares_one_connection_then_releases_it(
+        self, expertise_store: ExpertiseStore, tmp_path: Path
+    ) -> None:
+        rec = _make_record()
+        with expertise_store.session():
+            conn = expertise_store._local.conn
+            with expertise_store.session():
+                assert expertise_store._local.conn is conn
+                expertise_store.insert(rec)
+            assert expertise_store.get(rec.id) is not None
+            held = _open_in_other_process(tmp_path / "expertise" / "expertise.duckdb")
+
+        assert held.returncode != 0
+        assert expertise_store._local.conn is None
+        assert _open_in_other_process(tmp_path / "expertise" / "expertise.duckdb").returncode == 0
+        assert expertise_store.get(rec.id) is not None
@@ -9,7 +9,7 @@ import pytest
 
 from searchat.expertise.models import ExpertiseRecord, ExpertiseType
 from searchat.expertise.store import ExpertiseStore
-from searchat.knowledge_graph.detector import ContradictionDetector
+from searchat.knowledge_graph.detector import ContradictionDetector, similar_pairs
 from searchat.knowledge_graph.models import ContradictionCandidate
 
 
@@ -239,3 +239,79 @@ class TestNLILazyLoad:
     def test_custom_nli_model_name(self) -> None:
         detector = ContradictionDetector(nli_model="custom/model")
         assert detector._nli_model_name == "custom/model"
+
+
+def _unit(*components: float) -> np.ndarray:
+    vec = np.zeros(8, dtype=np.float32)
+    vec[: len(components)] = components
+    return vec / np.linalg.norm(vec)
+
+
+class TestBulkScan:
+    """All-pairs scan over stored vectors with batched NLI."""
+
+    def test_similar_pairs_are_unordered_and_capped_per_record(self) -> None:
+        vectors = np.stack([
+            _unit(1.0, 0.0),
+            _unit(1.0, 0.1),
+            _unit(1.0, 0.2),
+            _unit(0.0, 1.0),
+        ])
+
+        pairs = similar_pairs(vectors, 0.75, limit=20)
+        capped = similar_pairs(vectors, 0.75, limit=1)
+
+        assert [(i, j) for i, j, _ in pairs] == [(0, 1), (0, 2), (1, 2)]
+        assert all(score >= 0.75 for _, _, score in pairs)
+        # Record 0's nearest is 1, record 2's nearest is 1: (0, 2) drops out.
+        assert [(i, j) for i, j, _ in capped] == [(0, 1), (1, 2)]
+
+    def _index(self, records: list[ExpertiseRecord], vectors: list[np.ndarray]) -> MagicMock:
+        idx = MagicMock()
+        idx.stored_vectors.return_value = ([r.id for r in records], np.stack(vectors))
+        return idx
+
+    def test_scan_without_nli_flags_active_similar_pairs(self, expertise_store: ExpertiseStore) -> None:
+        a = _make_record("always use type hints", record_id="exp_a")
+        b = _make_record("never use type hints", record_id="exp_b")
+        c = _make_record("type hints are optional", record_id="exp_c")
+        d = _make_record("deploy on fridays", record_id="exp_d")
+        for record in (a, b, c, d):
+            expertise_store.insert(record)
+        expertise_store.soft_delete(c.id)
+        idx = self._index(
+            [a, b, c, d], [_unit(1.0, 0.0), _unit(1.0, 0.1), _unit(1.0, 0.2), _unit(0.0, 1.0)]
+        )
+        detector = ContradictionDetector()
+        detector._nli_available = False
+
+        batches = list(detector.scan(expertise_store, idx, records=[a]))
+
+        assert [(scored, total) for scored, total, _ in batches] == [(1, 1)]
+        candidates = batches[0][2]
+        assert [(x.record_id_a, x.record_id_b) for x in candidates] == [("exp_a", "exp_b")]
+        assert candidates[0].nli_available is False
+
+    def test_scan_scores_pairs_in_one_predict_call_and_skips_known_edges(
+        self, expertise_store: ExpertiseStore
+    ) -> None:
+        records = [_make_record(f"rule {i}", record_id=f"exp_{i}") for i in range(3)]
+        for record in records:
+            expertise_store.insert(record)
+        idx = self._index(records, [_unit(1.0, 0.0), _unit(1.0, 0.1), _unit(1.0, 0.2)])
+        mock_ce = MagicMock()
+        mock_ce.predict.return_value = np.array([[0.9, 0.05, 0.05], [0.1, 0.8, 0.1]])
+        detector = ContradictionDetector()
+        detector._nli_available = True
+        detector._cross_encoder = mock_ce
+
+        batches = list(detector.scan(
+            expertise_store, idx, exclude={frozenset(("exp_1", "exp_0"))},
+        ))
+
+        mock_ce.predict.assert_called_once()
+        scored_pairs = mock_ce.predict.call_args.args[0]
+        assert scored_pairs == [("rule 0", "rule 2"), ("rule 1", "rule 2")]
+        candidates = [c for _, _, batch in batches for c in batch]
+        assert [(c.record_id_a, c.record_id_b) for c in candidates] == [("exp_0", "exp_2")]
+        assert candidates[0].contradiction_score == pytest.approx(0.9)
@@ -1,6 +1,8 @@
 """Tests for KnowledgeGraphStore edge CRUD and query operations."""
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -200,6 +202,21 @@ class TestEdgeQueryByRecord:
         edges = kg_store.get_edges_for_record(record_id, as_source=False, as_target=False)
         assert edges == []
 
+    def test_get_edges_for_records_batches_ids(self, kg_store: KnowledgeGraphStore) -> None:
+        e1 = KnowledgeEdge(source_id="exp_a", target_id="exp_x", edge_type=EdgeType.SUPERSEDES)
+        e2 = KnowledgeEdge(source_id="exp_y", target_id="exp_b", edge_type=EdgeType.QUALIFIES)
+        e3 = KnowledgeEdge(source_id="exp_z", target_id="exp_w", edge_type=EdgeType.CONTRADICTS)
+        kg_store.bulk_create_edges([e1, e2, e3])
+
+        both = kg_store.get_edges_for_records(["exp_a", "exp_b"])
+        incoming = kg_store.get_edges_for_records(["exp_a", "exp_b"], as_source=False)
+        typed = kg_store.get_edges_for_records(["exp_a", "exp_b"], edge_type=EdgeType.QUALIFIES)
+
+        assert {e.id for e in both} == {e1.id, e2.id}
+        assert [e.id for e in incoming] == [e2.id]
+        assert [e.id for e in typed] == [e2.id]
+        assert kg_store.get_edges_for_records([]) == []
+
 
 class TestBulkOperations:
     def test_bulk_create_edges(self, kg_store: KnowledgeGraphStore) -> None:
@@ -229,3 +246,22 @@ class TestBulkOperations:
 
     def test_bulk_delete_edges_empty(self, kg_store: KnowledgeGraphStore) -> None:
         assert kg_store.bulk_delete_edges([]) == 0
+
+
+class TestConnectionLifetime:
+    def test_store_only_locks_file_during_session(self, kg_store: KnowledgeGraphStore, tmp_path: Path) -> None:
+        db_path = tmp_path / "knowledge_graph" / "knowledge_graph.duckdb"
+        script = "import duckdb, sys; duckdb.connect(sys.argv[1]).close()"
+
+        def open_elsewhere() -> int:
+            return subprocess.run(
+                [sys.executable, "-c", script, str(db_path)], capture_output=True, timeout=60
+            ).returncode
+
+        edge = KnowledgeEdge(source_id="a", target_id="b", edge_type=EdgeType.RESOLVED)
+        with kg_store.session():
+            kg_store.bulk_create_edges([edge])
+            assert open_elsewhere() != 0
+
+        assert open_elsewhere() == 0
+        assert kg_store.get_edge(edge.id) is not None
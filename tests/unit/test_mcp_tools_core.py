@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -112,7 +113,9 @@ class TestParseTool:
 
 
 class TestBuildServices:
-    def test_creates_config_engine_store(self, tmp_path: Path):
+    def test_creates_config_engine_and_per_call_store(self, tmp_path: Path):
+        from searchat.mcp.tools import open_store
+
         cfg = MagicMock()
         cfg.performance.memory_limit_mb = 256
         fake_engine = MagicMock()
@@ -123,11 +126,14 @@ class TestBuildServices:
             patch("searchat.mcp.tools.build_retrieval_service", return_value=fake_engine),
             patch("searchat.mcp.tools.build_storage_service", return_value=fake_store),
         ):
-            config, engine, store = build_services(tmp_path)
+            config, engine = build_services(tmp_path)
+            with open_store(tmp_path) as store:
+                fake_store.close.assert_not_called()
 
         assert config is cfg
         assert engine is fake_engine
         assert store is fake_store
+        fake_store.close.assert_called_once()
 
 
 class TestSearchConversations:
@@ -160,7 +166,8 @@ class TestSearchConversations:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, fake_engine, fake_store)),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, fake_engine)),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             result = search_conversations(query="hello")
 
@@ -183,7 +190,7 @@ class TestSearchConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, MagicMock()),
+                return_value=(MagicMock(), fake_engine),
             ),
         ):
             with pytest.raises(RuntimeError, match="Embedding model unavailable: all-MiniLM-L6-v2"):
@@ -208,7 +215,7 @@ class TestSearchConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, MagicMock()),
+                return_value=(MagicMock(), fake_engine),
             ),
         ):
             payload = json.loads(search_conversations(query="contract", mode="hybrid"))
@@ -226,7 +233,7 @@ class TestSearchConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, MagicMock()),
+                return_value=(MagicMock(), fake_engine),
             ),
         ):
             with pytest.raises(
@@ -258,7 +265,7 @@ class TestSearchConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, MagicMock()),
+                return_value=(MagicMock(), fake_engine),
             ),
         ):
             result = search_conversations(query="*", mode="semantic")
@@ -278,7 +285,8 @@ class TestGetConversation:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), fake_store)),
+            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             with pytest.raises(ValueError, match="Conversation not found"):
                 get_conversation(conversation_id="missing")
@@ -301,7 +309,8 @@ class TestGetConversation:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), fake_store)),
+            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             result = get_conversation(conversation_id="abc")
 
@@ -328,7 +337,8 @@ class TestListProjects:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), fake_store)),
+            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             result = list_projects()
 
@@ -353,7 +363,8 @@ class TestGetStatistics:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock(), fake_store)),
+            patch("searchat.mcp.tools.build_services", return_value=(MagicMock(), MagicMock())),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             result = get_statistics()
 
@@ -378,8 +389,9 @@ class TestFindSimilarConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, fake_store),
+                return_value=(MagicMock(), fake_engine),
             ),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             with pytest.raises(RuntimeError, match="Embedding model unavailable: all-MiniLM-L6-v2"):
                 find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path))
@@ -394,15 +406,7 @@ class TestFindSimilarConversations:
             SemanticVectorHit(vector_id=100, distance=0.15),
             SemanticVectorHit(vector_id=200, distance=0.25),
         ]
-
-        fake_store = MagicMock()
-        fake_store.get_conversation_meta.return_value = {
-            "conversation_id": "conv-123",
-            "title": "Python Testing Tutorial",
-        }
-        fake_conn = MagicMock()
-        fake_conn.execute.return_value.fetchone.return_value = ("representative chunk",)
-        fake_conn.execute.return_value.fetchall.return_value = [
+        fake_engine.similar_conversation_rows.return_value = [
             (
                 "conv-456",
                 "project-a",
@@ -414,14 +418,23 @@ class TestFindSimilarConversations:
                 0.15,
             )
         ]
+
+        fake_store = MagicMock()
+        fake_store.get_conversation_meta.return_value = {
+            "conversation_id": "conv-123",
+            "title": "Python Testing Tutorial",
+        }
+        fake_conn = MagicMock()
+        fake_conn.execute.return_value.fetchone.return_value = ("representative chunk",)
         fake_store._connect.return_value = fake_conn
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, fake_store),
+                return_value=(MagicMock(), fake_engine),
             ),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             result = find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path), limit=3)
 
@@ -432,6 +445,11 @@ class TestFindSimilarConversations:
             "Python Testing Tutorial representative chunk",
             13,
         )
+        fake_engine.similar_conversation_rows.assert_called_once_with(
+            fake_engine.find_similar_vector_hits.return_value,
+            exclude_conversation_id="conv-123",
+            limit=3,
+        )
 
     def test_propagates_semantic_capability_failures(self, tmp_path: Path):
         fake_engine = MagicMock()
@@ -451,8 +469,9 @@ class TestFindSimilarConversations:
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
             patch(
                 "searchat.mcp.tools.build_services",
-                return_value=(MagicMock(), fake_engine, fake_store),
+                return_value=(MagicMock(), fake_engine),
             ),
+            patch("searchat.mcp.tools.open_store", return_value=nullcontext(fake_store)),
         ):
             with pytest.raises(RuntimeError, match="FAISS index not available"):
                 find_similar_conversations(conversation_id="conv-123", search_dir=str(tmp_path))
@@ -492,7 +511,7 @@ class TestGenerateAgentConfig:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, MagicMock(), MagicMock())),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, MagicMock())),
             patch("searchat.services.pattern_mining.extract_patterns", return_value=[fake_pattern]),
         ):
             result = generate_agent_config(format="claude.md")
@@ -517,7 +536,7 @@ class TestGenerateAgentConfig:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine, MagicMock())),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine)),
             patch(
                 "searchat.services.pattern_mining.extract_patterns",
                 side_effect=AssertionError("should not extract"),
@@ -553,7 +572,7 @@ class TestProviderValidation:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine, MagicMock())),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine)),
         ):
             with pytest.raises(RuntimeError, match="Embedding model unavailable: all-MiniLM-L6-v2"):
                 ask_about_history(question="What changed?", search_dir=str(tmp_path))
@@ -570,7 +589,7 @@ class TestProviderValidation:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine, MagicMock())),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine)),
         ):
             with pytest.raises(
                 RuntimeError,
@@ -608,7 +627,7 @@ class TestProviderValidation:
 
         with (
             patch("searchat.mcp.tools.resolve_dataset", return_value=tmp_path),
-            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine, MagicMock())),
+            patch("searchat.mcp.tools.build_services", return_value=(cfg, engine)),
             patch(
                 "searchat.services.pattern_mining.extract_patterns",
                 side_effect=AssertionError("should not extract"),
@@ -66,6 +66,16 @@ class FakeKGStore:
                 result.append(e)
         return result
 
+    def get_edges_for_records(
+        self, record_ids: list[str], as_source: bool = True, as_target: bool = True
+    ) -> list[KnowledgeEdge]:
+        self.batch_calls = getattr(self, "batch_calls", 0) + 1
+        ids = set(record_ids)
+        return [
+            e for e in self._edges
+            if (as_source and e.source_id in ids) or (as_target and e.target_id in ids)
+        ]
+
 
 class TestPrioritizerKGFiltering:
     def test_superseded_records_excluded(self):
@@ -82,6 +92,7 @@ class TestPrioritizerKGFiltering:
         ids = [r.id for r in result.expertise]
         assert "old-rec" not in ids
         assert "new-rec" in ids
+        assert kg.batch_calls == 1
 
     def test_qualifying_notes_annotated(self):
         """Records with incoming QUALIFIES edges should have qualifying metadata."""